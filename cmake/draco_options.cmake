@@ -135,6 +135,10 @@ macro(draco_set_default_options)
     NAME DRACO_TRANSCODER_SUPPORTED
     HELPSTRING "Enable the Draco transcoder."
     VALUE OFF)
+  draco_option(
+    NAME DRACO_DECODER_ALLOCATION_STATS
+    HELPSTRING "Count allocations in the draco_decoder -stats output."
+    VALUE OFF)
   draco_option(
     NAME DRACO_DEBUG_COMPILER_WARNINGS
     HELPSTRING "Turn on more warnings."
@@ -258,6 +262,10 @@ macro(draco_set_optional_features)
     draco_enable_feature(FEATURE "DRACO_TRANSCODER_SUPPORTED")
   endif()
 
+  if(DRACO_DECODER_ALLOCATION_STATS)
+    draco_enable_feature(FEATURE "DRACO_DECODER_ALLOCATION_STATS")
+  endif()
+
 
 endmacro()
 
@@ -42,22 +42,32 @@ list(
     "${draco_src_root}/compression/attributes/prediction_schemes/prediction_scheme_normal_octahedron_transform_test.cc"
     "${draco_src_root}/compression/attributes/sequential_integer_attribute_encoding_test.cc"
     "${draco_src_root}/compression/bit_coders/rans_coding_test.cc"
+    "${draco_src_root}/compression/chunked_mesh_encoding_test.cc"
     "${draco_src_root}/compression/decode_test.cc"
     "${draco_src_root}/compression/encode_test.cc"
+    "${draco_src_root}/compression/encoder_option_search_test.cc"
     "${draco_src_root}/compression/entropy/shannon_entropy_test.cc"
     "${draco_src_root}/compression/entropy/symbol_coding_test.cc"
     "${draco_src_root}/compression/mesh/mesh_edgebreaker_encoding_test.cc"
     "${draco_src_root}/compression/mesh/mesh_encoder_test.cc"
+    "${draco_src_root}/compression/point_cloud/algorithms/float_points_tree_decoder_test.cc"
     "${draco_src_root}/compression/point_cloud/point_cloud_kd_tree_encoding_test.cc"
     "${draco_src_root}/compression/point_cloud/point_cloud_sequential_encoding_test.cc"
     "${draco_src_root}/core/buffer_bit_coding_test.cc"
+    "${draco_src_root}/core/deduplication_utils_test.cc"
     "${draco_src_root}/core/math_utils_test.cc"
     "${draco_src_root}/core/quantization_utils_test.cc"
     "${draco_src_root}/core/status_test.cc"
+    "${draco_src_root}/core/thread_pool_test.cc"
     "${draco_src_root}/core/vector_d_test.cc"
+    "${draco_src_root}/io/chunked_file_reader_test.cc"
+    "${draco_src_root}/io/encoded_asset_cache_test.cc"
+    "${draco_src_root}/io/file_decoder_buffer_test.cc"
     "${draco_src_root}/io/file_reader_test_common.h"
     "${draco_src_root}/io/file_utils_test.cc"
     "${draco_src_root}/io/file_writer_utils_test.cc"
+    "${draco_src_root}/io/mmap_file_reader_test.cc"
+    "${draco_src_root}/io/parser_utils_test.cc"
     "${draco_src_root}/io/stdio_file_reader_test.cc"
     "${draco_src_root}/io/stdio_file_writer_test.cc"
     "${draco_src_root}/io/obj_decoder_test.cc"
@@ -70,6 +80,7 @@ list(
     "${draco_src_root}/mesh/corner_table_test.cc"
     "${draco_src_root}/mesh/mesh_are_equivalent_test.cc"
     "${draco_src_root}/mesh/mesh_cleanup_test.cc"
+    "${draco_src_root}/mesh/mesh_spatial_splitter_test.cc"
     "${draco_src_root}/mesh/triangle_soup_mesh_builder_test.cc"
     "${draco_src_root}/metadata/metadata_encoder_test.cc"
     "${draco_src_root}/metadata/metadata_test.cc"
@@ -102,7 +113,10 @@ if(DRACO_TRANSCODER_SUPPORTED)
            "${draco_src_root}/scene/trs_matrix_test.cc"
            "${draco_src_root}/texture/texture_library_test.cc"
            "${draco_src_root}/texture/texture_map_test.cc"
-           "${draco_src_root}/texture/texture_transform_test.cc")
+           "${draco_src_root}/texture/texture_transform_test.cc"
+           "${draco_src_root}/tools/draco_transcoder_lib.cc"
+           "${draco_src_root}/tools/draco_transcoder_lib.h"
+           "${draco_src_root}/tools/draco_transcoder_lib_test.cc")
 
 endif()
 
@@ -116,6 +130,14 @@ macro(draco_setup_test_targets)
 
     list(APPEND draco_test_defines GTEST_HAS_PTHREAD=0)
 
+    if(DRACO_TINY_LIB)
+      # The tiny_lib C interface is compiled into the tests in the same way as
+      # into draco_benchmark.
+      list(APPEND draco_test_sources
+                  "${draco_src_root}/tiny_lib/draco_tiny_lib_test.cc"
+                  ${DRACO_TINY_LIB_sources})
+    endif()
+
     draco_add_library(
       TEST
       NAME draco_test_common
@@ -0,0 +1,446 @@
+# Copyright 2026 The Draco Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Python bindings for the draco_tiny_dec shared library.
+
+Decoded indices and attribute values are returned as NumPy arrays that point
+directly into the memory of the decoded geometry whenever the library can
+expose it, so no copy is made. The native geometry is released once the
+geometry object and every array created from it have been garbage collected.
+
+Example:
+
+    import draco_tiny
+    mesh = draco_tiny.decompress(open('bunny.drc', 'rb').read())
+    positions = mesh.get_attribute_by_type(draco_tiny.POSITION).data
+    faces = mesh.indices
+"""
+
+import ctypes
+import ctypes.util
+import os
+import platform
+import sys
+
+import numpy as np
+
+__all__ = [
+    'DracoError', 'Attribute', 'PointCloud', 'Mesh', 'load_library',
+    'decompress', 'decompress_point_cloud', 'decompress_batch', 'POSITION',
+    'NORMAL', 'COLOR', 'TEX_COORD', 'GENERIC'
+]
+
+# draco::GeometryAttribute::Type
+INVALID = -1
+POSITION = 0
+NORMAL = 1
+COLOR = 2
+TEX_COORD = 3
+GENERIC = 4
+
+# draco::DataType to NumPy dtype.
+_DTYPES = {
+    1: np.int8,
+    2: np.uint8,
+    3: np.int16,
+    4: np.uint16,
+    5: np.int32,
+    6: np.uint32,
+    7: np.int64,
+    8: np.uint64,
+    9: np.float32,
+    10: np.float64,
+    11: np.bool_,
+}
+
+# DecompressReturnCode values of draco_tiny_lib.cc.
+_RETURN_CODE_MESSAGES = {
+    -1: 'Null parameters',
+    -2: 'Unable to parse the geometry type',
+    -3: 'Unable to decode the triangular mesh',
+    -4: 'Unable to decode the point cloud',
+    -5: 'Decoding was cancelled',
+    -1000: 'The data contains a point cloud, use decompress_point_cloud()',
+}
+
+
+class DracoError(Exception):
+    """Raised when the library fails to decode the input data."""
+
+    def __init__(self, return_code):
+        self.return_code = return_code
+        super().__init__('{} (return code {})'.format(
+            _RETURN_CODE_MESSAGES.get(return_code, 'Decoding failed'),
+            return_code))
+
+
+class _Handle(ctypes.Structure):
+    _fields_ = [('internalPtr', ctypes.c_void_p)]
+
+
+class _CompressedData(ctypes.Structure):
+    _fields_ = [('data', ctypes.c_void_p), ('dataSize', ctypes.c_size_t)]
+
+
+_lib = None
+
+
+def _default_library_paths():
+    """Yields the default locations of the library.
+
+    These are the output directory of scripts/build.py, followed by the name of
+    the library built by CMake, which is found on the default search path of
+    the system.
+    """
+    machine = platform.machine().lower()
+    arch = 'arm64' if machine in ('arm64', 'aarch64') else 'x64'
+    # scripts/build.py copies the library without the 'lib' prefix.
+    if sys.platform.startswith('win'):
+        rid, name = 'win-' + arch, 'draco_tiny_dec.dll'
+        system_name = 'draco_tiny_dec.dll'
+    elif sys.platform == 'darwin':
+        rid, name = 'osx-' + arch, 'draco_tiny_dec.dylib'
+        system_name = 'libdraco_tiny_dec.dylib'
+    else:
+        rid, name = 'linux-' + arch, 'draco_tiny_dec.so'
+        system_name = 'libdraco_tiny_dec.so'
+    root = os.path.abspath(
+        os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
+    yield os.path.join(root, 'build', 'OUT', 'runtimes', rid, 'native', name)
+    found_name = ctypes.util.find_library('draco_tiny_dec')
+    if found_name:
+        yield found_name
+    yield system_name
+
+
+def load_library(path=None):
+    """Loads the draco_tiny_dec shared library and declares its functions.
+
+    Args:
+        path: Path of the library. When not set, the DRACO_TINY_DEC_LIBRARY
+            environment variable is used, then the output directory of
+            scripts/build.py and finally the default search path of the system.
+
+    Returns:
+        The loaded ctypes library.
+    """
+    global _lib
+    if path is None and _lib is not None:
+        return _lib
+    if path is None:
+        path = os.environ.get('DRACO_TINY_DEC_LIBRARY')
+    candidates = [path] if path else list(_default_library_paths())
+    error = None
+    lib = None
+    for candidate in candidates:
+        if os.path.isabs(candidate) and not os.path.exists(candidate):
+            continue
+        try:
+            # Calls through ctypes.CDLL release the GIL.
+            lib = ctypes.CDLL(candidate)
+            break
+        except OSError as e:
+            error = e
+    if lib is None:
+        raise OSError('Unable to load draco_tiny_dec from {}: {}'.format(
+            candidates, error))
+
+    handle_p = ctypes.POINTER(_Handle)
+    signatures = {
+        'Draco_Decompress': (ctypes.c_int,
+                             [ctypes.c_void_p, ctypes.c_size_t, handle_p]),
+        'Draco_DecompressPointCloud': (ctypes.c_int, [
+            ctypes.c_void_p, ctypes.c_size_t, handle_p
+        ]),
+        'Draco_DecompressBatch': (ctypes.c_int, [
+            ctypes.POINTER(_CompressedData), ctypes.c_int, ctypes.c_int,
+            handle_p, ctypes.POINTER(ctypes.c_int)
+        ]),
+        'Draco_DecompressedMesh_Release': (None, [_Handle]),
+        'Draco_DecompressedMesh_GetNumFaces': (ctypes.c_uint32, [_Handle]),
+        'Draco_DecompressedMesh_GetNumVertices': (ctypes.c_uint32, [_Handle]),
+        'Draco_DecompressedMesh_GetNumAttributes': (ctypes.c_uint32, [_Handle]),
+        'Draco_DecompressedMesh_GetAttribute': (None, [
+            _Handle, ctypes.c_int, handle_p
+        ]),
+        'Draco_DecompressedMesh_GetIndicesView': (ctypes.c_void_p, [_Handle]),
+        'Draco_DecompressedMesh_CopyIndices': (ctypes.c_int, [
+            _Handle, ctypes.c_void_p, ctypes.c_size_t
+        ]),
+        'Draco_DecompressedPointCloud_Release': (None, [_Handle]),
+        'Draco_DecompressedPointCloud_GetNumVertices': (ctypes.c_uint32,
+                                                        [_Handle]),
+        'Draco_DecompressedPointCloud_GetNumAttributes': (ctypes.c_uint32,
+                                                          [_Handle]),
+        'Draco_DecompressedPointCloud_GetAttribute': (None, [
+            _Handle, ctypes.c_int, handle_p
+        ]),
+        'Draco_Attribute_GetAttributeType': (ctypes.c_int32, [_Handle]),
+        'Draco_Attribute_GetDataType': (ctypes.c_uint32, [_Handle]),
+        'Draco_Attribute_GetNumComponents': (ctypes.c_uint32, [_Handle]),
+        'Draco_Attribute_GetUniqueId': (ctypes.c_uint32, [_Handle]),
+        'Draco_Attribute_GetDataView': (ctypes.c_void_p, [_Handle, _Handle]),
+        'Draco_Attribute_CopyData': (ctypes.c_int, [
+            _Handle, _Handle, ctypes.c_void_p, ctypes.c_size_t
+        ]),
+        'Draco_PointCloudAttribute_GetDataView': (ctypes.c_void_p,
+                                                  [_Handle, _Handle]),
+        'Draco_PointCloudAttribute_CopyData': (ctypes.c_int, [
+            _Handle, _Handle, ctypes.c_void_p, ctypes.c_size_t
+        ]),
+    }
+    for name, (restype, argtypes) in signatures.items():
+        function = getattr(lib, name)
+        function.restype = restype
+        function.argtypes = argtypes
+    if path is None or _lib is None:
+        _lib = lib
+    return lib
+
+
+class _NativeGeometry:
+    """Owns a decoded native geometry and releases it when collected."""
+
+    def __init__(self, lib, handle, release):
+        self._lib = lib
+        self.handle = handle
+        self._release = release
+
+    def __del__(self):
+        if self.handle is not None and self.handle.internalPtr:
+            self._release(self.handle)
+            self.handle = None
+
+
+def _wrap_memory(owner, address, dtype, shape):
+    """Returns a read-only array over |address| that keeps |owner| alive."""
+    dtype = np.dtype(dtype)
+    num_bytes = int(np.prod(shape)) * dtype.itemsize
+    memory = (ctypes.c_char * num_bytes).from_address(address)
+    # The ctypes array is the base of the NumPy array, so the native geometry is
+    # released only after every array referencing it has been collected.
+    memory._owner = owner
+    array = np.frombuffer(memory, dtype=dtype).reshape(shape)
+    array.flags.writeable = False
+    return array
+
+
+class Attribute:
+    """A decoded attribute, e.g. positions or normals of the points."""
+
+    def __init__(self, geometry, handle):
+        self._geometry = geometry
+        self._handle = handle
+        lib = geometry._native._lib
+        self.attribute_type = lib.Draco_Attribute_GetAttributeType(handle)
+        self.unique_id = lib.Draco_Attribute_GetUniqueId(handle)
+        self.num_components = lib.Draco_Attribute_GetNumComponents(handle)
+        self.dtype = np.dtype(_DTYPES[lib.Draco_Attribute_GetDataType(handle)])
+        self._data = None
+
+    @property
+    def data(self):
+        """Values of the attribute for each point.
+
+        The shape of the array is (num_points, num_components). It references
+        the decoded data directly when the data is stored in point order.
+        Otherwise the values are copied into a new array once.
+        """
+        if self._data is None:
+            self._data = self._geometry._attribute_data(self)
+        return self._data
+
+
+class PointCloud:
+    """A decoded point cloud."""
+
+    def __init__(self, native):
+        self._native = native
+        lib = native._lib
+        handle = native.handle
+        self.num_points = self._get_num_points(lib, handle)
+        self.attributes = []
+        for i in range(self._get_num_attributes(lib, handle)):
+            attribute = _Handle()
+            self._get_attribute(lib, handle, i, ctypes.byref(attribute))
+            self.attributes.append(Attribute(self, attribute))
+
+    @staticmethod
+    def _get_num_points(lib, handle):
+        return lib.Draco_DecompressedPointCloud_GetNumVertices(handle)
+
+    @staticmethod
+    def _get_num_attributes(lib, handle):
+        return lib.Draco_DecompressedPointCloud_GetNumAttributes(handle)
+
+    @staticmethod
+    def _get_attribute(lib, handle, index, out):
+        lib.Draco_DecompressedPointCloud_GetAttribute(handle, index, out)
+
+    def _attribute_functions(self):
+        lib = self._native._lib
+        return (lib.Draco_PointCloudAttribute_GetDataView,
+                lib.Draco_PointCloudAttribute_CopyData)
+
+    def _attribute_data(self, attribute):
+        get_view, copy_data = self._attribute_functions()
+        shape = (self.num_points, attribute.num_components)
+        address = get_view(self._native.handle, attribute._handle)
+        if address:
+            return _wrap_memory(self._native, address, attribute.dtype, shape)
+        data = np.empty(shape, dtype=attribute.dtype)
+        if self.num_points > 0:
+            code = copy_data(self._native.handle, attribute._handle,
+                             data.ctypes.data, data.nbytes)
+            if code != 0:
+                raise DracoError(code)
+        return data
+
+    def get_attribute_by_type(self, attribute_type, index=0):
+        """Returns the |index|-th attribute of |attribute_type| or None."""
+        matches = [
+            a for a in self.attributes if a.attribute_type == attribute_type
+        ]
+        return matches[index] if index < len(matches) else None
+
+    def get_attribute_by_unique_id(self, unique_id):
+        """Returns the attribute with |unique_id| or None."""
+        for attribute in self.attributes:
+            if attribute.unique_id == unique_id:
+                return attribute
+        return None
+
+
+class Mesh(PointCloud):
+    """A decoded triangular mesh."""
+
+    def __init__(self, native):
+        super().__init__(native)
+        self.num_faces = native._lib.Draco_DecompressedMesh_GetNumFaces(
+            native.handle)
+        self._indices = None
+
+    @staticmethod
+    def _get_num_points(lib, handle):
+        return lib.Draco_DecompressedMesh_GetNumVertices(handle)
+
+    @staticmethod
+    def _get_num_attributes(lib, handle):
+        return lib.Draco_DecompressedMesh_GetNumAttributes(handle)
+
+    @staticmethod
+    def _get_attribute(lib, handle, index, out):
+        lib.Draco_DecompressedMesh_GetAttribute(handle, index, out)
+
+    def _attribute_functions(self):
+        lib = self._native._lib
+        return lib.Draco_Attribute_GetDataView, lib.Draco_Attribute_CopyData
+
+    @property
+    def indices(self):
+        """Point indices of the triangles as a (num_faces, 3) uint32 array."""
+        if self._indices is None:
+            lib = self._native._lib
+            address = lib.Draco_DecompressedMesh_GetIndicesView(
+                self._native.handle)
+            if address:
+                self._indices = _wrap_memory(self._native, address, np.uint32,
+                                             (self.num_faces, 3))
+            else:
+                self._indices = np.empty((0, 3), dtype=np.uint32)
+        return self._indices
+
+
+def _as_uint8_array(data):
+    """Returns |data| (any bytes-like object) as a NumPy array without copy."""
+    return np.frombuffer(data, dtype=np.uint8)
+
+
+def decompress(data, library=None):
+    """Decodes a Draco compressed triangular mesh.
+
+    Args:
+        data: The compressed data as a bytes-like object.
+        library: Optional library returned by load_library().
+
+    Returns:
+        A Mesh.
+
+    Raises:
+        DracoError: When the data can't be decoded.
+    """
+    lib = library or load_library()
+    buffer = _as_uint8_array(data)
+    handle = _Handle()
+    code = lib.Draco_Decompress(buffer.ctypes.data, buffer.size,
+                                ctypes.byref(handle))
+    if code != 0:
+        raise DracoError(code)
+    return Mesh(
+        _NativeGeometry(lib, handle, lib.Draco_DecompressedMesh_Release))
+
+
+def decompress_point_cloud(data, library=None):
+    """Decodes any Draco compressed geometry as a PointCloud.
+
+    Connectivity of meshes is dropped, only the points and their attributes are
+    kept.
+    """
+    lib = library or load_library()
+    buffer = _as_uint8_array(data)
+    handle = _Handle()
+    code = lib.Draco_DecompressPointCloud(buffer.ctypes.data, buffer.size,
+                                          ctypes.byref(handle))
+    if code != 0:
+        raise DracoError(code)
+    return PointCloud(
+        _NativeGeometry(lib, handle, lib.Draco_DecompressedPointCloud_Release))
+
+
+def decompress_batch(blobs, num_threads=0, library=None):
+    """Decodes many compressed meshes on a pool of native threads.
+
+    The whole batch is decoded by a single library call, which runs without the
+    GIL so other Python threads keep running meanwhile.
+
+    Args:
+        blobs: Sequence of bytes-like objects with compressed meshes.
+        num_threads: Number of decoding threads, 0 uses all hardware threads.
+            Larger values than the number of hardware threads are limited to
+            it.
+        library: Optional library returned by load_library().
+
+    Returns:
+        A list with a Mesh for every successfully decoded input and a DracoError
+        instance for every input that failed to decode.
+    """
+    lib = library or load_library()
+    buffers = [_as_uint8_array(blob) for blob in blobs]
+    count = len(buffers)
+    inputs = (_CompressedData * count)(
+        *[_CompressedData(b.ctypes.data, b.size) for b in buffers])
+    handles = (_Handle * count)()
+    codes = (ctypes.c_int * count)()
+    code = lib.Draco_DecompressBatch(inputs, count, num_threads, handles, codes)
+    if code != 0:
+        raise DracoError(code)
+    results = []
+    for i in range(count):
+        if codes[i] != 0:
+            results.append(DracoError(codes[i]))
+            continue
+        handle = _Handle(handles[i].internalPtr)
+        results.append(
+            Mesh(_NativeGeometry(lib, handle,
+                                 lib.Draco_DecompressedMesh_Release)))
+    return results
@@ -0,0 +1,154 @@
+# Copyright 2026 The Draco Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the 'License');
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an 'AS IS' BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the draco_tiny package.
+
+The tests need the draco_tiny_dec shared library, see README.md. They are
+skipped when the library can't be loaded.
+"""
+
+import gc
+import os
+
+import numpy as np
+import pytest
+
+import draco_tiny
+
+_TESTDATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             os.pardir, 'testdata')
+
+try:
+    draco_tiny.load_library()
+except OSError as e:
+    pytest.skip('draco_tiny_dec is not available: {}'.format(e),
+                allow_module_level=True)
+
+
+def _read_test_file(name):
+    with open(os.path.join(_TESTDATA_DIR, name), 'rb') as f:
+        return f.read()
+
+
+@pytest.fixture
+def mesh_data():
+    return _read_test_file('test_nm.obj.edgebreaker.cl4.2.2.drc')
+
+
+@pytest.fixture
+def sequential_mesh_data():
+    # The sequential encoding keeps the attribute values in point order, so
+    # the attributes can be exposed without copying them.
+    return _read_test_file('test_nm.obj.sequential.cl3.2.2.drc')
+
+
+@pytest.fixture
+def point_cloud_data():
+    return _read_test_file('pc_kd_color.drc')
+
+
+def test_decompress(mesh_data):
+    mesh = draco_tiny.decompress(mesh_data)
+    assert mesh.num_faces > 0
+    assert mesh.num_points > 0
+    assert mesh.indices.shape == (mesh.num_faces, 3)
+    assert mesh.indices.dtype == np.uint32
+    assert mesh.indices.max() < mesh.num_points
+
+    positions = mesh.get_attribute_by_type(draco_tiny.POSITION)
+    assert positions is not None
+    assert positions.data.shape == (mesh.num_points, 3)
+    assert positions.data.dtype == np.float32
+    assert mesh.get_attribute_by_unique_id(positions.unique_id) is positions
+    assert mesh.get_attribute_by_type(draco_tiny.POSITION, 1) is None
+
+
+def test_decompress_invalid_data(mesh_data):
+    with pytest.raises(draco_tiny.DracoError):
+        draco_tiny.decompress(b'not a draco file')
+    with pytest.raises(draco_tiny.DracoError):
+        draco_tiny.decompress(mesh_data[:len(mesh_data) // 2])
+
+
+def test_decompress_reports_point_clouds(point_cloud_data):
+    with pytest.raises(draco_tiny.DracoError) as error:
+        draco_tiny.decompress(point_cloud_data)
+    assert error.value.return_code == -1000
+
+
+def test_decompress_point_cloud(point_cloud_data, mesh_data):
+    pc = draco_tiny.decompress_point_cloud(point_cloud_data)
+    assert pc.num_points > 0
+    assert not isinstance(pc, draco_tiny.Mesh)
+    positions = pc.get_attribute_by_type(draco_tiny.POSITION)
+    assert positions.data.shape == (pc.num_points, 3)
+    colors = pc.get_attribute_by_type(draco_tiny.COLOR)
+    assert colors is not None
+    assert colors.data.shape[0] == pc.num_points
+
+    # Meshes can be decoded as point clouds as well.
+    mesh = draco_tiny.decompress(mesh_data)
+    mesh_pc = draco_tiny.decompress_point_cloud(mesh_data)
+    assert mesh_pc.num_points == mesh.num_points
+    np.testing.assert_array_equal(
+        mesh_pc.get_attribute_by_type(draco_tiny.POSITION).data,
+        mesh.get_attribute_by_type(draco_tiny.POSITION).data)
+
+    with pytest.raises(draco_tiny.DracoError):
+        draco_tiny.decompress_point_cloud(b'not a draco file')
+
+
+def test_arrays_are_read_only_views(sequential_mesh_data):
+    mesh = draco_tiny.decompress(sequential_mesh_data)
+    indices = mesh.indices
+    positions = mesh.get_attribute_by_type(draco_tiny.POSITION).data
+    for array in (indices, positions):
+        assert not array.flags.writeable
+        assert not array.flags.owndata
+        with pytest.raises(ValueError):
+            array[0, 0] = 0
+    # The same views are returned on every access.
+    assert mesh.indices is indices
+
+    # The arrays keep the decoded geometry alive.
+    expected_indices = indices.copy()
+    expected_positions = positions.copy()
+    del mesh
+    gc.collect()
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_array_equal(positions, expected_positions)
+
+
+def test_attributes_not_in_point_order_are_copied(mesh_data):
+    mesh = draco_tiny.decompress(mesh_data)
+    positions = mesh.get_attribute_by_type(draco_tiny.POSITION).data
+    assert positions.flags.owndata
+    assert mesh.get_attribute_by_type(draco_tiny.POSITION).data is positions
+    # Indices are always exposed without a copy.
+    assert not mesh.indices.flags.owndata
+
+
+def test_decompress_batch(mesh_data, point_cloud_data):
+    blobs = [mesh_data, b'not a draco file', mesh_data, point_cloud_data]
+    results = draco_tiny.decompress_batch(blobs, num_threads=2)
+    assert len(results) == len(blobs)
+    expected = draco_tiny.decompress(mesh_data)
+    for i in (0, 2):
+        assert isinstance(results[i], draco_tiny.Mesh)
+        assert results[i].num_faces == expected.num_faces
+        np.testing.assert_array_equal(results[i].indices, expected.indices)
+    assert isinstance(results[1], draco_tiny.DracoError)
+    assert isinstance(results[3], draco_tiny.DracoError)
+    assert results[3].return_code == -1000
+
+    assert draco_tiny.decompress_batch([]) == []
@@ -4,6 +4,10 @@ import subprocess
 import argparse
 import shutil
 import platform
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 abspath = os.path.abspath
 
@@ -15,10 +19,126 @@ archTransltionStr = {"Win32":"x86", "x64":"x64", "ARM":"arm", "ARM64":"arm64"}
 def rel_path(path):
     return abspath(os.path.join(os.path.dirname(__file__), f"../{path}"))
 
+# Files and folders whose content determines the result of all builds.
+buildInputs = ["CMakeLists.txt", "cmake", "src", "scripts/build.py"]
+
+def compute_sources_hash():
+    sha = hashlib.sha256()
+    for buildInput in buildInputs:
+        inputPath = Path(rel_path(buildInput))
+        files = [inputPath] if inputPath.is_file() else sorted(p for p in inputPath.rglob("*") if p.is_file())
+        for file in files:
+            sha.update(file.relative_to(rel_path("")).as_posix().encode())
+            sha.update(file.read_bytes())
+    return sha.hexdigest()
+
+class BuildError(Exception):
+    pass
+
+class BuildCancelled(Exception):
+    pass
+
+# One target of the build matrix. Runs the commands of the target, writes
+# their output to a log file and keeps track of the build stamp used to skip
+# targets whose inputs did not change since their last successful build.
+class BuildJob:
+    def __init__(self, name, func, *func_args):
+        self.name = name
+        self.func = func
+        self.func_args = func_args
+        self.status = "pending"
+        self.seconds = 0.0
+        self.error = ""
+        self.logPath = rel_path(f"build/logs/{name}.log")
+        self._log = None
+        self._process = None
+        self._lock = threading.Lock()
+        self._cancelled = False
+
+    def execute(self):
+        os.makedirs(os.path.dirname(self.logPath), exist_ok=True)
+        start = time.time()
+        try:
+            with open(self.logPath, "w") as self._log:
+                self.status = "running"
+                self.func(self, *self.func_args)
+                if self.status == "running":
+                    self.status = "built"
+        except BuildCancelled:
+            self.status = "cancelled"
+        except Exception as e:
+            self.status = "failed"
+            self.error = str(e)
+            raise
+        finally:
+            self._log = None
+            self.seconds = time.time() - start
+
+    def print(self, message):
+        print(f"[{self.name}] {message}", flush=True)
+        if self._log:
+            self._log.write(f"{message}\n")
+
+    def run(self, cmd, **kwargs):
+        with self._lock:
+            if self._cancelled:
+                raise BuildCancelled()
+            self._log.write(f"$ {' '.join(str(c) for c in cmd)}\n")
+            self._log.flush()
+            output = None if verbose else self._log
+            try:
+                self._process = subprocess.Popen(cmd, stdout=output, stderr=subprocess.STDOUT if output else None, **kwargs)
+            except OSError as e:
+                raise BuildError(f"failed to run {cmd[0]}: {e}")
+        returncode = self._process.wait()
+        with self._lock:
+            self._process = None
+            if self._cancelled:
+                raise BuildCancelled()
+        if returncode != 0:
+            raise BuildError(f"{os.path.basename(str(cmd[0]))} exited with code {returncode}, see {self.logPath}")
+
+    def cancel(self):
+        with self._lock:
+            self._cancelled = True
+            if self._process:
+                self._process.terminate()
+
+    def configure_and_build(self, compilePath, cmake_cmd, build_cmd, outputs, env=None):
+        # Returns False when the target is up to date and nothing was built.
+        # |env| replaces the environment of the commands when it is set.
+        if compilerLauncher:
+            cmake_cmd = cmake_cmd + [
+                f"-DCMAKE_C_COMPILER_LAUNCHER={compilerLauncher}",
+                f"-DCMAKE_CXX_COMPILER_LAUNCHER={compilerLauncher}",
+            ]
+        build_cmd = build_cmd + ["--parallel", str(buildThreads)]
+        key = hashlib.sha256("\n".join([sourcesHash] + cmake_cmd).encode()).hexdigest()
+        self._stampPath = os.path.join(compilePath, ".draco_build_stamp")
+        self._stampKey = key
+        if not forceBuild and os.path.isfile(self._stampPath) and all(os.path.isfile(o) for o in outputs):
+            with open(self._stampPath) as f:
+                if f.read() == key:
+                    self.print("Up to date, skipping.")
+                    self.status = "skipped"
+                    return False
+        if os.path.isfile(self._stampPath):
+            os.remove(self._stampPath)
+        self.run(cmake_cmd, env=env)
+        self.run(build_cmd, env=env)
+        return True
+
+    def mark_done(self):
+        # Must be called after the outputs of the target were copied.
+        with open(self._stampPath, "w") as f:
+            f.write(self._stampKey)
+
 # --- Windows ---
-def build_windows(arch):
-    print(f"Building for Windows {arch}...\n")
+def build_windows(job, arch):
+    job.print(f"Building for Windows {arch}...")
     compilePath = rel_path(f"build/windows/{arch}")
+    archStr = archTransltionStr[arch]
+    dstPath = rel_path(f"build/OUT/runtimes/win-{archStr}/native/draco_tiny_dec.dll")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -26,27 +146,21 @@ def build_windows(arch):
         "-DDRACO_TINY_LIB_SHARED=ON",
         "-A", arch
     ]
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-
     build_cmd = ["cmake", "--build", compilePath, "--config", "Release",]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
 
-    archStr = archTransltionStr[arch]
-
     srcPath = os.path.join(compilePath, "Release/draco_tiny_dec.dll")
-    dstPath = rel_path(f"build/OUT/runtimes/win-{archStr}/native/draco_tiny_dec.dll")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
 
 # --- MacOS ---
-def build_mac():
-    print("Building for Mac...\n")
+def build_mac(job):
+    job.print("Building for Mac...")
     arch = "x64" if platform.machine() == "x86_64" else "arm64"
     compilePath = rel_path(f"build/mac/{arch}")
+    dstPath = rel_path(f"build/OUT/runtimes/osx-{arch}/native/draco_tiny_dec.dylib")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -54,33 +168,28 @@ def build_mac():
         "-DDRACO_TINY_LIB_SHARED=ON",
         "-DCMAKE_BUILD_TYPE=Release",
     ]
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-    
     build_cmd = ["cmake", "--build", compilePath, ]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
-    
+
     srcPath = os.path.join(compilePath, "libdraco_tiny_dec.dylib")
-    dstPath = f"build/OUT/runtimes/osx-{arch}/native/draco_tiny_dec.dylib"
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
 
 # --- IOS ---
-def build_ios_arm64(ios_platform):
+def build_ios_arm64(job, ios_platform):
     ios_platforms = {
         "OS64" : "ios-arm64",
         "SIMULATORARM64": "iossimulator-arm64",
     }
     if not ios_platform in ios_platforms.keys():
-        print(f"Invalid iOS platform({ios_platform}). Valid values are {ios_platforms.keys()}")
-        return
+        raise BuildError(f"Invalid iOS platform({ios_platform}). Valid values are {ios_platforms.keys()}")
     runtimesFolderName = ios_platforms[ios_platform]
 
-    print(f"Building for {runtimesFolderName} ...\n")
+    job.print(f"Building for {runtimesFolderName} ...")
     compilePath = rel_path(f"build/{runtimesFolderName}")
+    dstPath = rel_path(f"build/OUT/runtimes/{runtimesFolderName}/native/libdraco_tiny_dec.a")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -91,37 +200,30 @@ def build_ios_arm64(ios_platform):
         "-DDRACO_TINY_LIB_SHARED=OFF",
         "-DCMAKE_BUILD_TYPE=Release",
     ]
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-    
     build_cmd = ["cmake", "--build", compilePath, "--config", "Release"]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
-    
 
     # amalgamete static library
-    compilePath = os.path.join(compilePath,
+    libPath = os.path.join(compilePath,
         f"Release-iphoneos" if ios_platform == "OS64" else "Release-iphonesimulator")
-    dracoPath = os.path.join(compilePath, "libdraco.a")
-    tinyDecPath = os.path.join(compilePath, "libdraco_tiny_dec.a")
-    amalgamatedPath = os.path.join(compilePath, "libdraco_tiny_dec_amalgamated.a")
+    dracoPath = os.path.join(libPath, "libdraco.a")
+    tinyDecPath = os.path.join(libPath, "libdraco_tiny_dec.a")
+    amalgamatedPath = os.path.join(libPath, "libdraco_tiny_dec_amalgamated.a")
     amalgamate_cmd = ["libtool", "-static", "-o", amalgamatedPath, tinyDecPath, dracoPath]
-    result = subprocess.run(amalgamate_cmd)
-    if result.returncode != 0:
-        print("Failed to amalgamate the static libraries.")
-        return
+    job.run(amalgamate_cmd)
 
     # copy to OUT folder
-    dstPath = rel_path(f"build/OUT/runtimes/{runtimesFolderName}/native/libdraco_tiny_dec.a")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(amalgamatedPath, dstPath)
+    job.mark_done()
 
 # --- UWP ---
-def build_uwp(arch):
-    print(f"Building for UWP {arch}...\n")
+def build_uwp(job, arch):
+    job.print(f"Building for UWP {arch}...")
     compilePath = rel_path(f"build/uwp/{arch}")
+    archStr = archTransltionStr[arch]
+    dstPath = rel_path(f"build/OUT/runtimes/win-{archStr}/nativeassets/uap10.0/draco_tiny_dec.dll")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -135,34 +237,31 @@ def build_uwp(arch):
             # I discovered this flag in Evergine's Bullet project
         "-A", arch
     ]
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-    
     build_cmd = ["cmake", "--build", compilePath, "--config", "Release", ]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
-    
-    archStr = archTransltionStr[arch]
 
     srcPath = os.path.join(compilePath, "Release/draco_tiny_dec.dll")
-    dstPath = rel_path(f"build/OUT/runtimes/win-{archStr}/nativeassets/uap10.0/draco_tiny_dec.dll")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
 
 # --- Wasm ---
-def build_wasm(EmscriptenSDKPath):
-    print("Building for WebAssembly...\n")
+def build_wasm(job, EmscriptenSDKPath):
+    job.print("Building for WebAssembly...")
+    # Jobs run in parallel, so the environment of this target is kept in a
+    # copy instead of being set for the whole process.
+    env = os.environ.copy()
+    env["EMSCRIPTEN"] = abspath(os.path.join(EmscriptenSDKPath, "upstream", "emscripten"))
     emsdk_env = os.path.abspath(os.path.join(EmscriptenSDKPath, "emsdk_env.bat"))
-    subprocess.run([emsdk_env])
-    os.environ["EMSCRIPTEN"] = abspath(os.path.join(EmscriptenSDKPath, "upstream", "emscripten"))
+    job.run([emsdk_env], env=env)
 
     toolchainFile = abspath(f"{EmscriptenSDKPath}/upstream/emscripten/cmake/Modules/Platform/Emscripten.cmake")
     nodeDir = abspath(f"{EmscriptenSDKPath}/node")
     nodeVersion = os.listdir(nodeDir)[0]
     crosscompilingEmulator = os.path.join(nodeDir, nodeVersion, "/bin/node.exe")
     compilePath = rel_path("build/wasm")
+    dstPath = rel_path("build/OUT/runtimes/browser-wasm/native/draco_tiny_dec.a")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -177,25 +276,21 @@ def build_wasm(EmscriptenSDKPath):
     if ninjaExePath:
         ninjaExePath_absolute = abspath(ninjaExePath)
         cmake_cmd.append(f"-DCMAKE_MAKE_PROGRAM={ninjaExePath_absolute}")
-        
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
 
     build_cmd = ["cmake", "--build", compilePath]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath], env=env):
         return
-    
+
     srcPath = abspath(os.path.join(compilePath, "libdraco_tiny_dec.a"))
-    dstPath = rel_path("build/OUT/runtimes/browser-wasm/native/draco_tiny_dec.a")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
 
 # --- Android ---
-def build_android(AndroidNDKPath, abi, abiFolder):
-    print(f"Building for Android {abi}...\n")
+def build_android(job, AndroidNDKPath, abi, abiFolder):
+    job.print(f"Building for Android {abi}...")
     compilePath = rel_path(f"build/android/{abiFolder}")
+    dstPath = rel_path(f"build/OUT/runtimes/android-{abiFolder}/native/draco_tiny_dec.so")
     toolchainFile = abspath(os.path.join(AndroidNDKPath, "build/cmake/android.toolchain.cmake"))
     cmake_cmd = [
         "cmake", ".",
@@ -216,13 +311,8 @@ def build_android(AndroidNDKPath, abi, abiFolder):
         ninjaExePath_absolute = abspath(ninjaExePath)
         cmake_cmd.append(f"-DCMAKE_MAKE_PROGRAM={ninjaExePath_absolute}")
 
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-
     build_cmd = ["cmake", "--build", compilePath]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
 
     llvm_strip = abspath(os.path.join(AndroidNDKPath, "toolchains/llvm/prebuilt/windows-x86_64/bin/llvm-strip"))
@@ -230,19 +320,19 @@ def build_android(AndroidNDKPath, abi, abiFolder):
         llvm_strip,
         "-s", os.path.join(compilePath, "libdraco_tiny_dec.so")
     ]
-    result = subprocess.run(strip_cmd)
-    if result.returncode != 0:
-        return
-    
+    job.run(strip_cmd)
+
     srcPath = abspath(os.path.join(compilePath, "libdraco_tiny_dec.so"))
-    dstPath = rel_path(f"build/OUT/runtimes/android-{abiFolder}/native/draco_tiny_dec.so")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
 
 # --- Linux ---
-def build_linux(arch):
-    print(f"Building for Linux {arch}...\n")
+def build_linux(job, arch):
+    job.print(f"Building for Linux {arch}...")
     compilePath = rel_path(f"build/linux/{arch}")
+    archStr = archTransltionStr[arch]
+    dstPath = rel_path(f"build/OUT/runtimes/linux-{archStr}/native/draco_tiny_dec.so")
     cmake_cmd = [
         "cmake",
         "-B", compilePath,
@@ -258,58 +348,105 @@ def build_linux(arch):
             "-DCMAKE_CXX_COMPILER=aarch64-linux-gnu-g++",
         ]
 
-    result = subprocess.run(cmake_cmd)
-    if result.returncode != 0:
-        return
-    
     build_cmd = ["cmake", "--build", compilePath, "--config", "Release",]
-    result = subprocess.run(build_cmd)
-    if result.returncode != 0:
+    if not job.configure_and_build(compilePath, cmake_cmd, build_cmd, [dstPath]):
         return
-    
-    archStr = archTransltionStr[arch]
 
     srcPath = os.path.join(compilePath, "libdraco_tiny_dec.so")
-    dstPath = rel_path(f"build/OUT/runtimes/linux-{archStr}/native/draco_tiny_dec.so")
     os.makedirs(os.path.dirname(dstPath), exist_ok=True)
     shutil.copy2(srcPath, dstPath)
+    job.mark_done()
+
+# Runs |jobs| with at most |numJobs| of them at the same time. Stops all jobs as
+# soon as one of them fails and prints a summary. Returns True on success.
+def run_jobs(jobs, numJobs):
+    failed = False
+    with ThreadPoolExecutor(max_workers=numJobs) as executor:
+        futures = {executor.submit(job.execute): job for job in jobs}
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            if future.exception() and not failed:
+                failed = True
+                job = futures[future]
+                job.print(f"FAILED: {job.error}")
+                for other in jobs:
+                    other.cancel()
+                for other in futures:
+                    other.cancel()
+
+    print("\nBuild summary:")
+    for job in jobs:
+        status = job.status if job.status != "pending" else "cancelled"
+        print(f"  {job.name:<28} {status:<10} {job.seconds:7.1f}s")
+        if job.status == "failed":
+            print(f"    {job.error}")
+            if not verbose and os.path.isfile(job.logPath):
+                with open(job.logPath) as f:
+                    for line in f.readlines()[-20:]:
+                        print(f"    | {line.rstrip()}")
+    return not failed
 
 parser = argparse.ArgumentParser()
-parser.add_argument("-v", "--verbose", action="store_true")
+parser.add_argument("-v", "--verbose", action="store_true", help = "Print the output of the build commands instead of writing it to build/logs")
 parser.add_argument("--emscripten_sdk", help = "Path to the Emscripten SDK install dir")
 parser.add_argument("--android_ndk", help = "Path to the Android NDK install dir")
 parser.add_argument("--ninja_path", help = "Path to the ninja executable")
 parser.add_argument("--ios", action="store_true", help = "Build for iOS arm64")
+parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1, help = "Total number of parallel compile jobs shared by all targets")
+parser.add_argument("--max_targets", type=int, default=4, help = "Maximum number of targets built at the same time")
+parser.add_argument("--force", action="store_true", help = "Rebuild targets even if their inputs did not change")
+parser.add_argument("--no_compiler_cache", action="store_true", help = "Don't use ccache or sccache even if they are available")
 args = parser.parse_args()
 
 ninjaExePath = args.ninja_path
+verbose = args.verbose
+forceBuild = args.force
+compilerLauncher = None
+if not args.no_compiler_cache:
+    compilerLauncher = shutil.which("sccache") or shutil.which("ccache")
 
+jobs = []
 if os.name == 'nt':
-    build_windows("Win32")
-    build_windows("x64")
+    jobs.append(BuildJob("windows-x86", build_windows, "Win32"))
+    jobs.append(BuildJob("windows-x64", build_windows, "x64"))
 elif platform.system() == 'Darwin':
-    build_mac()
+    jobs.append(BuildJob("mac", build_mac))
     if args.ios:
-        build_ios_arm64("OS64")
-        build_ios_arm64("SIMULATORARM64")
+        jobs.append(BuildJob("ios-arm64", build_ios_arm64, "OS64"))
+        jobs.append(BuildJob("iossimulator-arm64", build_ios_arm64, "SIMULATORARM64"))
 elif platform.system() == 'Linux':
-    build_linux("x64")
-    build_linux("ARM64")
+    jobs.append(BuildJob("linux-x64", build_linux, "x64"))
+    jobs.append(BuildJob("linux-arm64", build_linux, "ARM64"))
 
-#build_uwp("Win32")
-#build_uwp("x64")
-#build_uwp("ARM")
-#build_uwp("ARM64")
+#jobs.append(BuildJob("uwp-x86", build_uwp, "Win32"))
+#jobs.append(BuildJob("uwp-x64", build_uwp, "x64"))
+#jobs.append(BuildJob("uwp-arm", build_uwp, "ARM"))
+#jobs.append(BuildJob("uwp-arm64", build_uwp, "ARM64"))
 
 if args.emscripten_sdk:
-    build_wasm(args.emscripten_sdk)
+    jobs.append(BuildJob("browser-wasm", build_wasm, args.emscripten_sdk))
 
 if args.android_ndk:
     if not "JAVA_HOME" in os.environ:
         java_path = abspath("openjdk/bin")
         os.environ["JAVA_HOME"] = java_path
         os.environ["PATH"] = f"{java_path};{os.environ['PATH']}"
-    build_android(args.android_ndk, "arm64-v8a", "arm64")
-    build_android(args.android_ndk, "armeabi-v7a", "arm")
-    build_android(args.android_ndk, "x86", "x86")
-    build_android(args.android_ndk, "x86_64", "x64")
\ No newline at end of file
+    jobs.append(BuildJob("android-arm64", build_android, args.android_ndk, "arm64-v8a", "arm64"))
+    jobs.append(BuildJob("android-arm", build_android, args.android_ndk, "armeabi-v7a", "arm"))
+    jobs.append(BuildJob("android-x86", build_android, args.android_ndk, "x86", "x86"))
+    jobs.append(BuildJob("android-x64", build_android, args.android_ndk, "x86_64", "x64"))
+
+if not jobs:
+    print("Nothing to build.")
+    sys.exit(0)
+
+# Split the compile job budget between the targets that run at the same time.
+numTargets = max(1, min(args.max_targets, len(jobs), args.jobs))
+buildThreads = max(1, args.jobs // numTargets)
+sourcesHash = compute_sources_hash()
+print(f"Building {len(jobs)} targets, {numTargets} at a time with {buildThreads} compile jobs each"
+      + (f", using {os.path.basename(compilerLauncher)}" if compilerLauncher else "") + ".\n", flush=True)
+
+if not run_jobs(jobs, numTargets):
+    sys.exit(1)
@@ -56,25 +56,22 @@ bool AttributeOctahedronTransform::InverseTransformAttribute(
   if (num_components != 3) {
     return false;
   }
-  constexpr int kEntrySize = sizeof(float) * 3;
-  float att_val[3];
-  const int32_t *source_attribute_data = reinterpret_cast<const int32_t *>(
-      attribute.GetAddress(AttributeValueIndex(0)));
-  uint8_t *target_address =
-      target_attribute->GetAddress(AttributeValueIndex(0));
   OctahedronToolBox octahedron_tool_box;
   if (!octahedron_tool_box.SetQuantizationBits(quantization_bits_)) {
     return false;
   }
-  for (uint32_t i = 0; i < num_points; ++i) {
-    const int32_t s = *source_attribute_data++;
-    const int32_t t = *source_attribute_data++;
-    octahedron_tool_box.QuantizedOctahedralCoordsToUnitVector(s, t, att_val);
-
-    // Store the decoded floating point values into the attribute buffer.
-    std::memcpy(target_address, att_val, kEntrySize);
-    target_address += kEntrySize;
+  if (num_points == 0) {
+    return true;
   }
+  const int32_t *const source_attribute_data =
+      reinterpret_cast<const int32_t *>(
+          attribute.GetAddress(AttributeValueIndex(0)));
+  // Store the decoded floating point values directly into the attribute
+  // buffer.
+  float *const target_attribute_data = reinterpret_cast<float *>(
+      target_attribute->GetAddress(AttributeValueIndex(0)));
+  octahedron_tool_box.QuantizedOctahedralCoordsToUnitVectors(
+      source_attribute_data, num_points, target_attribute_data);
   return true;
 }
 
@@ -78,31 +78,26 @@ bool AttributeQuantizationTransform::InverseTransformAttribute(
   const int32_t max_quantized_value =
       (1u << static_cast<uint32_t>(quantization_bits_)) - 1;
   const int num_components = target_attribute->num_components();
-  const int entry_size = sizeof(float) * num_components;
-  const std::unique_ptr<float[]> att_val(new float[num_components]);
-  int quant_val_id = 0;
-  int out_byte_pos = 0;
   Dequantizer dequantizer;
   if (!dequantizer.Init(range_, max_quantized_value)) {
     return false;
   }
+  if (min_values_.size() < static_cast<size_t>(num_components)) {
+    return false;
+  }
+  const int num_values = target_attribute->size();
+  if (num_values == 0) {
+    return true;
+  }
   const int32_t *const source_attribute_data =
       reinterpret_cast<const int32_t *>(
           attribute.GetAddress(AttributeValueIndex(0)));
-
-  const int num_values = target_attribute->size();
-
-  for (uint32_t i = 0; i < num_values; ++i) {
-    for (int c = 0; c < num_components; ++c) {
-      float value =
-          dequantizer.DequantizeFloat(source_attribute_data[quant_val_id++]);
-      value = value + min_values_[c];
-      att_val[c] = value;
-    }
-    // Store the floating point value into the attribute buffer.
-    target_attribute->buffer()->Write(out_byte_pos, att_val.get(), entry_size);
-    out_byte_pos += entry_size;
-  }
+  // Store the floating point values directly into the attribute buffer.
+  float *const target_attribute_data = reinterpret_cast<float *>(
+      target_attribute->GetAddress(AttributeValueIndex(0)));
+  dequantizer.DequantizeFloats(source_attribute_data, num_values,
+                               num_components, min_values_.data(),
+                               target_attribute_data);
   return true;
 }
 
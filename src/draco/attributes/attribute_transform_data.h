@@ -55,6 +55,9 @@ class AttributeTransformData {
     buffer_.Write(byte_offset, &in_data, sizeof(DataTypeT));
   }
 
+  // Returns the buffer storing all parameter values.
+  const DataBuffer *buffer() const { return &buffer_; }
+
   // Sets a parameter value at the end of the |buffer_|.
   template <typename DataTypeT>
   void AppendParameterValue(const DataTypeT &in_data) {
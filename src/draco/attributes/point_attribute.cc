@@ -14,13 +14,9 @@
 //
 #include "draco/attributes/point_attribute.h"
 
-#include <tuple>
-#include <unordered_map>
-using std::unordered_map;
+#include <vector>
 
-// Shortcut for typed conditionals.
-template <bool B, class T, class F>
-using conditional_t = typename std::conditional<B, T, F>::type;
+#include "draco/core/deduplication_utils.h"
 
 namespace draco {
 
@@ -89,121 +85,51 @@ AttributeValueIndex::ValueType PointAttribute::DeduplicateValues(
 }
 
 AttributeValueIndex::ValueType PointAttribute::DeduplicateValues(
-    const GeometryAttribute &in_att, AttributeValueIndex in_att_offset) {
-  AttributeValueIndex::ValueType unique_vals = 0;
+    const GeometryAttribute &in_att, AttributeValueIndex in_att_offset,
+    int num_threads) {
   switch (in_att.data_type()) {
-    // Currently we support only float, uint8, and uint16 arguments.
+    // Currently we support only float and integer attributes of up to 32 bits.
     case DT_FLOAT32:
-      unique_vals = DeduplicateTypedValues<float>(in_att, in_att_offset);
-      break;
     case DT_INT8:
-      unique_vals = DeduplicateTypedValues<int8_t>(in_att, in_att_offset);
-      break;
     case DT_UINT8:
     case DT_BOOL:
-      unique_vals = DeduplicateTypedValues<uint8_t>(in_att, in_att_offset);
-      break;
     case DT_UINT16:
-      unique_vals = DeduplicateTypedValues<uint16_t>(in_att, in_att_offset);
-      break;
     case DT_INT16:
-      unique_vals = DeduplicateTypedValues<int16_t>(in_att, in_att_offset);
-      break;
     case DT_UINT32:
-      unique_vals = DeduplicateTypedValues<uint32_t>(in_att, in_att_offset);
-      break;
     case DT_INT32:
-      unique_vals = DeduplicateTypedValues<int32_t>(in_att, in_att_offset);
       break;
     default:
       return -1;  // Unsupported data type.
   }
-  if (unique_vals == 0) {
-    return -1;  // Unexpected error.
-  }
-  return unique_vals;
-}
-
-// Helper function for calling UnifyDuplicateAttributes<T,num_components_t>
-// with the correct template arguments.
-// Returns the number of unique attribute values.
-template <typename T>
-AttributeValueIndex::ValueType PointAttribute::DeduplicateTypedValues(
-    const GeometryAttribute &in_att, AttributeValueIndex in_att_offset) {
-  // Select the correct method to call based on the number of attribute
-  // components.
-  switch (in_att.num_components()) {
-    case 1:
-      return DeduplicateFormattedValues<T, 1>(in_att, in_att_offset);
-    case 2:
-      return DeduplicateFormattedValues<T, 2>(in_att, in_att_offset);
-    case 3:
-      return DeduplicateFormattedValues<T, 3>(in_att, in_att_offset);
-    case 4:
-      return DeduplicateFormattedValues<T, 4>(in_att, in_att_offset);
-    default:
-      return 0;
-  }
-}
-
-template <typename T, int num_components_t>
-AttributeValueIndex::ValueType PointAttribute::DeduplicateFormattedValues(
-    const GeometryAttribute &in_att, AttributeValueIndex in_att_offset) {
-  // We want to detect duplicates using a hash map but we cannot hash floating
-  // point numbers directly so bit-copy floats to the same sized integers and
-  // hash them.
-
-  // First we need to determine which int type to use (1, 2, 4 or 8 bytes).
-  // Note, this is done at compile time using std::conditional struct.
-  // Conditional is in form <bool-expression, true, false>. If bool-expression
-  // is true the "true" branch is used and vice versa. All at compile time.
-  typedef conditional_t<sizeof(T) == 1, uint8_t,
-                        conditional_t<sizeof(T) == 2, uint16_t,
-                                      conditional_t<sizeof(T) == 4, uint32_t,
-                                                    /*else*/ uint64_t>>>
-      HashType;
-
-  AttributeValueIndex unique_vals(0);
-  typedef std::array<T, num_components_t> AttributeValue;
-  typedef std::array<HashType, num_components_t> AttributeHashableValue;
-  typedef unordered_map<AttributeHashableValue, AttributeValueIndex,
-                        HashArray<AttributeHashableValue>>
-      ValueToIndexMap;
-
-  // Hash map storing index of the first attribute with a given value.
-  ValueToIndexMap value_to_index_map;
-  AttributeValue att_value;
-  AttributeHashableValue hashable_value;
-  IndexTypeVector<AttributeValueIndex, AttributeValueIndex> value_map(
-      num_unique_entries_);
-  for (AttributeValueIndex i(0); i < num_unique_entries_; ++i) {
-    const AttributeValueIndex att_pos = i + in_att_offset;
-    att_value = in_att.GetValue<T, num_components_t>(att_pos);
-    // Convert the value to hashable type. Bit-copy real attributes to integers.
-    memcpy(&(hashable_value[0]), &(att_value[0]), sizeof(att_value));
-
-    typename ValueToIndexMap::iterator it;
-    bool inserted;
-    std::tie(it, inserted) = value_to_index_map.insert(
-        std::pair<AttributeHashableValue, AttributeValueIndex>(hashable_value,
-                                                               unique_vals));
-
-    // Try to update the hash map with a new entry pointing to the latest unique
-    // vertex index.
-    if (!inserted) {
-      // Duplicated value found. Update index mapping.
-      value_map[i] = it->second;
-    } else {
-      // New unique value.
-      SetAttributeValue(unique_vals, &att_value);
-      // Update index mapping.
-      value_map[i] = unique_vals;
-
-      ++unique_vals;
+  if (in_att.num_components() < 1 || in_att.num_components() > 4) {
+    return -1;
+  }
+  if (num_unique_entries_ == 0) {
+    return -1;  // Empty attributes are reported as an error.
+  }
+
+  // Values are compared as raw bytes, so floating point values are duplicates
+  // only when they have the same bit pattern.
+  const int value_size =
+      DataTypeLength(in_att.data_type()) * in_att.num_components();
+  std::vector<uint32_t> value_ids;
+  std::vector<uint32_t> unique_values;
+  const uint32_t num_unique_values = DeduplicateRecords(
+      in_att.GetAddress(in_att_offset), in_att.byte_stride(), value_size,
+      num_unique_entries_, num_threads, &value_ids, &unique_values);
+
+  // Move the unique values to the front of the attribute. Each unique value
+  // is stored at an index that is never larger than its original index.
+  for (uint32_t i = 0; i < num_unique_values; ++i) {
+    const AttributeValueIndex src_index(unique_values[i]);
+    if (&in_att == this && src_index == i && in_att_offset == 0) {
+      continue;  // The value is already at the right place.
     }
+    SetAttributeValue(AttributeValueIndex(i),
+                      in_att.GetAddress(src_index + in_att_offset));
   }
-  if (unique_vals == num_unique_entries_) {
-    return unique_vals.value();  // Nothing has changed.
+  if (num_unique_values == num_unique_entries_) {
+    return num_unique_values;  // Nothing has changed.
   }
   if (is_mapping_identity()) {
     // Change identity mapping to the explicit one.
@@ -211,15 +137,16 @@ AttributeValueIndex::ValueType PointAttribute::DeduplicateFormattedValues(
     SetExplicitMapping(num_unique_entries_);
     // Update the explicit map.
     for (uint32_t i = 0; i < num_unique_entries_; ++i) {
-      SetPointMapEntry(PointIndex(i), value_map[AttributeValueIndex(i)]);
+      SetPointMapEntry(PointIndex(i), AttributeValueIndex(value_ids[i]));
     }
   } else {
     // Update point to value map using the mapping between old and new values.
     for (PointIndex i(0); i < static_cast<uint32_t>(indices_map_.size()); ++i) {
-      SetPointMapEntry(i, value_map[indices_map_[i]]);
+      SetPointMapEntry(i,
+                       AttributeValueIndex(value_ids[indices_map_[i].value()]));
     }
   }
-  num_unique_entries_ = unique_vals.value();
+  num_unique_entries_ = num_unique_values;
   return num_unique_entries_;
 }
 #endif
@@ -117,9 +117,12 @@ class PointAttribute : public GeometryAttribute {
       const GeometryAttribute &in_att);
 
   // Same as above but the values read from |in_att| are sampled with the
-  // provided offset |in_att_offset|.
+  // provided offset |in_att_offset|. The values are compared on up to
+  // |num_threads| threads and the result is the same for any number of
+  // threads.
   AttributeValueIndex::ValueType DeduplicateValues(
-      const GeometryAttribute &in_att, AttributeValueIndex in_att_offset);
+      const GeometryAttribute &in_att, AttributeValueIndex in_att_offset,
+      int num_threads = 1);
 #endif
 
   // Set attribute transform data for the attribute. The data is used to store
@@ -140,15 +143,6 @@ class PointAttribute : public GeometryAttribute {
 #endif
 
  private:
-#ifdef DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED
-  template <typename T>
-  AttributeValueIndex::ValueType DeduplicateTypedValues(
-      const GeometryAttribute &in_att, AttributeValueIndex in_att_offset);
-  template <typename T, int COMPONENTS_COUNT>
-  AttributeValueIndex::ValueType DeduplicateFormattedValues(
-      const GeometryAttribute &in_att, AttributeValueIndex in_att_offset);
-#endif
-
   // Data storage for attribute values. GeometryAttribute itself doesn't own its
   // buffer so we need to allocate it here.
   std::unique_ptr<DataBuffer> attribute_buffer_;
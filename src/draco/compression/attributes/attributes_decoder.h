@@ -65,6 +65,19 @@ class AttributesDecoder : public AttributesDecoderInterface {
     return true;
   }
 
+  bool DecodePortableData(DecoderBuffer *in_buffer) override {
+    if (!DecodePortableAttributes(in_buffer)) {
+      return false;
+    }
+    return DecodeDataNeededByPortableTransforms(in_buffer);
+  }
+
+  // Unless overridden, all attributes are transformed together as part of the
+  // first attribute.
+  bool TransformAttributeToOriginalFormat(int i) override {
+    return i == 0 ? TransformAttributesToOriginalFormat() : true;
+  }
+
  protected:
   int32_t GetLocalIdForPointAttribute(int32_t point_attribute_id) const {
     const int id_map_size =
@@ -44,6 +44,18 @@ class AttributesDecoderInterface {
   // the derived classes.
   virtual bool DecodeAttributes(DecoderBuffer *in_buffer) = 0;
 
+  // DecodePortableData() and TransformAttributeToOriginalFormat() split
+  // DecodeAttributes() into two phases. The first one reads all data of the
+  // decoder from |in_buffer| and must run in the bitstream order. The second
+  // one converts the i-th decoded portable attribute into its original format.
+  // It only accesses data owned by that attribute, so the transforms of all
+  // attributes may run concurrently once every decoder finished the first
+  // phase. By default, all work is done in the first phase.
+  virtual bool DecodePortableData(DecoderBuffer *in_buffer) {
+    return DecodeAttributes(in_buffer);
+  }
+  virtual bool TransformAttributeToOriginalFormat(int /* i */) { return true; }
+
   virtual int32_t GetAttributeId(int i) const = 0;
   virtual int32_t GetNumAttributes() const = 0;
   virtual PointCloudDecoder *GetDecoder() const = 0;
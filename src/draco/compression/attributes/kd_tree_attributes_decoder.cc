@@ -129,10 +129,14 @@ class PointAttributeVectorOutputIterator {
       PointAttributeVectorOutputIterator const &) = delete;
 };
 
-KdTreeAttributesDecoder::KdTreeAttributesDecoder() {}
+KdTreeAttributesDecoder::KdTreeAttributesDecoder() : breadth_first_(false) {}
 
 bool KdTreeAttributesDecoder::DecodePortableAttributes(
     DecoderBuffer *in_buffer) {
+  // All attributes are decoded together.
+  DecoderStats::ScopedStage stage(GetDecoder()->stats(),
+                                  DecoderStats::STAGE_ATTRIBUTE_VALUES, -1,
+                                  in_buffer);
   if (in_buffer->bitstream_version() < DRACO_BITSTREAM_VERSION(2, 3)) {
     // Old bitstream does everything in the
     // DecodeDataNeededByPortableTransforms() method.
@@ -142,6 +146,15 @@ bool KdTreeAttributesDecoder::DecodePortableAttributes(
   if (!in_buffer->Decode(&compression_level)) {
     return false;
   }
+  breadth_first_ = false;
+  if (in_buffer->bitstream_version() >= DRACO_BITSTREAM_VERSION(2, 5)) {
+    uint8_t traversal_order;
+    if (!in_buffer->Decode(&traversal_order) ||
+        traversal_order > kKdTreeBreadthFirst) {
+      return false;
+    }
+    breadth_first_ = traversal_order == kKdTreeBreadthFirst;
+  }
   const int32_t num_points = GetDecoder()->point_cloud()->num_points();
 
   // Decode data using the kd tree decoding into integer (portable) attributes.
@@ -254,6 +267,20 @@ bool KdTreeAttributesDecoder::DecodePortableAttributes(
     default:
       return false;
   }
+
+  const int32_t num_decoded_points = GetDecoder()->point_cloud()->num_points();
+  if (num_decoded_points < num_points) {
+    // Only a subset of the points was decoded because of the decoding budgets,
+    // shrink all attributes to the decoded points.
+    for (int i = 0; i < GetNumAttributes(); ++i) {
+      const int att_id = GetAttributeId(i);
+      GetDecoder()->point_cloud()->attribute(att_id)->Resize(
+          num_decoded_points);
+    }
+    for (auto &att : quantized_portable_attributes_) {
+      att->Resize(num_decoded_points);
+    }
+  }
   return true;
 }
 
@@ -263,10 +290,45 @@ bool KdTreeAttributesDecoder::DecodePoints(int total_dimensionality,
                                            DecoderBuffer *in_buffer,
                                            OutIteratorT *out_iterator) {
   DynamicIntegerPointsKdTreeDecoder<level_t> decoder(total_dimensionality);
-  if (!decoder.DecodePoints(in_buffer, *out_iterator, num_expected_points) ||
-      decoder.num_decoded_points() != num_expected_points) {
+  decoder.SetBreadthFirstTraversal(breadth_first_);
+  const int max_depth =
+      GetDecoder()->options()->GetGlobalInt("kd_tree_max_depth", -1);
+  const int max_points =
+      GetDecoder()->options()->GetGlobalInt("kd_tree_max_points", -1);
+  if (!breadth_first_ || (max_depth < 0 && max_points < 0)) {
+    // Decode all points.
+    if (!decoder.DecodePoints(in_buffer, *out_iterator, num_expected_points) ||
+        decoder.num_decoded_points() != num_expected_points) {
+      return false;
+    }
+    return true;
+  }
+
+  // Decode the tree only up to the requested budgets. Each node of the tree
+  // that is left undecoded is represented by the center of its cell.
+  if (!decoder.StartProgressiveDecoding(in_buffer)) {
+    return false;
+  }
+  const uint32_t depth_budget = max_depth < 0
+                                    ? std::numeric_limits<uint32_t>::max()
+                                    : static_cast<uint32_t>(max_depth);
+  const uint32_t point_budget = max_points < 0
+                                    ? std::numeric_limits<uint32_t>::max()
+                                    : static_cast<uint32_t>(max_points);
+  if (!decoder.DecodeProgressive(depth_budget, point_budget, *out_iterator)) {
+    return false;
+  }
+  const bool is_complete = decoder.IsProgressiveDecodingComplete();
+  const uint64_t num_output_points =
+      static_cast<uint64_t>(decoder.num_decoded_points()) +
+      decoder.num_pending_nodes();
+  if (num_output_points > static_cast<uint64_t>(num_expected_points) ||
+      (is_complete && num_output_points != num_expected_points)) {
     return false;
   }
+  decoder.GetPendingPoints(*out_iterator);
+  GetDecoder()->point_cloud()->set_num_points(
+      static_cast<PointIndex::ValueType>(num_output_points));
   return true;
 }
 
@@ -491,6 +553,9 @@ bool KdTreeAttributesDecoder::TransformAttributeBackToSignedType(
 }
 
 bool KdTreeAttributesDecoder::TransformAttributesToOriginalFormat() {
+  DecoderStats::ScopedStage stage(GetDecoder()->stats(),
+                                  DecoderStats::STAGE_ATTRIBUTE_TRANSFORM, -1,
+                                  nullptr);
   if (quantized_portable_attributes_.empty() && min_signed_values_.empty()) {
     return true;
   }
@@ -551,28 +616,27 @@ bool KdTreeAttributesDecoder::TransformAttributesToOriginalFormat() {
       const int32_t max_quantized_value =
           (1u << static_cast<uint32_t>(transform.quantization_bits())) - 1;
       const int num_components = att->num_components();
-      const int entry_size = sizeof(float) * num_components;
-      const std::unique_ptr<float[]> att_val(new float[num_components]);
-      int quant_val_id = 0;
-      int out_byte_pos = 0;
       Dequantizer dequantizer;
       if (!dequantizer.Init(transform.range(), max_quantized_value)) {
         return false;
       }
-      const uint32_t *const portable_attribute_data =
-          reinterpret_cast<const uint32_t *>(
-              src_att->GetAddress(AttributeValueIndex(0)));
-      for (uint32_t i = 0; i < src_att->size(); ++i) {
-        for (int c = 0; c < num_components; ++c) {
-          float value = dequantizer.DequantizeFloat(
-              portable_attribute_data[quant_val_id++]);
-          value = value + transform.min_value(c);
-          att_val[c] = value;
-        }
-        // Store the floating point value into the attribute buffer.
-        att->buffer()->Write(out_byte_pos, att_val.get(), entry_size);
-        out_byte_pos += entry_size;
+      if (transform.min_values().size() <
+          static_cast<size_t>(num_components)) {
+        return false;
       }
+      if (src_att->size() == 0) {
+        continue;
+      }
+      const int32_t *const portable_attribute_data =
+          reinterpret_cast<const int32_t *>(
+              src_att->GetAddress(AttributeValueIndex(0)));
+      // Store the floating point values directly into the attribute buffer.
+      float *const att_data =
+          reinterpret_cast<float *>(att->GetAddress(AttributeValueIndex(0)));
+      dequantizer.DequantizeFloats(portable_attribute_data,
+                                   static_cast<int>(src_att->size()),
+                                   num_components,
+                                   transform.min_values().data(), att_data);
     }
   }
   return true;
@@ -43,6 +43,9 @@ class KdTreeAttributesDecoder : public AttributesDecoder {
       attribute_quantization_transforms_;
   std::vector<int32_t> min_signed_values_;
   std::vector<std::unique_ptr<PointAttribute>> quantized_portable_attributes_;
+  // Set when the kd-tree was encoded breadth first, in which case the decoding
+  // can stop at the depth and point budgets set in the decoder options.
+  bool breadth_first_;
 };
 
 }  // namespace draco
@@ -145,6 +145,14 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
 
   out_buffer->Encode(compression_level);
 
+  // The breadth first order is stored with a newer bit-stream version (see
+  // PointCloudEncoder::EncodeHeader()), older versions don't encode the order.
+  const bool breadth_first =
+      encoder()->options()->GetGlobalBool("kd_tree_breadth_first", false);
+  if (breadth_first) {
+    out_buffer->Encode(static_cast<uint8_t>(kKdTreeBreadthFirst));
+  }
+
   // Init PointDVector. The number of dimensions is equal to the total number
   // of dimensions across all attributes.
   const int num_points = encoder()->point_cloud()->num_points();
@@ -241,6 +249,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
   switch (compression_level) {
     case 6: {
       DynamicIntegerPointsKdTreeEncoder<6> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -249,6 +258,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 5: {
       DynamicIntegerPointsKdTreeEncoder<5> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -257,6 +267,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 4: {
       DynamicIntegerPointsKdTreeEncoder<4> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -265,6 +276,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 3: {
       DynamicIntegerPointsKdTreeEncoder<3> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -273,6 +285,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 2: {
       DynamicIntegerPointsKdTreeEncoder<2> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -281,6 +294,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 1: {
       DynamicIntegerPointsKdTreeEncoder<1> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
@@ -289,6 +303,7 @@ bool KdTreeAttributesEncoder::EncodePortableAttributes(
     }
     case 0: {
       DynamicIntegerPointsKdTreeEncoder<0> points_encoder(num_components_);
+      points_encoder.SetBreadthFirstTraversal(breadth_first);
       if (!points_encoder.EncodePoints(point_vector.begin(), point_vector.end(),
                                        num_bits, out_buffer)) {
         return false;
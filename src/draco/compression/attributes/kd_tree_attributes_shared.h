@@ -23,6 +23,11 @@ enum KdTreeAttributesEncodingMethod {
   kKdTreeIntegerEncoding
 };
 
+// Order in which the nodes of the kD-tree are encoded. The order is stored
+// only in point cloud bit-streams of version 2.5 and newer, older bit-streams
+// are always depth first.
+enum KdTreeTraversalOrder { kKdTreeDepthFirst = 0, kKdTreeBreadthFirst };
+
 }  // namespace draco
 
 #endif  // DRACO_COMPRESSION_ATTRIBUTES_KD_TREE_ATTRIBUTES_SHARED_H_
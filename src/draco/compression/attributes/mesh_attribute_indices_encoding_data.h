@@ -28,10 +28,12 @@ struct MeshAttributeIndicesEncodingData {
   MeshAttributeIndicesEncodingData() : num_values(0) {}
 
   void Init(int num_vertices) {
-    vertex_to_encoded_attribute_value_index_map.resize(num_vertices);
+    vertex_to_encoded_attribute_value_index_map.assign(num_vertices, 0);
 
     // We expect to store one value for each vertex.
+    encoded_attribute_value_index_to_corner_map.clear();
     encoded_attribute_value_index_to_corner_map.reserve(num_vertices);
+    num_values = 0;
   }
 
   // Array for storing the corner ids in the order their associated attribute
@@ -201,6 +201,53 @@ class OctahedronToolBox {
                                  out_vector);
   }
 
+  // Converts |num_vectors| quantized octahedral coordinates stored as
+  // interleaved <s, t> pairs in |in_st| into unit vectors stored as
+  // interleaved <x, y, z> triplets in |out_vectors|. The results are identical
+  // to calling QuantizedOctahedralCoordsToUnitVector() on each pair, but the
+  // computation is done in blocks using branch-free loops that can be
+  // auto-vectorized by the compiler.
+  void QuantizedOctahedralCoordsToUnitVectors(const int32_t *in_st,
+                                              int num_vectors,
+                                              float *out_vectors) const {
+    constexpr int kBlockSize = 64;
+    float y[kBlockSize];
+    float z[kBlockSize];
+    float x[kBlockSize];
+    for (int first = 0; first < num_vectors; first += kBlockSize) {
+      const int block_size = std::min(kBlockSize, num_vectors - first);
+      const int32_t *const block_in = in_st + 2 * first;
+      float *const block_out = out_vectors + 3 * first;
+      for (int i = 0; i < block_size; ++i) {
+        y[i] = block_in[2 * i] * dequantization_scale_ - 1.f;
+        z[i] = block_in[2 * i + 1] * dequantization_scale_ - 1.f;
+      }
+      // Same computation as in OctahedralCoordsToUnitVector().
+      for (int i = 0; i < block_size; ++i) {
+        float yi = y[i];
+        float zi = z[i];
+        const float xi = 1.f - std::abs(yi) - std::abs(zi);
+        const float x_offset = -xi < 0 ? 0.f : -xi;
+        yi += yi < 0 ? x_offset : -x_offset;
+        zi += zi < 0 ? x_offset : -x_offset;
+        const float norm_squared = xi * xi + yi * yi + zi * zi;
+        // The float comparison is equivalent to the double precision
+        // |norm_squared| < 1e-6 test used by the scalar path, because 1e-6f is
+        // the largest float value below 1e-6.
+        const bool is_zero = norm_squared <= 1e-6f;
+        const float d = 1.0f / std::sqrt(is_zero ? 1.f : norm_squared);
+        x[i] = is_zero ? 0.f : xi * d;
+        y[i] = is_zero ? 0.f : yi * d;
+        z[i] = is_zero ? 0.f : zi * d;
+      }
+      for (int i = 0; i < block_size; ++i) {
+        block_out[3 * i] = x[i];
+        block_out[3 * i + 1] = y[i];
+        block_out[3 * i + 2] = z[i];
+      }
+    }
+  }
+
   // |s| and |t| are expected to be signed values.
   inline bool IsInDiamond(const int32_t &s, const int32_t &t) const {
     // Expect center already at origin.
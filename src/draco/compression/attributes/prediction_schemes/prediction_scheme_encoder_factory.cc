@@ -28,6 +28,17 @@ PredictionSchemeMethod SelectPredictionMethod(
     // Selected fastest, though still doing some compression.
     return PREDICTION_DIFFERENCE;
   }
+  if (options.GetGlobalBool("realtime_encoding", false)) {
+    // The realtime profile uses only predictors with a constant cost per
+    // value. Normals are predicted from their neighbors, all other mesh
+    // attributes use the parallelogram prediction.
+    if (encoder->GetGeometryType() == TRIANGULAR_MESH &&
+        encoder->point_cloud()->attribute(att_id)->attribute_type() !=
+            GeometryAttribute::NORMAL) {
+      return MESH_PREDICTION_PARALLELOGRAM;
+    }
+    return PREDICTION_DIFFERENCE;
+  }
   if (encoder->GetGeometryType() == TRIANGULAR_MESH) {
     // Use speed setting to select the best encoding method.
     const int att_quant =
@@ -13,6 +13,7 @@
 // limitations under the License.
 //
 #include "draco/compression/attributes/prediction_schemes/prediction_scheme_normal_octahedron_encoding_transform.h"
+#include "draco/compression/attributes/normal_compression_utils.h"
 #include "draco/core/draco_test_base.h"
 
 namespace {
@@ -68,4 +69,35 @@ TEST_F(PredictionSchemeNormalOctahedronTransformTest, Interface) {
   ASSERT_EQ(transform.quantization_bits(), 4);
 }
 
+TEST_F(PredictionSchemeNormalOctahedronTransformTest,
+       BatchedUnitVectorConversion) {
+  // Checks that the batched conversion of quantized octahedral coordinates
+  // produces the same unit vectors as the per-value conversion.
+  for (int quantization_bits = 2; quantization_bits <= 8;
+       ++quantization_bits) {
+    draco::OctahedronToolBox tool_box;
+    ASSERT_TRUE(tool_box.SetQuantizationBits(quantization_bits));
+    const int32_t max_value = tool_box.max_quantized_value();
+    std::vector<int32_t> coords;
+    for (int32_t s = 0; s <= max_value; ++s) {
+      for (int32_t t = 0; t <= max_value; ++t) {
+        coords.push_back(s);
+        coords.push_back(t);
+      }
+    }
+    const int num_vectors = static_cast<int>(coords.size() / 2);
+    std::vector<float> vectors(3 * num_vectors);
+    tool_box.QuantizedOctahedralCoordsToUnitVectors(coords.data(), num_vectors,
+                                                     vectors.data());
+    for (int i = 0; i < num_vectors; ++i) {
+      float expected[3];
+      tool_box.QuantizedOctahedralCoordsToUnitVector(
+          coords[2 * i], coords[2 * i + 1], expected);
+      for (int c = 0; c < 3; ++c) {
+        ASSERT_EQ(vectors[3 * i + c], expected[c]);
+      }
+    }
+  }
+}
+
 }  // namespace
@@ -99,6 +99,9 @@ bool SequentialAttributeDecoder::InitPredictionScheme(
 
 bool SequentialAttributeDecoder::DecodeValues(
     const std::vector<PointIndex> &point_ids, DecoderBuffer *in_buffer) {
+  DecoderStats::ScopedStage stage(decoder_ ? decoder_->stats() : nullptr,
+                                  DecoderStats::STAGE_ATTRIBUTE_VALUES,
+                                  attribute_id_, in_buffer);
   const int32_t num_values = static_cast<uint32_t>(point_ids.size());
   const int entry_size = static_cast<int>(attribute_->byte_stride());
   std::unique_ptr<uint8_t[]> value_data_ptr(new uint8_t[entry_size]);
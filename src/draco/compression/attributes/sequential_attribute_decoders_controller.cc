@@ -50,8 +50,7 @@ bool SequentialAttributeDecodersController::DecodeAttributesDecoderData(
   return true;
 }
 
-bool SequentialAttributeDecodersController::DecodeAttributes(
-    DecoderBuffer *buffer) {
+bool SequentialAttributeDecodersController::InitializePointMapping() {
   if (!sequencer_ || !sequencer_->GenerateSequence(&point_ids_)) {
     return false;
   }
@@ -64,9 +63,25 @@ bool SequentialAttributeDecodersController::DecodeAttributes(
       return false;
     }
   }
+  return true;
+}
+
+bool SequentialAttributeDecodersController::DecodeAttributes(
+    DecoderBuffer *buffer) {
+  if (!InitializePointMapping()) {
+    return false;
+  }
   return AttributesDecoder::DecodeAttributes(buffer);
 }
 
+bool SequentialAttributeDecodersController::DecodePortableData(
+    DecoderBuffer *buffer) {
+  if (!InitializePointMapping()) {
+    return false;
+  }
+  return AttributesDecoder::DecodePortableData(buffer);
+}
+
 bool SequentialAttributeDecodersController::DecodePortableAttributes(
     DecoderBuffer *in_buffer) {
   const int32_t num_attributes = GetNumAttributes();
@@ -95,32 +110,40 @@ bool SequentialAttributeDecodersController::
     TransformAttributesToOriginalFormat() {
   const int32_t num_attributes = GetNumAttributes();
   for (int i = 0; i < num_attributes; ++i) {
-    // Check whether the attribute transform should be skipped.
-    if (GetDecoder()->options()) {
-      const PointAttribute *const attribute =
-          sequential_decoders_[i]->attribute();
-      const PointAttribute *const portable_attribute =
-          sequential_decoders_[i]->GetPortableAttribute();
-      if (portable_attribute &&
-          GetDecoder()->options()->GetAttributeBool(
-              attribute->attribute_type(), "skip_attribute_transform", false)) {
-        // Attribute transform should not be performed. In this case, we replace
-        // the output geometry attribute with the portable attribute.
-        // TODO(ostava): We can potentially avoid this copy by introducing a new
-        // mechanism that would allow to use the final attributes as portable
-        // attributes for predictors that may need them.
-        sequential_decoders_[i]->attribute()->CopyFrom(*portable_attribute);
-        continue;
-      }
-    }
-    if (!sequential_decoders_[i]->TransformAttributeToOriginalFormat(
-            point_ids_)) {
+    if (!TransformAttributeToOriginalFormat(i)) {
       return false;
     }
   }
   return true;
 }
 
+bool SequentialAttributeDecodersController::TransformAttributeToOriginalFormat(
+    int i) {
+  DecoderStats::ScopedStage stage(GetDecoder()->stats(),
+                                  DecoderStats::STAGE_ATTRIBUTE_TRANSFORM,
+                                  GetAttributeId(i), nullptr);
+  // Check whether the attribute transform should be skipped.
+  if (GetDecoder()->options()) {
+    const PointAttribute *const attribute =
+        sequential_decoders_[i]->attribute();
+    const PointAttribute *const portable_attribute =
+        sequential_decoders_[i]->GetPortableAttribute();
+    if (portable_attribute &&
+        GetDecoder()->options()->GetAttributeBool(
+            attribute->attribute_type(), "skip_attribute_transform", false)) {
+      // Attribute transform should not be performed. In this case, we replace
+      // the output geometry attribute with the portable attribute.
+      // TODO(ostava): We can potentially avoid this copy by introducing a new
+      // mechanism that would allow to use the final attributes as portable
+      // attributes for predictors that may need them.
+      sequential_decoders_[i]->attribute()->CopyFrom(*portable_attribute);
+      return true;
+    }
+  }
+  return sequential_decoders_[i]->TransformAttributeToOriginalFormat(
+      point_ids_);
+}
+
 std::unique_ptr<SequentialAttributeDecoder>
 SequentialAttributeDecodersController::CreateSequentialDecoder(
     uint8_t decoder_type) {
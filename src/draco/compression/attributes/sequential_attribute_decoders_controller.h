@@ -34,6 +34,8 @@ class SequentialAttributeDecodersController : public AttributesDecoder {
 
   bool DecodeAttributesDecoderData(DecoderBuffer *buffer) override;
   bool DecodeAttributes(DecoderBuffer *buffer) override;
+  bool DecodePortableData(DecoderBuffer *buffer) override;
+  bool TransformAttributeToOriginalFormat(int i) override;
   const PointAttribute *GetPortableAttribute(
       int32_t point_attribute_id) override {
     const int32_t loc_id = GetLocalIdForPointAttribute(point_attribute_id);
@@ -51,6 +53,10 @@ class SequentialAttributeDecodersController : public AttributesDecoder {
       uint8_t decoder_type);
 
  private:
+  // Generates the decoding order of points and initializes the point to
+  // attribute value mapping of all decoded attributes.
+  bool InitializePointMapping();
+
   std::vector<std::unique_ptr<SequentialAttributeDecoder>> sequential_decoders_;
   std::vector<PointIndex> point_ids_;
   std::unique_ptr<PointsSequencer> sequencer_;
@@ -116,60 +116,73 @@ bool SequentialIntegerAttributeDecoder::DecodeIntegerValues(
   if (portable_attribute_data == nullptr) {
     return false;
   }
-  uint8_t compressed;
-  if (!in_buffer->Decode(&compressed)) {
-    return false;
-  }
-  if (compressed > 0) {
-    // Decode compressed values.
-    if (!DecodeSymbols(static_cast<uint32_t>(num_values), num_components,
-                       in_buffer,
-                       reinterpret_cast<uint32_t *>(portable_attribute_data))) {
+  DecoderStats *const stats = decoder() ? decoder()->stats() : nullptr;
+  // Standalone attribute data does not belong to any geometry bit-stream.
+  const EncodedGeometryType geometry_type =
+      decoder() ? decoder()->GetGeometryType() : INVALID_GEOMETRY_TYPE;
+  {
+    DecoderStats::ScopedStage stage(stats, DecoderStats::STAGE_ATTRIBUTE_VALUES,
+                                    attribute_id(), in_buffer);
+    uint8_t compressed;
+    if (!in_buffer->Decode(&compressed)) {
       return false;
     }
-  } else {
-    // Decode the integer data directly.
-    // Get the number of bytes for a given entry.
-    uint8_t num_bytes;
-    if (!in_buffer->Decode(&num_bytes)) {
-      return false;
-    }
-    if (num_bytes == DataTypeLength(DT_INT32)) {
-      if (portable_attribute()->buffer()->data_size() <
-          sizeof(int32_t) * num_values) {
-        return false;
-      }
-      if (!in_buffer->Decode(portable_attribute_data,
-                             sizeof(int32_t) * num_values)) {
+    if (compressed > 0) {
+      // Decode compressed values.
+      if (!DecodeSymbols(
+              static_cast<uint32_t>(num_values), num_components, geometry_type,
+              in_buffer,
+              reinterpret_cast<uint32_t *>(portable_attribute_data))) {
         return false;
       }
     } else {
-      if (portable_attribute()->buffer()->data_size() <
-          num_bytes * num_values) {
-        return false;
-      }
-      if (in_buffer->remaining_size() <
-          static_cast<int64_t>(num_bytes) * static_cast<int64_t>(num_values)) {
+      // Decode the integer data directly.
+      // Get the number of bytes for a given entry.
+      uint8_t num_bytes;
+      if (!in_buffer->Decode(&num_bytes)) {
         return false;
       }
-      for (size_t i = 0; i < num_values; ++i) {
-        if (!in_buffer->Decode(portable_attribute_data + i, num_bytes)) {
+      if (num_bytes == DataTypeLength(DT_INT32)) {
+        if (portable_attribute()->buffer()->data_size() <
+            sizeof(int32_t) * num_values) {
           return false;
         }
+        if (!in_buffer->Decode(portable_attribute_data,
+                               sizeof(int32_t) * num_values)) {
+          return false;
+        }
+      } else {
+        if (portable_attribute()->buffer()->data_size() <
+            num_bytes * num_values) {
+          return false;
+        }
+        if (in_buffer->remaining_size() <
+            static_cast<int64_t>(num_bytes) *
+                static_cast<int64_t>(num_values)) {
+          return false;
+        }
+        for (size_t i = 0; i < num_values; ++i) {
+          if (!in_buffer->Decode(portable_attribute_data + i, num_bytes)) {
+            return false;
+          }
+        }
       }
     }
-  }
 
-  if (num_values > 0 && (prediction_scheme_ == nullptr ||
-                         !prediction_scheme_->AreCorrectionsPositive())) {
-    // Convert the values back to the original signed format.
-    ConvertSymbolsToSignedInts(
-        reinterpret_cast<const uint32_t *>(portable_attribute_data),
-        static_cast<int>(num_values), portable_attribute_data);
+    if (num_values > 0 && (prediction_scheme_ == nullptr ||
+                           !prediction_scheme_->AreCorrectionsPositive())) {
+      // Convert the values back to the original signed format.
+      ConvertSymbolsToSignedInts(
+          reinterpret_cast<const uint32_t *>(portable_attribute_data),
+          static_cast<int>(num_values), portable_attribute_data);
+    }
   }
 
   // If the data was encoded with a prediction scheme, we must revert it.
   if (prediction_scheme_) {
+    DecoderStats::ScopedStage stage(stats,
+                                    DecoderStats::STAGE_ATTRIBUTE_PREDICTION,
+                                    attribute_id(), in_buffer);
     if (!prediction_scheme_->DecodePredictionData(in_buffer)) {
       return false;
     }
@@ -16,6 +16,7 @@
 
 #include "draco/compression/attributes/prediction_schemes/prediction_scheme_encoder_factory.h"
 #include "draco/compression/attributes/prediction_schemes/prediction_scheme_wrap_encoding_transform.h"
+#include "draco/compression/entropy/rans_symbol_coding.h"
 #include "draco/compression/entropy/symbol_encoding.h"
 #include "draco/core/bit_utils.h"
 
@@ -160,6 +161,10 @@ bool SequentialIntegerAttributeEncoder::EncodeValues(
     if (encoder() != nullptr) {
       SetSymbolEncodingCompressionLevel(&symbol_encoding_options,
                                         10 - encoder()->options()->GetSpeed());
+      if (encoder()->options()->GetGlobalBool("use_interleaved_rans", false)) {
+        SetSymbolEncodingNumInterleavedStates(&symbol_encoding_options,
+                                              kDefaultNumRAnsInterleavedStates);
+      }
     }
     if (!EncodeSymbols(reinterpret_cast<uint32_t *>(encoded_data.data()),
                        static_cast<int>(point_ids.size()) * num_components,
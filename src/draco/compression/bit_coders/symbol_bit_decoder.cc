@@ -11,7 +11,10 @@ bool SymbolBitDecoder::StartDecoding(DecoderBuffer *source_buffer) {
   }
 
   symbols_.resize(size);
-  if (!DecodeSymbols(size, 1, source_buffer, symbols_.data())) {
+  // The symbol bit coder is not part of any geometry bit-stream and its
+  // encoder never uses interleaved rANS coding.
+  if (!DecodeSymbols(size, 1, INVALID_GEOMETRY_TYPE, source_buffer,
+                     symbols_.data())) {
     return false;
   }
   std::reverse(symbols_.begin(), symbols_.end());
@@ -0,0 +1,164 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/chunked_mesh_decoder.h"
+
+#include <cstring>
+#include <utility>
+
+#include "draco/compression/config/compression_shared.h"
+#include "draco/compression/decode.h"
+#include "draco/core/thread_pool.h"
+#include "draco/core/varint_decoding.h"
+#include "draco/core/vector_d.h"
+
+namespace draco {
+
+ChunkedMeshDecoder::ChunkedMeshDecoder() {}
+
+bool ChunkedMeshDecoder::IsChunkedMesh(const DecoderBuffer &in_buffer) {
+  return in_buffer.remaining_size() >= 5 &&
+         memcmp(in_buffer.data_head(), "DRCHK", 5) == 0;
+}
+
+Status ChunkedMeshDecoder::Init(DecoderBuffer *in_buffer) {
+  constexpr char kIoErrorMsg[] = "Failed to parse chunked mesh header.";
+  chunks_.clear();
+  char magic[5];
+  if (!in_buffer->Decode(magic, 5)) {
+    return Status(Status::IO_ERROR, kIoErrorMsg);
+  }
+  if (memcmp(magic, "DRCHK", 5) != 0) {
+    return Status(Status::DRACO_ERROR, "Not a chunked Draco mesh.");
+  }
+  uint8_t version_major, version_minor;
+  if (!in_buffer->Decode(&version_major) ||
+      !in_buffer->Decode(&version_minor)) {
+    return Status(Status::IO_ERROR, kIoErrorMsg);
+  }
+  if (version_major != kDracoChunkedMeshVersionMajor) {
+    return Status(Status::UNKNOWN_VERSION, "Unknown chunked mesh version.");
+  }
+  uint32_t num_chunks;
+  if (!DecodeVarint(&num_chunks, in_buffer)) {
+    return Status(Status::IO_ERROR, kIoErrorMsg);
+  }
+  // Each index entry takes at least 26 bytes.
+  if (num_chunks > in_buffer->remaining_size() / 26) {
+    return Status(Status::DRACO_ERROR, "Invalid number of chunks.");
+  }
+  std::vector<ChunkInfo> chunks(num_chunks);
+  uint64_t total_data_size = 0;
+  for (ChunkInfo &chunk : chunks) {
+    Vector3f min_point, max_point;
+    for (int c = 0; c < 3; ++c) {
+      if (!in_buffer->Decode(&min_point[c])) {
+        return Status(Status::IO_ERROR, kIoErrorMsg);
+      }
+    }
+    for (int c = 0; c < 3; ++c) {
+      if (!in_buffer->Decode(&max_point[c])) {
+        return Status(Status::IO_ERROR, kIoErrorMsg);
+      }
+    }
+    chunk.bounds = BoundingBox(min_point, max_point);
+    uint64_t data_size;
+    if (!DecodeVarint(&chunk.num_faces, in_buffer) ||
+        !DecodeVarint(&data_size, in_buffer)) {
+      return Status(Status::IO_ERROR, kIoErrorMsg);
+    }
+    // Check each size separately so that the total cannot overflow.
+    const uint64_t remaining_size = in_buffer->remaining_size();
+    if (total_data_size > remaining_size ||
+        data_size > remaining_size - total_data_size) {
+      return Status(Status::IO_ERROR, "Chunk data out of bounds.");
+    }
+    chunk.data_size = data_size;
+    total_data_size += data_size;
+  }
+  if (total_data_size > static_cast<uint64_t>(in_buffer->remaining_size())) {
+    return Status(Status::IO_ERROR, "Chunk data out of bounds.");
+  }
+  const char *data = in_buffer->data_head();
+  for (ChunkInfo &chunk : chunks) {
+    chunk.data = data;
+    data += chunk.data_size;
+  }
+  in_buffer->Advance(total_data_size);
+  chunks_ = std::move(chunks);
+  return OkStatus();
+}
+
+std::vector<int> ChunkedMeshDecoder::FindChunksInBox(
+    const BoundingBox &box) const {
+  std::vector<int> chunk_ids;
+  for (int i = 0; i < num_chunks(); ++i) {
+    const BoundingBox &bounds = chunks_[i].bounds;
+    bool intersects = true;
+    for (int c = 0; c < 3; ++c) {
+      if (bounds.GetMinPoint()[c] > box.GetMaxPoint()[c] ||
+          bounds.GetMaxPoint()[c] < box.GetMinPoint()[c]) {
+        intersects = false;
+        break;
+      }
+    }
+    if (intersects) {
+      chunk_ids.push_back(i);
+    }
+  }
+  return chunk_ids;
+}
+
+StatusOr<std::unique_ptr<Mesh>> ChunkedMeshDecoder::DecodeChunk(
+    int chunk_id) const {
+  if (chunk_id < 0 || chunk_id >= num_chunks()) {
+    return Status(Status::INVALID_PARAMETER, "Invalid chunk id.");
+  }
+  const ChunkInfo &chunk = chunks_[chunk_id];
+  DecoderBuffer buffer;
+  buffer.Init(chunk.data, chunk.data_size);
+  Decoder decoder;
+  *decoder.options() = options_;
+  return decoder.DecodeMeshFromBuffer(&buffer);
+}
+
+StatusOr<ChunkedMeshDecoder::MeshVector> ChunkedMeshDecoder::DecodeChunks(
+    const std::vector<int> &chunk_ids, int num_threads) const {
+  const int num_items = static_cast<int>(chunk_ids.size());
+  MeshVector meshes(num_items);
+  std::vector<Status> statuses(num_items);
+  ParallelFor(num_threads, num_items, [&](int i) {
+    StatusOr<std::unique_ptr<Mesh>> mesh_or = DecodeChunk(chunk_ids[i]);
+    if (!mesh_or.ok()) {
+      statuses[i] = mesh_or.status();
+      return;
+    }
+    meshes[i] = std::move(mesh_or).value();
+  });
+  for (const Status &status : statuses) {
+    DRACO_RETURN_IF_ERROR(status);
+  }
+  return std::move(meshes);
+}
+
+StatusOr<ChunkedMeshDecoder::MeshVector> ChunkedMeshDecoder::DecodeAllChunks(
+    int num_threads) const {
+  std::vector<int> chunk_ids(num_chunks());
+  for (int i = 0; i < num_chunks(); ++i) {
+    chunk_ids[i] = i;
+  }
+  return DecodeChunks(chunk_ids, num_threads);
+}
+
+}  // namespace draco
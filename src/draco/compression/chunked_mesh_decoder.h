@@ -0,0 +1,87 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_COMPRESSION_CHUNKED_MESH_DECODER_H_
+#define DRACO_COMPRESSION_CHUNKED_MESH_DECODER_H_
+
+#include <memory>
+#include <vector>
+
+#include "draco/compression/config/decoder_options.h"
+#include "draco/core/bounding_box.h"
+#include "draco/core/decoder_buffer.h"
+#include "draco/core/status.h"
+#include "draco/core/status_or.h"
+#include "draco/mesh/mesh.h"
+
+namespace draco {
+
+// Class for decoding containers of mesh chunks created by ChunkedMeshEncoder.
+// After the chunk index is parsed by Init(), any chunk can be decoded on its
+// own without decoding the rest of the container.
+class ChunkedMeshDecoder {
+ public:
+  typedef std::vector<std::unique_ptr<Mesh>> MeshVector;
+
+  // Information about a single chunk stored in the chunk index.
+  struct ChunkInfo {
+    // Bounds of the chunk positions (before quantization).
+    BoundingBox bounds;
+    uint32_t num_faces;
+    // Location of the encoded chunk in the input buffer.
+    const char *data;
+    size_t data_size;
+  };
+
+  ChunkedMeshDecoder();
+
+  // Returns true when |in_buffer| starts with a chunked mesh container. The
+  // buffer position is not changed.
+  static bool IsChunkedMesh(const DecoderBuffer &in_buffer);
+
+  // Parses the container header and the chunk index from |in_buffer| and
+  // moves the buffer position past the whole container. The chunks are
+  // decoded directly from the buffer data, so the data must outlive all
+  // subsequent decodes.
+  Status Init(DecoderBuffer *in_buffer);
+
+  int num_chunks() const { return static_cast<int>(chunks_.size()); }
+  const ChunkInfo &chunk(int chunk_id) const { return chunks_[chunk_id]; }
+
+  // Returns ids of all chunks whose bounds intersect |box|.
+  std::vector<int> FindChunksInBox(const BoundingBox &box) const;
+
+  // Decodes a single chunk. Can be called concurrently from multiple threads.
+  StatusOr<std::unique_ptr<Mesh>> DecodeChunk(int chunk_id) const;
+
+  // Decodes the chunks |chunk_ids| using up to |num_threads| threads. The
+  // returned meshes are in the same order as |chunk_ids|.
+  StatusOr<MeshVector> DecodeChunks(const std::vector<int> &chunk_ids,
+                                    int num_threads) const;
+
+  // Decodes all chunks using up to |num_threads| threads.
+  StatusOr<MeshVector> DecodeAllChunks(int num_threads) const;
+
+  // Returns the options used for decoding of the individual chunks (see
+  // Decoder::options()).
+  DecoderOptions *options() { return &options_; }
+
+ private:
+  std::vector<ChunkInfo> chunks_;
+  DecoderOptions options_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_COMPRESSION_CHUNKED_MESH_DECODER_H_
@@ -0,0 +1,128 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/chunked_mesh_encoder.h"
+
+#include <algorithm>
+#include <memory>
+#include <vector>
+
+#include "draco/compression/config/compression_shared.h"
+#include "draco/core/bounding_box.h"
+#include "draco/core/thread_pool.h"
+#include "draco/core/varint_encoding.h"
+#include "draco/core/vector_d.h"
+#include "draco/mesh/mesh_spatial_splitter.h"
+
+namespace draco {
+
+namespace {
+
+// Computes the bounds of all position values of |pc|. Unlike
+// PointCloud::ComputeBoundingBox(), the positions can use any data type.
+BoundingBox ComputePositionBounds(const PointCloud &pc) {
+  BoundingBox bounds;
+  const PointAttribute *const pos_att =
+      pc.GetNamedAttribute(GeometryAttribute::POSITION);
+  if (pos_att == nullptr) {
+    return bounds;
+  }
+  Vector3f pos;
+  for (AttributeValueIndex avi(0); avi < static_cast<uint32_t>(pos_att->size());
+       ++avi) {
+    pos_att->ConvertValue<float, 3>(avi, &pos[0]);
+    bounds.Update(pos);
+  }
+  return bounds;
+}
+
+}  // namespace
+
+ChunkedMeshEncoder::ChunkedMeshEncoder()
+    : max_faces_per_chunk_(65536), num_threads_(1) {}
+
+Status ChunkedMeshEncoder::EncodeMesh(const Mesh &mesh, const Encoder &encoder,
+                                      EncoderBuffer *out_buffer) const {
+  MeshSpatialSplitter splitter;
+  splitter.SetMaxFacesPerChunk(max_faces_per_chunk_);
+  DRACO_ASSIGN_OR_RETURN(MeshSpatialSplitter::MeshVector chunks,
+                         splitter.SplitMesh(mesh));
+
+  Encoder chunk_encoder = encoder;
+  const int pos_quantization_bits = encoder.options().GetAttributeInt(
+      GeometryAttribute::POSITION, "quantization_bits", -1);
+  const PointAttribute *const pos_att =
+      mesh.GetNamedAttribute(GeometryAttribute::POSITION);
+  // The shared grid is computed from 3D bounds, so positions with a different
+  // number of components are quantized separately in each chunk.
+  if (pos_quantization_bits > 0 && pos_att != nullptr &&
+      pos_att->num_components() == 3 &&
+      !encoder.options().IsAttributeOptionSet(GeometryAttribute::POSITION,
+                                              "quantization_origin")) {
+    // Quantize all chunks on the same grid. The range is computed in the same
+    // way as in AttributeQuantizationTransform.
+    const BoundingBox bounds = ComputePositionBounds(mesh);
+    const Vector3f size = bounds.Size();
+    float range = std::max(size[0], std::max(size[1], size[2]));
+    if (range == 0.f) {
+      range = 1.f;
+    }
+    chunk_encoder.SetAttributeExplicitQuantization(
+        GeometryAttribute::POSITION, pos_quantization_bits, 3,
+        &bounds.GetMinPoint()[0], range);
+  }
+
+  // Encode the chunks. Each chunk mesh is released as soon as it is encoded.
+  const int num_chunks = static_cast<int>(chunks.size());
+  std::vector<EncoderBuffer> chunk_buffers(num_chunks);
+  std::vector<BoundingBox> chunk_bounds(num_chunks);
+  std::vector<uint32_t> chunk_num_faces(num_chunks);
+  std::vector<Status> chunk_statuses(num_chunks);
+  ParallelFor(num_threads_, num_chunks, [&](int i) {
+    chunk_bounds[i] = ComputePositionBounds(*chunks[i]);
+    chunk_num_faces[i] = chunks[i]->num_faces();
+    Encoder local_encoder = chunk_encoder;
+    chunk_statuses[i] =
+        local_encoder.EncodeMeshToBuffer(*chunks[i], &chunk_buffers[i]);
+    chunks[i].reset();
+  });
+  for (const Status &status : chunk_statuses) {
+    DRACO_RETURN_IF_ERROR(status);
+  }
+
+  // Write the container header and the chunk index followed by the encoded
+  // chunks.
+  out_buffer->Encode("DRCHK", 5);
+  out_buffer->Encode(kDracoChunkedMeshVersionMajor);
+  out_buffer->Encode(kDracoChunkedMeshVersionMinor);
+  EncodeVarint(static_cast<uint32_t>(num_chunks), out_buffer);
+  for (int i = 0; i < num_chunks; ++i) {
+    for (int c = 0; c < 3; ++c) {
+      out_buffer->Encode(chunk_bounds[i].GetMinPoint()[c]);
+    }
+    for (int c = 0; c < 3; ++c) {
+      out_buffer->Encode(chunk_bounds[i].GetMaxPoint()[c]);
+    }
+    EncodeVarint(chunk_num_faces[i], out_buffer);
+    EncodeVarint(static_cast<uint64_t>(chunk_buffers[i].size()), out_buffer);
+  }
+  for (int i = 0; i < num_chunks; ++i) {
+    if (!out_buffer->Encode(chunk_buffers[i].data(), chunk_buffers[i].size())) {
+      return Status(Status::DRACO_ERROR, "Failed to write chunk data.");
+    }
+  }
+  return OkStatus();
+}
+
+}  // namespace draco
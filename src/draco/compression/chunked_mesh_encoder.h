@@ -0,0 +1,68 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_COMPRESSION_CHUNKED_MESH_ENCODER_H_
+#define DRACO_COMPRESSION_CHUNKED_MESH_ENCODER_H_
+
+#include "draco/compression/encode.h"
+#include "draco/core/encoder_buffer.h"
+#include "draco/core/status.h"
+#include "draco/mesh/mesh.h"
+
+namespace draco {
+
+// Class for encoding large meshes into a container of spatially partitioned
+// chunks. The input mesh is split using MeshSpatialSplitter and each chunk is
+// encoded as a standalone Draco mesh. The container starts with an index that
+// stores the bounds and the location of each chunk, which allows the decoder
+// to decode the chunks independently, in parallel, or only the chunks that
+// intersect a region of interest (see chunked_mesh_decoder.h).
+//
+// Container layout:
+//   "DRCHK"                      5 bytes
+//   version major, minor         2 x uint8_t
+//   number of chunks             varint
+//   for each chunk:
+//     bounds min, max            6 x float
+//     number of faces            varint
+//     encoded size               varint
+//   encoded chunks               concatenated Draco mesh bitstreams
+class ChunkedMeshEncoder {
+ public:
+  ChunkedMeshEncoder();
+
+  // Sets the maximum number of faces stored in a single chunk.
+  // Default = 65536.
+  void SetMaxFacesPerChunk(int max_faces) { max_faces_per_chunk_ = max_faces; }
+
+  // Sets the number of threads used to encode the chunks. The default of 1
+  // encodes all chunks on the calling thread.
+  void SetNumThreads(int num_threads) { num_threads_ = num_threads; }
+
+  // Encodes |mesh| into |out_buffer|. Each chunk is encoded with a copy of
+  // |encoder|. When positions are quantized without an explicit quantization
+  // origin, all chunks are quantized on a common grid defined by the bounds of
+  // the whole mesh so that vertices shared by neighboring chunks decode to the
+  // same positions.
+  Status EncodeMesh(const Mesh &mesh, const Encoder &encoder,
+                    EncoderBuffer *out_buffer) const;
+
+ private:
+  int max_faces_per_chunk_;
+  int num_threads_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_COMPRESSION_CHUNKED_MESH_ENCODER_H_
@@ -0,0 +1,217 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include <cmath>
+#include <vector>
+
+#include "draco/compression/chunked_mesh_decoder.h"
+#include "draco/compression/chunked_mesh_encoder.h"
+#include "draco/compression/config/compression_shared.h"
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/core/varint_encoding.h"
+#include "draco/io/file_utils.h"
+#include "draco/mesh/mesh_are_equivalent.h"
+#include "draco/mesh/triangle_soup_mesh_builder.h"
+
+namespace draco {
+
+class ChunkedMeshEncodingTest : public ::testing::Test {
+ protected:
+  void EncodeTestMesh(const std::string &file_name, int max_faces_per_chunk,
+                      EncoderBuffer *out_buffer) {
+    const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile(file_name);
+    ASSERT_NE(mesh, nullptr);
+    num_source_faces_ = mesh->num_faces();
+    Encoder encoder;
+    encoder.SetAttributeQuantization(GeometryAttribute::POSITION, 14);
+    ChunkedMeshEncoder chunked_encoder;
+    chunked_encoder.SetMaxFacesPerChunk(max_faces_per_chunk);
+    chunked_encoder.SetNumThreads(4);
+    DRACO_ASSERT_OK(chunked_encoder.EncodeMesh(*mesh, encoder, out_buffer));
+  }
+
+  uint32_t num_source_faces_ = 0;
+};
+
+TEST_F(ChunkedMeshEncodingTest, TestDecodeAllChunks) {
+  EncoderBuffer buffer;
+  EncodeTestMesh("bun_zipper.ply", 5000, &buffer);
+
+  DecoderBuffer in_buffer;
+  in_buffer.Init(buffer.data(), buffer.size());
+  ASSERT_TRUE(ChunkedMeshDecoder::IsChunkedMesh(in_buffer));
+  ChunkedMeshDecoder decoder;
+  DRACO_ASSERT_OK(decoder.Init(&in_buffer));
+  ASSERT_EQ(in_buffer.remaining_size(), 0);
+  ASSERT_GT(decoder.num_chunks(), 1);
+
+  DRACO_ASSIGN_OR_ASSERT(const auto meshes, decoder.DecodeAllChunks(4));
+  ASSERT_EQ(meshes.size(), decoder.num_chunks());
+  uint32_t num_faces = 0;
+  for (int i = 0; i < decoder.num_chunks(); ++i) {
+    ASSERT_EQ(meshes[i]->num_faces(), decoder.chunk(i).num_faces);
+    num_faces += meshes[i]->num_faces();
+
+    // Chunks decoded in parallel must be the same as chunks decoded one by
+    // one.
+    DRACO_ASSIGN_OR_ASSERT(const auto mesh, decoder.DecodeChunk(i));
+    MeshAreEquivalent equiv;
+    ASSERT_TRUE(equiv(*mesh, *meshes[i]));
+  }
+  ASSERT_EQ(num_faces, num_source_faces_);
+}
+
+TEST_F(ChunkedMeshEncodingTest, TestDecodeChunksInBox) {
+  EncoderBuffer buffer;
+  EncodeTestMesh("bun_zipper.ply", 2000, &buffer);
+
+  DecoderBuffer in_buffer;
+  in_buffer.Init(buffer.data(), buffer.size());
+  ChunkedMeshDecoder decoder;
+  DRACO_ASSERT_OK(decoder.Init(&in_buffer));
+
+  // A box containing the whole model selects all chunks.
+  BoundingBox all_bounds;
+  for (int i = 0; i < decoder.num_chunks(); ++i) {
+    all_bounds.Update(decoder.chunk(i).bounds);
+  }
+  ASSERT_EQ(decoder.FindChunksInBox(all_bounds).size(), decoder.num_chunks());
+
+  // A box around the first chunk selects only some of the chunks.
+  const std::vector<int> chunk_ids =
+      decoder.FindChunksInBox(decoder.chunk(0).bounds);
+  ASSERT_FALSE(chunk_ids.empty());
+  ASSERT_EQ(chunk_ids[0], 0);
+  ASSERT_LT(chunk_ids.size(), decoder.num_chunks());
+  DRACO_ASSIGN_OR_ASSERT(const auto meshes, decoder.DecodeChunks(chunk_ids, 2));
+  ASSERT_EQ(meshes.size(), chunk_ids.size());
+  for (size_t i = 0; i < meshes.size(); ++i) {
+    ASSERT_EQ(meshes[i]->num_faces(), decoder.chunk(chunk_ids[i]).num_faces);
+  }
+}
+
+TEST_F(ChunkedMeshEncodingTest, TestInvalidInput) {
+  EncoderBuffer buffer;
+  EncodeTestMesh("cube_att.obj", 4, &buffer);
+
+  // Truncated container must be rejected.
+  DecoderBuffer in_buffer;
+  in_buffer.Init(buffer.data(), buffer.size() - 1);
+  ChunkedMeshDecoder decoder;
+  ASSERT_FALSE(decoder.Init(&in_buffer).ok());
+
+  // Regular Draco files are not chunked containers.
+  const std::string file_name =
+      GetTestFileFullPath("test_nm.obj.edgebreaker.cl4.2.2.drc");
+  std::vector<char> data;
+  ASSERT_TRUE(ReadFileToBuffer(file_name, &data));
+  in_buffer.Init(data.data(), data.size());
+  ASSERT_FALSE(ChunkedMeshDecoder::IsChunkedMesh(in_buffer));
+  ASSERT_FALSE(decoder.Init(&in_buffer).ok());
+
+  in_buffer.Init(buffer.data(), buffer.size());
+  DRACO_ASSERT_OK(decoder.Init(&in_buffer));
+  ASSERT_FALSE(decoder.DecodeChunk(decoder.num_chunks()).ok());
+}
+
+TEST_F(ChunkedMeshEncodingTest, TestFourComponentPositions) {
+  // Grid of homogeneous positions. The fourth component is outside of the
+  // bounds of the first three.
+  constexpr int kGridSize = 20;
+  constexpr float kW = 1e7f;
+  TriangleSoupMeshBuilder builder;
+  builder.Start(2 * kGridSize * kGridSize);
+  const int pos_att_id =
+      builder.AddAttribute(GeometryAttribute::POSITION, 4, DT_FLOAT32);
+  int face = 0;
+  for (int y = 0; y < kGridSize; ++y) {
+    for (int x = 0; x < kGridSize; ++x) {
+      const float x0 = x, y0 = y, x1 = x + 1, y1 = y + 1;
+      builder.SetAttributeValuesForFace(pos_att_id, FaceIndex(face++),
+                                        Vector4f(x0, y0, 0.f, kW).data(),
+                                        Vector4f(x1, y0, 0.f, kW + 1.f).data(),
+                                        Vector4f(x1, y1, 0.f, kW + 2.f).data());
+      builder.SetAttributeValuesForFace(pos_att_id, FaceIndex(face++),
+                                        Vector4f(x0, y0, 0.f, kW).data(),
+                                        Vector4f(x1, y1, 0.f, kW + 2.f).data(),
+                                        Vector4f(x0, y1, 0.f, kW + 1.f).data());
+    }
+  }
+  const std::unique_ptr<Mesh> mesh = builder.Finalize();
+  ASSERT_NE(mesh, nullptr);
+
+  Encoder encoder;
+  encoder.SetAttributeQuantization(GeometryAttribute::POSITION, 14);
+  ChunkedMeshEncoder chunked_encoder;
+  chunked_encoder.SetMaxFacesPerChunk(100);
+  EncoderBuffer buffer;
+  DRACO_ASSERT_OK(chunked_encoder.EncodeMesh(*mesh, encoder, &buffer));
+
+  DecoderBuffer in_buffer;
+  in_buffer.Init(buffer.data(), buffer.size());
+  ChunkedMeshDecoder decoder;
+  DRACO_ASSERT_OK(decoder.Init(&in_buffer));
+  ASSERT_GT(decoder.num_chunks(), 1);
+  DRACO_ASSIGN_OR_ASSERT(const auto meshes, decoder.DecodeAllChunks(1));
+  uint32_t num_faces = 0;
+  for (const auto &chunk : meshes) {
+    num_faces += chunk->num_faces();
+    const PointAttribute *const pos_att =
+        chunk->GetNamedAttribute(GeometryAttribute::POSITION);
+    ASSERT_NE(pos_att, nullptr);
+    ASSERT_EQ(pos_att->num_components(), 4);
+    for (AttributeValueIndex avi(0); avi < pos_att->size(); ++avi) {
+      Vector4f pos;
+      pos_att->GetValue(avi, &pos[0]);
+      for (int c = 0; c < 2; ++c) {
+        ASSERT_GE(pos[c], -0.01f);
+        ASSERT_LE(pos[c], kGridSize + 0.01f);
+        ASSERT_NEAR(pos[c], std::round(pos[c]), 0.01f);
+      }
+      ASSERT_NEAR(pos[2], 0.f, 0.01f);
+      ASSERT_GE(pos[3], kW - 0.01f);
+      ASSERT_LE(pos[3], kW + 2.01f);
+      ASSERT_NEAR(pos[3], std::round(pos[3]), 0.01f);
+    }
+  }
+  ASSERT_EQ(num_faces, mesh->num_faces());
+}
+
+TEST_F(ChunkedMeshEncodingTest, TestMalformedHeader) {
+  // Header with chunk data sizes whose sum overflows uint64_t.
+  EncoderBuffer buffer;
+  buffer.Encode("DRCHK", 5);
+  buffer.Encode(kDracoChunkedMeshVersionMajor);
+  buffer.Encode(kDracoChunkedMeshVersionMinor);
+  EncodeVarint(static_cast<uint32_t>(2), &buffer);
+  const uint64_t data_sizes[2] = {1ull << 63, (1ull << 63) + 10};
+  for (const uint64_t data_size : data_sizes) {
+    for (int c = 0; c < 6; ++c) {
+      buffer.Encode(0.f);
+    }
+    EncodeVarint(static_cast<uint32_t>(1), &buffer);
+    EncodeVarint(data_size, &buffer);
+  }
+  const std::vector<char> data(32, 0);
+  buffer.Encode(data.data(), data.size());
+
+  DecoderBuffer in_buffer;
+  in_buffer.Init(buffer.data(), buffer.size());
+  ChunkedMeshDecoder decoder;
+  ASSERT_FALSE(decoder.Init(&in_buffer).ok());
+  ASSERT_EQ(decoder.num_chunks(), 0);
+}
+
+}  // namespace draco
@@ -28,6 +28,27 @@ static constexpr uint8_t kDracoPointCloudBitstreamVersionMinor = 3;
 static constexpr uint8_t kDracoMeshBitstreamVersionMajor = 2;
 static constexpr uint8_t kDracoMeshBitstreamVersionMinor = 2;
 
+// Minor bit-stream versions that add support for symbols encoded with
+// interleaved rANS states (SYMBOL_CODING_RAW_INTERLEAVED). The encoder writes
+// these versions only when the interleaved coding is enabled, so that all
+// other streams remain decodable by older decoders.
+static constexpr uint8_t kDracoPointCloudInterleavedRAnsBitstreamVersionMinor =
+    4;
+static constexpr uint8_t kDracoMeshInterleavedRAnsBitstreamVersionMinor = 3;
+
+// Minor point cloud bit-stream version that adds the breadth first order of
+// the kd-tree encoding, which can be decoded progressively with depth and point
+// budgets (see Decoder::SetKdTreeMaxDepth()). Like the interleaved rANS
+// version, it is written only when the breadth first order is enabled. It is
+// a superset of the previous minor version.
+static constexpr uint8_t
+    kDracoPointCloudBreadthFirstKdTreeBitstreamVersionMinor = 5;
+
+// Version of the container with independently encoded mesh chunks (see
+// chunked_mesh_encoder.h).
+static constexpr uint8_t kDracoChunkedMeshVersionMajor = 1;
+static constexpr uint8_t kDracoChunkedMeshVersionMinor = 0;
+
 // Concatenated latest bit-stream version.
 static constexpr uint16_t kDracoPointCloudBitstreamVersion =
     DRACO_BITSTREAM_VERSION(kDracoPointCloudBitstreamVersionMajor,
@@ -144,6 +165,9 @@ enum NormalPredictionMode {
 enum SymbolCodingMethod {
   SYMBOL_CODING_TAGGED = 0,
   SYMBOL_CODING_RAW = 1,
+  // Same as SYMBOL_CODING_RAW but the symbols are split between several
+  // interleaved rANS states that can be decoded in parallel.
+  SYMBOL_CODING_RAW_INTERLEAVED = 2,
   NUM_SYMBOL_CODING_METHODS,
 };
 
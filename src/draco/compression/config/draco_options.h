@@ -123,6 +123,11 @@ class DracoOptions {
   const Options *FindAttributeOptions(const AttributeKeyT &att_key) const;
   const Options &GetGlobalOptions() const { return global_options_; }
 
+  // Returns options of all attributes ordered by their attribute keys.
+  const std::map<AttributeKey, Options> &GetAllAttributeOptions() const {
+    return attribute_options_;
+  }
+
  private:
   Options *GetAttributeOptions(const AttributeKeyT &att_key);
 
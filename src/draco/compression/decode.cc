@@ -15,43 +15,10 @@
 #include "draco/compression/decode.h"
 
 #include "draco/compression/config/compression_shared.h"
-
-#ifdef DRACO_MESH_COMPRESSION_SUPPORTED
-#include "draco/compression/mesh/mesh_edgebreaker_decoder.h"
-#include "draco/compression/mesh/mesh_sequential_decoder.h"
-#endif
-
-#ifdef DRACO_POINT_CLOUD_COMPRESSION_SUPPORTED
-#include "draco/compression/point_cloud/point_cloud_kd_tree_decoder.h"
-#include "draco/compression/point_cloud/point_cloud_sequential_decoder.h"
-#endif
+#include "draco/compression/decoder_context.h"
 
 namespace draco {
 
-#ifdef DRACO_POINT_CLOUD_COMPRESSION_SUPPORTED
-StatusOr<std::unique_ptr<PointCloudDecoder>> CreatePointCloudDecoder(
-    int8_t method) {
-  if (method == POINT_CLOUD_SEQUENTIAL_ENCODING) {
-    return std::unique_ptr<PointCloudDecoder>(
-        new PointCloudSequentialDecoder());
-  } else if (method == POINT_CLOUD_KD_TREE_ENCODING) {
-    return std::unique_ptr<PointCloudDecoder>(new PointCloudKdTreeDecoder());
-  }
-  return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
-}
-#endif
-
-#ifdef DRACO_MESH_COMPRESSION_SUPPORTED
-StatusOr<std::unique_ptr<MeshDecoder>> CreateMeshDecoder(uint8_t method) {
-  if (method == MESH_SEQUENTIAL_ENCODING) {
-    return std::unique_ptr<MeshDecoder>(new MeshSequentialDecoder());
-  } else if (method == MESH_EDGEBREAKER_ENCODING) {
-    return std::unique_ptr<MeshDecoder>(new MeshEdgebreakerDecoder());
-  }
-  return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
-}
-#endif
-
 StatusOr<EncodedGeometryType> Decoder::GetEncodedGeometryType(
     DecoderBuffer *in_buffer) {
   DecoderBuffer temp_buffer(*in_buffer);
@@ -99,9 +66,21 @@ Status Decoder::DecodeBufferToGeometry(DecoderBuffer *in_buffer,
   if (header.encoder_type != POINT_CLOUD) {
     return Status(Status::DRACO_ERROR, "Input is not a point cloud.");
   }
+  if (context_ != nullptr) {
+    DRACO_ASSIGN_OR_RETURN(
+        PointCloudDecoder * decoder,
+        context_->GetPointCloudDecoder(header.encoder_method))
+    decoder->set_cancellation_flag(cancellation_flag_);
+    decoder->set_stats(stats_);
+    const Status status = decoder->Decode(options_, in_buffer, out_geometry);
+    context_->OnDecodeFinished(decoder, *out_geometry, status);
+    return status;
+  }
   DRACO_ASSIGN_OR_RETURN(std::unique_ptr<PointCloudDecoder> decoder,
                          CreatePointCloudDecoder(header.encoder_method))
 
+  decoder->set_cancellation_flag(cancellation_flag_);
+  decoder->set_stats(stats_);
   DRACO_RETURN_IF_ERROR(decoder->Decode(options_, in_buffer, out_geometry))
   return OkStatus();
 #else
@@ -118,9 +97,20 @@ Status Decoder::DecodeBufferToGeometry(DecoderBuffer *in_buffer,
   if (header.encoder_type != TRIANGULAR_MESH) {
     return Status(Status::DRACO_ERROR, "Input is not a mesh.");
   }
+  if (context_ != nullptr) {
+    DRACO_ASSIGN_OR_RETURN(MeshDecoder * decoder,
+                           context_->GetMeshDecoder(header.encoder_method))
+    decoder->set_cancellation_flag(cancellation_flag_);
+    decoder->set_stats(stats_);
+    const Status status = decoder->Decode(options_, in_buffer, out_geometry);
+    context_->OnDecodeFinished(decoder, *out_geometry, status);
+    return status;
+  }
   DRACO_ASSIGN_OR_RETURN(std::unique_ptr<MeshDecoder> decoder,
                          CreateMeshDecoder(header.encoder_method))
 
+  decoder->set_cancellation_flag(cancellation_flag_);
+  decoder->set_stats(stats_);
   DRACO_RETURN_IF_ERROR(decoder->Decode(options_, in_buffer, out_geometry))
   return OkStatus();
 #else
@@ -132,4 +122,16 @@ void Decoder::SetSkipAttributeTransform(GeometryAttribute::Type att_type) {
   options_.SetAttributeBool(att_type, "skip_attribute_transform", true);
 }
 
+void Decoder::SetAttributeDecodingThreads(int num_threads) {
+  options_.SetGlobalInt("attribute_decoding_threads", num_threads);
+}
+
+void Decoder::SetKdTreeMaxDepth(int max_depth) {
+  options_.SetGlobalInt("kd_tree_max_depth", max_depth);
+}
+
+void Decoder::SetKdTreeMaxPoints(int max_points) {
+  options_.SetGlobalInt("kd_tree_max_points", max_points);
+}
+
 }  // namespace draco
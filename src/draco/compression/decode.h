@@ -15,8 +15,12 @@
 #ifndef DRACO_COMPRESSION_DECODE_H_
 #define DRACO_COMPRESSION_DECODE_H_
 
+#include <atomic>
+
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/config/decoder_options.h"
+#include "draco/compression/decoder_context.h"
+#include "draco/compression/decoder_stats.h"
 #include "draco/core/decoder_buffer.h"
 #include "draco/core/status_or.h"
 #include "draco/draco_features.h"
@@ -67,12 +71,54 @@ class Decoder {
   // transform manually.
   void SetSkipAttributeTransform(GeometryAttribute::Type att_type);
 
+  // Sets the number of threads used to transform decoded attributes back to
+  // their original format (e.g. dequantization of positions and decoding of
+  // octahedral normals). Entropy decoding of the attributes stays serial. The
+  // default of 1 decodes everything on the calling thread.
+  void SetAttributeDecodingThreads(int num_threads);
+
+  // Sets budgets for decoding point clouds that were encoded with the breadth
+  // first kd-tree (see EncoderBase::SetKdTreeBreadthFirstTraversal()). The
+  // decoder stops refining the tree once it reaches |max_depth| or once the
+  // number of points exceeds |max_points|, and it returns a representative
+  // subset of the point cloud where each undecoded tree node is replaced by the
+  // center of its cell. A finer subset can be obtained by decoding the same
+  // data with larger budgets. Negative values (default) disable the budgets.
+  // The budgets are ignored for all other encoded data.
+  void SetKdTreeMaxDepth(int max_depth);
+  void SetKdTreeMaxPoints(int max_points);
+
   // Returns the options instance used by the decoder that can be used by users
   // to control the decoding process.
   DecoderOptions *options() { return &options_; }
 
+  // Sets an optional flag that can be raised from another thread to abort an
+  // ongoing decode. The flag is checked between the decoding stages, i.e.,
+  // after the connectivity and before each attributes decoder. A cancelled
+  // decode returns an error status. The flag must outlive the decoding.
+  void SetCancellationFlag(const std::atomic<bool> *flag) {
+    cancellation_flag_ = flag;
+  }
+
+  // Sets an optional context that keeps the geometry decoders and their
+  // working memory alive between decodes. Reusing one context for many
+  // decodes avoids reallocating the decoder state for each model. The context
+  // must outlive the decoding and it must not be used by multiple decoders
+  // concurrently. Passing nullptr restores the default behavior where a new
+  // geometry decoder is created for each decode.
+  void SetDecoderContext(DecoderContext *context) { context_ = context; }
+
+  // Sets optional statistics that record the time, consumed bytes and
+  // allocations of the individual decoding stages (see decoder_stats.h). The
+  // stages of each decode are appended to |stats|, use DecoderStats::Clear()
+  // to reset them. The statistics must outlive the decoding.
+  void SetStats(DecoderStats *stats) { stats_ = stats; }
+
  private:
   DecoderOptions options_;
+  const std::atomic<bool> *cancellation_flag_ = nullptr;
+  DecoderContext *context_ = nullptr;
+  DecoderStats *stats_ = nullptr;
 };
 
 }  // namespace draco
@@ -14,6 +14,7 @@
 //
 #include "draco/compression/decode.h"
 
+#include <atomic>
 #include <cinttypes>
 #include <sstream>
 
@@ -22,6 +23,8 @@
 #include "draco/core/draco_test_utils.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/obj_encoder.h"
+#include "draco/mesh/mesh_are_equivalent.h"
+#include "draco/point_cloud/point_cloud_builder.h"
 
 namespace {
 
@@ -242,4 +245,245 @@ TEST_F(DecodeTest, TestSkipAttributeTransformUniqueId) {
             << std::endl;
 }
 
+TEST_F(DecodeTest, TestCancellationFlag) {
+  // Tests that a raised cancellation flag aborts the decoding and that a
+  // cleared flag does not affect it.
+  std::vector<char> data;
+  ASSERT_TRUE(draco::ReadFileToBuffer(
+      draco::GetTestFileFullPath("cube_att.obj.edgebreaker.cl4.2.2.drc"),
+      &data));
+  ASSERT_FALSE(data.empty());
+
+  std::atomic<bool> cancelled(true);
+  draco::Decoder decoder;
+  decoder.SetCancellationFlag(&cancelled);
+  draco::DecoderBuffer buffer;
+  buffer.Init(data.data(), data.size());
+  ASSERT_FALSE(decoder.DecodeMeshFromBuffer(&buffer).ok());
+
+  cancelled = false;
+  buffer.Init(data.data(), data.size());
+  DRACO_ASSERT_OK(decoder.DecodeMeshFromBuffer(&buffer).status());
+}
+
+TEST_F(DecodeTest, TestAttributeDecodingThreads) {
+  // Tests that transforming the attributes on multiple threads produces the
+  // same output as the serial decoding.
+  for (const std::string file_name :
+       {"car.drc", "cube_att.obj.edgebreaker.cl10.2.2.drc",
+        "pc_kd_color.drc"}) {
+    std::vector<char> data;
+    ASSERT_TRUE(
+        draco::ReadFileToBuffer(draco::GetTestFileFullPath(file_name), &data));
+    draco::DecoderBuffer buffer;
+    buffer.Init(data.data(), data.size());
+    draco::Decoder decoder;
+    std::unique_ptr<draco::PointCloud> pc_serial =
+        decoder.DecodePointCloudFromBuffer(&buffer).value();
+    ASSERT_NE(pc_serial, nullptr);
+
+    buffer.Init(data.data(), data.size());
+    decoder.SetAttributeDecodingThreads(4);
+    std::unique_ptr<draco::PointCloud> pc_threaded =
+        decoder.DecodePointCloudFromBuffer(&buffer).value();
+    ASSERT_NE(pc_threaded, nullptr);
+
+    ASSERT_EQ(pc_serial->num_attributes(), pc_threaded->num_attributes());
+    for (int i = 0; i < pc_serial->num_attributes(); ++i) {
+      const draco::PointAttribute *const att_serial = pc_serial->attribute(i);
+      const draco::PointAttribute *const att_threaded =
+          pc_threaded->attribute(i);
+      ASSERT_EQ(att_serial->size(), att_threaded->size());
+      ASSERT_EQ(att_serial->buffer()->data_size(),
+                att_threaded->buffer()->data_size());
+      ASSERT_EQ(memcmp(att_serial->buffer()->data(),
+                       att_threaded->buffer()->data(),
+                       att_serial->buffer()->data_size()),
+                0);
+    }
+  }
+}
+
+
+TEST_F(DecodeTest, TestDecoderContext) {
+  // Tests that decoding multiple models with a shared decoder context produces
+  // the same geometry as decoding each model with a new decoder.
+  const std::vector<std::string> file_names = {
+      "test_nm.obj.edgebreaker.cl4.2.2.drc",
+      "cube_att.obj.edgebreaker.cl10.2.2.drc",
+      "test_nm.obj.edgebreaker.cl10.2.2.drc",
+      "cube_att.obj.edgebreaker.cl4.2.2.drc",
+      "test_nm.obj.sequential.cl3.2.2.drc",
+      "car.drc",
+      "test_nm.obj.edgebreaker.0.10.0.drc"};
+  draco::DecoderContext context;
+  for (int pass = 0; pass < 2; ++pass) {
+    for (const std::string &file_name : file_names) {
+      std::vector<char> data;
+      ASSERT_TRUE(draco::ReadFileToBuffer(
+          draco::GetTestFileFullPath(file_name), &data));
+      draco::DecoderBuffer buffer;
+      buffer.Init(data.data(), data.size());
+      draco::Decoder decoder;
+      DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::Mesh> expected_mesh,
+                             decoder.DecodeMeshFromBuffer(&buffer));
+
+      buffer.Init(data.data(), data.size());
+      decoder.SetDecoderContext(&context);
+      DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::Mesh> mesh,
+                             decoder.DecodeMeshFromBuffer(&buffer));
+      draco::MeshAreEquivalent equiv;
+      ASSERT_TRUE(equiv(*expected_mesh, *mesh)) << file_name;
+    }
+  }
+  // Only one decoder per encoding method should have been created.
+  ASSERT_EQ(context.num_created_decoders(), 2);
+  ASSERT_GT(context.retained_memory(), 0u);
+  context.Clear();
+  ASSERT_EQ(context.retained_memory(), 0u);
+
+  // Decoders exceeding the memory limit are not retained.
+  context.set_max_retained_memory(0);
+  std::vector<char> data;
+  ASSERT_TRUE(draco::ReadFileToBuffer(
+      draco::GetTestFileFullPath("test_nm.obj.edgebreaker.cl4.2.2.drc"),
+      &data));
+  draco::DecoderBuffer buffer;
+  buffer.Init(data.data(), data.size());
+  draco::Decoder decoder;
+  decoder.SetDecoderContext(&context);
+  DRACO_ASSERT_OK(decoder.DecodeMeshFromBuffer(&buffer).status());
+  ASSERT_EQ(context.retained_memory(), 0u);
+}
+
+TEST_F(DecodeTest, TestDecoderStats) {
+  // Tests that the decoder records the individual decoding stages.
+  std::vector<char> data;
+  ASSERT_TRUE(draco::ReadFileToBuffer(
+      draco::GetTestFileFullPath("test_nm.obj.edgebreaker.cl10.2.2.drc"),
+      &data));
+  draco::DecoderBuffer buffer;
+  buffer.Init(data.data(), data.size());
+
+  draco::DecoderStats stats;
+  int64_t num_counter_calls = 0;
+  stats.set_allocation_counter(
+      [&num_counter_calls]() { return num_counter_calls++; });
+  draco::Decoder decoder;
+  decoder.SetStats(&stats);
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::Mesh> mesh,
+                         decoder.DecodeMeshFromBuffer(&buffer));
+
+  ASSERT_FALSE(stats.stages().empty());
+  ASSERT_EQ(stats.stages()[0].stage, draco::DecoderStats::STAGE_HEADER);
+  ASSERT_EQ(stats.stages()[0].num_bytes, 11);
+  int64_t num_bytes = 0;
+  std::vector<int> num_values_stages(mesh->num_attributes(), 0);
+  for (const draco::DecoderStats::StageStats &stage : stats.stages()) {
+    ASSERT_GE(stage.time_ms, 0.0);
+    // Each stage calls the counter once at the start and once at the end.
+    ASSERT_EQ(stage.num_allocations, 1);
+    num_bytes += stage.num_bytes;
+    if (stage.stage == draco::DecoderStats::STAGE_ATTRIBUTE_VALUES) {
+      ASSERT_GE(stage.attribute_id, 0);
+      ASSERT_LT(stage.attribute_id, mesh->num_attributes());
+      num_values_stages[stage.attribute_id]++;
+    }
+  }
+  ASSERT_LE(num_bytes, static_cast<int64_t>(data.size()));
+  for (const int num_stages : num_values_stages) {
+    ASSERT_EQ(num_stages, 1);
+  }
+  ASSERT_GT(stats.StageTimeMs(draco::DecoderStats::STAGE_CONNECTIVITY), 0.0);
+  ASSERT_GE(stats.TotalTimeMs(),
+            stats.StageTimeMs(draco::DecoderStats::STAGE_CONNECTIVITY));
+  ASSERT_STREQ(draco::DecoderStats::StageName(
+                   draco::DecoderStats::STAGE_CONNECTIVITY),
+               "connectivity");
+
+  stats.Clear();
+  ASSERT_TRUE(stats.stages().empty());
+}
+
+TEST_F(DecodeTest, TestKdTreeDecodingBudgets) {
+  // Tests that point clouds encoded with the breadth first kd-tree can be
+  // decoded into a representative subset of points with the depth and point
+  // budgets.
+  constexpr int kGridSize = 16;
+  constexpr int kNumPoints = kGridSize * kGridSize * kGridSize;
+  draco::PointCloudBuilder builder;
+  builder.Start(kNumPoints);
+  const int pos_att_id = builder.AddAttribute(
+      draco::GeometryAttribute::POSITION, 3, draco::DT_FLOAT32);
+  const int color_att_id =
+      builder.AddAttribute(draco::GeometryAttribute::COLOR, 3, draco::DT_UINT8);
+  for (int i = 0; i < kNumPoints; ++i) {
+    const float pos[3] = {static_cast<float>(i % kGridSize),
+                          static_cast<float>((i / kGridSize) % kGridSize),
+                          static_cast<float>(i / (kGridSize * kGridSize))};
+    const uint8_t color[3] = {static_cast<uint8_t>(16 * pos[0]),
+                              static_cast<uint8_t>(16 * pos[1]),
+                              static_cast<uint8_t>(16 * pos[2])};
+    builder.SetAttributeValueForPoint(pos_att_id, draco::PointIndex(i), pos);
+    builder.SetAttributeValueForPoint(color_att_id, draco::PointIndex(i),
+                                      color);
+  }
+  std::unique_ptr<draco::PointCloud> pc = builder.Finalize(false);
+  ASSERT_NE(pc, nullptr);
+
+  draco::Encoder encoder;
+  encoder.SetEncodingMethod(draco::POINT_CLOUD_KD_TREE_ENCODING);
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION, 10);
+  encoder.SetKdTreeBreadthFirstTraversal(true);
+  draco::EncoderBuffer enc_buffer;
+  DRACO_ASSERT_OK(encoder.EncodePointCloudToBuffer(*pc, &enc_buffer));
+
+  const auto decode = [&enc_buffer](int max_depth, int max_points) {
+    draco::DecoderBuffer buffer;
+    buffer.Init(enc_buffer.data(), enc_buffer.size());
+    draco::Decoder decoder;
+    decoder.SetKdTreeMaxDepth(max_depth);
+    decoder.SetKdTreeMaxPoints(max_points);
+    return decoder.DecodePointCloudFromBuffer(&buffer);
+  };
+
+  // Without budgets, all points are decoded.
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::PointCloud> full_pc,
+                         decode(-1, -1));
+  ASSERT_EQ(full_pc->num_points(), kNumPoints);
+
+  // Each level of the tree splits the nodes in two, i.e., the first three
+  // levels contain at most eight nodes.
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::PointCloud> depth_pc,
+                         decode(3, -1));
+  ASSERT_GT(depth_pc->num_points(), 0);
+  ASSERT_LE(depth_pc->num_points(), 8);
+
+  // The point budget is exceeded by at most a few points of the last decoded
+  // tree node. Larger budgets refine the subset.
+  int last_num_points = depth_pc->num_points();
+  for (const int max_points : {100, 1000}) {
+    DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::PointCloud> subset_pc,
+                           decode(-1, max_points));
+    ASSERT_GE(subset_pc->num_points(), max_points);
+    ASSERT_LE(subset_pc->num_points(), max_points + 2);
+    ASSERT_GT(subset_pc->num_points(), last_num_points);
+    last_num_points = subset_pc->num_points();
+    for (int i = 0; i < subset_pc->num_attributes(); ++i) {
+      ASSERT_EQ(subset_pc->attribute(i)->size(), subset_pc->num_points());
+    }
+    // All points of the subset lie within the bounds of the input.
+    const draco::PointAttribute *const pos_att =
+        subset_pc->GetNamedAttribute(draco::GeometryAttribute::POSITION);
+    for (draco::PointIndex pi(0); pi < subset_pc->num_points(); ++pi) {
+      float pos[3];
+      pos_att->GetMappedValue(pi, pos);
+      for (int c = 0; c < 3; ++c) {
+        ASSERT_GE(pos[c], -0.01f);
+        ASSERT_LE(pos[c], kGridSize - 1 + 0.01f);
+      }
+    }
+  }
+}
+
 }  // namespace
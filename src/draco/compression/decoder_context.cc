@@ -0,0 +1,168 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/decoder_context.h"
+
+#include <algorithm>
+
+#include "draco/compression/config/compression_shared.h"
+
+#ifdef DRACO_MESH_COMPRESSION_SUPPORTED
+#include "draco/compression/mesh/mesh_edgebreaker_decoder.h"
+#include "draco/compression/mesh/mesh_sequential_decoder.h"
+#endif
+
+#ifdef DRACO_POINT_CLOUD_COMPRESSION_SUPPORTED
+#include "draco/compression/point_cloud/point_cloud_kd_tree_decoder.h"
+#include "draco/compression/point_cloud/point_cloud_sequential_decoder.h"
+#endif
+
+namespace draco {
+
+namespace {
+// Approximate working memory kept by the decoders for each decoded face and
+// point. Edgebreaker keeps two corner maps, the processed corner lists and the
+// traversal symbols for each face, and the vertex corners, hole flags and
+// valences for each point.
+constexpr size_t kRetainedBytesPerFace = 40;
+constexpr size_t kRetainedBytesPerPoint = 12;
+}  // namespace
+
+StatusOr<std::unique_ptr<PointCloudDecoder>> CreatePointCloudDecoder(
+    int8_t method) {
+#ifdef DRACO_POINT_CLOUD_COMPRESSION_SUPPORTED
+  if (method == POINT_CLOUD_SEQUENTIAL_ENCODING) {
+    return std::unique_ptr<PointCloudDecoder>(
+        new PointCloudSequentialDecoder());
+  } else if (method == POINT_CLOUD_KD_TREE_ENCODING) {
+    return std::unique_ptr<PointCloudDecoder>(new PointCloudKdTreeDecoder());
+  }
+#endif
+  return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
+}
+
+StatusOr<std::unique_ptr<MeshDecoder>> CreateMeshDecoder(uint8_t method) {
+#ifdef DRACO_MESH_COMPRESSION_SUPPORTED
+  if (method == MESH_SEQUENTIAL_ENCODING) {
+    return std::unique_ptr<MeshDecoder>(new MeshSequentialDecoder());
+  } else if (method == MESH_EDGEBREAKER_ENCODING) {
+    return std::unique_ptr<MeshDecoder>(new MeshEdgebreakerDecoder());
+  }
+#endif
+  return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
+}
+
+constexpr size_t DecoderContext::kDefaultMaxRetainedMemory;
+
+DecoderContext::DecoderContext()
+    : max_retained_memory_(kDefaultMaxRetainedMemory),
+      num_created_decoders_(0) {
+  for (int i = 0; i < kNumPointCloudMethods; ++i) {
+    point_cloud_decoder_memory_[i] = 0;
+  }
+  for (int i = 0; i < kNumMeshMethods; ++i) {
+    mesh_decoder_memory_[i] = 0;
+  }
+}
+
+StatusOr<PointCloudDecoder *> DecoderContext::GetPointCloudDecoder(
+    int8_t method) {
+  if (method < 0 || method >= kNumPointCloudMethods) {
+    return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
+  }
+  if (point_cloud_decoders_[method] == nullptr) {
+    DRACO_ASSIGN_OR_RETURN(point_cloud_decoders_[method],
+                           CreatePointCloudDecoder(method));
+    ++num_created_decoders_;
+  }
+  return point_cloud_decoders_[method].get();
+}
+
+StatusOr<MeshDecoder *> DecoderContext::GetMeshDecoder(uint8_t method) {
+  if (method >= kNumMeshMethods) {
+    return Status(Status::DRACO_ERROR, "Unsupported encoding method.");
+  }
+  if (mesh_decoders_[method] == nullptr) {
+    DRACO_ASSIGN_OR_RETURN(mesh_decoders_[method], CreateMeshDecoder(method));
+    ++num_created_decoders_;
+  }
+  return mesh_decoders_[method].get();
+}
+
+void DecoderContext::OnDecodeFinished(const PointCloudDecoder *decoder,
+                                      const PointCloud &geometry,
+                                      const Status &status) {
+  // The working buffers keep their capacity so the retained memory is given
+  // by the largest geometry decoded so far.
+  const size_t memory = EstimateRetainedMemory(*decoder, geometry);
+  for (int i = 0; i < kNumPointCloudMethods; ++i) {
+    if (point_cloud_decoders_[i].get() == decoder) {
+      ReleaseOrRetain(status, memory, &point_cloud_decoders_[i],
+                      &point_cloud_decoder_memory_[i]);
+    }
+  }
+  for (int i = 0; i < kNumMeshMethods; ++i) {
+    if (mesh_decoders_[i].get() == decoder) {
+      ReleaseOrRetain(status, memory, &mesh_decoders_[i],
+                      &mesh_decoder_memory_[i]);
+    }
+  }
+}
+
+template <class DecoderT>
+void DecoderContext::ReleaseOrRetain(const Status &status, size_t memory,
+                                     std::unique_ptr<DecoderT> *decoder,
+                                     size_t *retained_memory) const {
+  *retained_memory = std::max(*retained_memory, memory);
+  // A failed decode can leave arbitrarily sized buffers behind (e.g. when the
+  // input is corrupted) so the decoder is never retained in that case.
+  if (!status.ok() || *retained_memory > max_retained_memory_) {
+    *decoder = nullptr;
+    *retained_memory = 0;
+  }
+}
+
+void DecoderContext::Clear() {
+  for (int i = 0; i < kNumPointCloudMethods; ++i) {
+    point_cloud_decoders_[i] = nullptr;
+    point_cloud_decoder_memory_[i] = 0;
+  }
+  for (int i = 0; i < kNumMeshMethods; ++i) {
+    mesh_decoders_[i] = nullptr;
+    mesh_decoder_memory_[i] = 0;
+  }
+}
+
+size_t DecoderContext::retained_memory() const {
+  size_t memory = 0;
+  for (int i = 0; i < kNumPointCloudMethods; ++i) {
+    memory += point_cloud_decoder_memory_[i];
+  }
+  for (int i = 0; i < kNumMeshMethods; ++i) {
+    memory += mesh_decoder_memory_[i];
+  }
+  return memory;
+}
+
+size_t DecoderContext::EstimateRetainedMemory(
+    const PointCloudDecoder &decoder, const PointCloud &geometry) {
+  size_t memory = geometry.num_points() * kRetainedBytesPerPoint;
+  if (decoder.GetGeometryType() == TRIANGULAR_MESH) {
+    const Mesh &mesh = static_cast<const Mesh &>(geometry);
+    memory += mesh.num_faces() * kRetainedBytesPerFace;
+  }
+  return memory;
+}
+
+}  // namespace draco
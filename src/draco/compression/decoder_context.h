@@ -0,0 +1,116 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_COMPRESSION_DECODER_CONTEXT_H_
+#define DRACO_COMPRESSION_DECODER_CONTEXT_H_
+
+#include <cstddef>
+#include <memory>
+
+#include "draco/compression/mesh/mesh_decoder.h"
+#include "draco/compression/point_cloud/point_cloud_decoder.h"
+#include "draco/core/status_or.h"
+#include "draco/draco_features.h"
+
+namespace draco {
+
+// Creates a new decoder for the given point cloud encoding |method|.
+StatusOr<std::unique_ptr<PointCloudDecoder>> CreatePointCloudDecoder(
+    int8_t method);
+
+// Creates a new decoder for the given mesh encoding |method|.
+StatusOr<std::unique_ptr<MeshDecoder>> CreateMeshDecoder(uint8_t method);
+
+// Long-lived state that can be shared by many consecutive decodes. The context
+// keeps one geometry decoder per encoding method alive between the decodes so
+// that their working memory (e.g. the edgebreaker corner table, traversal
+// stacks and symbol buffers) is reused instead of being reallocated for every
+// decoded model. This is mostly useful when decoding large numbers of small
+// models.
+//
+// The amount of retained memory can be limited with set_max_retained_memory().
+// When the estimated working memory of a decoder exceeds the limit after a
+// decode, the decoder is released and a new one is created for the next
+// decode.
+//
+// DecoderContext is not thread-safe. Use one context per decoding thread.
+class DecoderContext {
+ public:
+  // Default limit on the retained working memory in bytes.
+  static constexpr size_t kDefaultMaxRetainedMemory = 64 * 1024 * 1024;
+
+  DecoderContext();
+
+  // Returns a decoder for the point cloud encoding |method|. The returned
+  // decoder is owned by the context and it is valid until the next call to
+  // any of the non-const methods of the context.
+  StatusOr<PointCloudDecoder *> GetPointCloudDecoder(int8_t method);
+
+  // Returns a decoder for the mesh encoding |method|. See
+  // GetPointCloudDecoder() for the lifetime of the returned decoder.
+  StatusOr<MeshDecoder *> GetMeshDecoder(uint8_t method);
+
+  // Must be called after a decoder obtained from the context was used to
+  // decode |geometry|. |status| is the result of the decode. Failed decodes
+  // and decodes that exceed the memory limit release the used decoder.
+  void OnDecodeFinished(const PointCloudDecoder *decoder,
+                        const PointCloud &geometry, const Status &status);
+
+  // Releases all retained decoders and their memory.
+  void Clear();
+
+  void set_max_retained_memory(size_t max_bytes) {
+    max_retained_memory_ = max_bytes;
+  }
+  size_t max_retained_memory() const { return max_retained_memory_; }
+
+  // Returns the estimated working memory in bytes that is currently retained
+  // by the decoders of this context.
+  size_t retained_memory() const;
+
+  // Returns the number of decoders that were created by the context. Useful
+  // for checking how often the retained decoders could be reused.
+  int num_created_decoders() const { return num_created_decoders_; }
+
+ private:
+  static constexpr int kNumPointCloudMethods = 2;
+  static constexpr int kNumMeshMethods = 2;
+
+  // Returns an estimate of the working memory that a decoder keeps after
+  // decoding |geometry|.
+  static size_t EstimateRetainedMemory(const PointCloudDecoder &decoder,
+                                       const PointCloud &geometry);
+
+  // Updates the retained memory of |decoder| and releases the decoder when the
+  // decode failed or when the memory limit is exceeded.
+  template <class DecoderT>
+  void ReleaseOrRetain(const Status &status, size_t memory,
+                       std::unique_ptr<DecoderT> *decoder,
+                       size_t *retained_memory) const;
+
+  std::unique_ptr<PointCloudDecoder>
+      point_cloud_decoders_[kNumPointCloudMethods];
+  std::unique_ptr<MeshDecoder> mesh_decoders_[kNumMeshMethods];
+
+  // Estimated retained memory for each of the decoders above.
+  size_t point_cloud_decoder_memory_[kNumPointCloudMethods];
+  size_t mesh_decoder_memory_[kNumMeshMethods];
+
+  size_t max_retained_memory_;
+  int num_created_decoders_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_COMPRESSION_DECODER_CONTEXT_H_
@@ -0,0 +1,102 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/decoder_stats.h"
+
+namespace draco {
+
+DecoderStats::ScopedStage::ScopedStage(DecoderStats *stats, Stage stage,
+                                       int attribute_id,
+                                       const DecoderBuffer *buffer)
+    : stats_(stats),
+      stage_(stage),
+      attribute_id_(attribute_id),
+      buffer_(buffer),
+      start_data_head_(nullptr),
+      start_allocations_(0) {
+  if (stats_ == nullptr) {
+    return;
+  }
+  start_data_head_ = buffer_ ? buffer_->data_head() : nullptr;
+  start_allocations_ = stats_->GetNumAllocations();
+  start_time_ = std::chrono::steady_clock::now();
+}
+
+DecoderStats::ScopedStage::~ScopedStage() {
+  if (stats_ == nullptr) {
+    return;
+  }
+  const std::chrono::duration<double, std::milli> elapsed =
+      std::chrono::steady_clock::now() - start_time_;
+  StageStats stage;
+  stage.stage = stage_;
+  stage.attribute_id = attribute_id_;
+  stage.time_ms = elapsed.count();
+  stage.num_bytes = buffer_ ? buffer_->data_head() - start_data_head_ : 0;
+  stage.num_allocations = stats_->GetNumAllocations() - start_allocations_;
+  stats_->AddStage(stage);
+}
+
+void DecoderStats::Clear() {
+  std::lock_guard<std::mutex> lock(mutex_);
+  stages_.clear();
+}
+
+double DecoderStats::TotalTimeMs() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  double time_ms = 0;
+  for (const StageStats &stage : stages_) {
+    time_ms += stage.time_ms;
+  }
+  return time_ms;
+}
+
+double DecoderStats::StageTimeMs(Stage stage) const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  double time_ms = 0;
+  for (const StageStats &s : stages_) {
+    if (s.stage == stage) {
+      time_ms += s.time_ms;
+    }
+  }
+  return time_ms;
+}
+
+const char *DecoderStats::StageName(Stage stage) {
+  switch (stage) {
+    case STAGE_HEADER:
+      return "header";
+    case STAGE_METADATA:
+      return "metadata";
+    case STAGE_CONNECTIVITY:
+      return "connectivity";
+    case STAGE_ATTRIBUTES_DECODER_DATA:
+      return "attributes_decoder_data";
+    case STAGE_ATTRIBUTE_VALUES:
+      return "attribute_values";
+    case STAGE_ATTRIBUTE_PREDICTION:
+      return "attribute_prediction";
+    case STAGE_ATTRIBUTE_TRANSFORM:
+      return "attribute_transform";
+    default:
+      return "unknown";
+  }
+}
+
+void DecoderStats::AddStage(const StageStats &stage) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  stages_.push_back(stage);
+}
+
+}  // namespace draco
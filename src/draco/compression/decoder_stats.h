@@ -0,0 +1,134 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_COMPRESSION_DECODER_STATS_H_
+#define DRACO_COMPRESSION_DECODER_STATS_H_
+
+#include <chrono>
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <vector>
+
+#include "draco/core/decoder_buffer.h"
+
+namespace draco {
+
+// Collects per-stage statistics of a decode. An instance can be attached to a
+// decoder with Decoder::SetStats(). The decoder then records the wall time,
+// the number of consumed input bytes and optionally the number of memory
+// allocations of each decoding stage. Stages that process a single attribute
+// record the id of the attribute.
+//
+// Stages are appended in the order in which they finish. The recorded stages
+// never overlap on one thread, so their sum is the instrumented part of the
+// decode.
+class DecoderStats {
+ public:
+  enum Stage {
+    // Draco header and version checks.
+    STAGE_HEADER = 0,
+    // Geometry metadata.
+    STAGE_METADATA,
+    // Connectivity of meshes (e.g. the edgebreaker traversal) or the geometry
+    // data of point clouds.
+    STAGE_CONNECTIVITY,
+    // Creation and initialization of the attribute decoders.
+    STAGE_ATTRIBUTES_DECODER_DATA,
+    // Entropy decoding of attribute values.
+    STAGE_ATTRIBUTE_VALUES,
+    // Reversal of the attribute prediction scheme.
+    STAGE_ATTRIBUTE_PREDICTION,
+    // Transform of the attribute to its original format, e.g. dequantization
+    // or octahedral decoding of normals.
+    STAGE_ATTRIBUTE_TRANSFORM,
+    NUM_STAGES
+  };
+
+  struct StageStats {
+    Stage stage;
+    // Id of the processed attribute or -1 when the stage is not specific to a
+    // single attribute.
+    int attribute_id;
+    double time_ms;
+    // Number of input bytes consumed by the stage.
+    int64_t num_bytes;
+    // Number of allocations made during the stage. Always 0 when no
+    // allocation counter is set.
+    int64_t num_allocations;
+  };
+
+  // Records a stage from construction until destruction. Does nothing when
+  // |stats| is nullptr.
+  class ScopedStage {
+   public:
+    ScopedStage(DecoderStats *stats, Stage stage, int attribute_id,
+                const DecoderBuffer *buffer);
+    ~ScopedStage();
+
+   private:
+    DecoderStats *const stats_;
+    const Stage stage_;
+    const int attribute_id_;
+    const DecoderBuffer *const buffer_;
+    // Position of the buffer at the start of the stage. Decoders may
+    // re-initialize the buffer with the remaining data so the consumed bytes
+    // are measured using the data pointer instead of the buffer offset.
+    const char *start_data_head_;
+    int64_t start_allocations_;
+    std::chrono::steady_clock::time_point start_time_;
+  };
+
+  DecoderStats() = default;
+
+  // Sets a function returning the total number of allocations made by the
+  // process. Draco does not track allocations itself, so the application has
+  // to provide the counter, e.g. from a custom operator new. Allocations of
+  // stages that run concurrently with other threads may be attributed to the
+  // wrong stage.
+  void set_allocation_counter(std::function<int64_t()> counter) {
+    allocation_counter_ = std::move(counter);
+  }
+
+  // Removes all recorded stages.
+  void Clear();
+
+  // Returns the recorded stages. Must not be called while a decoder that uses
+  // these stats is running.
+  const std::vector<StageStats> &stages() const { return stages_; }
+
+  // Returns the sum of the times of all recorded stages.
+  double TotalTimeMs() const;
+
+  // Returns the sum of times of all recorded stages of type |stage|.
+  double StageTimeMs(Stage stage) const;
+
+  // Returns a human readable name of the |stage|, e.g. "connectivity".
+  static const char *StageName(Stage stage);
+
+ private:
+  int64_t GetNumAllocations() const {
+    return allocation_counter_ ? allocation_counter_() : 0;
+  }
+  void AddStage(const StageStats &stage);
+
+  std::function<int64_t()> allocation_counter_;
+  std::vector<StageStats> stages_;
+  // Attribute transforms may be recorded from multiple threads.
+  mutable std::mutex mutex_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_COMPRESSION_DECODER_STATS_H_
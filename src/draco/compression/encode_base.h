@@ -43,6 +43,39 @@ class EncoderBase {
   // Note that this can slow down encoding for certain encoders.
   void SetTrackEncodedProperties(bool flag);
 
+  // Enables/disables entropy coding of symbols with several interleaved rANS
+  // states, which makes the decoding faster at a slightly larger size of the
+  // encoded data (default = false). Encoded data that use this option are
+  // stored with a newer bit-stream version (see compression_shared.h) and they
+  // cannot be decoded by older decoders.
+  void SetUseInterleavedRAns(bool flag) {
+    options_.SetGlobalBool("use_interleaved_rans", flag);
+  }
+
+  // Enables/disables encoding of the kd-tree of point clouds breadth first,
+  // i.e., level by level (default = false). The encoded size is unchanged, but
+  // the decoder can stop at a given tree depth or number of points and return
+  // a representative subset of the point cloud (see Decoder). It applies only
+  // to point clouds encoded with POINT_CLOUD_KD_TREE_ENCODING. Such data are
+  // stored with a newer bit-stream version (see compression_shared.h) and they
+  // cannot be decoded by older decoders.
+  void SetKdTreeBreadthFirstTraversal(bool flag) {
+    options_.SetGlobalBool("kd_tree_breadth_first", flag);
+  }
+
+  // Enables/disables the realtime encoding profile intended for
+  // latency-sensitive compression (default = false). When enabled, the encoder
+  // skips all methods whose cost is not linear in the size of the input: meshes
+  // are encoded with the standard edgebreaker and a single connectivity for
+  // all attributes, attributes use fixed prediction schemes instead of the
+  // speed-dependent selection, and point clouds are encoded sequentially.
+  // Options that are set explicitly (such as the encoding method or
+  // prediction schemes) take precedence over the profile. The encoded data can
+  // be decoded by any decoder.
+  void SetRealtimeEncoding(bool flag) {
+    options_.SetGlobalBool("realtime_encoding", flag);
+  }
+
   // Returns the number of encoded points and faces during the last encoding
   // operation. Returns 0 if SetTrackEncodedProperties() was not set.
   size_t num_encoded_points() const { return num_encoded_points_; }
@@ -23,11 +23,13 @@
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/decode.h"
 #include "draco/compression/expert_encode.h"
+#include "draco/compression/point_cloud/point_cloud_decoder.h"
 #include "draco/core/draco_test_base.h"
 #include "draco/core/draco_test_utils.h"
 #include "draco/core/vector_d.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/obj_decoder.h"
+#include "draco/mesh/mesh_are_equivalent.h"
 #include "draco/mesh/triangle_soup_mesh_builder.h"
 #include "draco/point_cloud/point_cloud_builder.h"
 
@@ -377,6 +379,146 @@ TEST_F(EncodeTest, TestTrackingOfNumberOfEncodedEntriesNotSet) {
   ASSERT_EQ(encoder.num_encoded_faces(), 0);
 }
 
+TEST_F(EncodeTest, TestRealtimeEncoding) {
+  // Tests that meshes encoded with the realtime profile use the standard
+  // edgebreaker for all speed settings and that they can be decoded.
+  std::unique_ptr<draco::Mesh> mesh(
+      draco::ReadMeshFromTestFile("cube_att.obj"));
+  ASSERT_NE(mesh, nullptr);
+
+  for (int speed : {0, 5, 10}) {
+    draco::Encoder encoder;
+    encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION, 14);
+    encoder.SetAttributeQuantization(draco::GeometryAttribute::TEX_COORD, 12);
+    encoder.SetAttributeQuantization(draco::GeometryAttribute::NORMAL, 10);
+    encoder.SetSpeedOptions(speed, speed);
+    encoder.SetRealtimeEncoding(true);
+    draco::EncoderBuffer buffer;
+    DRACO_ASSERT_OK(encoder.EncodeMeshToBuffer(*mesh, &buffer));
+
+    draco::DecoderBuffer header_buffer;
+    header_buffer.Init(buffer.data(), buffer.size());
+    draco::DracoHeader header;
+    DRACO_ASSERT_OK(
+        draco::PointCloudDecoder::DecodeHeader(&header_buffer, &header));
+    ASSERT_EQ(header.encoder_method, draco::MESH_EDGEBREAKER_ENCODING);
+    uint8_t edgebreaker_method;
+    ASSERT_TRUE(header_buffer.Decode(&edgebreaker_method));
+    ASSERT_EQ(edgebreaker_method, draco::MESH_EDGEBREAKER_STANDARD_ENCODING);
+
+    draco::DecoderBuffer decoder_buffer;
+    decoder_buffer.Init(buffer.data(), buffer.size());
+    draco::Decoder decoder;
+    DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::Mesh> decoded_mesh,
+                           decoder.DecodeMeshFromBuffer(&decoder_buffer));
+    ASSERT_EQ(decoded_mesh->num_faces(), mesh->num_faces());
+    ASSERT_EQ(decoded_mesh->num_attributes(), mesh->num_attributes());
+  }
+
+  // Point clouds are encoded sequentially.
+  std::unique_ptr<draco::PointCloud> pc = CreateTestPointCloud();
+  ASSERT_NE(pc, nullptr);
+  draco::Encoder encoder;
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION, 16);
+  encoder.SetRealtimeEncoding(true);
+  draco::EncoderBuffer buffer;
+  DRACO_ASSERT_OK(encoder.EncodePointCloudToBuffer(*pc, &buffer));
+  draco::DecoderBuffer header_buffer;
+  header_buffer.Init(buffer.data(), buffer.size());
+  draco::DracoHeader header;
+  DRACO_ASSERT_OK(
+      draco::PointCloudDecoder::DecodeHeader(&header_buffer, &header));
+  ASSERT_EQ(header.encoder_method, draco::POINT_CLOUD_SEQUENTIAL_ENCODING);
+}
+
+TEST_F(EncodeTest, TestInterleavedRAns) {
+  // Tests that the interleaved rANS coding bumps the bit-stream version of the
+  // encoded data and that the data decodes to the same geometry as without
+  // the option.
+  std::unique_ptr<draco::Mesh> mesh(draco::ReadMeshFromTestFile("test_nm.obj"));
+  ASSERT_NE(mesh, nullptr);
+  draco::Encoder encoder;
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION, 14);
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::NORMAL, 10);
+  // Interleaved coding only replaces raw rANS coding of symbols, which is
+  // selected at this speed.
+  encoder.SetSpeedOptions(3, 3);
+  draco::EncoderBuffer mesh_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeMeshToBuffer(*mesh, &mesh_buffer));
+  encoder.SetUseInterleavedRAns(true);
+  draco::EncoderBuffer interleaved_mesh_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeMeshToBuffer(*mesh, &interleaved_mesh_buffer));
+  // Apart from the version in the header, the encoded data differs because
+  // the symbols are coded with a different method.
+  std::string mesh_data(mesh_buffer.data(), mesh_buffer.size());
+  std::string interleaved_mesh_data(interleaved_mesh_buffer.data(),
+                                    interleaved_mesh_buffer.size());
+  interleaved_mesh_data[6] = mesh_data[6];
+  ASSERT_NE(interleaved_mesh_data, mesh_data);
+
+  draco::DecoderBuffer decoder_buffer;
+  decoder_buffer.Init(interleaved_mesh_buffer.data(),
+                      interleaved_mesh_buffer.size());
+  draco::DracoHeader header;
+  DRACO_ASSERT_OK(
+      draco::PointCloudDecoder::DecodeHeader(&decoder_buffer, &header));
+  ASSERT_EQ(header.version_major, draco::kDracoMeshBitstreamVersionMajor);
+  ASSERT_EQ(header.version_minor,
+            draco::kDracoMeshInterleavedRAnsBitstreamVersionMinor);
+
+  draco::Decoder decoder;
+  decoder_buffer.Init(mesh_buffer.data(), mesh_buffer.size());
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::Mesh> decoded_mesh,
+                         decoder.DecodeMeshFromBuffer(&decoder_buffer));
+  decoder_buffer.Init(interleaved_mesh_buffer.data(),
+                      interleaved_mesh_buffer.size());
+  DRACO_ASSIGN_OR_ASSERT(
+      std::unique_ptr<draco::Mesh> decoded_interleaved_mesh,
+      decoder.DecodeMeshFromBuffer(&decoder_buffer));
+  draco::MeshAreEquivalent equiv;
+  ASSERT_TRUE(equiv(*decoded_mesh, *decoded_interleaved_mesh));
+
+  // Point clouds.
+  std::unique_ptr<draco::PointCloud> pc = CreateTestPointCloud();
+  ASSERT_NE(pc, nullptr);
+  draco::Encoder pc_encoder;
+  pc_encoder.SetEncodingMethod(draco::POINT_CLOUD_SEQUENTIAL_ENCODING);
+  pc_encoder.SetUseInterleavedRAns(true);
+  draco::EncoderBuffer pc_buffer;
+  DRACO_ASSERT_OK(pc_encoder.EncodePointCloudToBuffer(*pc, &pc_buffer));
+
+  decoder_buffer.Init(pc_buffer.data(), pc_buffer.size());
+  DRACO_ASSERT_OK(
+      draco::PointCloudDecoder::DecodeHeader(&decoder_buffer, &header));
+  ASSERT_EQ(header.version_major, draco::kDracoPointCloudBitstreamVersionMajor);
+  ASSERT_EQ(header.version_minor,
+            draco::kDracoPointCloudInterleavedRAnsBitstreamVersionMinor);
+
+  decoder_buffer.Init(pc_buffer.data(), pc_buffer.size());
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::PointCloud> decoded_pc,
+                         decoder.DecodePointCloudFromBuffer(&decoder_buffer));
+  ASSERT_EQ(decoded_pc->num_points(), pc->num_points());
+  ASSERT_EQ(decoded_pc->num_attributes(), pc->num_attributes());
+  for (int i = 0; i < pc->num_attributes(); ++i) {
+    const draco::PointAttribute *const att = pc->attribute(i);
+    const draco::PointAttribute *const decoded_att = decoded_pc->attribute(i);
+    ASSERT_EQ(decoded_att->byte_stride(), att->byte_stride());
+    for (draco::PointIndex p(0); p < pc->num_points(); ++p) {
+      ASSERT_EQ(memcmp(att->GetAddress(att->mapped_index(p)),
+                       decoded_att->GetAddress(decoded_att->mapped_index(p)),
+                       att->byte_stride()),
+                0);
+    }
+  }
+
+  // Point cloud streams with version 2.3 must not contain interleaved rANS
+  // coded symbols.
+  std::string pc_data(pc_buffer.data(), pc_buffer.size());
+  pc_data[6] = draco::kDracoPointCloudBitstreamVersionMinor;
+  decoder_buffer.Init(pc_data.data(), pc_data.size());
+  ASSERT_FALSE(decoder.DecodePointCloudFromBuffer(&decoder_buffer).ok());
+}
+
 TEST_F(EncodeTest, TestNoPosQuantizationNormalCoding) {
   // Tests that we can encode and decode a file with quantized normals but
   // non-quantized positions.
@@ -0,0 +1,267 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/encoder_option_search.h"
+
+#include <algorithm>
+#include <chrono>
+#include <cmath>
+#include <memory>
+#include <vector>
+
+#include "draco/attributes/attribute_quantization_transform.h"
+#include "draco/compression/decode.h"
+#include "draco/compression/expert_encode.h"
+#include "draco/core/quantization_utils.h"
+#include "draco/core/thread_pool.h"
+
+namespace draco {
+
+namespace {
+
+constexpr int kMinQuantizationBits = 1;
+constexpr int kMaxQuantizationBits = 30;
+constexpr int kMaxCompressionLevel = 10;
+
+// Returns the maximum distance between the values of the position attribute
+// |att| and the values reconstructed by the decoder when the attribute is
+// quantized to |quantization_bits| using |options|.
+StatusOr<double> ComputeQuantizationError(const PointAttribute &att,
+                                          int att_id,
+                                          const EncoderOptions &options,
+                                          int quantization_bits) {
+  const int num_components = att.num_components();
+  AttributeQuantizationTransform transform;
+  // Use the same quantization parameters as the attribute encoder.
+  if (options.IsAttributeOptionSet(att_id, "quantization_origin") &&
+      options.IsAttributeOptionSet(att_id, "quantization_range")) {
+    std::vector<float> quantization_origin(num_components);
+    options.GetAttributeVector(att_id, "quantization_origin", num_components,
+                               &quantization_origin[0]);
+    const float range =
+        options.GetAttributeFloat(att_id, "quantization_range", 1.f);
+    if (!transform.SetParameters(quantization_bits, quantization_origin.data(),
+                                 num_components, range)) {
+      return Status(Status::DRACO_ERROR, "Invalid quantization parameters.");
+    }
+  } else if (!transform.ComputeParameters(att, quantization_bits)) {
+    return Status(Status::DRACO_ERROR,
+                  "Failed to compute quantization parameters.");
+  }
+
+  const int32_t max_quantized_value = (1u << quantization_bits) - 1;
+  Quantizer quantizer;
+  quantizer.Init(transform.range(), max_quantized_value);
+  Dequantizer dequantizer;
+  if (!dequantizer.Init(transform.range(), max_quantized_value)) {
+    return Status(Status::DRACO_ERROR, "Invalid quantization range.");
+  }
+  std::vector<float> value(num_components);
+  double max_squared_error = 0.0;
+  for (AttributeValueIndex i(0); i < static_cast<uint32_t>(att.size()); ++i) {
+    att.GetValue(i, value.data());
+    double squared_error = 0.0;
+    for (int c = 0; c < num_components; ++c) {
+      const float min_value = transform.min_value(c);
+      const int32_t q_val = quantizer.QuantizeFloat(value[c] - min_value);
+      const double diff =
+          static_cast<double>(dequantizer.DequantizeFloat(q_val) + min_value) -
+          value[c];
+      squared_error += diff * diff;
+    }
+    max_squared_error = std::max(max_squared_error, squared_error);
+  }
+  return std::sqrt(max_squared_error);
+}
+
+// Returns the fastest of |num_runs| decoding times of |buffer| in
+// milliseconds.
+StatusOr<double> MeasureDecodeTime(const EncoderBuffer &buffer,
+                                   int num_runs) {
+  double min_time_ms = 0.0;
+  for (int run = 0; run < std::max(num_runs, 1); ++run) {
+    DecoderBuffer decoder_buffer;
+    decoder_buffer.Init(buffer.data(), buffer.size());
+    Decoder decoder;
+    const auto start = std::chrono::steady_clock::now();
+    DRACO_ASSIGN_OR_RETURN(std::unique_ptr<PointCloud> pc,
+                           decoder.DecodePointCloudFromBuffer(&decoder_buffer));
+    const std::chrono::duration<double, std::milli> elapsed =
+        std::chrono::steady_clock::now() - start;
+    if (run == 0 || elapsed.count() < min_time_ms) {
+      min_time_ms = elapsed.count();
+    }
+  }
+  return min_time_ms;
+}
+
+}  // namespace
+
+EncoderOptionSearch::EncoderOptionSearch()
+    : max_position_error_(0.0),
+      max_decode_time_ms_(0.0),
+      num_decode_runs_(3),
+      num_threads_(1) {}
+
+StatusOr<EncoderOptionSearchResult> EncoderOptionSearch::SearchMesh(
+    const Mesh &mesh, const EncoderOptions &base_options) const {
+  return Search(mesh, &mesh, base_options);
+}
+
+StatusOr<EncoderOptionSearchResult> EncoderOptionSearch::SearchPointCloud(
+    const PointCloud &pc, const EncoderOptions &base_options) const {
+  return Search(pc, nullptr, base_options);
+}
+
+StatusOr<EncoderOptionSearchResult> EncoderOptionSearch::Search(
+    const PointCloud &pc, const Mesh *mesh,
+    const EncoderOptions &base_options) const {
+#ifdef DRACO_TRANSCODER_SUPPORTED
+  if (pc.IsCompressionEnabled()) {
+    // The encoder would override the searched options with the compression
+    // options of the geometry.
+    return Status(Status::DRACO_ERROR,
+                  "Option search does not support geometry with compression "
+                  "options.");
+  }
+#endif  // DRACO_TRANSCODER_SUPPORTED
+  const int pos_att_id = pc.GetNamedAttributeId(GeometryAttribute::POSITION);
+  if (pos_att_id == -1) {
+    return Status(Status::DRACO_ERROR, "Missing position attribute.");
+  }
+  const PointAttribute &pos_att = *pc.attribute(pos_att_id);
+  EncoderOptions options = base_options;
+
+  // Select the position quantization. Only floating point positions are
+  // quantized by the encoder.
+  int quantization_bits = -1;
+  double position_error = 0.0;
+  if (pos_att.data_type() == DT_FLOAT32) {
+    if (max_position_error_ > 0.0) {
+      // The error decreases with the number of quantization bits, so the
+      // lowest sufficient quantization can be found by bisection.
+      int low = kMinQuantizationBits;
+      int high = kMaxQuantizationBits;
+      DRACO_ASSIGN_OR_RETURN(
+          double high_error,
+          ComputeQuantizationError(pos_att, pos_att_id, options, high));
+      if (high_error > max_position_error_) {
+        return Status(Status::DRACO_ERROR,
+                      "Position error budget cannot be satisfied.");
+      }
+      while (low < high) {
+        const int bits = (low + high) / 2;
+        DRACO_ASSIGN_OR_RETURN(
+            const double error,
+            ComputeQuantizationError(pos_att, pos_att_id, options, bits));
+        if (error <= max_position_error_) {
+          high = bits;
+          high_error = error;
+        } else {
+          low = bits + 1;
+        }
+      }
+      quantization_bits = high;
+      position_error = high_error;
+      options.SetAttributeInt(pos_att_id, "quantization_bits",
+                              quantization_bits);
+    } else {
+      quantization_bits =
+          options.GetAttributeInt(pos_att_id, "quantization_bits", -1);
+      if (quantization_bits > 0) {
+        DRACO_ASSIGN_OR_RETURN(position_error,
+                               ComputeQuantizationError(pos_att, pos_att_id,
+                                                        options,
+                                                        quantization_bits));
+      } else {
+        quantization_bits = -1;
+      }
+    }
+  }
+
+  // Evaluate compression levels starting from the highest one.
+  const int batch_size = std::max(num_threads_, 1);
+  EncoderOptionSearchResult best;
+  bool best_found = false;
+  Status first_error = OkStatus();
+  int num_evaluated = 0;
+  for (int batch_begin = 0; batch_begin <= kMaxCompressionLevel && !best_found;
+       batch_begin += batch_size) {
+    const int num_candidates =
+        std::min(batch_size, kMaxCompressionLevel + 1 - batch_begin);
+    std::vector<EncoderOptions> candidate_options(num_candidates, options);
+    std::vector<EncoderBuffer> buffers(num_candidates);
+    std::vector<Status> statuses(num_candidates, OkStatus());
+    ParallelFor(num_threads_, num_candidates, [&](int i) {
+      const int speed = batch_begin + i;
+      candidate_options[i].SetSpeed(speed, speed);
+      std::unique_ptr<ExpertEncoder> encoder;
+      if (mesh) {
+        encoder.reset(new ExpertEncoder(*mesh));
+      } else {
+        encoder.reset(new ExpertEncoder(pc));
+      }
+      encoder->Reset(candidate_options[i]);
+      statuses[i] = encoder->EncodeToBuffer(&buffers[i]);
+    });
+    num_evaluated += num_candidates;
+
+    // Decoding times are measured serially so that the candidates do not
+    // compete with each other.
+    for (int i = 0; i < num_candidates; ++i) {
+      if (!statuses[i].ok()) {
+        if (first_error.ok()) {
+          first_error = statuses[i];
+        }
+        continue;
+      }
+      const StatusOr<double> decode_time =
+          MeasureDecodeTime(buffers[i], num_decode_runs_);
+      if (!decode_time.ok()) {
+        if (first_error.ok()) {
+          first_error = decode_time.status();
+        }
+        continue;
+      }
+      if (max_decode_time_ms_ > 0.0 &&
+          decode_time.value() > max_decode_time_ms_) {
+        continue;
+      }
+      const int64_t encoded_size = buffers[i].size();
+      if (best_found && (encoded_size > best.encoded_size ||
+                         (encoded_size == best.encoded_size &&
+                          decode_time.value() >= best.decode_time_ms))) {
+        continue;
+      }
+      best_found = true;
+      best.options = candidate_options[i];
+      best.compression_level = kMaxCompressionLevel - (batch_begin + i);
+      best.encoded_size = encoded_size;
+      best.decode_time_ms = decode_time.value();
+    }
+  }
+  if (!best_found) {
+    if (!first_error.ok()) {
+      return first_error;
+    }
+    return Status(Status::DRACO_ERROR,
+                  "Decoding time budget cannot be satisfied.");
+  }
+  best.position_quantization_bits = quantization_bits;
+  best.position_error = position_error;
+  best.num_evaluated_configurations = num_evaluated;
+  return best;
+}
+
+}  // namespace draco
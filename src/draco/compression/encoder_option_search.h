@@ -0,0 +1,127 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_COMPRESSION_ENCODER_OPTION_SEARCH_H_
+#define DRACO_COMPRESSION_ENCODER_OPTION_SEARCH_H_
+
+#include "draco/compression/config/encoder_options.h"
+#include "draco/core/status_or.h"
+#include "draco/mesh/mesh.h"
+#include "draco/point_cloud/point_cloud.h"
+
+namespace draco {
+
+// Configuration selected by EncoderOptionSearch together with its measured
+// properties.
+struct EncoderOptionSearchResult {
+  EncoderOptionSearchResult()
+      : options(EncoderOptions::CreateDefaultOptions()),
+        position_quantization_bits(-1),
+        compression_level(-1),
+        encoded_size(0),
+        decode_time_ms(0.0),
+        position_error(0.0),
+        num_evaluated_configurations(0) {}
+
+  // Options of the selected configuration that can be passed to
+  // ExpertEncoder::Reset().
+  EncoderOptions options;
+
+  // Quantization bits of the position attribute or -1 when the positions are
+  // not quantized.
+  int position_quantization_bits;
+
+  // Selected compression level (0 - 10, see draco_encoder).
+  int compression_level;
+
+  // Size of the encoded geometry in bytes.
+  int64_t encoded_size;
+
+  // Fastest measured time of decoding the encoded geometry.
+  double decode_time_ms;
+
+  // Maximum distance between the input and the decoded positions.
+  double position_error;
+
+  // Number of configurations that were encoded during the search.
+  int num_evaluated_configurations;
+};
+
+// Class for finding encoder options that give the smallest encoded size of a
+// given geometry under a budget on the geometric error and the decoding time.
+//
+// The search first selects the lowest position quantization that satisfies
+// the error budget. The error of a quantization is measured by comparing the
+// input positions with their values reconstructed by the decoder, which do not
+// depend on the remaining options. A lower quantization never increases the
+// encoded size, so higher quantizations are not evaluated.
+//
+// Compression levels are then evaluated from the highest to the lowest one in
+// batches that are encoded in parallel. The candidates are decoded several
+// times on the calling thread to measure their decoding time. Because lower
+// compression levels produce larger encoded data, the search stops after the
+// first batch that contains a candidate within the decoding time budget.
+//
+// Options of the other attributes, such as their quantization, are taken from
+// the base options provided to the search.
+class EncoderOptionSearch {
+ public:
+  EncoderOptionSearch();
+
+  // Sets the maximum allowed distance between the input and the decoded
+  // positions in the units of the position attribute. When the budget is not
+  // set (<= 0), the position quantization of the base options is used.
+  void SetMaxPositionError(double max_error) {
+    max_position_error_ = max_error;
+  }
+
+  // Sets the maximum allowed decoding time in milliseconds. When the budget is
+  // not set (<= 0), the decoding time is not limited.
+  void SetMaxDecodeTimeMs(double max_decode_time_ms) {
+    max_decode_time_ms_ = max_decode_time_ms;
+  }
+
+  // Sets the number of times each candidate is decoded. The fastest of the
+  // runs is used as its decoding time. Default = 3.
+  void SetNumDecodeRuns(int num_runs) { num_decode_runs_ = num_runs; }
+
+  // Sets the number of threads used to encode the candidates. The default of 1
+  // encodes all candidates on the calling thread.
+  void SetNumThreads(int num_threads) { num_threads_ = num_threads; }
+
+  // Searches for the best options for encoding |mesh| or |pc|. The search
+  // starts from |base_options| that are set up for the attribute ids of the
+  // geometry (see Encoder::CreateExpertEncoderOptions()). Returns an error when
+  // no configuration satisfies the budget.
+  StatusOr<EncoderOptionSearchResult> SearchMesh(
+      const Mesh &mesh, const EncoderOptions &base_options) const;
+  StatusOr<EncoderOptionSearchResult> SearchPointCloud(
+      const PointCloud &pc, const EncoderOptions &base_options) const;
+
+ private:
+  // Searches options for |pc|. |mesh| is either the same geometry as |pc| or
+  // nullptr when the geometry is encoded as a point cloud.
+  StatusOr<EncoderOptionSearchResult> Search(
+      const PointCloud &pc, const Mesh *mesh,
+      const EncoderOptions &base_options) const;
+
+  double max_position_error_;
+  double max_decode_time_ms_;
+  int num_decode_runs_;
+  int num_threads_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_COMPRESSION_ENCODER_OPTION_SEARCH_H_
@@ -0,0 +1,144 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/encoder_option_search.h"
+
+#include <algorithm>
+#include <cmath>
+#include <memory>
+
+#include "draco/compression/decode.h"
+#include "draco/compression/encode.h"
+#include "draco/compression/expert_encode.h"
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/core/vector_d.h"
+
+namespace {
+
+class EncoderOptionSearchTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    mesh_ = draco::ReadMeshFromTestFile("test_nm.obj");
+    ASSERT_NE(mesh_, nullptr);
+    draco::Encoder encoder;
+    encoder.SetAttributeQuantization(draco::GeometryAttribute::NORMAL, 8);
+    base_options_.reset(
+        new draco::EncoderOptions(encoder.CreateExpertEncoderOptions(*mesh_)));
+  }
+
+  // Returns the maximum distance between any decoded position of |buffer| and
+  // its closest input position.
+  float ComputeDecodedPositionError(const draco::EncoderBuffer &buffer) const {
+    draco::DecoderBuffer decoder_buffer;
+    decoder_buffer.Init(buffer.data(), buffer.size());
+    draco::Decoder decoder;
+    std::unique_ptr<draco::Mesh> decoded_mesh =
+        decoder.DecodeMeshFromBuffer(&decoder_buffer).value();
+    const draco::PointAttribute *const pos_att =
+        mesh_->GetNamedAttribute(draco::GeometryAttribute::POSITION);
+    const draco::PointAttribute *const decoded_pos_att =
+        decoded_mesh->GetNamedAttribute(draco::GeometryAttribute::POSITION);
+    float max_error = 0.f;
+    for (draco::AttributeValueIndex i(0); i < decoded_pos_att->size(); ++i) {
+      draco::Vector3f decoded_pos;
+      decoded_pos_att->GetValue(i, &decoded_pos[0]);
+      float min_dist = -1.f;
+      for (draco::AttributeValueIndex j(0); j < pos_att->size(); ++j) {
+        draco::Vector3f pos;
+        pos_att->GetValue(j, &pos[0]);
+        const float dist = std::sqrt((pos - decoded_pos).SquaredNorm());
+        if (min_dist < 0.f || dist < min_dist) {
+          min_dist = dist;
+        }
+      }
+      max_error = std::max(max_error, min_dist);
+    }
+    return max_error;
+  }
+
+  std::unique_ptr<draco::Mesh> mesh_;
+  std::unique_ptr<draco::EncoderOptions> base_options_;
+};
+
+TEST_F(EncoderOptionSearchTest, TestPositionErrorBudget) {
+  draco::EncoderOptionSearch search;
+  search.SetMaxPositionError(1e-2);
+  DRACO_ASSIGN_OR_ASSERT(const draco::EncoderOptionSearchResult result,
+                         search.SearchMesh(*mesh_, *base_options_));
+  ASSERT_GT(result.position_quantization_bits, 0);
+  ASSERT_LE(result.position_error, 1e-2);
+  ASSERT_EQ(result.options.GetAttributeInt(
+                mesh_->GetNamedAttributeId(draco::GeometryAttribute::POSITION),
+                "quantization_bits", -1),
+            result.position_quantization_bits);
+  // Without a decoding time budget, only the highest compression level is
+  // evaluated.
+  ASSERT_EQ(result.compression_level, 10);
+  ASSERT_EQ(result.num_evaluated_configurations, 1);
+
+  // The measured error matches the error of the decoded positions.
+  draco::ExpertEncoder encoder(*mesh_);
+  encoder.Reset(result.options);
+  draco::EncoderBuffer buffer;
+  DRACO_ASSERT_OK(encoder.EncodeToBuffer(&buffer));
+  ASSERT_EQ(buffer.size(), result.encoded_size);
+  ASSERT_LE(ComputeDecodedPositionError(buffer),
+            result.position_error * 1.001 + 1e-6);
+
+  // A tighter budget requires more quantization bits.
+  search.SetMaxPositionError(1e-4);
+  DRACO_ASSIGN_OR_ASSERT(const draco::EncoderOptionSearchResult precise_result,
+                         search.SearchMesh(*mesh_, *base_options_));
+  ASSERT_GT(precise_result.position_quantization_bits,
+            result.position_quantization_bits);
+  ASSERT_LE(precise_result.position_error, 1e-4);
+  ASSERT_GT(precise_result.encoded_size, result.encoded_size);
+}
+
+TEST_F(EncoderOptionSearchTest, TestDecodeTimeBudget) {
+  draco::EncoderOptionSearch search;
+  search.SetMaxPositionError(1e-3);
+  search.SetNumThreads(4);
+  search.SetNumDecodeRuns(1);
+  search.SetMaxDecodeTimeMs(1e6);
+  DRACO_ASSIGN_OR_ASSERT(const draco::EncoderOptionSearchResult result,
+                         search.SearchMesh(*mesh_, *base_options_));
+  // All candidates of the first batch satisfy the budget.
+  ASSERT_EQ(result.num_evaluated_configurations, 4);
+  ASSERT_GE(result.compression_level, 7);
+  ASSERT_LE(result.decode_time_ms, 1e6);
+
+  // Impossible budgets are reported.
+  search.SetMaxDecodeTimeMs(1e-9);
+  ASSERT_FALSE(search.SearchMesh(*mesh_, *base_options_).ok());
+  search.SetMaxDecodeTimeMs(0.0);
+  search.SetMaxPositionError(1e-12);
+  ASSERT_FALSE(search.SearchMesh(*mesh_, *base_options_).ok());
+}
+
+TEST_F(EncoderOptionSearchTest, TestPointCloud) {
+  // Without an error budget, the quantization of the base options is kept.
+  base_options_->SetAttributeInt(
+      mesh_->GetNamedAttributeId(draco::GeometryAttribute::POSITION),
+      "quantization_bits", 12);
+  draco::EncoderOptionSearch search;
+  DRACO_ASSIGN_OR_ASSERT(const draco::EncoderOptionSearchResult result,
+                         search.SearchPointCloud(*mesh_, *base_options_));
+  ASSERT_EQ(result.position_quantization_bits, 12);
+  ASSERT_GT(result.position_error, 0.0);
+  ASSERT_GT(result.encoded_size, 0);
+}
+
+}  // namespace
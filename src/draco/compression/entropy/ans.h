@@ -401,6 +401,46 @@ class RAnsEncoder {
   AnsCoder ans_;
 };
 
+// Initializes the rANS decoder |ans| with base |l_rans_base| from the input
+// buffer. The |offset| specifies the number of bytes encoded by the encoder. A
+// non zero return value is an error.
+static inline int rans_read_init(struct AnsDecoder *const ans,
+                                 const uint8_t *const buf, int offset,
+                                 uint32_t l_rans_base) {
+  unsigned x;
+  if (offset < 1) {
+    return 1;
+  }
+  ans->buf = buf;
+  x = buf[offset - 1] >> 6;
+  if (x == 0) {
+    ans->buf_offset = offset - 1;
+    ans->state = buf[offset - 1] & 0x3F;
+  } else if (x == 1) {
+    if (offset < 2) {
+      return 1;
+    }
+    ans->buf_offset = offset - 2;
+    ans->state = mem_get_le16(buf + offset - 2) & 0x3FFF;
+  } else if (x == 2) {
+    if (offset < 3) {
+      return 1;
+    }
+    ans->buf_offset = offset - 3;
+    ans->state = mem_get_le24(buf + offset - 3) & 0x3FFFFF;
+  } else if (x == 3) {
+    ans->buf_offset = offset - 4;
+    ans->state = mem_get_le32(buf + offset - 4) & 0x3FFFFFFF;
+  } else {
+    return 1;
+  }
+  ans->state += l_rans_base;
+  if (ans->state >= l_rans_base * DRACO_ANS_IO_BASE) {
+    return 1;
+  }
+  return 0;
+}
+
 struct rans_dec_sym {
   uint32_t val;
   uint32_t prob;
@@ -419,38 +459,7 @@ class RAnsDecoder {
   // number of bytes encoded by the encoder. A non zero return value is an
   // error.
   inline int read_init(const uint8_t *const buf, int offset) {
-    unsigned x;
-    if (offset < 1) {
-      return 1;
-    }
-    ans_.buf = buf;
-    x = buf[offset - 1] >> 6;
-    if (x == 0) {
-      ans_.buf_offset = offset - 1;
-      ans_.state = buf[offset - 1] & 0x3F;
-    } else if (x == 1) {
-      if (offset < 2) {
-        return 1;
-      }
-      ans_.buf_offset = offset - 2;
-      ans_.state = mem_get_le16(buf + offset - 2) & 0x3FFF;
-    } else if (x == 2) {
-      if (offset < 3) {
-        return 1;
-      }
-      ans_.buf_offset = offset - 3;
-      ans_.state = mem_get_le24(buf + offset - 3) & 0x3FFFFF;
-    } else if (x == 3) {
-      ans_.buf_offset = offset - 4;
-      ans_.state = mem_get_le32(buf + offset - 4) & 0x3FFFFFFF;
-    } else {
-      return 1;
-    }
-    ans_.state += l_rans_base;
-    if (ans_.state >= l_rans_base * DRACO_ANS_IO_BASE) {
-      return 1;
-    }
-    return 0;
+    return rans_read_init(&ans_, buf, offset, l_rans_base);
   }
 
   inline int read_end() { return ans_.state == l_rans_base; }
@@ -516,6 +525,112 @@ class RAnsDecoder {
   AnsDecoder ans_;
 };
 
+// Class for decoding symbols that were encoded with several interleaved rANS
+// states, where the i-th symbol was encoded by the state i % num_states into
+// its own stream (see RAnsSymbolEncoder::EncodeInterleavedSymbols()). The
+// states don't depend on each other, which allows the processor to overlap
+// their decoding. All states share one lookup table that stores each symbol
+// together with its probability, so every decoded symbol needs a single table
+// access. The number of precision bits needs to be the same as with the
+// RAnsEncoder that was used to encode the input data.
+template <int rans_precision_bits_t>
+class RAnsInterleavedDecoder {
+ public:
+  static constexpr int kMaxNumStates = 8;
+
+  RAnsInterleavedDecoder() {}
+
+  // Initializes the |state_id|-th state from the input buffer. The |offset|
+  // specifies the number of bytes encoded by the encoder. A non zero return
+  // value is an error.
+  inline int read_init(int state_id, const uint8_t *const buf, int offset) {
+    return rans_read_init(&states_[state_id], buf, offset, l_rans_base);
+  }
+
+  // Decodes |num_values| symbols into |out_values| using the first
+  // |num_states_t| states.
+  template <int num_states_t>
+  inline void read_symbols(uint32_t num_values, uint32_t *out_values) {
+    static_assert(num_states_t <= kMaxNumStates, "Too many rANS states.");
+    // Keep the states in local variables so that the compiler can hold them
+    // in registers.
+    uint32_t state[num_states_t];
+    int buf_offset[num_states_t];
+    const uint8_t *buf[num_states_t];
+    for (int s = 0; s < num_states_t; ++s) {
+      state[s] = states_[s].state;
+      buf_offset[s] = states_[s].buf_offset;
+      buf[s] = states_[s].buf;
+    }
+    const rans_lut_entry *const lut = lut_table_.data();
+    uint32_t i = 0;
+    for (; i + num_states_t <= num_values; i += num_states_t) {
+      for (int s = 0; s < num_states_t; ++s) {
+        out_values[i + s] = read_symbol(lut, &state[s], &buf_offset[s], buf[s]);
+      }
+    }
+    for (int s = 0; i < num_values; ++i, ++s) {
+      out_values[i] = read_symbol(lut, &state[s], &buf_offset[s], buf[s]);
+    }
+    for (int s = 0; s < num_states_t; ++s) {
+      states_[s].state = state[s];
+      states_[s].buf_offset = buf_offset[s];
+    }
+  }
+
+  // Construct a lookup table with |rans_precision| number of entries.
+  // Returns false if the table couldn't be built (because of wrong input data).
+  inline bool rans_build_look_up_table(const uint32_t token_probs[],
+                                       uint32_t num_symbols) {
+    lut_table_.resize(rans_precision);
+    uint32_t cum_prob = 0;
+    uint32_t act_prob = 0;
+    for (uint32_t i = 0; i < num_symbols; ++i) {
+      cum_prob += token_probs[i];
+      if (cum_prob > rans_precision) {
+        return false;
+      }
+      for (uint32_t j = act_prob; j < cum_prob; ++j) {
+        lut_table_[j].val = i;
+        lut_table_[j].prob = token_probs[i];
+        // The remainder of the state is |j|, so the difference to the
+        // cumulative probability can be precomputed for every entry.
+        lut_table_[j].rem_minus_cum_prob = j - act_prob;
+      }
+      act_prob = cum_prob;
+    }
+    if (cum_prob != rans_precision) {
+      return false;
+    }
+    return true;
+  }
+
+ private:
+  struct rans_lut_entry {
+    uint32_t val;
+    uint32_t prob;
+    uint32_t rem_minus_cum_prob;
+  };
+
+  static inline uint32_t read_symbol(const rans_lut_entry *const lut,
+                                     uint32_t *state, int *buf_offset,
+                                     const uint8_t *buf) {
+    uint32_t x = *state;
+    while (x < l_rans_base && *buf_offset > 0) {
+      x = x * DRACO_ANS_IO_BASE + buf[--*buf_offset];
+    }
+    const rans_lut_entry &entry = lut[x & (rans_precision - 1)];
+    *state = (x >> rans_precision_bits_t) * entry.prob +
+             entry.rem_minus_cum_prob;
+    return entry.val;
+  }
+
+  static constexpr int rans_precision = 1 << rans_precision_bits_t;
+  static constexpr int l_rans_base = rans_precision * 4;
+  std::vector<rans_lut_entry> lut_table_;
+  AnsDecoder states_[kMaxNumStates];
+};
+
 #undef DRACO_ANS_DIVREM
 #undef DRACO_ANS_P8_PRECISION
 #undef DRACO_ANS_L_BASE
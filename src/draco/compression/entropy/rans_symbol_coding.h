@@ -37,6 +37,16 @@ constexpr int ComputeRAnsPrecisionFromUniqueSymbolsBitLength(
              : ComputeRAnsUnclampedPrecision(symbols_bit_length);
 }
 
+// Number of interleaved rANS states used by default when the interleaved
+// symbol coding is enabled.
+constexpr int kDefaultNumRAnsInterleavedStates = 4;
+
+// Returns true when |num_states| is a supported number of interleaved rANS
+// states (2, 4 or 8).
+constexpr bool IsValidNumRAnsInterleavedStates(int num_states) {
+  return num_states == 2 || num_states == 4 || num_states == 8;
+}
+
 // Compute approximate frequency table size needed for storing the provided
 // symbols.
 static inline int64_t ApproximateRAnsFrequencyTableBits(
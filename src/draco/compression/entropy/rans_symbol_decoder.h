@@ -43,6 +43,13 @@ class RAnsSymbolDecoder {
   uint32_t DecodeSymbol() { return ans_.rans_read(); }
   void EndDecoding();
 
+  // Decodes |num_values| symbols encoded by
+  // RAnsSymbolEncoder::EncodeInterleavedSymbols() into |out_values|. The
+  // buffer will be advanced past the encoded data after this call. This
+  // replaces the StartDecoding(), DecodeSymbol() and EndDecoding() calls.
+  bool DecodeInterleavedSymbols(uint32_t num_values, DecoderBuffer *buffer,
+                                uint32_t *out_values);
+
  private:
   static constexpr int rans_precision_bits_ =
       ComputeRAnsPrecisionFromUniqueSymbolsBitLength(
@@ -124,9 +131,6 @@ bool RAnsSymbolDecoder<unique_symbols_bit_length_t>::Create(
       probability_table_[i] = prob;
     }
   }
-  if (!ans_.rans_build_look_up_table(&probability_table_[0], num_symbols_)) {
-    return false;
-  }
   return true;
 }
 
@@ -158,6 +162,12 @@ bool RAnsSymbolDecoder<unique_symbols_bit_length_t>::StartDecoding(
   if (ans_.read_init(data_head, static_cast<int>(bytes_encoded)) != 0) {
     return false;
   }
+  // The lookup table is built here rather than in Create() so that it is not
+  // needed when the symbols are decoded with DecodeInterleavedSymbols().
+  if (!ans_.rans_build_look_up_table(probability_table_.data(),
+                                     num_symbols_)) {
+    return false;
+  }
   return true;
 }
 
@@ -166,6 +176,54 @@ void RAnsSymbolDecoder<unique_symbols_bit_length_t>::EndDecoding() {
   ans_.read_end();
 }
 
+template <int unique_symbols_bit_length_t>
+bool RAnsSymbolDecoder<unique_symbols_bit_length_t>::DecodeInterleavedSymbols(
+    uint32_t num_values, DecoderBuffer *buffer, uint32_t *out_values) {
+  uint8_t num_states;
+  if (!buffer->Decode(&num_states)) {
+    return false;
+  }
+  if (!IsValidNumRAnsInterleavedStates(num_states)) {
+    return false;
+  }
+  RAnsInterleavedDecoder<rans_precision_bits_> decoder;
+  if (!decoder.rans_build_look_up_table(probability_table_.data(),
+                                        num_symbols_)) {
+    return false;
+  }
+  for (int s = 0; s < num_states; ++s) {
+    uint64_t bytes_encoded;
+    if (!DecodeVarint<uint64_t>(&bytes_encoded, buffer)) {
+      return false;
+    }
+    if (bytes_encoded > static_cast<uint64_t>(buffer->remaining_size())) {
+      return false;
+    }
+    const uint8_t *const data_head =
+        reinterpret_cast<const uint8_t *>(buffer->data_head());
+    // Advance the buffer past the rANS data of the current state.
+    buffer->Advance(bytes_encoded);
+    if (decoder.read_init(s, data_head, static_cast<int>(bytes_encoded)) !=
+        0) {
+      return false;
+    }
+  }
+  switch (num_states) {
+    case 2:
+      decoder.template read_symbols<2>(num_values, out_values);
+      break;
+    case 4:
+      decoder.template read_symbols<4>(num_values, out_values);
+      break;
+    case 8:
+      decoder.template read_symbols<8>(num_values, out_values);
+      break;
+    default:
+      return false;
+  }
+  return true;
+}
+
 }  // namespace draco
 
 #endif  // DRACO_COMPRESSION_ENTROPY_RANS_SYMBOL_DECODER_H_
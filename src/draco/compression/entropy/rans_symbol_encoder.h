@@ -46,6 +46,14 @@ class RAnsSymbolEncoder {
   }
   void EndEncoding(EncoderBuffer *buffer);
 
+  // Encodes all |num_symbols| |symbols| using |num_states| interleaved rANS
+  // states. The i-th symbol is encoded by the state i % |num_states| and each
+  // state is stored in a separate stream. This replaces the StartEncoding(),
+  // EncodeSymbol() and EndEncoding() calls. Data encoded by this method must be
+  // decoded with RAnsSymbolDecoder::DecodeInterleavedSymbols().
+  bool EncodeInterleavedSymbols(const uint32_t *symbols, int num_symbols,
+                                int num_states, EncoderBuffer *buffer);
+
   // rANS requires to encode the input symbols in the reverse order.
   static constexpr bool needs_reverse_encoding() { return true; }
 
@@ -285,6 +293,36 @@ void RAnsSymbolEncoder<unique_symbols_bit_length_t>::EndEncoding(
   buffer->Resize(buffer_offset_ + bytes_written + size_len);
 }
 
+template <int unique_symbols_bit_length_t>
+bool RAnsSymbolEncoder<unique_symbols_bit_length_t>::EncodeInterleavedSymbols(
+    const uint32_t *symbols, int num_symbols, int num_states,
+    EncoderBuffer *buffer) {
+  if (!IsValidNumRAnsInterleavedStates(num_states)) {
+    return false;
+  }
+  buffer->Encode(static_cast<uint8_t>(num_states));
+  // Every encoded symbol outputs at most |kMaxBytesPerSymbol| bytes and the
+  // final state is stored in at most four bytes.
+  constexpr int kMaxBytesPerSymbol = (rans_precision_bits_ + 7) / 8;
+  std::vector<uint8_t> state_data;
+  for (int s = 0; s < num_states; ++s) {
+    const int num_state_symbols =
+        num_symbols > s ? (num_symbols - s + num_states - 1) / num_states : 0;
+    state_data.resize(static_cast<size_t>(num_state_symbols) *
+                          kMaxBytesPerSymbol +
+                      4);
+    ans_.write_init(state_data.data());
+    // rANS requires to encode the input symbols in the reverse order.
+    for (int i = num_state_symbols - 1; i >= 0; --i) {
+      ans_.rans_write(&probability_table_[symbols[s + i * num_states]]);
+    }
+    const uint64_t bytes_written = static_cast<uint64_t>(ans_.write_end());
+    EncodeVarint(bytes_written, buffer);
+    buffer->Encode(state_data.data(), bytes_written);
+  }
+  return true;
+}
+
 }  // namespace draco
 
 #endif  // DRACO_COMPRESSION_ENTROPY_RANS_SYMBOL_ENCODER_H_
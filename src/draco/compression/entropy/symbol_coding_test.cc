@@ -13,6 +13,7 @@
 // limitations under the License.
 //
 #include "draco/compression/config/compression_shared.h"
+#include "draco/compression/entropy/rans_symbol_coding.h"
 #include "draco/compression/entropy/symbol_decoding.h"
 #include "draco/compression/entropy/symbol_encoding.h"
 #include "draco/core/bit_utils.h"
@@ -24,7 +25,9 @@ namespace draco {
 
 class SymbolCodingTest : public ::testing::Test {
  protected:
-  SymbolCodingTest() : bitstream_version_(kDracoMeshBitstreamVersion) {}
+  SymbolCodingTest()
+      : geometry_type_(TRIANGULAR_MESH),
+        bitstream_version_(kDracoMeshBitstreamVersion) {}
 
   template <class SignedIntTypeT>
   void TestConvertToSymbolAndBack(SignedIntTypeT x) {
@@ -34,6 +37,7 @@ class SymbolCodingTest : public ::testing::Test {
     ASSERT_EQ(x, y);
   }
 
+  EncodedGeometryType geometry_type_;
   uint16_t bitstream_version_;
 };
 
@@ -50,7 +54,7 @@ TEST_F(SymbolCodingTest, TestLargeNumbers) {
   DecoderBuffer db;
   db.Init(eb.data(), eb.size());
   db.set_bitstream_version(bitstream_version_);
-  ASSERT_TRUE(DecodeSymbols(num_values, 1, &db, &out[0]));
+  ASSERT_TRUE(DecodeSymbols(num_values, 1, geometry_type_, &db, &out[0]));
   for (int i = 0; i < num_values; ++i) {
     EXPECT_EQ(in[i], out[i]);
   }
@@ -82,8 +86,16 @@ TEST_F(SymbolCodingTest, TestManyNumbers) {
     out_values.resize(in_values.size());
     DecoderBuffer db;
     db.Init(eb.data(), eb.size());
-    db.set_bitstream_version(bitstream_version_);
-    ASSERT_TRUE(DecodeSymbols(in_values.size(), 1, &db, &out_values[0]));
+    if (method == SYMBOL_CODING_RAW_INTERLEAVED) {
+      // Interleaved rANS coding requires a newer bit-stream version.
+      db.set_bitstream_version(DRACO_BITSTREAM_VERSION(
+          kDracoMeshBitstreamVersionMajor,
+          kDracoMeshInterleavedRAnsBitstreamVersionMinor));
+    } else {
+      db.set_bitstream_version(bitstream_version_);
+    }
+    ASSERT_TRUE(DecodeSymbols(in_values.size(), 1, geometry_type_, &db,
+                              &out_values[0]));
     for (uint32_t i = 0; i < in_values.size(); ++i) {
       ASSERT_EQ(in_values[i], out_values[i]);
     }
@@ -97,7 +109,7 @@ TEST_F(SymbolCodingTest, TestEmpty) {
   DecoderBuffer db;
   db.Init(eb.data(), eb.size());
   db.set_bitstream_version(bitstream_version_);
-  ASSERT_TRUE(DecodeSymbols(0, 1, &db, nullptr));
+  ASSERT_TRUE(DecodeSymbols(0, 1, geometry_type_, &db, nullptr));
 }
 
 TEST_F(SymbolCodingTest, TestOneSymbol) {
@@ -111,7 +123,7 @@ TEST_F(SymbolCodingTest, TestOneSymbol) {
   DecoderBuffer db;
   db.Init(eb.data(), eb.size());
   db.set_bitstream_version(bitstream_version_);
-  ASSERT_TRUE(DecodeSymbols(in.size(), 1, &db, &out[0]));
+  ASSERT_TRUE(DecodeSymbols(in.size(), 1, geometry_type_, &db, &out[0]));
   for (uint32_t i = 0; i < in.size(); ++i) {
     ASSERT_EQ(in[i], out[i]);
   }
@@ -133,7 +145,7 @@ TEST_F(SymbolCodingTest, TestBitLengths) {
     DecoderBuffer db;
     db.Init(eb.data(), eb.size());
     db.set_bitstream_version(bitstream_version_);
-    ASSERT_TRUE(DecodeSymbols(i + 1, 1, &db, &out[0]));
+    ASSERT_TRUE(DecodeSymbols(i + 1, 1, geometry_type_, &db, &out[0]));
     for (int j = 0; j < i + 1; ++j) {
       ASSERT_EQ(in[j], out[j]);
     }
@@ -152,12 +164,88 @@ TEST_F(SymbolCodingTest, TestLargeNumberCondition) {
   DecoderBuffer db;
   db.Init(eb.data(), eb.size());
   db.set_bitstream_version(bitstream_version_);
-  ASSERT_TRUE(DecodeSymbols(in.size(), 1, &db, &out[0]));
+  ASSERT_TRUE(DecodeSymbols(in.size(), 1, geometry_type_, &db, &out[0]));
   for (uint32_t i = 0; i < in.size(); ++i) {
     ASSERT_EQ(in[i], out[i]);
   }
 }
 
+TEST_F(SymbolCodingTest, TestInterleavedStates) {
+  // This test verifies that symbols encoded with interleaved rANS states are
+  // decoded correctly for all supported numbers of states, including inputs
+  // that are not a multiple of the number of states.
+  std::vector<uint32_t> in;
+  for (int i = 0; i < 10007; ++i) {
+    in.push_back((i * i + 7 * i) % 301);
+  }
+  // The coding is supported by mesh and point cloud bit-streams that are
+  // written with interleaved rANS enabled.
+  const std::pair<EncodedGeometryType, uint16_t> bitstream_versions[] = {
+      {TRIANGULAR_MESH,
+       DRACO_BITSTREAM_VERSION(kDracoMeshBitstreamVersionMajor,
+                               kDracoMeshInterleavedRAnsBitstreamVersionMinor)},
+      {POINT_CLOUD,
+       DRACO_BITSTREAM_VERSION(
+           kDracoPointCloudBitstreamVersionMajor,
+           kDracoPointCloudInterleavedRAnsBitstreamVersionMinor)}};
+  for (const auto &bitstream_version : bitstream_versions) {
+    for (const int num_states : {2, 4, 8}) {
+      for (const int num_values : {1, 3, 8, 9, 10007}) {
+        Options options;
+        SetSymbolEncodingMethod(&options, SYMBOL_CODING_RAW);
+        ASSERT_TRUE(
+            SetSymbolEncodingNumInterleavedStates(&options, num_states));
+        EncoderBuffer eb;
+        ASSERT_TRUE(EncodeSymbols(in.data(), num_values, 1, &options, &eb));
+        ASSERT_EQ(eb.data()[0], SYMBOL_CODING_RAW_INTERLEAVED);
+
+        std::vector<uint32_t> out(num_values);
+        DecoderBuffer db;
+        db.Init(eb.data(), eb.size());
+        db.set_bitstream_version(bitstream_version.second);
+        ASSERT_TRUE(DecodeSymbols(num_values, 1, bitstream_version.first, &db,
+                                  &out[0]));
+        for (int i = 0; i < num_values; ++i) {
+          ASSERT_EQ(in[i], out[i]);
+        }
+      }
+    }
+  }
+  Options options;
+  ASSERT_FALSE(SetSymbolEncodingNumInterleavedStates(&options, 3));
+}
+
+TEST_F(SymbolCodingTest, TestInterleavedStatesBitstreamVersion) {
+  // This test verifies that the interleaved rANS coding is rejected for
+  // bit-stream versions that don't support it.
+  const std::vector<uint32_t> in(1000, 5);
+  Options options;
+  SetSymbolEncodingMethod(&options, SYMBOL_CODING_RAW_INTERLEAVED);
+  EncoderBuffer eb;
+  ASSERT_TRUE(EncodeSymbols(in.data(), in.size(), 1, &options, &eb));
+
+  std::vector<uint32_t> out(in.size());
+  DecoderBuffer db;
+  db.Init(eb.data(), eb.size());
+  db.set_bitstream_version(DRACO_BITSTREAM_VERSION(2, 2));
+  ASSERT_FALSE(DecodeSymbols(in.size(), 1, TRIANGULAR_MESH, &db, &out[0]));
+
+  // Version 2.3 supports the coding only for meshes.
+  db.Init(eb.data(), eb.size());
+  db.set_bitstream_version(DRACO_BITSTREAM_VERSION(2, 3));
+  ASSERT_FALSE(DecodeSymbols(in.size(), 1, POINT_CLOUD, &db, &out[0]));
+  db.Init(eb.data(), eb.size());
+  db.set_bitstream_version(DRACO_BITSTREAM_VERSION(2, 3));
+  ASSERT_TRUE(DecodeSymbols(in.size(), 1, TRIANGULAR_MESH, &db, &out[0]));
+  ASSERT_EQ(out, in);
+
+  // Data that does not belong to a geometry never uses the coding.
+  db.Init(eb.data(), eb.size());
+  db.set_bitstream_version(DRACO_BITSTREAM_VERSION(2, 4));
+  ASSERT_FALSE(
+      DecodeSymbols(in.size(), 1, INVALID_GEOMETRY_TYPE, &db, &out[0]));
+}
+
 TEST_F(SymbolCodingTest, TestConversionFullRange) {
   TestConvertToSymbolAndBack(static_cast<int8_t>(-128));
   TestConvertToSymbolAndBack(static_cast<int8_t>(-127));
@@ -26,11 +26,12 @@ bool DecodeTaggedSymbols(uint32_t num_values, int num_components,
                          DecoderBuffer *src_buffer, uint32_t *out_values);
 
 template <template <int> class SymbolDecoderT>
-bool DecodeRawSymbols(uint32_t num_values, DecoderBuffer *src_buffer,
-                      uint32_t *out_values);
+bool DecodeRawSymbols(uint32_t num_values, bool interleaved,
+                      DecoderBuffer *src_buffer, uint32_t *out_values);
 
 bool DecodeSymbols(uint32_t num_values, int num_components,
-                   DecoderBuffer *src_buffer, uint32_t *out_values) {
+                   EncodedGeometryType geometry_type, DecoderBuffer *src_buffer,
+                   uint32_t *out_values) {
   if (num_values == 0) {
     return true;
   }
@@ -43,7 +44,27 @@ bool DecodeSymbols(uint32_t num_values, int num_components,
     return DecodeTaggedSymbols<RAnsSymbolDecoder>(num_values, num_components,
                                                   src_buffer, out_values);
   } else if (scheme == SYMBOL_CODING_RAW) {
-    return DecodeRawSymbols<RAnsSymbolDecoder>(num_values, src_buffer,
+    return DecodeRawSymbols<RAnsSymbolDecoder>(num_values, false, src_buffer,
+                                               out_values);
+  } else if (scheme == SYMBOL_CODING_RAW_INTERLEAVED) {
+    // Interleaved rANS coding was introduced in mesh bit-stream version 2.3
+    // and point cloud bit-stream version 2.4.
+    uint16_t min_bitstream_version;
+    if (geometry_type == TRIANGULAR_MESH) {
+      min_bitstream_version = DRACO_BITSTREAM_VERSION(
+          kDracoMeshBitstreamVersionMajor,
+          kDracoMeshInterleavedRAnsBitstreamVersionMinor);
+    } else if (geometry_type == POINT_CLOUD) {
+      min_bitstream_version = DRACO_BITSTREAM_VERSION(
+          kDracoPointCloudBitstreamVersionMajor,
+          kDracoPointCloudInterleavedRAnsBitstreamVersionMinor);
+    } else {
+      return false;
+    }
+    if (src_buffer->bitstream_version() < min_bitstream_version) {
+      return false;
+    }
+    return DecodeRawSymbols<RAnsSymbolDecoder>(num_values, true, src_buffer,
                                                out_values);
   }
   return false;
@@ -88,7 +109,8 @@ bool DecodeTaggedSymbols(uint32_t num_values, int num_components,
 }
 
 template <class SymbolDecoderT>
-bool DecodeRawSymbolsInternal(uint32_t num_values, DecoderBuffer *src_buffer,
+bool DecodeRawSymbolsInternal(uint32_t num_values, bool interleaved,
+                              DecoderBuffer *src_buffer,
                               uint32_t *out_values) {
   SymbolDecoderT decoder;
   if (!decoder.Create(src_buffer)) {
@@ -99,6 +121,10 @@ bool DecodeRawSymbolsInternal(uint32_t num_values, DecoderBuffer *src_buffer,
     return false;  // Wrong number of symbols.
   }
 
+  if (interleaved) {
+    return decoder.DecodeInterleavedSymbols(num_values, src_buffer,
+                                            out_values);
+  }
   if (!decoder.StartDecoding(src_buffer)) {
     return false;
   }
@@ -112,67 +138,67 @@ bool DecodeRawSymbolsInternal(uint32_t num_values, DecoderBuffer *src_buffer,
 }
 
 template <template <int> class SymbolDecoderT>
-bool DecodeRawSymbols(uint32_t num_values, DecoderBuffer *src_buffer,
-                      uint32_t *out_values) {
+bool DecodeRawSymbols(uint32_t num_values, bool interleaved,
+                      DecoderBuffer *src_buffer, uint32_t *out_values) {
   uint8_t max_bit_length;
   if (!src_buffer->Decode(&max_bit_length)) {
     return false;
   }
   switch (max_bit_length) {
     case 1:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<1>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<1>>(
+          num_values, interleaved, src_buffer, out_values);
     case 2:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<2>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<2>>(
+          num_values, interleaved, src_buffer, out_values);
     case 3:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<3>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<3>>(
+          num_values, interleaved, src_buffer, out_values);
     case 4:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<4>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<4>>(
+          num_values, interleaved, src_buffer, out_values);
     case 5:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<5>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<5>>(
+          num_values, interleaved, src_buffer, out_values);
     case 6:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<6>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<6>>(
+          num_values, interleaved, src_buffer, out_values);
     case 7:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<7>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<7>>(
+          num_values, interleaved, src_buffer, out_values);
     case 8:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<8>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<8>>(
+          num_values, interleaved, src_buffer, out_values);
     case 9:
-      return DecodeRawSymbolsInternal<SymbolDecoderT<9>>(num_values, src_buffer,
-                                                         out_values);
+      return DecodeRawSymbolsInternal<SymbolDecoderT<9>>(
+          num_values, interleaved, src_buffer, out_values);
     case 10:
       return DecodeRawSymbolsInternal<SymbolDecoderT<10>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 11:
       return DecodeRawSymbolsInternal<SymbolDecoderT<11>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 12:
       return DecodeRawSymbolsInternal<SymbolDecoderT<12>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 13:
       return DecodeRawSymbolsInternal<SymbolDecoderT<13>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 14:
       return DecodeRawSymbolsInternal<SymbolDecoderT<14>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 15:
       return DecodeRawSymbolsInternal<SymbolDecoderT<15>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 16:
       return DecodeRawSymbolsInternal<SymbolDecoderT<16>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 17:
       return DecodeRawSymbolsInternal<SymbolDecoderT<17>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     case 18:
       return DecodeRawSymbolsInternal<SymbolDecoderT<18>>(
-          num_values, src_buffer, out_values);
+          num_values, interleaved, src_buffer, out_values);
     default:
       return false;
   }
@@ -15,14 +15,18 @@
 #ifndef DRACO_COMPRESSION_ENTROPY_SYMBOL_DECODING_H_
 #define DRACO_COMPRESSION_ENTROPY_SYMBOL_DECODING_H_
 
+#include "draco/compression/config/compression_shared.h"
 #include "draco/core/decoder_buffer.h"
 
 namespace draco {
 
 // Decodes an array of symbols that was previously encoded with an entropy code.
-// Returns false on error.
+// |geometry_type| is the type of the geometry stored in |src_buffer|. It is
+// used to check whether the bit-stream version of |src_buffer| supports the
+// decoded symbol coding. Returns false on error.
 bool DecodeSymbols(uint32_t num_values, int num_components,
-                   DecoderBuffer *src_buffer, uint32_t *out_values);
+                   EncodedGeometryType geometry_type, DecoderBuffer *src_buffer,
+                   uint32_t *out_values);
 
 }  // namespace draco
 
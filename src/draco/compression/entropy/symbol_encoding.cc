@@ -43,6 +43,14 @@ bool SetSymbolEncodingCompressionLevel(Options *options,
   return true;
 }
 
+bool SetSymbolEncodingNumInterleavedStates(Options *options, int num_states) {
+  if (num_states != 0 && !IsValidNumRAnsInterleavedStates(num_states)) {
+    return false;
+  }
+  options->SetInt("symbol_encoding_num_interleaved_states", num_states);
+  return true;
+}
+
 // Computes bit lengths of the input values. If num_components > 1, the values
 // are processed in "num_components" sized chunks and the bit length is always
 // computed for the largest value from the chunk.
@@ -111,7 +119,8 @@ bool EncodeTaggedSymbols(const uint32_t *symbols, int num_values,
 template <template <int> class SymbolEncoderT>
 bool EncodeRawSymbols(const uint32_t *symbols, int num_values,
                       uint32_t max_entry_value, int32_t num_unique_symbols,
-                      const Options *options, EncoderBuffer *target_buffer);
+                      int num_interleaved_states, const Options *options,
+                      EncoderBuffer *target_buffer);
 
 bool EncodeSymbols(const uint32_t *symbols, int num_values, int num_components,
                    const Options *options, EncoderBuffer *target_buffer) {
@@ -156,6 +165,18 @@ bool EncodeSymbols(const uint32_t *symbols, int num_values, int num_components,
       method = SYMBOL_CODING_RAW;
     }
   }
+  int num_interleaved_states = 0;
+  if (options != nullptr &&
+      options->IsOptionSet("symbol_encoding_num_interleaved_states")) {
+    num_interleaved_states =
+        options->GetInt("symbol_encoding_num_interleaved_states");
+  }
+  if (method == SYMBOL_CODING_RAW && num_interleaved_states > 0) {
+    method = SYMBOL_CODING_RAW_INTERLEAVED;
+  } else if (method == SYMBOL_CODING_RAW_INTERLEAVED &&
+             num_interleaved_states == 0) {
+    num_interleaved_states = kDefaultNumRAnsInterleavedStates;
+  }
   // Use the tagged scheme.
   target_buffer->Encode(static_cast<uint8_t>(method));
   if (method == SYMBOL_CODING_TAGGED) {
@@ -164,9 +185,14 @@ bool EncodeSymbols(const uint32_t *symbols, int num_values, int num_components,
   }
   if (method == SYMBOL_CODING_RAW) {
     return EncodeRawSymbols<RAnsSymbolEncoder>(symbols, num_values, max_value,
-                                               num_unique_symbols, options,
+                                               num_unique_symbols, 0, options,
                                                target_buffer);
   }
+  if (method == SYMBOL_CODING_RAW_INTERLEAVED) {
+    return EncodeRawSymbols<RAnsSymbolEncoder>(
+        symbols, num_values, max_value, num_unique_symbols,
+        num_interleaved_states, options, target_buffer);
+  }
   // Unknown method selected.
   return false;
 }
@@ -242,9 +268,13 @@ bool EncodeTaggedSymbols(const uint32_t *symbols, int num_values,
   return true;
 }
 
+// Encodes the symbols using a single rANS state when |num_interleaved_states|
+// is zero. Otherwise the symbols are encoded using the specified number of
+// interleaved rANS states.
 template <class SymbolEncoderT>
 bool EncodeRawSymbolsInternal(const uint32_t *symbols, int num_values,
                               uint32_t max_entry_value,
+                              int num_interleaved_states,
                               EncoderBuffer *target_buffer) {
   // Count the frequency of each entry value.
   std::vector<uint64_t> frequencies(max_entry_value + 1, 0);
@@ -255,6 +285,11 @@ bool EncodeRawSymbolsInternal(const uint32_t *symbols, int num_values,
   SymbolEncoderT encoder;
   encoder.Create(frequencies.data(), static_cast<int>(frequencies.size()),
                  target_buffer);
+  if (num_interleaved_states > 0) {
+    return encoder.EncodeInterleavedSymbols(symbols, num_values,
+                                            num_interleaved_states,
+                                            target_buffer);
+  }
   encoder.StartEncoding(target_buffer);
   // Encode all values.
   if (SymbolEncoderT::needs_reverse_encoding()) {
@@ -273,7 +308,8 @@ bool EncodeRawSymbolsInternal(const uint32_t *symbols, int num_values,
 template <template <int> class SymbolEncoderT>
 bool EncodeRawSymbols(const uint32_t *symbols, int num_values,
                       uint32_t max_entry_value, int32_t num_unique_symbols,
-                      const Options *options, EncoderBuffer *target_buffer) {
+                      int num_interleaved_states, const Options *options,
+                      EncoderBuffer *target_buffer) {
   int symbol_bits = 0;
   if (num_unique_symbols > 0) {
     symbol_bits = MostSignificantBit(num_unique_symbols);
@@ -316,58 +352,76 @@ bool EncodeRawSymbols(const uint32_t *symbols, int num_values,
       FALLTHROUGH_INTENDED;
     case 1:
       return EncodeRawSymbolsInternal<SymbolEncoderT<1>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 2:
       return EncodeRawSymbolsInternal<SymbolEncoderT<2>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 3:
       return EncodeRawSymbolsInternal<SymbolEncoderT<3>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 4:
       return EncodeRawSymbolsInternal<SymbolEncoderT<4>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 5:
       return EncodeRawSymbolsInternal<SymbolEncoderT<5>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 6:
       return EncodeRawSymbolsInternal<SymbolEncoderT<6>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 7:
       return EncodeRawSymbolsInternal<SymbolEncoderT<7>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 8:
       return EncodeRawSymbolsInternal<SymbolEncoderT<8>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 9:
       return EncodeRawSymbolsInternal<SymbolEncoderT<9>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 10:
       return EncodeRawSymbolsInternal<SymbolEncoderT<10>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 11:
       return EncodeRawSymbolsInternal<SymbolEncoderT<11>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 12:
       return EncodeRawSymbolsInternal<SymbolEncoderT<12>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 13:
       return EncodeRawSymbolsInternal<SymbolEncoderT<13>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 14:
       return EncodeRawSymbolsInternal<SymbolEncoderT<14>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 15:
       return EncodeRawSymbolsInternal<SymbolEncoderT<15>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 16:
       return EncodeRawSymbolsInternal<SymbolEncoderT<16>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 17:
       return EncodeRawSymbolsInternal<SymbolEncoderT<17>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     case 18:
       return EncodeRawSymbolsInternal<SymbolEncoderT<18>>(
-          symbols, num_values, max_entry_value, target_buffer);
+          symbols, num_values, max_entry_value, num_interleaved_states,
+          target_buffer);
     default:
       return false;
   }
@@ -42,6 +42,14 @@ void SetSymbolEncodingMethod(Options *options, SymbolCodingMethod method);
 // Returns false if an invalid level has been set.
 bool SetSymbolEncodingCompressionLevel(Options *options, int compression_level);
 
+// Sets the number of interleaved rANS states used when the symbols are encoded
+// with the raw scheme. Valid values are 2, 4 and 8 which make the encoder use
+// SYMBOL_CODING_RAW_INTERLEAVED instead of SYMBOL_CODING_RAW. Value 0 disables
+// the interleaved coding (default). Note that the interleaved coding can be
+// decoded only from bit-stream version 2.3 and newer.
+// Returns false if an invalid number of states has been set.
+bool SetSymbolEncodingNumInterleavedStates(Options *options, int num_states);
+
 }  // namespace draco
 
 #endif  // DRACO_COMPRESSION_ENTROPY_SYMBOL_ENCODING_H_
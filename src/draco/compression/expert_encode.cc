@@ -62,8 +62,11 @@ Status ExpertEncoder::EncodePointCloudToBuffer(const PointCloud &pc,
   if (encoding_method == POINT_CLOUD_SEQUENTIAL_ENCODING) {
     // Use sequential encoding if requested.
     encoder.reset(new PointCloudSequentialEncoder());
-  } else if (encoding_method == -1 && options().GetSpeed() == 10) {
-    // Use sequential encoding if speed is at max.
+  } else if (encoding_method == -1 &&
+             (options().GetSpeed() == 10 ||
+              options().GetGlobalBool("realtime_encoding", false))) {
+    // Use sequential encoding if speed is at max or if the realtime profile
+    // is enabled.
     encoder.reset(new PointCloudSequentialEncoder());
   } else {
     // Speed < 10, use POINT_CLOUD_KD_TREE_ENCODING if possible.
@@ -124,8 +127,10 @@ Status ExpertEncoder::EncodeMeshToBuffer(const Mesh &m,
   // Select the encoding method only based on the provided options.
   int encoding_method = options().GetGlobalInt("encoding_method", -1);
   if (encoding_method == -1) {
-    // For now select the edgebreaker for all options expect of speed 10
-    if (options().GetSpeed() == 10) {
+    // For now select the edgebreaker for all options expect of speed 10. The
+    // realtime profile always uses the edgebreaker.
+    if (options().GetSpeed() == 10 &&
+        !options().GetGlobalBool("realtime_encoding", false)) {
       encoding_method = MESH_SEQUENTIAL_ENCODING;
     } else {
       encoding_method = MESH_EDGEBREAKER_ENCODING;
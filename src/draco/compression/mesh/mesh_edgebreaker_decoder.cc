@@ -20,7 +20,8 @@
 
 namespace draco {
 
-MeshEdgebreakerDecoder::MeshEdgebreakerDecoder() {}
+MeshEdgebreakerDecoder::MeshEdgebreakerDecoder()
+    : impl_traversal_decoder_type_(-1) {}
 
 bool MeshEdgebreakerDecoder::CreateAttributesDecoder(int32_t att_decoder_id) {
   return impl_->CreateAttributesDecoder(att_decoder_id);
@@ -31,7 +32,12 @@ bool MeshEdgebreakerDecoder::InitializeDecoder() {
   if (!buffer()->Decode(&traversal_decoder_type)) {
     return false;
   }
+  if (impl_ && impl_traversal_decoder_type_ == traversal_decoder_type) {
+    // Reuse the implementation from the previous decode.
+    return impl_->Init(this);
+  }
   impl_ = nullptr;
+  impl_traversal_decoder_type_ = -1;
   if (traversal_decoder_type == MESH_EDGEBREAKER_STANDARD_ENCODING) {
 #ifdef DRACO_STANDARD_EDGEBREAKER_SUPPORTED
     impl_ = std::unique_ptr<MeshEdgebreakerDecoderImplInterface>(
@@ -56,6 +62,7 @@ bool MeshEdgebreakerDecoder::InitializeDecoder() {
   if (!impl_->Init(this)) {
     return false;
   }
+  impl_traversal_decoder_type_ = traversal_decoder_type;
   return true;
 }
 
@@ -47,6 +47,10 @@ class MeshEdgebreakerDecoder : public MeshDecoder {
   bool OnAttributesDecoded() override;
 
   std::unique_ptr<MeshEdgebreakerDecoderImplInterface> impl_;
+
+  // Traversal decoder type of |impl_| or -1 when |impl_| is not set. Used to
+  // reuse the implementation (and its memory) across multiple decodes.
+  int impl_traversal_decoder_type_;
 };
 
 }  // namespace draco
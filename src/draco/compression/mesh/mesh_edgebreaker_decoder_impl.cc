@@ -372,9 +372,10 @@ bool MeshEdgebreakerDecoderImpl<TraversalDecoder>::DecodeConnectivity() {
 
   // Decode topology (connectivity).
   vertex_traversal_length_.clear();
-  corner_table_ = std::unique_ptr<CornerTable>(new CornerTable());
+  // The corner table is kept between decodes so that its memory can be reused
+  // when the decoder is used multiple times.
   if (corner_table_ == nullptr) {
-    return false;
+    corner_table_ = std::unique_ptr<CornerTable>(new CornerTable());
   }
   processed_corner_ids_.clear();
   processed_corner_ids_.reserve(num_faces);
@@ -390,6 +391,7 @@ bool MeshEdgebreakerDecoderImpl<TraversalDecoder>::DecodeConnectivity() {
   last_vert_id_ = -1;
 
   attribute_data_.clear();
+  pos_data_decoder_id_ = -1;
   // Add one attribute data for each attribute decoder.
   attribute_data_.resize(num_attribute_data);
 
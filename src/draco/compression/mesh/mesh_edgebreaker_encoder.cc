@@ -32,13 +32,17 @@ bool MeshEdgebreakerEncoder::InitializeEncoder() {
   // For tiny meshes it's usually better to use the basic edgebreaker as the
   // overhead of the predictive one may turn out to be too big.
   const bool is_tiny_mesh = mesh()->num_faces() < 1000;
+  // The realtime profile uses the standard edgebreaker that has the lowest
+  // cost per face.
+  const bool is_realtime =
+      options()->GetGlobalBool("realtime_encoding", false);
 
   int selected_edgebreaker_method =
       options()->GetGlobalInt("edgebreaker_method", -1);
   if (selected_edgebreaker_method == -1) {
     if (is_standard_edgebreaker_available &&
         (options()->GetSpeed() >= 5 || !is_predictive_edgebreaker_available ||
-         is_tiny_mesh)) {
+         is_tiny_mesh || is_realtime)) {
       selected_edgebreaker_method = MESH_EDGEBREAKER_STANDARD_ENCODING;
     } else {
       selected_edgebreaker_method = MESH_EDGEBREAKER_VALENCE_ENCODING;
@@ -52,8 +52,10 @@ bool MeshEdgebreakerEncoderImpl<TraversalEncoder>::Init(
   if (encoder_->options()->IsGlobalOptionSet("split_mesh_on_seams")) {
     use_single_connectivity_ =
         encoder_->options()->GetGlobalBool("split_mesh_on_seams", false);
-  } else if (encoder_->options()->GetSpeed() >= 6) {
-    // Else use default setting based on speed.
+  } else if (encoder_->options()->GetSpeed() >= 6 ||
+             encoder_->options()->GetGlobalBool("realtime_encoding", false)) {
+    // Else use default setting based on speed. The realtime profile always
+    // uses a single connectivity to avoid building attribute corner tables.
     use_single_connectivity_ = true;
   } else {
     use_single_connectivity_ = false;
@@ -161,6 +163,7 @@ bool MeshEdgebreakerEncoderImpl<TraversalEncoder>::GenerateAttributesEncoder(
     }
 
     if (GetEncoder()->options()->GetSpeed() == 0 &&
+        !GetEncoder()->options()->GetGlobalBool("realtime_encoding", false) &&
         att->attribute_type() == GeometryAttribute::POSITION) {
       traversal_method = MESH_TRAVERSAL_PREDICTION_DEGREE;
       if (use_single_connectivity_ && mesh_->num_attributes() > 1) {
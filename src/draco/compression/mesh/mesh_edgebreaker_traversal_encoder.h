@@ -45,6 +45,11 @@ class MeshEdgebreakerTraversalEncoder {
 
   // Called before the traversal encoding is started.
   void Start() {
+    // Each face produces at most one symbol. Reserve the storage up front so
+    // that the traversal does not need to reallocate it.
+    const int num_faces = encoder_impl_->GetEncoder()->mesh()->num_faces();
+    symbols_.clear();
+    symbols_.reserve(num_faces);
     start_face_encoder_.StartEncoding();
     if (num_attribute_data_ > 0) {
       // Init and start arithmetic encoders for storing configuration types
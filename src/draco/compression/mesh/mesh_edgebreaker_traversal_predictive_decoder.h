@@ -50,7 +50,9 @@ class MeshEdgebreakerTraversalPredictiveDecoder
       return false;
     }
     // Set the valences of all initial vertices to 0.
-    vertex_valences_.resize(num_vertices_, 0);
+    vertex_valences_.assign(num_vertices_, 0);
+    last_symbol_ = -1;
+    predicted_symbol_ = -1;
     if (!prediction_decoder_.StartDecoding(out_buffer)) {
       return false;
     }
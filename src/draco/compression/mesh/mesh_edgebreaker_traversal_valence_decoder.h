@@ -97,13 +97,15 @@ class MeshEdgebreakerTraversalValenceDecoder
       return false;
     }
     // Set the valences of all initial vertices to 0.
-    vertex_valences_.resize(num_vertices_, 0);
+    vertex_valences_.assign(num_vertices_, 0);
+    last_symbol_ = -1;
+    active_context_ = -1;
 
     const int num_unique_valences = max_valence_ - min_valence_ + 1;
 
     // Decode all symbols for all contexts.
     context_symbols_.resize(num_unique_valences);
-    context_counters_.resize(context_symbols_.size());
+    context_counters_.assign(context_symbols_.size(), 0);
     for (int i = 0; i < context_symbols_.size(); ++i) {
       uint32_t num_symbols;
       if (!DecodeVarint<uint32_t>(&num_symbols, out_buffer)) {
@@ -114,7 +116,10 @@ class MeshEdgebreakerTraversalValenceDecoder
       }
       if (num_symbols > 0) {
         context_symbols_[i].resize(num_symbols);
-        DecodeSymbols(num_symbols, 1, out_buffer, context_symbols_[i].data());
+        if (!DecodeSymbols(num_symbols, 1, TRIANGULAR_MESH, out_buffer,
+                           context_symbols_[i].data())) {
+          return false;
+        }
         // All symbols are going to be processed from the back.
         context_counters_[i] = num_symbols;
       }
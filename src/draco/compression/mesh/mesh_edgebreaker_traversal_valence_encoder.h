@@ -15,6 +15,7 @@
 #ifndef DRACO_COMPRESSION_MESH_MESH_EDGEBREAKER_TRAVERSAL_VALENCE_ENCODER_H_
 #define DRACO_COMPRESSION_MESH_MESH_EDGEBREAKER_TRAVERSAL_VALENCE_ENCODER_H_
 
+#include "draco/compression/entropy/rans_symbol_coding.h"
 #include "draco/compression/entropy/symbol_encoding.h"
 #include "draco/compression/mesh/mesh_edgebreaker_traversal_encoder.h"
 #include "draco/core/varint_encoding.h"
@@ -189,14 +190,21 @@ class MeshEdgebreakerTraversalValenceEncoder
     MeshEdgebreakerTraversalEncoder::EncodeStartFaces();
     MeshEdgebreakerTraversalEncoder::EncodeAttributeSeams();
 
+    Options symbol_encoding_options;
+    if (encoder_impl()->GetEncoder()->options()->GetGlobalBool(
+            "use_interleaved_rans", false)) {
+      SetSymbolEncodingNumInterleavedStates(&symbol_encoding_options,
+                                            kDefaultNumRAnsInterleavedStates);
+    }
+
     // Store the contexts.
     for (int i = 0; i < context_symbols_.size(); ++i) {
       EncodeVarint<uint32_t>(static_cast<uint32_t>(context_symbols_[i].size()),
                              GetOutputBuffer());
       if (context_symbols_[i].size() > 0) {
         EncodeSymbols(context_symbols_[i].data(),
-                      static_cast<int>(context_symbols_[i].size()), 1, nullptr,
-                      GetOutputBuffer());
+                      static_cast<int>(context_symbols_[i].size()), 1,
+                      &symbol_encoding_options, GetOutputBuffer());
       }
     }
   }
@@ -141,7 +141,8 @@ bool MeshSequentialDecoder::CreateAttributesDecoder(int32_t att_decoder_id) {
 bool MeshSequentialDecoder::DecodeAndDecompressIndices(uint32_t num_faces) {
   // Get decoded indices differences that were encoded with an entropy code.
   std::vector<uint32_t> indices_buffer(num_faces * 3);
-  if (!DecodeSymbols(num_faces * 3, 1, buffer(), indices_buffer.data())) {
+  if (!DecodeSymbols(num_faces * 3, 1, TRIANGULAR_MESH, buffer(),
+                     indices_buffer.data())) {
     return false;
   }
   // Reconstruct the indices from the differences.
@@ -18,6 +18,7 @@
 
 #include "draco/compression/attributes/linear_sequencer.h"
 #include "draco/compression/attributes/sequential_attribute_encoders_controller.h"
+#include "draco/compression/entropy/rans_symbol_coding.h"
 #include "draco/compression/entropy/symbol_encoding.h"
 #include "draco/core/varint_encoding.h"
 
@@ -112,8 +113,13 @@ bool MeshSequentialEncoder::CompressAndEncodeIndices() {
       last_index_value = index_value;
     }
   }
+  Options symbol_encoding_options;
+  if (options()->GetGlobalBool("use_interleaved_rans", false)) {
+    SetSymbolEncodingNumInterleavedStates(&symbol_encoding_options,
+                                          kDefaultNumRAnsInterleavedStates);
+  }
   EncodeSymbols(indices_buffer.data(), static_cast<int>(indices_buffer.size()),
-                1, nullptr, buffer());
+                1, &symbol_encoding_options, buffer());
   return true;
 }
 
@@ -92,7 +92,15 @@ class DynamicIntegerPointsKdTreeDecoder {
         // Init the stack with the maximum depth of the tree.
         // +1 for a second leaf.
         base_stack_(32 * dimension + 1, VectorUint32(dimension, 0)),
-        levels_stack_(32 * dimension + 1, VectorUint32(dimension, 0)) {}
+        levels_stack_(32 * dimension + 1, VectorUint32(dimension, 0)),
+        breadth_first_(false),
+        depth_(0),
+        node_pos_(0) {}
+
+  // Tells the decoder that the points were encoded breadth first (see
+  // DynamicIntegerPointsKdTreeEncoder::SetBreadthFirstTraversal()).
+  // Default = false.
+  void SetBreadthFirstTraversal(bool flag) { breadth_first_ = flag; }
 
   // Decodes an integer point cloud from |buffer|. Optional |oit_max_points| can
   // be used to tell the decoder the maximum number of points accepted by the
@@ -117,6 +125,45 @@ class DynamicIntegerPointsKdTreeDecoder {
   // Returns the number of decoded points. Must be called after DecodePoints().
   uint32_t num_decoded_points() const { return num_decoded_points_; }
 
+  // Progressive decoding of breadth first streams. The decoding is started by
+  // StartProgressiveDecoding() and it is then advanced by one or more calls of
+  // DecodeProgressive(). In between, the points that are not decoded yet can
+  // be approximated by GetPendingPoints(). The decoder keeps pointers to the
+  // data of the input buffer, which must stay valid until the decoding is
+  // complete.
+
+  // Parses the header of a breadth first stream from |buffer|.
+  bool StartProgressiveDecoding(DecoderBuffer *buffer);
+
+  // Decodes the tree until all nodes up to |max_depth| are decoded or until
+  // the number of decoded points plus the number of pending nodes exceeds
+  // |max_points|, whichever comes first. The newly decoded points are written
+  // to |oit|, i.e., over all calls, each point is output exactly once.
+  template <class OutputIteratorT>
+  bool DecodeProgressive(uint32_t max_depth, uint32_t max_points,
+                         OutputIteratorT &oit);
+
+  // Outputs one point for each node of the tree that is not decoded yet. The
+  // point is located at the center of the node's cell. Together with the
+  // points output by DecodeProgressive(), the points give an approximation of
+  // the whole point cloud that becomes exact once the decoding is complete.
+  template <class OutputIteratorT>
+  void GetPendingPoints(OutputIteratorT &oit) const;
+
+  // Returns the number of tree nodes that are not decoded yet.
+  uint32_t num_pending_nodes() const {
+    return static_cast<uint32_t>((nodes_.size() - node_pos_ +
+                                  next_nodes_.size()) /
+                                 NodeStride());
+  }
+
+  // Returns the depth of the next tree node to be decoded.
+  uint32_t progressive_depth() const { return depth_; }
+
+  bool IsProgressiveDecodingComplete() const {
+    return node_pos_ == nodes_.size() && next_nodes_.empty();
+  }
+
  private:
   uint32_t GetAxis(uint32_t num_remaining_points, const VectorUint32 &levels,
                    uint32_t last_axis);
@@ -152,6 +199,16 @@ class DynamicIntegerPointsKdTreeDecoder {
   VectorUint32 axes_;
   std::vector<VectorUint32> base_stack_;
   std::vector<VectorUint32> levels_stack_;
+
+  // State of the progressive decoding. Tree nodes of the current and the next
+  // level are stored in flat arrays where each node consists of the number of
+  // its points, the last axis, its base and its levels.
+  uint32_t NodeStride() const { return 2 + 2 * dimension_; }
+  bool breadth_first_;
+  uint32_t depth_;
+  size_t node_pos_;
+  VectorUint32 nodes_;
+  VectorUint32 next_nodes_;
 };
 
 // Decodes a point cloud from |buffer|.
@@ -183,6 +240,17 @@ template <int compression_level_t>
 template <class OutputIteratorT>
 bool DynamicIntegerPointsKdTreeDecoder<compression_level_t>::DecodePoints(
     DecoderBuffer *buffer, OutputIteratorT &oit, uint32_t oit_max_points) {
+  if (breadth_first_) {
+    if (!StartProgressiveDecoding(buffer)) {
+      return false;
+    }
+    if (num_points_ > oit_max_points) {
+      return false;
+    }
+    const uint32_t max_value = std::numeric_limits<uint32_t>::max();
+    return DecodeProgressive(max_value, max_value, oit) &&
+           IsProgressiveDecodingComplete();
+  }
   if (!buffer->Decode(&bit_length_)) {
     return false;
   }
@@ -359,6 +427,192 @@ bool DynamicIntegerPointsKdTreeDecoder<compression_level_t>::DecodeInternal(
   return true;
 }
 
+template <int compression_level_t>
+bool DynamicIntegerPointsKdTreeDecoder<
+    compression_level_t>::StartProgressiveDecoding(DecoderBuffer *buffer) {
+  nodes_.clear();
+  next_nodes_.clear();
+  node_pos_ = 0;
+  depth_ = 0;
+  num_decoded_points_ = 0;
+  if (!buffer->Decode(&bit_length_)) {
+    return false;
+  }
+  if (bit_length_ > 32) {
+    return false;
+  }
+  if (!buffer->Decode(&num_points_)) {
+    return false;
+  }
+  if (num_points_ == 0) {
+    return true;
+  }
+  if (!numbers_decoder_.StartDecoding(buffer)) {
+    return false;
+  }
+  if (!remaining_bits_decoder_.StartDecoding(buffer)) {
+    return false;
+  }
+  if (!axis_decoder_.StartDecoding(buffer)) {
+    return false;
+  }
+  if (!half_decoder_.StartDecoding(buffer)) {
+    return false;
+  }
+
+  // Add the root node.
+  nodes_.resize(NodeStride(), 0);
+  nodes_[0] = num_points_;
+  return true;
+}
+
+template <int compression_level_t>
+template <class OutputIteratorT>
+bool DynamicIntegerPointsKdTreeDecoder<compression_level_t>::DecodeProgressive(
+    uint32_t max_depth, uint32_t max_points, OutputIteratorT &oit) {
+  const uint32_t stride = NodeStride();
+  VectorUint32 old_base(dimension_);
+  VectorUint32 levels(dimension_);
+  while (!IsProgressiveDecodingComplete()) {
+    if (node_pos_ == nodes_.size()) {
+      // Move to the next level of the tree.
+      nodes_.swap(next_nodes_);
+      next_nodes_.clear();
+      node_pos_ = 0;
+      ++depth_;
+    }
+    if (depth_ >= max_depth ||
+        static_cast<uint64_t>(num_decoded_points_) + num_pending_nodes() >
+            max_points) {
+      return true;
+    }
+
+    const uint32_t *const node = &nodes_[node_pos_];
+    const uint32_t num_remaining_points = node[0];
+    const uint32_t last_axis = node[1];
+    for (uint32_t i = 0; i < dimension_; ++i) {
+      old_base[i] = node[2 + i];
+      levels[i] = node[2 + dimension_ + i];
+    }
+    node_pos_ += stride;
+
+    if (num_remaining_points > num_points_) {
+      return false;
+    }
+
+    const uint32_t axis = GetAxis(num_remaining_points, levels, last_axis);
+    if (axis >= dimension_) {
+      return false;
+    }
+
+    const uint32_t level = levels[axis];
+
+    // All axes have been fully subdivided, just output points.
+    if ((bit_length_ - level) == 0) {
+      for (uint32_t i = 0; i < num_remaining_points; i++) {
+        *oit = old_base;
+        ++oit;
+        ++num_decoded_points_;
+      }
+      continue;
+    }
+
+    // Fast decoding of remaining bits if number of points is 1 or 2.
+    if (num_remaining_points <= 2) {
+      axes_[0] = axis;
+      for (uint32_t i = 1; i < dimension_; i++) {
+        axes_[i] = DRACO_INCREMENT_MOD(axes_[i - 1], dimension_);
+      }
+      for (uint32_t i = 0; i < num_remaining_points; ++i) {
+        for (uint32_t j = 0; j < dimension_; j++) {
+          p_[axes_[j]] = 0;
+          const uint32_t num_remaining_bits = bit_length_ - levels[axes_[j]];
+          if (num_remaining_bits) {
+            if (!remaining_bits_decoder_.DecodeLeastSignificantBits32(
+                    num_remaining_bits, &p_[axes_[j]])) {
+              return false;
+            }
+          }
+          p_[axes_[j]] = old_base[axes_[j]] | p_[axes_[j]];
+        }
+        *oit = p_;
+        ++oit;
+        ++num_decoded_points_;
+      }
+      continue;
+    }
+
+    if (num_decoded_points_ > num_points_) {
+      return false;
+    }
+
+    const int num_remaining_bits = bit_length_ - level;
+    const uint32_t modifier = 1 << (num_remaining_bits - 1);
+    const int incoming_bits = MostSignificantBit(num_remaining_points);
+
+    uint32_t number = 0;
+    DecodeNumber(incoming_bits, &number);
+
+    uint32_t first_half = num_remaining_points / 2;
+    if (first_half < number) {
+      // Invalid |number|.
+      return false;
+    }
+    first_half -= number;
+    uint32_t second_half = num_remaining_points - first_half;
+
+    if (first_half != second_half) {
+      if (!half_decoder_.DecodeNextBit()) {
+        std::swap(first_half, second_half);
+      }
+    }
+
+    levels[axis] += 1;
+    for (int half = 0; half < 2; ++half) {
+      const uint32_t num_half_points = half == 0 ? first_half : second_half;
+      if (num_half_points == 0) {
+        continue;
+      }
+      next_nodes_.push_back(num_half_points);
+      next_nodes_.push_back(axis);
+      for (uint32_t i = 0; i < dimension_; ++i) {
+        next_nodes_.push_back(old_base[i] + (half == 1 && i == axis ? modifier
+                                                                    : 0));
+      }
+      next_nodes_.insert(next_nodes_.end(), levels.begin(), levels.end());
+    }
+  }
+  numbers_decoder_.EndDecoding();
+  remaining_bits_decoder_.EndDecoding();
+  axis_decoder_.EndDecoding();
+  half_decoder_.EndDecoding();
+  return true;
+}
+
+template <int compression_level_t>
+template <class OutputIteratorT>
+void DynamicIntegerPointsKdTreeDecoder<compression_level_t>::GetPendingPoints(
+    OutputIteratorT &oit) const {
+  const uint32_t stride = NodeStride();
+  VectorUint32 point(dimension_);
+  for (const VectorUint32 *node_list : {&nodes_, &next_nodes_}) {
+    const size_t begin = node_list == &nodes_ ? node_pos_ : 0;
+    for (size_t pos = begin; pos < node_list->size(); pos += stride) {
+      const uint32_t *const node = &(*node_list)[pos];
+      for (uint32_t i = 0; i < dimension_; ++i) {
+        const uint32_t num_remaining_bits =
+            bit_length_ - node[2 + dimension_ + i];
+        point[i] = node[2 + i];
+        if (num_remaining_bits > 0) {
+          point[i] += 1u << (num_remaining_bits - 1);
+        }
+      }
+      *oit = point;
+      ++oit;
+    }
+  }
+}
+
 extern template class DynamicIntegerPointsKdTreeDecoder<0>;
 extern template class DynamicIntegerPointsKdTreeDecoder<2>;
 extern template class DynamicIntegerPointsKdTreeDecoder<4>;
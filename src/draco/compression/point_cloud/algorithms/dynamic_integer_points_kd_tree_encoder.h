@@ -106,7 +106,16 @@ class DynamicIntegerPointsKdTreeEncoder {
         num_remaining_bits_(dimension, 0),
         axes_(dimension, 0),
         base_stack_(32 * dimension + 1, VectorUint32(dimension, 0)),
-        levels_stack_(32 * dimension + 1, VectorUint32(dimension, 0)) {}
+        levels_stack_(32 * dimension + 1, VectorUint32(dimension, 0)),
+        breadth_first_(false) {}
+
+  // Sets whether the tree is encoded breadth first, i.e., level by level,
+  // instead of the default depth first order. Breadth first streams can be
+  // decoded progressively (see DynamicIntegerPointsKdTreeDecoder), but the
+  // decoder must be told about the used order as it is not stored in the
+  // stream. The encoded data have the same size in both orders.
+  // Default = false.
+  void SetBreadthFirstTraversal(bool flag) { breadth_first_ = flag; }
 
   // Encodes an integer point cloud given by [begin,end) into buffer.
   // |bit_length| gives the highest bit used for all coordinates.
@@ -127,10 +136,13 @@ class DynamicIntegerPointsKdTreeEncoder {
   template <class RandomAccessIteratorT>
   uint32_t GetAndEncodeAxis(RandomAccessIteratorT begin,
                             RandomAccessIteratorT end,
-                            const VectorUint32 &old_base,
-                            const VectorUint32 &levels, uint32_t last_axis);
+                            const uint32_t *old_base, const uint32_t *levels,
+                            uint32_t last_axis);
   template <class RandomAccessIteratorT>
   void EncodeInternal(RandomAccessIteratorT begin, RandomAccessIteratorT end);
+  template <class RandomAccessIteratorT>
+  void EncodeInternalBreadthFirst(RandomAccessIteratorT begin,
+                                  RandomAccessIteratorT end);
 
   class Splitter {
    public:
@@ -179,6 +191,7 @@ class DynamicIntegerPointsKdTreeEncoder {
   VectorUint32 axes_;
   std::vector<VectorUint32> base_stack_;
   std::vector<VectorUint32> levels_stack_;
+  bool breadth_first_;
 };
 
 template <int compression_level_t>
@@ -200,7 +213,11 @@ bool DynamicIntegerPointsKdTreeEncoder<compression_level_t>::EncodePoints(
   axis_encoder_.StartEncoding();
   half_encoder_.StartEncoding();
 
-  EncodeInternal(begin, end);
+  if (breadth_first_) {
+    EncodeInternalBreadthFirst(begin, end);
+  } else {
+    EncodeInternal(begin, end);
+  }
 
   numbers_encoder_.EndEncoding(buffer);
   remaining_bits_encoder_.EndEncoding(buffer);
@@ -214,8 +231,7 @@ template <class RandomAccessIteratorT>
 uint32_t
 DynamicIntegerPointsKdTreeEncoder<compression_level_t>::GetAndEncodeAxis(
     RandomAccessIteratorT begin, RandomAccessIteratorT end,
-    const VectorUint32 &old_base, const VectorUint32 &levels,
-    uint32_t last_axis) {
+    const uint32_t *old_base, const uint32_t *levels, uint32_t last_axis) {
   if (!Policy::select_axis) {
     return DRACO_INCREMENT_MOD(last_axis, dimension_);
   }
@@ -292,8 +308,8 @@ void DynamicIntegerPointsKdTreeEncoder<compression_level_t>::EncodeInternal(
     const VectorUint32 &old_base = base_stack_[stack_pos];
     const VectorUint32 &levels = levels_stack_[stack_pos];
 
-    const uint32_t axis =
-        GetAndEncodeAxis(begin, end, old_base, levels, last_axis);
+    const uint32_t axis = GetAndEncodeAxis(begin, end, old_base.data(),
+                                           levels.data(), last_axis);
     const uint32_t level = levels[axis];
     const uint32_t num_remaining_points = static_cast<uint32_t>(end - begin);
 
@@ -362,6 +378,114 @@ void DynamicIntegerPointsKdTreeEncoder<compression_level_t>::EncodeInternal(
     }
   }
 }
+
+template <int compression_level_t>
+template <class RandomAccessIteratorT>
+void DynamicIntegerPointsKdTreeEncoder<compression_level_t>::
+    EncodeInternalBreadthFirst(RandomAccessIteratorT begin,
+                               RandomAccessIteratorT end) {
+  // Same as EncodeInternal() but all nodes of one level of the tree are
+  // encoded before any node of the next level. The nodes can't share the
+  // stacks used by the depth first traversal. Instead, the base and levels of
+  // the n-th node of a tree level are stored in flat arrays starting at
+  // n * dimension_. The arrays of the current and the next tree level are
+  // swapped after each level so that their memory is reused.
+  struct Node {
+    RandomAccessIteratorT begin;
+    RandomAccessIteratorT end;
+    uint32_t last_axis;
+  };
+  std::vector<Node> nodes;
+  std::vector<Node> next_nodes;
+  VectorUint32 bases(dimension_, 0);
+  VectorUint32 levels_data(dimension_, 0);
+  VectorUint32 next_bases;
+  VectorUint32 next_levels_data;
+  nodes.push_back(Node{begin, end, 0});
+
+  while (!nodes.empty()) {
+    for (size_t n = 0; n < nodes.size(); ++n) {
+      const Node &node = nodes[n];
+      begin = node.begin;
+      end = node.end;
+      const uint32_t *const old_base = &bases[n * dimension_];
+      uint32_t *const levels = &levels_data[n * dimension_];
+
+      const uint32_t axis =
+          GetAndEncodeAxis(begin, end, old_base, levels, node.last_axis);
+      const uint32_t level = levels[axis];
+      const uint32_t num_remaining_points = static_cast<uint32_t>(end - begin);
+
+      // If this happens all axis are subdivided to the end.
+      if ((bit_length_ - level) == 0) {
+        continue;
+      }
+
+      // Fast encoding of remaining bits if number of points is 1 or 2.
+      if (num_remaining_points <= 2) {
+        axes_[0] = axis;
+        for (uint32_t i = 1; i < dimension_; i++) {
+          axes_[i] = DRACO_INCREMENT_MOD(axes_[i - 1], dimension_);
+        }
+        for (uint32_t i = 0; i < num_remaining_points; ++i) {
+          const auto &p = *(begin + i);
+          for (uint32_t j = 0; j < dimension_; j++) {
+            const uint32_t num_remaining_bits = bit_length_ - levels[axes_[j]];
+            if (num_remaining_bits) {
+              remaining_bits_encoder_.EncodeLeastSignificantBits32(
+                  num_remaining_bits, p[axes_[j]]);
+            }
+          }
+        }
+        continue;
+      }
+
+      const uint32_t num_remaining_bits = bit_length_ - level;
+      const uint32_t modifier = 1 << (num_remaining_bits - 1);
+      const RandomAccessIteratorT split = std::partition(
+          begin, end, Splitter(axis, old_base[axis] + modifier));
+
+      // Encode number of points in first and second half.
+      const int required_bits = MostSignificantBit(num_remaining_points);
+
+      const uint32_t first_half = static_cast<uint32_t>(split - begin);
+      const uint32_t second_half = static_cast<uint32_t>(end - split);
+      const bool left = first_half < second_half;
+
+      if (first_half != second_half) {
+        half_encoder_.EncodeBit(left);
+      }
+
+      if (left) {
+        EncodeNumber(required_bits, num_remaining_points / 2 - first_half);
+      } else {
+        EncodeNumber(required_bits, num_remaining_points / 2 - second_half);
+      }
+
+      levels[axis] += 1;
+      if (split != begin) {
+        next_nodes.push_back(Node{begin, split, axis});
+        next_bases.insert(next_bases.end(), old_base, old_base + dimension_);
+        next_levels_data.insert(next_levels_data.end(), levels,
+                                levels + dimension_);
+      }
+      if (split != end) {
+        next_nodes.push_back(Node{split, end, axis});
+        next_bases.insert(next_bases.end(), old_base, old_base + dimension_);
+        next_bases[next_bases.size() - dimension_ + axis] += modifier;
+        next_levels_data.insert(next_levels_data.end(), levels,
+                                levels + dimension_);
+      }
+    }
+    nodes.swap(next_nodes);
+    next_nodes.clear();
+    bases.swap(next_bases);
+    next_bases.clear();
+    levels_data.swap(next_levels_data);
+    next_levels_data.clear();
+  }
+}
+
 extern template class DynamicIntegerPointsKdTreeEncoder<0>;
 extern template class DynamicIntegerPointsKdTreeEncoder<2>;
 extern template class DynamicIntegerPointsKdTreeEncoder<4>;
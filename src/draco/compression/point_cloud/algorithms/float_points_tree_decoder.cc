@@ -62,13 +62,15 @@ class ConversionOutputIterator {
 };
 
 FloatPointsTreeDecoder::FloatPointsTreeDecoder()
-    : num_points_(0), compression_level_(0), num_points_from_header_(0) {
+    : method_(KDTREE),
+      num_points_(0),
+      compression_level_(0),
+      num_points_from_header_(0) {
   qinfo_.quantization_bits = 0;
   qinfo_.range = 0;
 }
 
-bool FloatPointsTreeDecoder::DecodePointCloudKdTreeInternal(
-    DecoderBuffer *buffer, std::vector<Point3ui> *qpoints) {
+bool FloatPointsTreeDecoder::DecodeKdTreeHeader(DecoderBuffer *buffer) {
   if (!buffer->Decode(&qinfo_.quantization_bits)) {
     return false;
   }
@@ -94,50 +96,53 @@ bool FloatPointsTreeDecoder::DecodePointCloudKdTreeInternal(
                compression_level_);
     return false;
   }
+  return true;
+}
 
+template <int compression_level_t>
+static bool DecodeQuantizedPoints(DecoderBuffer *buffer, bool breadth_first,
+                                  std::vector<Point3ui> *qpoints) {
   std::back_insert_iterator<std::vector<Point3ui>> oit_qpoints =
       std::back_inserter(*qpoints);
   ConversionOutputIterator<std::back_insert_iterator<std::vector<Point3ui>>,
                            Converter>
       oit(oit_qpoints);
+  DynamicIntegerPointsKdTreeDecoder<compression_level_t> qpoints_decoder(3);
+  qpoints_decoder.SetBreadthFirstTraversal(breadth_first);
+  return qpoints_decoder.DecodePoints(buffer, oit);
+}
+
+bool FloatPointsTreeDecoder::DecodePointCloudKdTreeInternal(
+    DecoderBuffer *buffer, std::vector<Point3ui> *qpoints) {
+  if (!DecodeKdTreeHeader(buffer)) {
+    return false;
+  }
+
   if (num_points_ > 0) {
     qpoints->reserve(num_points_);
+    const bool breadth_first = method_ == PROGRESSIVE_KDTREE;
     switch (compression_level_) {
-      case 0: {
-        DynamicIntegerPointsKdTreeDecoder<0> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 0:
+        DecodeQuantizedPoints<0>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 1: {
-        DynamicIntegerPointsKdTreeDecoder<1> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 1:
+        DecodeQuantizedPoints<1>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 2: {
-        DynamicIntegerPointsKdTreeDecoder<2> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 2:
+        DecodeQuantizedPoints<2>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 3: {
-        DynamicIntegerPointsKdTreeDecoder<3> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 3:
+        DecodeQuantizedPoints<3>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 4: {
-        DynamicIntegerPointsKdTreeDecoder<4> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 4:
+        DecodeQuantizedPoints<4>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 5: {
-        DynamicIntegerPointsKdTreeDecoder<5> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 5:
+        DecodeQuantizedPoints<5>(buffer, breadth_first, qpoints);
         break;
-      }
-      case 6: {
-        DynamicIntegerPointsKdTreeDecoder<6> qpoints_decoder(3);
-        qpoints_decoder.DecodePoints(buffer, oit);
+      case 6:
+        DecodeQuantizedPoints<6>(buffer, breadth_first, qpoints);
         break;
-      }
       default:
         return false;
     }
@@ -149,4 +154,117 @@ bool FloatPointsTreeDecoder::DecodePointCloudKdTreeInternal(
   return true;
 }
 
+// Implementation of the progressive decoder interface for a given compression
+// level.
+template <int compression_level_t>
+class FloatPointsTreeDecoder::ProgressiveKdTreeDecoder
+    : public ProgressiveDecoderInterface {
+ public:
+  typedef std::back_insert_iterator<std::vector<Point3ui>> BackInserter;
+  typedef ConversionOutputIterator<BackInserter, Converter> OutputIterator;
+
+  ProgressiveKdTreeDecoder() : decoder_(3) {
+    decoder_.SetBreadthFirstTraversal(true);
+  }
+
+  bool Start(DecoderBuffer *buffer) override {
+    return decoder_.StartProgressiveDecoding(buffer);
+  }
+  bool Decode(uint32_t max_depth, uint32_t max_points,
+              std::vector<Point3ui> *qpoints) override {
+    OutputIterator oit(std::back_inserter(*qpoints));
+    return decoder_.DecodeProgressive(max_depth, max_points, oit);
+  }
+  void GetPendingPoints(std::vector<Point3ui> *qpoints) const override {
+    OutputIterator oit(std::back_inserter(*qpoints));
+    decoder_.GetPendingPoints(oit);
+  }
+  uint32_t num_pending_nodes() const override {
+    return decoder_.num_pending_nodes();
+  }
+  bool IsComplete() const override {
+    return decoder_.IsProgressiveDecodingComplete();
+  }
+
+ private:
+  DynamicIntegerPointsKdTreeDecoder<compression_level_t> decoder_;
+};
+
+bool FloatPointsTreeDecoder::StartProgressiveDecoding(DecoderBuffer *buffer) {
+  progressive_decoder_ = nullptr;
+  uint32_t decoded_version;
+  if (!buffer->Decode(&decoded_version)) {
+    return false;
+  }
+  if (decoded_version != 3) {
+    return false;
+  }
+  int8_t method_number;
+  if (!buffer->Decode(&method_number)) {
+    return false;
+  }
+  method_ = method_number;
+  if (method_ != PROGRESSIVE_KDTREE) {
+    return false;
+  }
+  if (!DecodeKdTreeHeader(buffer)) {
+    return false;
+  }
+  if (num_points_ == 0) {
+    return true;
+  }
+
+  std::unique_ptr<ProgressiveDecoderInterface> decoder;
+  switch (compression_level_) {
+    case 0:
+      decoder.reset(new ProgressiveKdTreeDecoder<0>());
+      break;
+    case 1:
+      decoder.reset(new ProgressiveKdTreeDecoder<1>());
+      break;
+    case 2:
+      decoder.reset(new ProgressiveKdTreeDecoder<2>());
+      break;
+    case 3:
+      decoder.reset(new ProgressiveKdTreeDecoder<3>());
+      break;
+    case 4:
+      decoder.reset(new ProgressiveKdTreeDecoder<4>());
+      break;
+    case 5:
+      decoder.reset(new ProgressiveKdTreeDecoder<5>());
+      break;
+    case 6:
+      decoder.reset(new ProgressiveKdTreeDecoder<6>());
+      break;
+    default:
+      return false;
+  }
+  if (!decoder->Start(buffer)) {
+    return false;
+  }
+  progressive_decoder_ = std::move(decoder);
+  return true;
+}
+
+bool FloatPointsTreeDecoder::DecodeProgressiveInternal(
+    uint32_t max_depth, uint32_t max_points, std::vector<Point3ui> *qpoints) {
+  if (progressive_decoder_ == nullptr) {
+    // Either the decoding was not started or the point cloud is empty.
+    return method_ == PROGRESSIVE_KDTREE && num_points_ == 0;
+  }
+  return progressive_decoder_->Decode(max_depth, max_points, qpoints);
+}
+
+uint32_t FloatPointsTreeDecoder::num_pending_points() const {
+  if (progressive_decoder_ == nullptr) {
+    return 0;
+  }
+  return progressive_decoder_->num_pending_nodes();
+}
+
+bool FloatPointsTreeDecoder::IsProgressiveDecodingComplete() const {
+  return progressive_decoder_ == nullptr || progressive_decoder_->IsComplete();
+}
+
 }  // namespace draco
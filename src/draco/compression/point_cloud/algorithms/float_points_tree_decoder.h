@@ -16,6 +16,7 @@
 #define DRACO_COMPRESSION_POINT_CLOUD_ALGORITHMS_FLOAT_POINTS_TREE_DECODER_H_
 
 #include <memory>
+#include <vector>
 
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/point_cloud/algorithms/point_cloud_compression_method.h"
@@ -53,6 +54,32 @@ class FloatPointsTreeDecoder {
     return DecodePointCloud(&buffer, out);
   }
 
+  // Progressive decoding of point clouds encoded with the PROGRESSIVE_KDTREE
+  // method. StartProgressiveDecoding() parses the header of the point cloud
+  // and each call of DecodeProgressive() then decodes more levels of the
+  // kd-tree. In between, GetPendingPoints() can be used to get an
+  // approximation of the points that are not decoded yet, e.g., for
+  // level-of-detail rendering. The data of |buffer| must stay valid until the
+  // decoding is complete.
+  bool StartProgressiveDecoding(DecoderBuffer *buffer);
+
+  // Decodes the kd-tree until all levels up to |max_depth| are decoded or
+  // until the number of decoded points plus the number of pending points
+  // exceeds |max_points|. Only the newly decoded points are written to |out|.
+  template <class OutputIteratorT>
+  bool DecodeProgressive(uint32_t max_depth, uint32_t max_points,
+                         OutputIteratorT &out);
+
+  // Writes one approximate point for each kd-tree cell that is not decoded
+  // yet to |out|. Each cell contains at least one point of the input.
+  template <class OutputIteratorT>
+  void GetPendingPoints(OutputIteratorT &out) const;
+
+  // Returns the number of points written by GetPendingPoints().
+  uint32_t num_pending_points() const;
+
+  bool IsProgressiveDecodingComplete() const;
+
   uint32_t quantization_bits() const { return qinfo_.quantization_bits; }
   uint32_t compression_level() const { return compression_level_; }
   float range() const { return qinfo_.range; }
@@ -61,6 +88,8 @@ class FloatPointsTreeDecoder {
   std::string identification_string() const {
     if (method_ == KDTREE) {
       return "FloatPointsTreeDecoder: IntegerPointsKDTreeDecoder";
+    } else if (method_ == PROGRESSIVE_KDTREE) {
+      return "FloatPointsTreeDecoder: ProgressiveIntegerPointsKDTreeDecoder";
     } else {
       return "FloatPointsTreeDecoder: Unsupported Method";
     }
@@ -71,8 +100,26 @@ class FloatPointsTreeDecoder {
   }
 
  private:
+  // Interface of the quantized kd-tree decoder used for progressive decoding.
+  // Hides the compression level that is a template parameter of the decoder.
+  class ProgressiveDecoderInterface {
+   public:
+    virtual ~ProgressiveDecoderInterface() = default;
+    virtual bool Start(DecoderBuffer *buffer) = 0;
+    virtual bool Decode(uint32_t max_depth, uint32_t max_points,
+                        std::vector<Point3ui> *qpoints) = 0;
+    virtual void GetPendingPoints(std::vector<Point3ui> *qpoints) const = 0;
+    virtual uint32_t num_pending_nodes() const = 0;
+    virtual bool IsComplete() const = 0;
+  };
+  template <int compression_level_t>
+  class ProgressiveKdTreeDecoder;
+
+  bool DecodeKdTreeHeader(DecoderBuffer *buffer);
   bool DecodePointCloudKdTreeInternal(DecoderBuffer *buffer,
                                       std::vector<Point3ui> *qpoints);
+  bool DecodeProgressiveInternal(uint32_t max_depth, uint32_t max_points,
+                                 std::vector<Point3ui> *qpoints);
 
   static const uint32_t version_ = 3;
   QuantizationInfo qinfo_;
@@ -84,6 +131,8 @@ class FloatPointsTreeDecoder {
   // matches the number of points in the compression header. If
   // |num_points_from_header_| is 0, do not perform the check. Defaults to 0.
   uint32_t num_points_from_header_;
+
+  std::unique_ptr<ProgressiveDecoderInterface> progressive_decoder_;
 };
 
 #ifndef DRACO_OLD_GCC
@@ -115,7 +164,7 @@ bool FloatPointsTreeDecoder::DecodePointCloud(DecoderBuffer *buffer,
 
     method_ = method_number;
 
-    if (method_ == KDTREE) {
+    if (method_ == KDTREE || method_ == PROGRESSIVE_KDTREE) {
       if (!DecodePointCloudKdTreeInternal(buffer, &qpoints)) {
         return false;
       }
@@ -136,6 +185,28 @@ bool FloatPointsTreeDecoder::DecodePointCloud(DecoderBuffer *buffer,
   return true;
 }
 
+template <class OutputIteratorT>
+bool FloatPointsTreeDecoder::DecodeProgressive(uint32_t max_depth,
+                                               uint32_t max_points,
+                                               OutputIteratorT &out) {
+  std::vector<Point3ui> qpoints;
+  if (!DecodeProgressiveInternal(max_depth, max_points, &qpoints)) {
+    return false;
+  }
+  DequantizePoints3(qpoints.begin(), qpoints.end(), qinfo_, out);
+  return true;
+}
+
+template <class OutputIteratorT>
+void FloatPointsTreeDecoder::GetPendingPoints(OutputIteratorT &out) const {
+  if (progressive_decoder_ == nullptr) {
+    return;
+  }
+  std::vector<Point3ui> qpoints;
+  progressive_decoder_->GetPendingPoints(&qpoints);
+  DequantizePoints3(qpoints.begin(), qpoints.end(), qinfo_, out);
+}
+
 }  // namespace draco
 
 #endif  // DRACO_COMPRESSION_POINT_CLOUD_ALGORITHMS_FLOAT_POINTS_TREE_DECODER_H_
@@ -0,0 +1,164 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/compression/point_cloud/algorithms/float_points_tree_decoder.h"
+
+#include <algorithm>
+#include <iterator>
+#include <random>
+#include <vector>
+
+#include "draco/compression/point_cloud/algorithms/float_points_tree_encoder.h"
+#include "draco/core/draco_test_base.h"
+
+namespace draco {
+
+namespace {
+
+class FloatPointsTreeDecoderTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    // Generate points in a few clusters so that the kd-tree is not balanced.
+    std::mt19937 generator(1234);
+    std::uniform_real_distribution<float> dist(0.f, 1.f);
+    for (int i = 0; i < 3000; ++i) {
+      const float offset = static_cast<float>(i % 3) * 10.f;
+      points_.push_back(Point3f(offset + dist(generator), dist(generator),
+                                offset * 0.5f + dist(generator)));
+    }
+    // Add some duplicate points.
+    for (int i = 0; i < 20; ++i) {
+      points_.push_back(points_[i]);
+    }
+  }
+
+  std::vector<Point3f> EncodeAndDecode(PointCloudCompressionMethod method,
+                                       uint32_t compression_level,
+                                       EncoderBuffer *buffer) const {
+    FloatPointsTreeEncoder encoder(method, 12, compression_level);
+    EXPECT_TRUE(encoder.EncodePointCloud(points_.begin(), points_.end()));
+    buffer->Clear();
+    buffer->Encode(encoder.buffer()->data(), encoder.buffer()->size());
+
+    FloatPointsTreeDecoder decoder;
+    std::vector<Point3f> decoded_points;
+    EXPECT_TRUE(decoder.DecodePointCloud(buffer->data(), buffer->size(),
+                                         std::back_inserter(decoded_points)));
+    std::sort(decoded_points.begin(), decoded_points.end());
+    return decoded_points;
+  }
+
+  std::vector<Point3f> points_;
+};
+
+TEST_F(FloatPointsTreeDecoderTest, TestBreadthFirstDecoding) {
+  // Tests that points encoded breadth first decode to the same points as
+  // points encoded with the default depth first traversal.
+  for (uint32_t compression_level = 0; compression_level <= 6;
+       ++compression_level) {
+    EncoderBuffer buffer;
+    const std::vector<Point3f> kd_tree_points =
+        EncodeAndDecode(KDTREE, compression_level, &buffer);
+    const std::vector<Point3f> progressive_points =
+        EncodeAndDecode(PROGRESSIVE_KDTREE, compression_level, &buffer);
+    ASSERT_EQ(kd_tree_points.size(), points_.size());
+    ASSERT_EQ(kd_tree_points, progressive_points);
+  }
+}
+
+TEST_F(FloatPointsTreeDecoderTest, TestProgressiveDecoding) {
+  for (uint32_t compression_level = 0; compression_level <= 6;
+       compression_level += 3) {
+    EncoderBuffer buffer;
+    const std::vector<Point3f> expected_points =
+        EncodeAndDecode(PROGRESSIVE_KDTREE, compression_level, &buffer);
+
+    DecoderBuffer dec_buffer;
+    dec_buffer.Init(buffer.data(), buffer.size());
+    dec_buffer.set_bitstream_version(kDracoPointCloudBitstreamVersion);
+    FloatPointsTreeDecoder decoder;
+    ASSERT_TRUE(decoder.StartProgressiveDecoding(&dec_buffer));
+    ASSERT_EQ(decoder.num_points(), points_.size());
+    ASSERT_EQ(decoder.num_pending_points(), 1);
+
+    // Decode the tree level by level.
+    std::vector<Point3f> decoded_points;
+    std::back_insert_iterator<std::vector<Point3f>> oit =
+        std::back_inserter(decoded_points);
+    uint32_t depth = 0;
+    uint32_t last_num_pending_points = 1;
+    while (!decoder.IsProgressiveDecodingComplete()) {
+      ASSERT_LT(depth, 100);
+      ASSERT_TRUE(decoder.DecodeProgressive(++depth, points_.size(), oit));
+      std::vector<Point3f> pending_points;
+      std::back_insert_iterator<std::vector<Point3f>> pending_oit =
+          std::back_inserter(pending_points);
+      decoder.GetPendingPoints(pending_oit);
+      ASSERT_EQ(pending_points.size(), decoder.num_pending_points());
+      // Each pending point represents at least one input point.
+      ASSERT_LE(decoded_points.size() + pending_points.size(), points_.size());
+      if (decoded_points.empty()) {
+        // Until points are decoded, the number of cells can only grow.
+        ASSERT_GE(pending_points.size(), last_num_pending_points);
+      }
+      last_num_pending_points = decoder.num_pending_points();
+    }
+    ASSERT_GT(depth, 1);
+    ASSERT_EQ(decoder.num_pending_points(), 0);
+    std::sort(decoded_points.begin(), decoded_points.end());
+    ASSERT_EQ(decoded_points, expected_points);
+  }
+}
+
+TEST_F(FloatPointsTreeDecoderTest, TestProgressiveDecodingPointBudget) {
+  EncoderBuffer buffer;
+  const std::vector<Point3f> expected_points =
+      EncodeAndDecode(PROGRESSIVE_KDTREE, 6, &buffer);
+
+  DecoderBuffer dec_buffer;
+  dec_buffer.Init(buffer.data(), buffer.size());
+  dec_buffer.set_bitstream_version(kDracoPointCloudBitstreamVersion);
+  FloatPointsTreeDecoder decoder;
+  ASSERT_TRUE(decoder.StartProgressiveDecoding(&dec_buffer));
+
+  // Decode a coarse level of detail with about 100 points.
+  std::vector<Point3f> decoded_points;
+  std::back_insert_iterator<std::vector<Point3f>> oit =
+      std::back_inserter(decoded_points);
+  ASSERT_TRUE(decoder.DecodeProgressive(100, 100, oit));
+  ASSERT_FALSE(decoder.IsProgressiveDecodingComplete());
+  ASSERT_GT(decoded_points.size() + decoder.num_pending_points(), 100);
+  ASSERT_LT(decoded_points.size() + decoder.num_pending_points(), 110);
+
+  // Decode the rest.
+  ASSERT_TRUE(decoder.DecodeProgressive(100, points_.size(), oit));
+  ASSERT_TRUE(decoder.IsProgressiveDecodingComplete());
+  std::sort(decoded_points.begin(), decoded_points.end());
+  ASSERT_EQ(decoded_points, expected_points);
+}
+
+TEST_F(FloatPointsTreeDecoderTest, TestProgressiveDecodingOfKdTreeFails) {
+  // Depth first streams can't be decoded progressively.
+  FloatPointsTreeEncoder encoder(KDTREE, 12, 6);
+  ASSERT_TRUE(encoder.EncodePointCloud(points_.begin(), points_.end()));
+  DecoderBuffer dec_buffer;
+  dec_buffer.Init(encoder.buffer()->data(), encoder.buffer()->size());
+  dec_buffer.set_bitstream_version(kDracoPointCloudBitstreamVersion);
+  FloatPointsTreeDecoder decoder;
+  ASSERT_FALSE(decoder.StartProgressiveDecoding(&dec_buffer));
+}
+
+}  // namespace
+
+}  // namespace draco
@@ -44,50 +44,30 @@ bool FloatPointsTreeEncoder::EncodePointCloudKdTreeInternal(
     std::vector<Point3ui> *qpoints) {
   DRACO_DCHECK_LE(compression_level_, 6);
   switch (compression_level_) {
-    case 0: {
-      DynamicIntegerPointsKdTreeEncoder<0> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    case 1: {
-      DynamicIntegerPointsKdTreeEncoder<1> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    case 2: {
-      DynamicIntegerPointsKdTreeEncoder<2> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    case 3: {
-      DynamicIntegerPointsKdTreeEncoder<3> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    case 4: {
-      DynamicIntegerPointsKdTreeEncoder<4> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    case 5: {
-      DynamicIntegerPointsKdTreeEncoder<5> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
-    default: {
-      DynamicIntegerPointsKdTreeEncoder<6> qpoints_encoder(3);
-      qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
-                                   qinfo_.quantization_bits + 1, &buffer_);
-      break;
-    }
+    case 0:
+      return EncodeQuantizedPoints<0>(qpoints);
+    case 1:
+      return EncodeQuantizedPoints<1>(qpoints);
+    case 2:
+      return EncodeQuantizedPoints<2>(qpoints);
+    case 3:
+      return EncodeQuantizedPoints<3>(qpoints);
+    case 4:
+      return EncodeQuantizedPoints<4>(qpoints);
+    case 5:
+      return EncodeQuantizedPoints<5>(qpoints);
+    default:
+      return EncodeQuantizedPoints<6>(qpoints);
   }
+}
 
+template <int compression_level_t>
+bool FloatPointsTreeEncoder::EncodeQuantizedPoints(
+    std::vector<Point3ui> *qpoints) {
+  DynamicIntegerPointsKdTreeEncoder<compression_level_t> qpoints_encoder(3);
+  qpoints_encoder.SetBreadthFirstTraversal(method_ == PROGRESSIVE_KDTREE);
+  qpoints_encoder.EncodePoints(qpoints->begin(), qpoints->end(),
+                               qinfo_.quantization_bits + 1, &buffer_);
   return true;
 }
 
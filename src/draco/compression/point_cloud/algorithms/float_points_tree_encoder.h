@@ -66,6 +66,8 @@ class FloatPointsTreeEncoder {
   std::string identification_string() const {
     if (method_ == KDTREE) {
       return "FloatPointsTreeEncoder: IntegerPointsKDTreeEncoder";
+    } else if (method_ == PROGRESSIVE_KDTREE) {
+      return "FloatPointsTreeEncoder: ProgressiveIntegerPointsKDTreeEncoder";
     } else {
       return "FloatPointsTreeEncoder: Unsupported Method";
     }
@@ -74,6 +76,8 @@ class FloatPointsTreeEncoder {
  private:
   void Clear() { buffer_.Clear(); }
   bool EncodePointCloudKdTreeInternal(std::vector<Point3ui> *qpoints);
+  template <int compression_level_t>
+  bool EncodeQuantizedPoints(std::vector<Point3ui> *qpoints);
 
   static const uint32_t version_;
   QuantizationInfo qinfo_;
@@ -105,7 +109,7 @@ bool FloatPointsTreeEncoder::EncodePointCloud(InputIteratorT points_begin,
   buffer()->Encode(qinfo_.range);
   buffer()->Encode(num_points_);
 
-  if (method_ == KDTREE) {
+  if (method_ == KDTREE || method_ == PROGRESSIVE_KDTREE) {
     buffer()->Encode(compression_level_);
   }
 
@@ -113,7 +117,7 @@ bool FloatPointsTreeEncoder::EncodePointCloud(InputIteratorT points_begin,
     return true;
   }
 
-  if (method_ == KDTREE) {
+  if (method_ == KDTREE || method_ == PROGRESSIVE_KDTREE) {
     return EncodePointCloudKdTreeInternal(&qpoints);
   } else {  // Unsupported method.
     fprintf(stderr, "Method not supported. \n");
@@ -27,6 +27,9 @@ enum PointCloudCompressionMethod {
   KDTREE = 1,
   RESERVED_POINT_CLOUD_METHOD_2 = 2,  // Reserved for internal use.
   RESERVED_POINT_CLOUD_METHOD_3 = 0,  // Reserved for internal use.
+  // Same as KDTREE but the tree is stored level by level (breadth first),
+  // which allows progressive decoding of the point cloud.
+  PROGRESSIVE_KDTREE = 4,
 };
 
 }  // namespace draco
@@ -14,6 +14,10 @@
 //
 #include "draco/compression/point_cloud/point_cloud_decoder.h"
 
+#include <utility>
+#include <vector>
+
+#include "draco/core/thread_pool.h"
 #include "draco/metadata/metadata_decoder.h"
 
 namespace draco {
@@ -23,7 +27,9 @@ PointCloudDecoder::PointCloudDecoder()
       buffer_(nullptr),
       version_major_(0),
       version_minor_(0),
-      options_(nullptr) {}
+      options_(nullptr),
+      cancellation_flag_(nullptr),
+      stats_(nullptr) {}
 
 Status PointCloudDecoder::DecodeHeader(DecoderBuffer *buffer,
                                        DracoHeader *out_header) {
@@ -69,8 +75,16 @@ Status PointCloudDecoder::Decode(const DecoderOptions &options,
   options_ = &options;
   buffer_ = in_buffer;
   point_cloud_ = out_point_cloud;
+  // Drop any state left over from a previous decode when the decoder instance
+  // is reused (see DecoderContext).
+  attributes_decoders_.clear();
+  attribute_to_decoder_map_.clear();
   DracoHeader header;
-  DRACO_RETURN_IF_ERROR(DecodeHeader(buffer_, &header))
+  {
+    DecoderStats::ScopedStage stage(stats_, DecoderStats::STAGE_HEADER, -1,
+                                    buffer_);
+    DRACO_RETURN_IF_ERROR(DecodeHeader(buffer_, &header))
+  }
   // Sanity check that we are really using the right decoder (mostly for cases
   // where the Decode method was called manually outside of our main API.
   if (header.encoder_type != GetGeometryType()) {
@@ -86,8 +100,9 @@ Status PointCloudDecoder::Decode(const DecoderOptions &options,
       header.encoder_type == POINT_CLOUD ? kDracoPointCloudBitstreamVersionMajor
                                          : kDracoMeshBitstreamVersionMajor;
   const uint8_t max_supported_minor_version =
-      header.encoder_type == POINT_CLOUD ? kDracoPointCloudBitstreamVersionMinor
-                                         : kDracoMeshBitstreamVersionMinor;
+      header.encoder_type == POINT_CLOUD
+          ? kDracoPointCloudBreadthFirstKdTreeBitstreamVersionMinor
+          : kDracoMeshInterleavedRAnsBitstreamVersionMinor;
 
   // Check for version compatibility.
 #ifdef DRACO_BACKWARDS_COMPATIBILITY_SUPPORTED
@@ -102,7 +117,14 @@ Status PointCloudDecoder::Decode(const DecoderOptions &options,
   if (version_major_ != max_supported_major_version) {
     return Status(Status::UNKNOWN_VERSION, "Unsupported major version.");
   }
-  if (version_minor_ != max_supported_minor_version) {
+  // Streams that don't use interleaved rANS coding or the breadth first
+  // kd-tree are written with the default minor version, all newer minor
+  // versions up to the maximum one are supported.
+  const uint8_t default_minor_version =
+      header.encoder_type == POINT_CLOUD ? kDracoPointCloudBitstreamVersionMinor
+                                         : kDracoMeshBitstreamVersionMinor;
+  if (version_minor_ < default_minor_version ||
+      version_minor_ > max_supported_minor_version) {
     return Status(Status::UNKNOWN_VERSION, "Unsupported minor version.");
   }
 #endif
@@ -111,15 +133,27 @@ Status PointCloudDecoder::Decode(const DecoderOptions &options,
 
   if (bitstream_version() >= DRACO_BITSTREAM_VERSION(1, 3) &&
       (header.flags & METADATA_FLAG_MASK)) {
+    DecoderStats::ScopedStage stage(stats_, DecoderStats::STAGE_METADATA, -1,
+                                    buffer_);
     DRACO_RETURN_IF_ERROR(DecodeMetadata())
   }
-  if (!InitializeDecoder()) {
-    return Status(Status::DRACO_ERROR, "Failed to initialize the decoder.");
+  {
+    DecoderStats::ScopedStage stage(stats_, DecoderStats::STAGE_CONNECTIVITY,
+                                    -1, buffer_);
+    if (!InitializeDecoder()) {
+      return Status(Status::DRACO_ERROR, "Failed to initialize the decoder.");
+    }
+    if (!DecodeGeometryData()) {
+      return Status(Status::DRACO_ERROR, "Failed to decode geometry data.");
+    }
   }
-  if (!DecodeGeometryData()) {
-    return Status(Status::DRACO_ERROR, "Failed to decode geometry data.");
+  if (IsCancelled()) {
+    return Status(Status::DRACO_ERROR, "Decoding was cancelled.");
   }
   if (!DecodePointAttributes()) {
+    if (IsCancelled()) {
+      return Status(Status::DRACO_ERROR, "Decoding was cancelled.");
+    }
     return Status(Status::DRACO_ERROR, "Failed to decode point attributes.");
   }
   return OkStatus();
@@ -127,29 +161,33 @@ Status PointCloudDecoder::Decode(const DecoderOptions &options,
 
 bool PointCloudDecoder::DecodePointAttributes() {
   uint8_t num_attributes_decoders;
-  if (!buffer_->Decode(&num_attributes_decoders)) {
-    return false;
-  }
-  // Create all attribute decoders. This is implementation specific and the
-  // derived classes can use any data encoded in the
-  // PointCloudEncoder::EncodeAttributesEncoderIdentifier() call.
-  for (int i = 0; i < num_attributes_decoders; ++i) {
-    if (!CreateAttributesDecoder(i)) {
+  {
+    DecoderStats::ScopedStage stage(
+        stats_, DecoderStats::STAGE_ATTRIBUTES_DECODER_DATA, -1, buffer_);
+    if (!buffer_->Decode(&num_attributes_decoders)) {
       return false;
     }
-  }
+    // Create all attribute decoders. This is implementation specific and the
+    // derived classes can use any data encoded in the
+    // PointCloudEncoder::EncodeAttributesEncoderIdentifier() call.
+    for (int i = 0; i < num_attributes_decoders; ++i) {
+      if (!CreateAttributesDecoder(i)) {
+        return false;
+      }
+    }
 
-  // Initialize all attributes decoders. No data is decoded here.
-  for (auto &att_dec : attributes_decoders_) {
-    if (!att_dec->Init(this, point_cloud_)) {
-      return false;
+    // Initialize all attributes decoders. No data is decoded here.
+    for (auto &att_dec : attributes_decoders_) {
+      if (!att_dec->Init(this, point_cloud_)) {
+        return false;
+      }
     }
-  }
 
-  // Decode any data needed by the attribute decoders.
-  for (int i = 0; i < num_attributes_decoders; ++i) {
-    if (!attributes_decoders_[i]->DecodeAttributesDecoderData(buffer_)) {
-      return false;
+    // Decode any data needed by the attribute decoders.
+    for (int i = 0; i < num_attributes_decoders; ++i) {
+      if (!attributes_decoders_[i]->DecodeAttributesDecoderData(buffer_)) {
+        return false;
+      }
     }
   }
 
@@ -177,7 +215,18 @@ bool PointCloudDecoder::DecodePointAttributes() {
 }
 
 bool PointCloudDecoder::DecodeAllAttributes() {
+  // Attributes of bitstreams older than 2.0 are predicted from the final
+  // (transformed) values of other attributes, so their transforms cannot be
+  // deferred.
+  const int num_threads =
+      options_ ? options_->GetGlobalInt("attribute_decoding_threads", 1) : 1;
+  if (num_threads > 1 && bitstream_version() >= DRACO_BITSTREAM_VERSION(2, 0)) {
+    return DecodeAllAttributesConcurrently(num_threads);
+  }
   for (auto &att_dec : attributes_decoders_) {
+    if (IsCancelled()) {
+      return false;
+    }
     if (!att_dec->DecodeAttributes(buffer_)) {
       return false;
     }
@@ -185,6 +234,38 @@ bool PointCloudDecoder::DecodeAllAttributes() {
   return true;
 }
 
+bool PointCloudDecoder::DecodeAllAttributesConcurrently(int num_threads) {
+  // Entropy decoding and prediction of all attributes must follow the order
+  // of the data in the bitstream. Predictors only depend on the portable
+  // attributes of other decoders, so the transforms to the original format
+  // (e.g. dequantization or octahedral decoding of normals) can be deferred
+  // and run in parallel afterwards.
+  std::vector<std::pair<int, int>> transforms;
+  for (int i = 0; i < num_attributes_decoders(); ++i) {
+    if (IsCancelled()) {
+      return false;
+    }
+    if (!attributes_decoders_[i]->DecodePortableData(buffer_)) {
+      return false;
+    }
+    for (int j = 0; j < attributes_decoders_[i]->GetNumAttributes(); ++j) {
+      transforms.push_back(std::make_pair(i, j));
+    }
+  }
+  std::atomic<bool> ok(true);
+  ParallelFor(num_threads, static_cast<int>(transforms.size()), [&](int t) {
+    if (!ok || IsCancelled()) {
+      ok = false;
+      return;
+    }
+    if (!attributes_decoders_[transforms[t].first]
+             ->TransformAttributeToOriginalFormat(transforms[t].second)) {
+      ok = false;
+    }
+  });
+  return ok;
+}
+
 const PointAttribute *PointCloudDecoder::GetPortableAttribute(
     int32_t parent_att_id) {
   if (parent_att_id < 0 || parent_att_id >= point_cloud_->num_attributes()) {
@@ -15,9 +15,12 @@
 #ifndef DRACO_COMPRESSION_POINT_CLOUD_POINT_CLOUD_DECODER_H_
 #define DRACO_COMPRESSION_POINT_CLOUD_POINT_CLOUD_DECODER_H_
 
+#include <atomic>
+
 #include "draco/compression/attributes/attributes_decoder_interface.h"
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/config/decoder_options.h"
+#include "draco/compression/decoder_stats.h"
 #include "draco/core/status.h"
 #include "draco/point_cloud/point_cloud.h"
 
@@ -79,6 +82,22 @@ class PointCloudDecoder {
   DecoderBuffer *buffer() { return buffer_; }
   const DecoderOptions *options() const { return options_; }
 
+  // Sets an optional flag that is polled between the decoding stages (after
+  // the connectivity and before each attributes decoder). Once the flag is
+  // set, Decode() stops early and returns an error. The flag must outlive
+  // the decoding.
+  void set_cancellation_flag(const std::atomic<bool> *flag) {
+    cancellation_flag_ = flag;
+  }
+  bool IsCancelled() const {
+    return cancellation_flag_ != nullptr && cancellation_flag_->load();
+  }
+
+  // Sets optional statistics that are filled with the timings of the
+  // individual decoding stages. Can be nullptr.
+  void set_stats(DecoderStats *stats) { stats_ = stats; }
+  DecoderStats *stats() const { return stats_; }
+
  protected:
   // Can be implemented by derived classes to perform any custom initialization
   // of the decoder. Called in the Decode() method.
@@ -90,6 +109,9 @@ class PointCloudDecoder {
   virtual bool DecodePointAttributes();
 
   virtual bool DecodeAllAttributes();
+  // Same as DecodeAllAttributes() but transforms the decoded portable
+  // attributes to their original format on up to |num_threads| threads.
+  bool DecodeAllAttributesConcurrently(int num_threads);
   virtual bool OnAttributesDecoded() { return true; }
 
   Status DecodeMetadata();
@@ -111,6 +133,10 @@ class PointCloudDecoder {
   uint8_t version_minor_;
 
   const DecoderOptions *options_;
+
+  const std::atomic<bool> *cancellation_flag_;
+
+  DecoderStats *stats_;
 };
 
 }  // namespace draco
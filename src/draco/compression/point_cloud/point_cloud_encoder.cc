@@ -69,6 +69,19 @@ Status PointCloudEncoder::EncodeHeader() {
   version_minor = encoder_type == POINT_CLOUD
                       ? kDracoPointCloudBitstreamVersionMinor
                       : kDracoMeshBitstreamVersionMinor;
+  if (options()->GetGlobalBool("use_interleaved_rans", false)) {
+    // Interleaved rANS coding requires a newer bit-stream version.
+    version_minor = encoder_type == POINT_CLOUD
+                        ? kDracoPointCloudInterleavedRAnsBitstreamVersionMinor
+                        : kDracoMeshInterleavedRAnsBitstreamVersionMinor;
+  }
+  if (encoder_type == POINT_CLOUD &&
+      GetEncodingMethod() == POINT_CLOUD_KD_TREE_ENCODING &&
+      options()->GetGlobalBool("kd_tree_breadth_first", false)) {
+    // Breadth first kd-tree requires a newer bit-stream version that also
+    // supports the interleaved rANS coding.
+    version_minor = kDracoPointCloudBreadthFirstKdTreeBitstreamVersionMinor;
+  }
 
   buffer_->Encode(version_major);
   buffer_->Encode(version_minor);
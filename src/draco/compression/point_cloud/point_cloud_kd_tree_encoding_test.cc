@@ -82,6 +82,34 @@ class PointCloudKdTreeEncodingTest : public ::testing::Test {
     }
   }
 
+  void TestBreadthFirstKdTreeEncoding(const PointCloud &pc) {
+    EncoderBuffer buffer;
+    PointCloudKdTreeEncoder encoder;
+    EncoderOptions options = EncoderOptions::CreateDefaultOptions();
+    options.SetGlobalInt("quantization_bits", 16);
+    options.SetGlobalBool("kd_tree_breadth_first", true);
+    for (int compression_level = 0; compression_level <= 6;
+         ++compression_level) {
+      options.SetSpeed(10 - compression_level, 10 - compression_level);
+      encoder.SetPointCloud(pc);
+      buffer.Clear();
+      DRACO_ASSERT_OK(encoder.Encode(options, &buffer));
+      // Breadth first kd-tree is stored with a newer minor version.
+      ASSERT_EQ(buffer.data()[6],
+                kDracoPointCloudBreadthFirstKdTreeBitstreamVersionMinor);
+
+      DecoderBuffer dec_buffer;
+      dec_buffer.Init(buffer.data(), buffer.size());
+      PointCloudKdTreeDecoder decoder;
+
+      std::unique_ptr<PointCloud> out_pc(new PointCloud());
+      DecoderOptions dec_options;
+      DRACO_ASSERT_OK(decoder.Decode(dec_options, &dec_buffer, out_pc.get()));
+
+      ComparePointClouds(pc, *out_pc);
+    }
+  }
+
   void TestFloatEncoding(const std::string &file_name) {
     std::unique_ptr<PointCloud> pc = ReadPointCloudFromTestFile(file_name);
     ASSERT_NE(pc, nullptr);
@@ -94,6 +122,12 @@ TEST_F(PointCloudKdTreeEncodingTest, TestFloatKdTreeEncoding) {
   TestFloatEncoding("cube_subd.obj");
 }
 
+TEST_F(PointCloudKdTreeEncodingTest, TestFloatBreadthFirstKdTreeEncoding) {
+  std::unique_ptr<PointCloud> pc = ReadPointCloudFromTestFile("cube_subd.obj");
+  ASSERT_NE(pc, nullptr);
+  TestBreadthFirstKdTreeEncoding(*pc);
+}
+
 TEST_F(PointCloudKdTreeEncodingTest, TestIntKdTreeEncoding) {
   constexpr int num_points = 120;
   std::vector<std::array<uint32_t, 3>> points(num_points);
@@ -229,6 +263,7 @@ TEST_F(PointCloudKdTreeEncodingTest,
   ASSERT_NE(pc, nullptr);
 
   TestKdTreeEncoding(*pc);
+  TestBreadthFirstKdTreeEncoding(*pc);
 }
 
 // Test 16 only encoding for one attribute.
@@ -425,6 +460,7 @@ TEST_F(PointCloudKdTreeEncodingTest, TestIntKdTreeEncodingSignedTypes) {
   ASSERT_NE(pc, nullptr);
 
   TestKdTreeEncoding(*pc);
+  TestBreadthFirstKdTreeEncoding(*pc);
 }
 
 // Test encoding of integer point clouds with > 16 dimensions.
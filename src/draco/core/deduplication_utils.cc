@@ -0,0 +1,198 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/core/deduplication_utils.h"
+
+#include <algorithm>
+#include <cstring>
+
+#include "draco/core/thread_pool.h"
+
+namespace draco {
+
+namespace {
+
+constexpr uint32_t kInvalidRecord = 0xffffffff;
+
+// Largest open addressing table whose slots can be indexed by uint32_t.
+constexpr uint64_t kMaxTableSize = 1ull << 31;
+
+// Inputs smaller than this are not worth splitting between threads.
+constexpr uint32_t kMinRecordsPerThread = 1 << 16;
+
+// Maximum number of hash value ranges that are processed independently.
+constexpr int kMaxNumShardBits = 8;
+
+constexpr uint64_t kMultiplier = 0x9E3779B97F4A7C15ULL;
+
+inline uint32_t HashRecord(const uint8_t *record, int record_size) {
+  uint64_t hash = static_cast<uint64_t>(record_size) * kMultiplier;
+  int i = 0;
+  for (; i + 8 <= record_size; i += 8) {
+    uint64_t word;
+    memcpy(&word, record + i, sizeof(word));
+    hash = (hash ^ word) * kMultiplier;
+    hash ^= hash >> 29;
+  }
+  if (i < record_size) {
+    uint64_t word = 0;
+    memcpy(&word, record + i, record_size - i);
+    hash = (hash ^ word) * kMultiplier;
+  }
+  // Mix all bits into the upper 32 bits.
+  hash ^= hash >> 32;
+  hash *= 0xD6E8FEB86659FD93ULL;
+  return static_cast<uint32_t>(hash >> 32);
+}
+
+}  // namespace
+
+uint32_t DeduplicateRecords(const uint8_t *data, int64_t stride,
+                            int record_size, uint32_t num_records,
+                            int max_num_threads,
+                            std::vector<uint32_t> *out_record_ids,
+                            std::vector<uint32_t> *out_unique_records) {
+  std::vector<uint32_t> &record_ids = *out_record_ids;
+  record_ids.resize(num_records);
+  if (out_unique_records) {
+    out_unique_records->clear();
+  }
+  if (num_records == 0) {
+    return 0;
+  }
+  if (num_records > kMaxNumDeduplicatedRecords) {
+    // A single shard could exceed the largest table, keep all records.
+    for (uint32_t r = 0; r < num_records; ++r) {
+      record_ids[r] = r;
+    }
+    if (out_unique_records) {
+      *out_unique_records = record_ids;
+    }
+    return num_records;
+  }
+  const auto get_record = [data, stride](uint32_t r) {
+    return data + static_cast<int64_t>(r) * stride;
+  };
+
+  const int num_threads = std::max(
+      1, std::min(max_num_threads,
+                  static_cast<int>(num_records / kMinRecordsPerThread)));
+  // Records are split into shards by the upper bits of their hashes so that
+  // each shard can be processed independently of the others.
+  int num_shard_bits = 0;
+  while (num_threads > 1 && num_shard_bits < kMaxNumShardBits &&
+         (1 << num_shard_bits) < 4 * num_threads) {
+    ++num_shard_bits;
+  }
+  const int num_shards = 1 << num_shard_bits;
+  const auto get_shard = [num_shard_bits](uint32_t hash) {
+    return num_shard_bits == 0 ? 0 : hash >> (32 - num_shard_bits);
+  };
+
+  // Hash all records and count the records of each shard in each chunk of
+  // the input.
+  const int num_chunks = num_threads;
+  const auto get_chunk_begin = [num_records, num_chunks](int chunk) {
+    return static_cast<uint32_t>(static_cast<uint64_t>(num_records) * chunk /
+                                 num_chunks);
+  };
+  std::vector<uint32_t> hashes(num_records);
+  std::vector<uint32_t> shard_offsets(num_chunks * num_shards, 0);
+  ParallelFor(num_threads, num_chunks, [&](int c) {
+    uint32_t *const counts = &shard_offsets[c * num_shards];
+    for (uint32_t r = get_chunk_begin(c); r < get_chunk_begin(c + 1); ++r) {
+      hashes[r] = HashRecord(get_record(r), record_size);
+      ++counts[get_shard(hashes[r])];
+    }
+  });
+
+  // Group records by their shards. Records within a shard stay in increasing
+  // order which guarantees that the first occurrence of each record is always
+  // found first.
+  std::vector<uint32_t> shard_records;
+  std::vector<uint32_t> shard_begin(num_shards + 1, 0);
+  if (num_shards > 1) {
+    uint32_t offset = 0;
+    for (int s = 0; s < num_shards; ++s) {
+      shard_begin[s] = offset;
+      for (int c = 0; c < num_chunks; ++c) {
+        const uint32_t count = shard_offsets[c * num_shards + s];
+        shard_offsets[c * num_shards + s] = offset;
+        offset += count;
+      }
+    }
+    shard_records.resize(num_records);
+    ParallelFor(num_threads, num_chunks, [&](int c) {
+      uint32_t *const offsets = &shard_offsets[c * num_shards];
+      for (uint32_t r = get_chunk_begin(c); r < get_chunk_begin(c + 1); ++r) {
+        shard_records[offsets[get_shard(hashes[r])]++] = r;
+      }
+    });
+  }
+  shard_begin[num_shards] = num_records;
+
+  // Find the first occurrence of every record using an open addressing table
+  // for each shard. The index of the first occurrence is temporarily stored
+  // in |record_ids|.
+  ParallelFor(num_threads, num_shards, [&](int s) {
+    const uint32_t begin = shard_begin[s];
+    const uint32_t end = shard_begin[s + 1];
+    // The table size is computed in 64 bits so that it does not overflow for
+    // large shards. Capping it at |kMaxTableSize| is safe because a shard
+    // never has more records than the capped table has slots.
+    uint64_t table_size = 16;
+    while (table_size < 2 * static_cast<uint64_t>(end - begin) &&
+           table_size < kMaxTableSize) {
+      table_size <<= 1;
+    }
+    const uint32_t mask = static_cast<uint32_t>(table_size - 1);
+    std::vector<uint32_t> table(table_size, kInvalidRecord);
+    for (uint32_t i = begin; i < end; ++i) {
+      const uint32_t r = num_shards > 1 ? shard_records[i] : i;
+      const uint32_t hash = hashes[r];
+      const uint8_t *const record = get_record(r);
+      for (uint32_t slot = hash & mask;; slot = (slot + 1) & mask) {
+        const uint32_t other = table[slot];
+        if (other == kInvalidRecord) {
+          table[slot] = r;
+          record_ids[r] = r;
+          break;
+        }
+        if (hashes[other] == hash &&
+            memcmp(get_record(other), record, record_size) == 0) {
+          record_ids[r] = other;
+          break;
+        }
+      }
+    }
+  });
+
+  // Assign unique ids in the order of the first occurrences. First
+  // occurrences always precede their duplicates so their ids are already
+  // assigned.
+  uint32_t num_unique_records = 0;
+  for (uint32_t r = 0; r < num_records; ++r) {
+    if (record_ids[r] == r) {
+      record_ids[r] = num_unique_records++;
+      if (out_unique_records) {
+        out_unique_records->push_back(r);
+      }
+    } else {
+      record_ids[r] = record_ids[record_ids[r]];
+    }
+  }
+  return num_unique_records;
+}
+
+}  // namespace draco
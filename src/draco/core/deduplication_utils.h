@@ -0,0 +1,51 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_CORE_DEDUPLICATION_UTILS_H_
+#define DRACO_CORE_DEDUPLICATION_UTILS_H_
+
+#include <stdint.h>
+
+#include <vector>
+
+namespace draco {
+
+// Largest number of records that DeduplicateRecords() deduplicates.
+constexpr uint32_t kMaxNumDeduplicatedRecords = 1u << 31;
+
+// Finds duplicate records in an array of |num_records| fixed size records.
+// Record i occupies |record_size| bytes starting at |data| + i * |stride| and
+// two records are duplicates when their bytes are equal.
+//
+// Every record is assigned the id of its unique record in |out_record_ids|.
+// Unique ids are assigned in the order of the first occurrences of the
+// records, so the result is always the same as for a serial scan and does not
+// depend on |max_num_threads|. |out_unique_records| is optional and it is set
+// to the index of the first occurrence of each unique record. Returns the
+// number of unique records.
+//
+// Records are hashed in bulk and matched with open addressing tables over
+// disjoint ranges of hash values that are processed by up to
+// |max_num_threads| threads. Small inputs are always processed serially.
+// Inputs with more than |kMaxNumDeduplicatedRecords| records are not
+// deduplicated and each record is assigned its own id.
+uint32_t DeduplicateRecords(const uint8_t *data, int64_t stride,
+                            int record_size, uint32_t num_records,
+                            int max_num_threads,
+                            std::vector<uint32_t> *out_record_ids,
+                            std::vector<uint32_t> *out_unique_records);
+
+}  // namespace draco
+
+#endif  // DRACO_CORE_DEDUPLICATION_UTILS_H_
@@ -0,0 +1,100 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/core/deduplication_utils.h"
+
+#include <cstring>
+#include <map>
+#include <random>
+#include <string>
+#include <vector>
+
+#include "draco/core/draco_test_base.h"
+
+namespace {
+
+// Record of three floats followed by padding that must be ignored.
+struct PaddedRecord {
+  float values[3];
+  uint32_t padding;
+};
+
+TEST(DeduplicationUtilsTest, TestDeduplicateRecords) {
+  // Generate enough records for the work to be split between threads.
+  std::mt19937 generator(42);
+  std::uniform_int_distribution<int> dist(0, 50000);
+  std::vector<PaddedRecord> records(400000);
+  for (PaddedRecord &record : records) {
+    const int value = dist(generator);
+    record.values[0] = static_cast<float>(value);
+    record.values[1] = static_cast<float>(value % 7);
+    record.values[2] = -0.5f * value;
+    record.padding = static_cast<uint32_t>(generator());
+  }
+  // Positive and negative zeros have different bit patterns.
+  records[10].values[2] = 0.f;
+  records[11] = records[10];
+  records[11].values[2] = -0.f;
+
+  // Compute the expected ids with a serial scan.
+  std::map<std::string, uint32_t> value_to_id;
+  std::vector<uint32_t> expected_ids;
+  std::vector<uint32_t> expected_unique_records;
+  for (uint32_t i = 0; i < records.size(); ++i) {
+    const std::string key(reinterpret_cast<const char *>(records[i].values),
+                          sizeof(records[i].values));
+    const auto it = value_to_id.find(key);
+    if (it == value_to_id.end()) {
+      expected_ids.push_back(static_cast<uint32_t>(value_to_id.size()));
+      expected_unique_records.push_back(i);
+      value_to_id[key] = expected_ids.back();
+    } else {
+      expected_ids.push_back(it->second);
+    }
+  }
+  ASSERT_NE(expected_ids[10], expected_ids[11]);
+
+  for (int num_threads : {1, 2, 5, 8}) {
+    std::vector<uint32_t> ids;
+    std::vector<uint32_t> unique_records;
+    const uint32_t num_unique = draco::DeduplicateRecords(
+        reinterpret_cast<const uint8_t *>(records.data()), sizeof(PaddedRecord),
+        sizeof(records[0].values), records.size(), num_threads, &ids,
+        &unique_records);
+    ASSERT_EQ(num_unique, value_to_id.size());
+    ASSERT_EQ(ids, expected_ids);
+    ASSERT_EQ(unique_records, expected_unique_records);
+  }
+}
+
+TEST(DeduplicationUtilsTest, TestDeduplicateRecordsEdgeCases) {
+  std::vector<uint32_t> ids(3, 7);
+  ASSERT_EQ(draco::DeduplicateRecords(nullptr, 0, 4, 0, 4, &ids, nullptr), 0);
+  ASSERT_TRUE(ids.empty());
+
+  // Records of zero size are all equal.
+  ASSERT_EQ(draco::DeduplicateRecords(nullptr, 0, 0, 5, 4, &ids, nullptr), 1);
+  ASSERT_EQ(ids, std::vector<uint32_t>(5, 0));
+
+  // Records with odd sizes.
+  const char data[] = "abcabdabcxyz";
+  std::vector<uint32_t> unique_records;
+  ASSERT_EQ(draco::DeduplicateRecords(reinterpret_cast<const uint8_t *>(data),
+                                      3, 3, 4, 1, &ids, &unique_records),
+            3);
+  ASSERT_EQ(ids, std::vector<uint32_t>({0, 1, 0, 2}));
+  ASSERT_EQ(unique_records, std::vector<uint32_t>({0, 1, 3}));
+}
+
+}  // namespace
@@ -14,7 +14,9 @@
 //
 #include "draco/core/hash_utils.h"
 
+#include <algorithm>
 #include <cstddef>
+#include <cstring>
 #include <functional>
 #include <limits>
 
@@ -55,4 +57,111 @@ uint64_t FingerprintString(const char *s, size_t len) {
   }
   return hash;
 }
+
+namespace {
+
+// Constants and round functions of the xxHash64 algorithm.
+constexpr uint64_t kPrime1 = 0x9E3779B185EBCA87ULL;
+constexpr uint64_t kPrime2 = 0xC2B2AE3D27D4EB4FULL;
+constexpr uint64_t kPrime3 = 0x165667B19E3779F9ULL;
+constexpr uint64_t kPrime4 = 0x85EBCA77C2B2AE63ULL;
+constexpr uint64_t kPrime5 = 0x27D4EB2F165667C5ULL;
+
+inline uint64_t RotateLeft(uint64_t value, int bits) {
+  return (value << bits) | (value >> (64 - bits));
+}
+
+inline uint64_t Round(uint64_t lane, uint64_t input) {
+  lane += input * kPrime2;
+  lane = RotateLeft(lane, 31);
+  return lane * kPrime1;
+}
+
+inline uint64_t MergeRound(uint64_t hash, uint64_t lane) {
+  hash ^= Round(0, lane);
+  return hash * kPrime1 + kPrime4;
+}
+
+inline uint64_t Avalanche(uint64_t hash) {
+  hash ^= hash >> 33;
+  hash *= kPrime2;
+  hash ^= hash >> 29;
+  hash *= kPrime3;
+  hash ^= hash >> 32;
+  return hash;
+}
+
+inline uint64_t ReadUint64(const uint8_t *data) {
+  uint64_t value;
+  memcpy(&value, data, sizeof(value));
+  return value;
+}
+
+}  // namespace
+
+ContentHasher::ContentHasher() : num_pending_bytes_(0), total_size_(0) {
+  lanes_[0] = kPrime1 + kPrime2;
+  lanes_[1] = kPrime2;
+  lanes_[2] = 0;
+  lanes_[3] = 0 - kPrime1;
+}
+
+void ContentHasher::ProcessStripe(const uint8_t *data) {
+  for (int i = 0; i < 4; ++i) {
+    lanes_[i] = Round(lanes_[i], ReadUint64(data + 8 * i));
+  }
+}
+
+void ContentHasher::Update(const void *data, size_t size) {
+  const uint8_t *bytes = static_cast<const uint8_t *>(data);
+  total_size_ += size;
+  if (num_pending_bytes_ > 0) {
+    const size_t num_bytes =
+        std::min(size, static_cast<size_t>(kStripeSize) - num_pending_bytes_);
+    memcpy(pending_ + num_pending_bytes_, bytes, num_bytes);
+    num_pending_bytes_ += num_bytes;
+    bytes += num_bytes;
+    size -= num_bytes;
+    if (num_pending_bytes_ < kStripeSize) {
+      return;
+    }
+    ProcessStripe(pending_);
+    num_pending_bytes_ = 0;
+  }
+  while (size >= kStripeSize) {
+    ProcessStripe(bytes);
+    bytes += kStripeSize;
+    size -= kStripeSize;
+  }
+  memcpy(pending_, bytes, size);
+  num_pending_bytes_ = size;
+}
+
+ContentHasher::Digest ContentHasher::GetDigest() const {
+  // Two different merges of the lanes give the two halves of the digest.
+  uint64_t hash = RotateLeft(lanes_[0], 1) + RotateLeft(lanes_[1], 7) +
+                  RotateLeft(lanes_[2], 12) + RotateLeft(lanes_[3], 18);
+  for (int i = 0; i < 4; ++i) {
+    hash = MergeRound(hash, lanes_[i]);
+  }
+  hash += total_size_;
+
+  // Process the remaining bytes the same way as the xxHash64 tail.
+  size_t pos = 0;
+  for (; pos + 8 <= num_pending_bytes_; pos += 8) {
+    hash ^= Round(0, ReadUint64(pending_ + pos));
+    hash = RotateLeft(hash, 27) * kPrime1 + kPrime4;
+  }
+  for (; pos < num_pending_bytes_; ++pos) {
+    hash ^= pending_[pos] * kPrime5;
+    hash = RotateLeft(hash, 11) * kPrime1;
+  }
+
+  uint64_t hash2 = hash ^ kPrime5;
+  for (int i = 3; i >= 0; --i) {
+    hash2 = MergeRound(hash2, RotateLeft(lanes_[i], 23));
+  }
+  return {{Avalanche(hash), Avalanche(hash2)}};
+}
+
 }  // namespace draco
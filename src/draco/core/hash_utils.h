@@ -17,6 +17,7 @@
 
 #include <stdint.h>
 
+#include <array>
 #include <cstddef>
 #include <functional>
 
@@ -59,6 +60,40 @@ struct HashArray {
   }
 };
 
+// Fast non-cryptographic hash of a stream of bytes that produces a 128-bit
+// digest. The data can be added in any number of chunks and the digest depends
+// only on the concatenation of all added bytes. Multi-byte values are hashed in
+// the byte order of the host, so digests of the same data can differ between
+// little and big endian platforms.
+class ContentHasher {
+ public:
+  typedef std::array<uint64_t, 2> Digest;
+
+  ContentHasher();
+
+  // Adds |size| bytes starting at |data| to the hashed stream.
+  void Update(const void *data, size_t size);
+
+  // Adds the bytes of a trivially copyable |value| to the hashed stream.
+  template <typename T>
+  void UpdateValue(const T &value) {
+    Update(&value, sizeof(T));
+  }
+
+  // Returns the digest of all data added so far. The hasher can still be
+  // updated afterwards.
+  Digest GetDigest() const;
+
+ private:
+  void ProcessStripe(const uint8_t *data);
+
+  static constexpr int kStripeSize = 32;
+  uint64_t lanes_[4];
+  uint8_t pending_[kStripeSize];
+  size_t num_pending_bytes_;
+  uint64_t total_size_;
+};
+
 }  // namespace draco
 
 #endif  // DRACO_CORE_HASH_UTILS_H_
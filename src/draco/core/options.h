@@ -71,6 +71,11 @@ class Options {
     return options_.count(name) > 0;
   }
 
+  // Returns all stored <name, value> pairs ordered by name.
+  const std::map<std::string, std::string> &GetAllOptions() const {
+    return options_;
+  }
+
  private:
   // All entries are internally stored as strings and converted to the desired
   // return type based on the used Get* method.
@@ -14,6 +14,8 @@
 //
 #include "draco/core/quantization_utils.h"
 
+#include <vector>
+
 namespace draco {
 
 Quantizer::Quantizer() : inverse_delta_(1.f) {}
@@ -39,4 +41,38 @@ bool Dequantizer::Init(float delta) {
   return true;
 }
 
+void Dequantizer::DequantizeFloats(const int32_t *in, int num_entries,
+                                   int num_components, const float *offsets,
+                                   float *out) const {
+  if (num_entries <= 0 || num_components <= 0) {
+    return;
+  }
+  // Values are processed in blocks of |kBlockEntries| entries. The offsets are
+  // repeated over the whole block so that the inner loop has no dependency on
+  // the component index.
+  constexpr int kBlockEntries = 16;
+  const int block_size = kBlockEntries * num_components;
+  std::vector<float> block_offsets(block_size);
+  for (int i = 0; i < block_size; ++i) {
+    block_offsets[i] = offsets[i % num_components];
+  }
+  const float *const block_offsets_data = block_offsets.data();
+  const float delta = delta_;
+  const int64_t num_values = static_cast<int64_t>(num_entries) * num_components;
+  int64_t i = 0;
+  for (; i + block_size <= num_values; i += block_size) {
+    const int32_t *const block_in = in + i;
+    float *const block_out = out + i;
+    for (int j = 0; j < block_size; ++j) {
+      block_out[j] =
+          static_cast<float>(block_in[j]) * delta + block_offsets_data[j];
+    }
+  }
+  // Remaining values (always a whole number of entries).
+  const int num_remaining = static_cast<int>(num_values - i);
+  for (int j = 0; j < num_remaining; ++j) {
+    out[i + j] = static_cast<float>(in[i + j]) * delta + block_offsets_data[j];
+  }
+}
+
 }  // namespace draco
@@ -73,6 +73,14 @@ class Dequantizer {
   }
   inline float operator()(int32_t val) const { return DequantizeFloat(val); }
 
+  // Dequantizes |num_entries| entries of |num_components| values each from
+  // |in| and adds the per-component |offsets| to them. The results written to
+  // |out| are identical to computing DequantizeFloat(in[i]) + offsets[c] for
+  // each value, but the work is processed in contiguous blocks that can be
+  // auto-vectorized by the compiler.
+  void DequantizeFloats(const int32_t *in, int num_entries, int num_components,
+                        const float *offsets, float *out) const;
+
  private:
   float delta_;
 };
@@ -14,6 +14,8 @@
 //
 #include "draco/core/quantization_utils.h"
 
+#include <vector>
+
 #include "draco/core/draco_test_base.h"
 
 namespace draco {
@@ -56,6 +58,29 @@ TEST_F(QuantizationUtilsTest, TestDequantizer) {
   ASSERT_FALSE(dequantizer.Init(1.f, -4));
 }
 
+TEST_F(QuantizationUtilsTest, TestDequantizeFloats) {
+  // Test verifies that the batched dequantization produces the same values as
+  // dequantizing each value separately.
+  Dequantizer dequantizer;
+  ASSERT_TRUE(dequantizer.Init(10.f, 1023));
+  const float offsets[3] = {-5.f, 0.25f, 1000.f};
+  for (int num_components = 1; num_components <= 3; ++num_components) {
+    // Use enough entries to cover both the blocked and the remaining values.
+    const int num_entries = 101;
+    std::vector<int32_t> quantized(num_entries * num_components);
+    for (size_t i = 0; i < quantized.size(); ++i) {
+      quantized[i] = (i * 37) % 1024;
+    }
+    std::vector<float> values(quantized.size());
+    dequantizer.DequantizeFloats(quantized.data(), num_entries, num_components,
+                                 offsets, values.data());
+    for (size_t i = 0; i < quantized.size(); ++i) {
+      EXPECT_EQ(values[i], dequantizer.DequantizeFloat(quantized[i]) +
+                               offsets[i % num_components]);
+    }
+  }
+}
+
 TEST_F(QuantizationUtilsTest, TestDeltaQuantization) {
   // Test verifies that the quantizer and dequantizer work correctly when
   // initialized with a delta value.
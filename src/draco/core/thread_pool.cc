@@ -0,0 +1,154 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/core/thread_pool.h"
+
+#include <algorithm>
+#include <atomic>
+#include <thread>
+#include <vector>
+
+namespace draco {
+
+int GetHardwareNumThreads() {
+  if (!AreThreadsSupported()) {
+    return 1;
+  }
+  const unsigned int num_threads = std::thread::hardware_concurrency();
+  return num_threads == 0 ? 1 : static_cast<int>(num_threads);
+}
+
+// Items of a single ParallelFor() call that are shared by the calling thread
+// and the workers helping it.
+struct ThreadPool::Job {
+  Job(int num_items, int max_workers, const std::function<void(int)> *func)
+      : func(func),
+        num_items(num_items),
+        max_workers(max_workers),
+        num_workers(0),
+        next_item(0),
+        num_finished_items(0) {}
+
+  // Processes items until all of them are taken.
+  void Run() {
+    for (int i = next_item++; i < num_items; i = next_item++) {
+      (*func)(i);
+      if (++num_finished_items == num_items) {
+        std::lock_guard<std::mutex> lock(mutex);
+        finished.notify_all();
+      }
+    }
+  }
+
+  // Only called for items that are not finished, so the function outlives
+  // all its uses.
+  const std::function<void(int)> *const func;
+  const int num_items;
+  // Maximum number of workers that can join the calling thread.
+  const int max_workers;
+  // Number of workers that joined the job, guarded by the pool mutex.
+  int num_workers;
+  std::atomic<int> next_item;
+  std::atomic<int> num_finished_items;
+  std::mutex mutex;
+  std::condition_variable finished;
+};
+
+ThreadPool::ThreadPool() : ThreadPool(GetHardwareNumThreads()) {}
+
+ThreadPool::ThreadPool(int max_num_threads)
+    : max_num_threads_(std::max(1, max_num_threads)), stop_(false) {}
+
+ThreadPool::~ThreadPool() {
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    stop_ = true;
+  }
+  job_available_.notify_all();
+  for (std::thread &worker : workers_) {
+    worker.join();
+  }
+}
+
+void ThreadPool::ParallelFor(int num_threads, int num_items,
+                             const std::function<void(int)> &func) {
+  if (!AreThreadsSupported()) {
+    num_threads = 1;
+  }
+  num_threads = std::min({num_threads, num_items, max_num_threads_});
+  if (num_threads <= 1) {
+    for (int i = 0; i < num_items; ++i) {
+      func(i);
+    }
+    return;
+  }
+
+  const std::shared_ptr<Job> job =
+      std::make_shared<Job>(num_items, num_threads - 1, &func);
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    while (static_cast<int>(workers_.size()) < num_threads - 1) {
+      workers_.emplace_back(&ThreadPool::RunWorker, this);
+    }
+    jobs_.push_back(job);
+  }
+  job_available_.notify_all();
+
+  job->Run();
+  {
+    // All items are taken, no other worker needs to join.
+    std::lock_guard<std::mutex> lock(mutex_);
+    const auto it = std::find(jobs_.begin(), jobs_.end(), job);
+    if (it != jobs_.end()) {
+      jobs_.erase(it);
+    }
+  }
+  // Wait for the items that are still processed by the workers.
+  std::unique_lock<std::mutex> lock(job->mutex);
+  job->finished.wait(
+      lock, [&job]() { return job->num_finished_items == job->num_items; });
+}
+
+int ThreadPool::num_workers() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return static_cast<int>(workers_.size());
+}
+
+void ThreadPool::RunWorker() {
+  while (true) {
+    std::shared_ptr<Job> job;
+    {
+      std::unique_lock<std::mutex> lock(mutex_);
+      job_available_.wait(lock, [this]() { return stop_ || !jobs_.empty(); });
+      if (stop_) {
+        return;
+      }
+      job = jobs_.front();
+      if (++job->num_workers == job->max_workers) {
+        jobs_.pop_front();
+      }
+    }
+    job->Run();
+  }
+}
+
+void ParallelFor(int num_threads, int num_items,
+                 const std::function<void(int)> &func) {
+  // The pool is intentionally never destroyed so that it can be used until
+  // the process exits.
+  static ThreadPool *const pool = new ThreadPool();
+  pool->ParallelFor(num_threads, num_items, func);
+}
+
+}  // namespace draco
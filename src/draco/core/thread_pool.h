@@ -0,0 +1,96 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_CORE_THREAD_POOL_H_
+#define DRACO_CORE_THREAD_POOL_H_
+
+#include <condition_variable>
+#include <deque>
+#include <functional>
+#include <memory>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+namespace draco {
+
+// Returns true when the current build can spawn worker threads. Emscripten
+// builds without pthread support run everything on the calling thread.
+constexpr bool AreThreadsSupported() {
+#if defined(__EMSCRIPTEN__) && !defined(__EMSCRIPTEN_PTHREADS__)
+  return false;
+#else
+  return true;
+#endif
+}
+
+// Returns the number of concurrent threads supported by the hardware (at least
+// one).
+int GetHardwareNumThreads();
+
+// Pool of worker threads that are created once and reused by all parallel
+// loops run on the pool. Workers are added on demand, up to the largest number
+// of threads requested by any loop, and are joined when the pool is destroyed.
+// Loops never run on more than |max_num_threads| threads, the calling thread
+// included, so the pool never holds more than |max_num_threads| - 1 workers.
+class ThreadPool {
+ public:
+  // Creates a pool limited to GetHardwareNumThreads() threads.
+  ThreadPool();
+  // Creates a pool limited to |max_num_threads| threads (at least one).
+  explicit ThreadPool(int max_num_threads);
+  ThreadPool(const ThreadPool &) = delete;
+  ThreadPool &operator=(const ThreadPool &) = delete;
+  ~ThreadPool();
+
+  // Calls |func(i)| for every i in [0, num_items). The work is distributed
+  // over up to |num_threads| threads, the calling thread included, but never
+  // over more threads than the pool is limited to. Items are handed out one at
+  // a time so the order in which they are processed is unspecified, but the
+  // function returns only after all of them have been processed. When
+  // |num_threads| is less than or equal to one, or threads are not supported,
+  // the items are processed serially in increasing order.
+  //
+  // |func| may itself run parallel loops on the same pool. The calling thread
+  // keeps processing the items of its own loop, so nested loops never wait for
+  // a free worker.
+  void ParallelFor(int num_threads, int num_items,
+                   const std::function<void(int)> &func);
+
+  // Returns the number of worker threads created so far.
+  int num_workers() const;
+
+ private:
+  struct Job;
+
+  void RunWorker();
+
+  mutable std::mutex mutex_;
+  std::condition_variable job_available_;
+  // Jobs that can still accept more workers.
+  std::deque<std::shared_ptr<Job>> jobs_;
+  std::vector<std::thread> workers_;
+  const int max_num_threads_;
+  bool stop_;
+};
+
+// Runs ParallelFor() on a thread pool shared by the whole process, see
+// ThreadPool::ParallelFor(). The shared pool is limited to the number of
+// hardware threads.
+void ParallelFor(int num_threads, int num_items,
+                 const std::function<void(int)> &func);
+
+}  // namespace draco
+
+#endif  // DRACO_CORE_THREAD_POOL_H_
@@ -0,0 +1,110 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/core/thread_pool.h"
+
+#include <atomic>
+#include <mutex>
+#include <set>
+#include <thread>
+#include <vector>
+
+#include "draco/core/draco_test_base.h"
+
+namespace {
+
+TEST(ThreadPoolTest, TestParallelForVisitsEveryItemOnce) {
+  for (int num_threads : {0, 1, 2, 8}) {
+    std::vector<std::atomic<int>> visits(1000);
+    for (auto &v : visits) {
+      v = 0;
+    }
+    draco::ParallelFor(num_threads, static_cast<int>(visits.size()),
+                       [&](int i) { ++visits[i]; });
+    for (const auto &v : visits) {
+      ASSERT_EQ(v, 1);
+    }
+  }
+}
+
+TEST(ThreadPoolTest, TestParallelForSerialOrder) {
+  // A single thread must process the items in increasing order.
+  std::vector<int> order;
+  draco::ParallelFor(1, 5, [&](int i) { order.push_back(i); });
+  ASSERT_EQ(order, std::vector<int>({0, 1, 2, 3, 4}));
+}
+
+TEST(ThreadPoolTest, TestParallelForNoItems) {
+  int calls = 0;
+  draco::ParallelFor(4, 0, [&](int) { ++calls; });
+  ASSERT_EQ(calls, 0);
+}
+
+TEST(ThreadPoolTest, TestWorkersAreReused) {
+  draco::ThreadPool pool(4);
+  std::mutex mutex;
+  std::set<std::thread::id> thread_ids;
+  for (int run = 0; run < 20; ++run) {
+    pool.ParallelFor(4, 100, [&](int) {
+      std::lock_guard<std::mutex> lock(mutex);
+      thread_ids.insert(std::this_thread::get_id());
+    });
+  }
+  // Three workers and the calling thread.
+  ASSERT_EQ(pool.num_workers(), 3);
+  ASSERT_LE(thread_ids.size(), 4);
+
+  // Smaller loops do not add workers.
+  pool.ParallelFor(2, 100, [](int) {});
+  ASSERT_EQ(pool.num_workers(), 3);
+}
+
+TEST(ThreadPoolTest, TestNestedParallelFor) {
+  draco::ThreadPool pool(4);
+  std::vector<std::atomic<int>> visits(64);
+  for (auto &v : visits) {
+    v = 0;
+  }
+  pool.ParallelFor(4, 8, [&](int i) {
+    pool.ParallelFor(4, 8, [&](int j) { ++visits[i * 8 + j]; });
+  });
+  for (const auto &v : visits) {
+    ASSERT_EQ(v, 1);
+  }
+}
+
+TEST(ThreadPoolTest, TestNumThreadsIsLimited) {
+  draco::ThreadPool pool(2);
+  std::vector<std::atomic<int>> visits(1000);
+  for (auto &v : visits) {
+    v = 0;
+  }
+  pool.ParallelFor(1000, 1000, [&](int i) { ++visits[i]; });
+  for (const auto &v : visits) {
+    ASSERT_EQ(v, 1);
+  }
+  // One worker and the calling thread.
+  ASSERT_EQ(pool.num_workers(), 1);
+
+  // The default pool is limited to the hardware threads.
+  draco::ThreadPool hardware_pool;
+  hardware_pool.ParallelFor(1000, 1000, [](int) {});
+  ASSERT_LE(hardware_pool.num_workers(), draco::GetHardwareNumThreads() - 1);
+}
+
+TEST(ThreadPoolTest, TestHardwareNumThreads) {
+  ASSERT_GE(draco::GetHardwareNumThreads(), 1);
+}
+
+}  // namespace
@@ -0,0 +1,115 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/chunked_file_reader.h"
+
+#include <cstring>
+#include <string>
+#include <utility>
+
+namespace draco {
+
+constexpr size_t ChunkedFileReader::kDefaultChunkSize;
+
+StatusOr<std::unique_ptr<ChunkedFileReader>> ChunkedFileReader::Open(
+    const std::string &file_name, size_t chunk_size) {
+  if (chunk_size == 0) {
+    return Status(Status::INVALID_PARAMETER, "Invalid chunk size.");
+  }
+  FILE *const file = fopen(file_name.c_str(), "rb");
+  if (file == nullptr) {
+    return Status(Status::IO_ERROR, "Unable to open input file.");
+  }
+  return std::unique_ptr<ChunkedFileReader>(
+      new ChunkedFileReader(file, chunk_size));
+}
+
+ChunkedFileReader::~ChunkedFileReader() { fclose(file_); }
+
+Status ChunkedFileReader::Rewind() {
+  if (fseek(file_, 0, SEEK_SET) != 0) {
+    return Status(Status::IO_ERROR, "Unable to rewind input file.");
+  }
+  end_of_file_ = false;
+  exposed_size_ = 0;
+  data_size_ = 0;
+  return OkStatus();
+}
+
+StatusOr<bool> ChunkedFileReader::Refill(DecoderBuffer *buffer,
+                                         bool whole_lines) {
+  // Find out how much of the exposed data was consumed by the parser.
+  size_t consumed_size = exposed_size_;
+  const char *const head = buffer->data_head();
+  if (buffer->remaining_size() > 0 && head >= data_.data() &&
+      head < data_.data() + exposed_size_) {
+    consumed_size = head - data_.data();
+  }
+  const size_t unconsumed_size = exposed_size_ - consumed_size;
+
+  // Move all bytes that were not consumed yet to the beginning of the chunk.
+  data_size_ -= consumed_size;
+  if (consumed_size > 0 && data_size_ > 0) {
+    memmove(data_.data(), data_.data() + consumed_size, data_size_);
+  }
+
+  exposed_size_ = data_size_;
+  while (true) {
+    const size_t search_begin = data_size_;
+    if (!end_of_file_) {
+      data_.resize(data_size_ + chunk_size_);
+      const size_t num_read = fread(data_.data() + data_size_, 1, chunk_size_,
+                                    file_);
+      if (num_read < chunk_size_) {
+        if (ferror(file_)) {
+          return Status(Status::IO_ERROR, "Unable to read input file.");
+        }
+        end_of_file_ = true;
+      }
+      data_size_ += num_read;
+    }
+    exposed_size_ = data_size_;
+    if (!whole_lines || end_of_file_) {
+      break;
+    }
+    // Expose the data up to the last line break of the newly read data. The
+    // data kept from the previous chunk may also contain line breaks when the
+    // caller did not consume all exposed lines, but those lines are exposed
+    // again together with the new data, so searching only the new data keeps
+    // the cost linear in the size of the file.
+    const char *const search_start = data_.data() + search_begin;
+    const char *line_end = nullptr;
+    for (const char *ptr = data_.data() + data_size_; ptr > search_start;) {
+      if (*--ptr == '\n') {
+        line_end = ptr;
+        break;
+      }
+    }
+    if (line_end != nullptr) {
+      exposed_size_ = line_end + 1 - data_.data();
+      break;
+    }
+    // No line break found, extend the chunk.
+  }
+
+  buffer->Init(data_.data(), exposed_size_);
+  // After the end of the file, data that the caller did not consume yet is
+  // still reported as long as the caller keeps consuming it. This lets parsers
+  // that stop at the end of the exposed lines finish the remaining data
+  // without looping forever on data they cannot parse.
+  return exposed_size_ > unconsumed_size ||
+         (exposed_size_ > 0 && consumed_size > 0);
+}
+
+}  // namespace draco
@@ -0,0 +1,95 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_IO_CHUNKED_FILE_READER_H_
+#define DRACO_IO_CHUNKED_FILE_READER_H_
+
+#include <cstddef>
+#include <cstdio>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "draco/core/decoder_buffer.h"
+#include "draco/core/status.h"
+#include "draco/core/status_or.h"
+
+namespace draco {
+
+// Reads a file sequentially in chunks of a fixed size so that parsers of large
+// text files (OBJ, PLY) can process their input with bounded memory instead of
+// loading the whole file first. Each chunk is exposed through a DecoderBuffer.
+//
+// Typical usage:
+//
+//   DecoderBuffer buffer;
+//   while (reader->Refill(&buffer, true).value()) {
+//     // Parse data from |buffer|. Unparsed bytes are kept for the next chunk.
+//   }
+class ChunkedFileReader {
+ public:
+  // Default size of the chunks in bytes.
+  static constexpr size_t kDefaultChunkSize = 1 << 22;
+
+  // Opens |file_name| for reading in chunks of |chunk_size| bytes.
+  static StatusOr<std::unique_ptr<ChunkedFileReader>> Open(
+      const std::string &file_name, size_t chunk_size = kDefaultChunkSize);
+
+  ChunkedFileReader(const ChunkedFileReader &) = delete;
+  ChunkedFileReader &operator=(const ChunkedFileReader &) = delete;
+
+  // Closes the file.
+  ~ChunkedFileReader();
+
+  // Restarts reading from the beginning of the file. Any data previously
+  // exposed through Refill() becomes invalid.
+  Status Rewind();
+
+  // Reads the next chunk of the file into |buffer|. Data of the previous chunk
+  // that was not yet consumed from |buffer| is kept at the beginning of the new
+  // chunk, everything before it is released. |buffer| must be either empty or
+  // initialized by the previous call of this method.
+  //
+  // When |whole_lines| is true, the exposed data ends after the last '\n'
+  // character of the chunk so that text parsers never see partial lines. The
+  // rest of the chunk is exposed on the next call. A chunk may grow beyond
+  // |chunk_size| when a single line does not fit into it.
+  //
+  // Returns true when new data was added to |buffer|, or when data remains in
+  // |buffer| after some of the previously exposed data was consumed. Returns
+  // false when the end of the file was reached and the caller either consumed
+  // all data or made no progress since the previous call.
+  StatusOr<bool> Refill(DecoderBuffer *buffer, bool whole_lines);
+
+  size_t chunk_size() const { return chunk_size_; }
+
+ private:
+  ChunkedFileReader(FILE *file, size_t chunk_size)
+      : file_(file), chunk_size_(chunk_size) {}
+
+  FILE *file_;
+  const size_t chunk_size_;
+  bool end_of_file_ = false;
+
+  // Storage of the current chunk. The first |exposed_size_| bytes are exposed
+  // to the parser, the remaining bytes up to |data_size_| were already read
+  // from the file but belong to the next chunk.
+  std::vector<char> data_;
+  size_t exposed_size_ = 0;
+  size_t data_size_ = 0;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_IO_CHUNKED_FILE_READER_H_
@@ -0,0 +1,93 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/chunked_file_reader.h"
+
+#include <string>
+
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/io/file_reader_test_common.h"
+#include "draco/io/file_utils.h"
+
+namespace draco {
+namespace {
+
+TEST(ChunkedFileReaderTest, FailOpen) {
+  EXPECT_FALSE(ChunkedFileReader::Open("").ok());
+  EXPECT_FALSE(ChunkedFileReader::Open("chunked reader fake file").ok());
+  EXPECT_FALSE(ChunkedFileReader::Open(GetTestFileFullPath("car.drc"), 0).ok());
+}
+
+TEST(ChunkedFileReaderTest, ReadBinaryChunks) {
+  DRACO_ASSIGN_OR_ASSERT(
+      std::unique_ptr<ChunkedFileReader> reader,
+      ChunkedFileReader::Open(GetTestFileFullPath("car.drc"), 1000));
+  std::vector<char> expected;
+  ASSERT_TRUE(ReadFileToBuffer(GetTestFileFullPath("car.drc"), &expected));
+
+  // Read the file twice to test rewinding.
+  for (int pass = 0; pass < 2; ++pass) {
+    DRACO_ASSERT_OK(reader->Rewind());
+    DecoderBuffer buffer;
+    std::vector<char> data;
+    while (true) {
+      DRACO_ASSIGN_OR_ASSERT(const bool has_data,
+                             reader->Refill(&buffer, false));
+      if (!has_data) {
+        break;
+      }
+      ASSERT_LE(buffer.remaining_size(), 1000);
+      // Consume all data of the chunk.
+      data.insert(data.end(), buffer.data_head(),
+                  buffer.data_head() + buffer.remaining_size());
+      buffer.Advance(buffer.remaining_size());
+    }
+    ASSERT_EQ(data.size(), kFileSizeCarDrc);
+    ASSERT_EQ(data, expected);
+  }
+}
+
+TEST(ChunkedFileReaderTest, ReadLines) {
+  const std::string file_name = GetTestFileFullPath("cube_att.obj");
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<ChunkedFileReader> reader,
+                         ChunkedFileReader::Open(file_name, 10));
+  std::string expected;
+  ASSERT_TRUE(ReadFileToString(file_name, &expected));
+
+  DecoderBuffer buffer;
+  std::string data;
+  while (true) {
+    DRACO_ASSIGN_OR_ASSERT(const bool has_data, reader->Refill(&buffer, true));
+    if (!has_data) {
+      break;
+    }
+    // Consume a single line. Each chunk must end with a whole line.
+    const char *const head = buffer.data_head();
+    const char *const line_end = static_cast<const char *>(
+        memchr(head, '\n', buffer.remaining_size()));
+    if (line_end == nullptr) {
+      // Only the last line of the file may miss the line break.
+      data.append(head, buffer.remaining_size());
+      buffer.Advance(buffer.remaining_size());
+      continue;
+    }
+    data.append(head, line_end + 1);
+    buffer.Advance(line_end + 1 - head);
+  }
+  ASSERT_EQ(data, expected);
+}
+
+}  // namespace
+}  // namespace draco
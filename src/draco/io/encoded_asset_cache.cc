@@ -0,0 +1,539 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/encoded_asset_cache.h"
+
+#include <algorithm>
+#include <cinttypes>
+#include <cstdio>
+#include <sstream>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "draco/compression/config/compression_shared.h"
+#include "draco/core/draco_version.h"
+#include "draco/core/macros.h"
+#include "draco/io/file_utils.h"
+#include "draco/io/file_writer_utils.h"
+#include "draco/metadata/metadata_encoder.h"
+
+namespace draco {
+
+namespace {
+
+constexpr char kIndexFileName[] = "draco_asset_cache_index";
+// Version 2 added the number of encoded points and faces to the records.
+// Indices of other versions are ignored.
+constexpr char kIndexHeader[] = "draco_asset_cache 2";
+constexpr char kEntryExtension[] = ".drc";
+
+// Size stored in the index records of removed entries.
+constexpr int64_t kRemovedEntrySize = -1;
+
+// Number of point to value index mappings hashed at once.
+constexpr int kIndexBatchSize = 1024;
+
+void HashString(const std::string &str, ContentHasher *hasher) {
+  hasher->UpdateValue(static_cast<uint64_t>(str.size()));
+  hasher->Update(str.data(), str.size());
+}
+
+// Returns true when |key| has the format produced by ComputeKey(). This also
+// makes sure that keys can be safely used as file names.
+bool IsValidKey(const std::string &key) {
+  if (key.size() != 32) {
+    return false;
+  }
+  for (const char c : key) {
+    if (!((c >= '0' && c <= '9') || (c >= 'a' && c <= 'f'))) {
+      return false;
+    }
+  }
+  return true;
+}
+
+}  // namespace
+
+EncodedAssetCache::EncodedAssetCache()
+    : max_size_bytes_(0),
+      size_bytes_(0),
+      access_counter_(0),
+      index_dirty_(false),
+      num_hits_(0),
+      num_misses_(0) {}
+
+EncodedAssetCache::~EncodedAssetCache() {
+  // Errors can't be reported from the destructor. The cache can still be
+  // used without the index, only the least recently used order is lost.
+  Flush();
+}
+
+Status EncodedAssetCache::Open(const std::string &cache_dir,
+                               int64_t max_size_bytes) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (cache_dir.empty()) {
+    return Status(Status::INVALID_PARAMETER, "Empty cache directory.");
+  }
+  if (max_size_bytes < 0) {
+    return Status(Status::INVALID_PARAMETER, "Invalid cache size.");
+  }
+  cache_dir_ = cache_dir;
+  max_size_bytes_ = max_size_bytes;
+  if (!CheckAndCreatePathForFile(GetIndexPath())) {
+    cache_dir_.clear();
+    return Status(Status::IO_ERROR,
+                  "Unable to create cache directory: " + cache_dir);
+  }
+  LoadIndex();
+  EvictEntries();
+  // Rewrite the index so that the records appended by Store() do not pile up
+  // across cache sessions.
+  return WriteIndex();
+}
+
+void EncodedAssetCache::HashLibraryVersion(ContentHasher *hasher) {
+  HashString(kDracoVersion, hasher);
+  hasher->UpdateValue(kDracoMeshBitstreamVersion);
+  hasher->UpdateValue(kDracoPointCloudBitstreamVersion);
+}
+
+void EncodedAssetCache::HashGeometry(const PointCloud &pc, const Mesh *mesh,
+                                     ContentHasher *hasher) {
+  hasher->UpdateValue(static_cast<uint8_t>(mesh != nullptr));
+  hasher->UpdateValue(static_cast<uint64_t>(pc.num_points()));
+  hasher->UpdateValue(static_cast<int32_t>(pc.num_attributes()));
+  for (int i = 0; i < pc.num_attributes(); ++i) {
+    const PointAttribute &att = *pc.attribute(i);
+    hasher->UpdateValue(static_cast<int32_t>(att.attribute_type()));
+    hasher->UpdateValue(static_cast<int32_t>(att.data_type()));
+    hasher->UpdateValue(static_cast<int32_t>(att.num_components()));
+    hasher->UpdateValue(static_cast<uint8_t>(att.normalized()));
+    hasher->UpdateValue(att.unique_id());
+    hasher->UpdateValue(static_cast<uint64_t>(att.size()));
+
+    // Hash the attribute values directly from the attribute buffer.
+    const int64_t value_size =
+        DataTypeLength(att.data_type()) * att.num_components();
+    if (att.size() == 0) {
+      // Nothing to hash.
+    } else if (att.byte_stride() == value_size) {
+      hasher->Update(att.GetAddress(AttributeValueIndex(0)),
+                     att.size() * value_size);
+    } else {
+      // Values are interleaved with other data. Hash them one by one.
+      for (AttributeValueIndex avi(0); avi < static_cast<uint32_t>(att.size());
+           ++avi) {
+        hasher->Update(att.GetAddress(avi), value_size);
+      }
+    }
+
+    // Hash the mapping between points and attribute values.
+    hasher->UpdateValue(static_cast<uint8_t>(att.is_mapping_identity()));
+    if (!att.is_mapping_identity()) {
+      uint32_t batch[kIndexBatchSize];
+      int batch_size = 0;
+      for (PointIndex pi(0); pi < pc.num_points(); ++pi) {
+        batch[batch_size++] = att.mapped_index(pi).value();
+        if (batch_size == kIndexBatchSize) {
+          hasher->Update(batch, sizeof(batch));
+          batch_size = 0;
+        }
+      }
+      hasher->Update(batch, batch_size * sizeof(batch[0]));
+    }
+
+    const AttributeTransformData *const transform_data =
+        att.GetAttributeTransformData();
+    if (transform_data == nullptr) {
+      hasher->UpdateValue(static_cast<int32_t>(ATTRIBUTE_INVALID_TRANSFORM));
+    } else {
+      hasher->UpdateValue(
+          static_cast<int32_t>(transform_data->transform_type()));
+      const DataBuffer *const buffer = transform_data->buffer();
+      hasher->UpdateValue(static_cast<uint64_t>(buffer->data_size()));
+      hasher->Update(buffer->data(), buffer->data_size());
+    }
+  }
+
+  // Hash the metadata in its encoded form.
+  EncoderBuffer metadata_buffer;
+  if (pc.GetMetadata() != nullptr) {
+    MetadataEncoder metadata_encoder;
+    metadata_encoder.EncodeGeometryMetadata(&metadata_buffer, pc.GetMetadata());
+  }
+  hasher->UpdateValue(static_cast<uint64_t>(metadata_buffer.size()));
+  hasher->Update(metadata_buffer.data(), metadata_buffer.size());
+
+#ifdef DRACO_TRANSCODER_SUPPORTED
+  // The encoder applies the compression options of the geometry for all
+  // settings that are not set in the encoder options.
+  hasher->UpdateValue(static_cast<uint8_t>(pc.IsCompressionEnabled()));
+  if (pc.IsCompressionEnabled()) {
+    const DracoCompressionOptions &options = pc.GetCompressionOptions();
+    hasher->UpdateValue(static_cast<int32_t>(options.compression_level));
+    const SpatialQuantizationOptions &position = options.quantization_position;
+    hasher->UpdateValue(
+        static_cast<uint8_t>(position.AreQuantizationBitsDefined()));
+    hasher->UpdateValue(static_cast<int32_t>(position.quantization_bits()));
+    hasher->UpdateValue(position.spacing());
+    hasher->UpdateValue(static_cast<int32_t>(options.quantization_bits_normal));
+    hasher->UpdateValue(
+        static_cast<int32_t>(options.quantization_bits_tex_coord));
+    hasher->UpdateValue(static_cast<int32_t>(options.quantization_bits_color));
+    hasher->UpdateValue(
+        static_cast<int32_t>(options.quantization_bits_generic));
+    hasher->UpdateValue(
+        static_cast<int32_t>(options.quantization_bits_tangent));
+    hasher->UpdateValue(static_cast<int32_t>(options.quantization_bits_weight));
+    hasher->UpdateValue(
+        static_cast<uint8_t>(options.find_non_degenerate_texture_quantization));
+  }
+#endif  // DRACO_TRANSCODER_SUPPORTED
+
+  if (mesh != nullptr) {
+    for (int i = 0; i < pc.num_attributes(); ++i) {
+      hasher->UpdateValue(
+          static_cast<int32_t>(mesh->GetAttributeElementType(i)));
+    }
+    hasher->UpdateValue(static_cast<uint64_t>(mesh->num_faces()));
+    if (mesh->num_faces() > 0) {
+      hasher->Update(&mesh->face(FaceIndex(0))[0],
+                     mesh->num_faces() * sizeof(Mesh::Face));
+    }
+  }
+}
+
+void EncodedAssetCache::HashOptions(const Options &options,
+                                    ContentHasher *hasher) {
+  const std::map<std::string, std::string> &all_options =
+      options.GetAllOptions();
+  hasher->UpdateValue(static_cast<uint64_t>(all_options.size()));
+  for (const auto &it : all_options) {
+    HashString(it.first, hasher);
+    HashString(it.second, hasher);
+  }
+}
+
+std::string EncodedAssetCache::DigestToString(
+    const ContentHasher::Digest &digest) {
+  char str[33];
+  snprintf(str, sizeof(str), "%016" PRIx64 "%016" PRIx64, digest[0], digest[1]);
+  return std::string(str);
+}
+
+bool EncodedAssetCache::Lookup(const std::string &key,
+                               EncoderBuffer *out_buffer,
+                               int64_t *out_num_encoded_points,
+                               int64_t *out_num_encoded_faces) {
+  std::string path;
+  Entry entry;
+  {
+    std::lock_guard<std::mutex> lock(mutex_);
+    const auto it = entries_.find(key);
+    if (it == entries_.end()) {
+      ++num_misses_;
+      return false;
+    }
+    it->second.last_access = ++access_counter_;
+    index_dirty_ = true;
+    entry = it->second;
+    path = GetEntryPath(key);
+  }
+
+  // Read the entry without holding the lock so that other threads can use
+  // the cache in the meantime. Store() replaces entry files atomically.
+  std::vector<char> data;
+  const bool read = ReadFileToBuffer(path, &data) &&
+                    static_cast<int64_t>(data.size()) == entry.size;
+  bool copied = false;
+  if (read) {
+    out_buffer->Clear();
+    copied = out_buffer->Encode(data.data(), data.size());
+  }
+
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (!read) {
+    // The entry was modified or removed outside of the cache. Keep it when it
+    // was replaced or used by another thread during the read.
+    const auto it = entries_.find(key);
+    if (it != entries_.end() && it->second.last_access == entry.last_access) {
+      RemoveEntry(it);
+    }
+  }
+  if (!copied) {
+    ++num_misses_;
+    return false;
+  }
+  *out_num_encoded_points = entry.num_encoded_points;
+  *out_num_encoded_faces = entry.num_encoded_faces;
+  ++num_hits_;
+  return true;
+}
+
+bool EncodedAssetCache::Lookup(const std::string &key,
+                               EncoderBuffer *out_buffer) {
+  int64_t num_encoded_points;
+  int64_t num_encoded_faces;
+  return Lookup(key, out_buffer, &num_encoded_points, &num_encoded_faces);
+}
+
+Status EncodedAssetCache::Store(const std::string &key,
+                                const EncoderBuffer &buffer,
+                                int64_t num_encoded_points,
+                                int64_t num_encoded_faces) {
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (cache_dir_.empty()) {
+    return Status(Status::DRACO_ERROR, "Cache is not open.");
+  }
+  if (!IsValidKey(key)) {
+    return Status(Status::INVALID_PARAMETER, "Invalid cache key.");
+  }
+  const int64_t size = static_cast<int64_t>(buffer.size());
+  if (size > max_size_bytes_) {
+    // The asset would evict everything else and still not fit.
+    return OkStatus();
+  }
+  auto it = entries_.find(key);
+  if (it != entries_.end()) {
+    RemoveEntry(it);
+  }
+
+  // Write the data to a temporary file first so that an interrupted write
+  // never leaves a truncated entry behind.
+  const std::string path = GetEntryPath(key);
+  const std::string temp_path = path + ".tmp";
+  if (!WriteBufferToFile(buffer.data(), buffer.size(), temp_path)) {
+    return Status(Status::IO_ERROR, "Failed to write cache entry.");
+  }
+  std::remove(path.c_str());
+  if (std::rename(temp_path.c_str(), path.c_str()) != 0) {
+    std::remove(temp_path.c_str());
+    return Status(Status::IO_ERROR, "Failed to write cache entry.");
+  }
+  entries_[key] = {size, ++access_counter_, num_encoded_points,
+                   num_encoded_faces};
+  size_bytes_ += size;
+  index_dirty_ = true;
+  AddIndexRecord(key, entries_[key]);
+  EvictEntries();
+  return AppendIndexRecords();
+}
+
+Status EncodedAssetCache::EncodeMeshToBuffer(const Mesh &mesh, Encoder *encoder,
+                                             EncoderBuffer *out_buffer) {
+  const std::string key = ComputeKey(mesh, encoder->options());
+  if (Lookup(key, out_buffer)) {
+    return OkStatus();
+  }
+  out_buffer->Clear();
+  DRACO_RETURN_IF_ERROR(encoder->EncodeMeshToBuffer(mesh, out_buffer));
+  StoreEncodedAsset(key, *out_buffer, encoder->num_encoded_points(),
+                    encoder->num_encoded_faces());
+  return OkStatus();
+}
+
+Status EncodedAssetCache::EncodePointCloudToBuffer(const PointCloud &pc,
+                                                   Encoder *encoder,
+                                                   EncoderBuffer *out_buffer) {
+  const std::string key = ComputeKey(pc, encoder->options());
+  if (Lookup(key, out_buffer)) {
+    return OkStatus();
+  }
+  out_buffer->Clear();
+  DRACO_RETURN_IF_ERROR(encoder->EncodePointCloudToBuffer(pc, out_buffer));
+  StoreEncodedAsset(key, *out_buffer, encoder->num_encoded_points(), 0);
+  return OkStatus();
+}
+
+void EncodedAssetCache::StoreEncodedAsset(const std::string &key,
+                                          const EncoderBuffer &buffer,
+                                          int64_t num_encoded_points,
+                                          int64_t num_encoded_faces) {
+  const Status status =
+      Store(key, buffer, num_encoded_points, num_encoded_faces);
+  if (!status.ok()) {
+    // The encoded asset is still valid, so only report the failure.
+    DRACO_LOGE("Failed to store the encoded asset in the cache: %s\n",
+               status.error_msg());
+  }
+}
+
+Status EncodedAssetCache::Clear() {
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (cache_dir_.empty()) {
+    return Status(Status::DRACO_ERROR, "Cache is not open.");
+  }
+  while (!entries_.empty()) {
+    RemoveEntry(entries_.begin());
+  }
+  return WriteIndex();
+}
+
+Status EncodedAssetCache::Flush() {
+  std::lock_guard<std::mutex> lock(mutex_);
+  if (cache_dir_.empty() || !index_dirty_) {
+    return OkStatus();
+  }
+  return WriteIndex();
+}
+
+int EncodedAssetCache::num_entries() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return static_cast<int>(entries_.size());
+}
+
+int64_t EncodedAssetCache::size_bytes() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return size_bytes_;
+}
+
+int64_t EncodedAssetCache::num_hits() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return num_hits_;
+}
+
+int64_t EncodedAssetCache::num_misses() const {
+  std::lock_guard<std::mutex> lock(mutex_);
+  return num_misses_;
+}
+
+std::string EncodedAssetCache::GetEntryPath(const std::string &key) const {
+  return cache_dir_ + "/" + key + kEntryExtension;
+}
+
+std::string EncodedAssetCache::GetIndexPath() const {
+  return cache_dir_ + "/" + kIndexFileName;
+}
+
+void EncodedAssetCache::LoadIndex() {
+  entries_.clear();
+  size_bytes_ = 0;
+  access_counter_ = 0;
+  index_dirty_ = false;
+  std::string contents;
+  if (!ReadFileToString(GetIndexPath(), &contents)) {
+    // New or unreadable cache. Entry files that are not in the index are
+    // ignored.
+    return;
+  }
+  std::istringstream stream(contents);
+  std::string line;
+  if (!std::getline(stream, line) || line != kIndexHeader) {
+    return;
+  }
+  // Later records of a key replace the earlier ones.
+  while (std::getline(stream, line)) {
+    std::istringstream line_stream(line);
+    std::string key;
+    Entry entry;
+    if (!(line_stream >> key >> entry.size >> entry.last_access >>
+          entry.num_encoded_points >> entry.num_encoded_faces) ||
+        !IsValidKey(key)) {
+      continue;
+    }
+    const auto it = entries_.find(key);
+    if (it != entries_.end()) {
+      size_bytes_ -= it->second.size;
+      entries_.erase(it);
+    }
+    if (entry.size < 0) {
+      continue;  // The entry was removed.
+    }
+    entries_[key] = entry;
+    size_bytes_ += entry.size;
+    access_counter_ = std::max(access_counter_, entry.last_access);
+  }
+}
+
+Status EncodedAssetCache::WriteIndex() {
+  std::ostringstream stream;
+  stream << kIndexHeader << "\n";
+  for (const auto &it : entries_) {
+    stream << it.first << " " << it.second.size << " " << it.second.last_access
+           << " " << it.second.num_encoded_points << " "
+           << it.second.num_encoded_faces << "\n";
+  }
+  const std::string contents = stream.str();
+  const std::string path = GetIndexPath();
+  const std::string temp_path = path + ".tmp";
+  if (!WriteBufferToFile(contents.data(), contents.size(), temp_path)) {
+    return Status(Status::IO_ERROR, "Failed to write cache index.");
+  }
+  std::remove(path.c_str());
+  if (std::rename(temp_path.c_str(), path.c_str()) != 0) {
+    return Status(Status::IO_ERROR, "Failed to write cache index.");
+  }
+  // The rewritten index already contains all pending records.
+  pending_index_records_.clear();
+  index_dirty_ = false;
+  return OkStatus();
+}
+
+void EncodedAssetCache::AddIndexRecord(const std::string &key,
+                                       const Entry &entry) {
+  pending_index_records_ += key + " " + std::to_string(entry.size) + " " +
+                            std::to_string(entry.last_access) + " " +
+                            std::to_string(entry.num_encoded_points) + " " +
+                            std::to_string(entry.num_encoded_faces) + "\n";
+}
+
+Status EncodedAssetCache::AppendIndexRecords() {
+  if (pending_index_records_.empty()) {
+    return OkStatus();
+  }
+  FILE *const file = fopen(GetIndexPath().c_str(), "ab");
+  if (file == nullptr) {
+    return Status(Status::IO_ERROR, "Failed to write cache index.");
+  }
+  const size_t num_written = fwrite(pending_index_records_.data(), 1,
+                                    pending_index_records_.size(), file);
+  const bool closed = fclose(file) == 0;
+  if (num_written != pending_index_records_.size() || !closed) {
+    // The index may end with a partial record now. It is ignored when the
+    // index is loaded and the index is rewritten by Flush().
+    return Status(Status::IO_ERROR, "Failed to write cache index.");
+  }
+  pending_index_records_.clear();
+  return OkStatus();
+}
+
+void EncodedAssetCache::RemoveEntry(std::map<std::string, Entry>::iterator it) {
+  std::remove(GetEntryPath(it->first).c_str());
+  size_bytes_ -= it->second.size;
+  AddIndexRecord(it->first, {kRemovedEntrySize, 0, 0, 0});
+  entries_.erase(it);
+  index_dirty_ = true;
+}
+
+void EncodedAssetCache::EvictEntries() {
+  if (size_bytes_ <= max_size_bytes_) {
+    return;
+  }
+  // Sort the entries from the least recently used one.
+  std::vector<std::pair<uint64_t, std::string>> lru_entries;
+  lru_entries.reserve(entries_.size());
+  for (const auto &it : entries_) {
+    lru_entries.push_back(std::make_pair(it.second.last_access, it.first));
+  }
+  std::sort(lru_entries.begin(), lru_entries.end());
+  for (const auto &lru_entry : lru_entries) {
+    if (size_bytes_ <= max_size_bytes_) {
+      break;
+    }
+    RemoveEntry(entries_.find(lru_entry.second));
+  }
+}
+
+}  // namespace draco
@@ -0,0 +1,196 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_IO_ENCODED_ASSET_CACHE_H_
+#define DRACO_IO_ENCODED_ASSET_CACHE_H_
+
+#include <cstdint>
+#include <map>
+#include <mutex>
+#include <string>
+
+#include "draco/compression/config/encoder_options.h"
+#include "draco/compression/encode.h"
+#include "draco/core/encoder_buffer.h"
+#include "draco/core/hash_utils.h"
+#include "draco/core/status.h"
+#include "draco/mesh/mesh.h"
+#include "draco/point_cloud/point_cloud.h"
+
+namespace draco {
+
+// Persistent on-disk cache of encoded Draco assets. Entries are identified by
+// a key computed from the content of the input geometry, the encoder options
+// and the Draco version, so an unchanged input encoded with unchanged options
+// can be served from the cache instead of being encoded again. The total size
+// of the cached assets is bounded and the least recently used entries are
+// evicted when the bound is exceeded.
+//
+// Each entry is stored in a separate file in the cache directory. The state
+// of the cache, including the number of encoded points and faces of each
+// entry, is kept in an index file. Store() only appends the records of
+// the stored and evicted entries to the index, and the whole index is
+// rewritten by Open(), Flush() and when the cache is destroyed. The cache can
+// be shared by multiple threads, but a cache directory should be used by only
+// one process at a time.
+// Entries that are missing on disk or that have an unexpected size are treated
+// as cache misses.
+//
+// Example:
+//
+//   EncodedAssetCache cache;
+//   DRACO_RETURN_IF_ERROR(cache.Open("/tmp/draco_cache", 1 << 30));
+//   Encoder encoder;
+//   ...
+//   EncoderBuffer buffer;
+//   DRACO_RETURN_IF_ERROR(cache.EncodeMeshToBuffer(mesh, &encoder, &buffer));
+//
+class EncodedAssetCache {
+ public:
+  EncodedAssetCache();
+  ~EncodedAssetCache();
+
+  // Opens the cache stored in |cache_dir| and limits the total size of the
+  // cached assets to |max_size_bytes|. The directory is created when it does
+  // not exist.
+  Status Open(const std::string &cache_dir, int64_t max_size_bytes);
+
+  // Returns the cache key of |mesh| encoded with |options|. The key is a
+  // string of 32 hexadecimal digits.
+  template <typename AttributeKeyT>
+  static std::string ComputeKey(
+      const Mesh &mesh, const EncoderOptionsBase<AttributeKeyT> &options) {
+    return ComputeKeyInternal(mesh, &mesh, options);
+  }
+
+  // Returns the cache key of |pc| encoded as a point cloud with |options|.
+  template <typename AttributeKeyT>
+  static std::string ComputeKey(
+      const PointCloud &pc, const EncoderOptionsBase<AttributeKeyT> &options) {
+    return ComputeKeyInternal(pc, nullptr, options);
+  }
+
+  // Copies the cached asset stored under |key| into |out_buffer| and sets
+  // |out_num_encoded_points| and |out_num_encoded_faces| to the values given
+  // to Store(). Returns false when the cache does not contain the asset. The
+  // entry file is read without holding the lock of the cache.
+  bool Lookup(const std::string &key, EncoderBuffer *out_buffer,
+              int64_t *out_num_encoded_points, int64_t *out_num_encoded_faces);
+
+  // Same as above without returning the number of encoded points and faces.
+  bool Lookup(const std::string &key, EncoderBuffer *out_buffer);
+
+  // Stores |buffer| with |num_encoded_points| and |num_encoded_faces| under
+  // |key| and evicts least recently used entries when the cache grows over
+  // its size limit.
+  Status Store(const std::string &key, const EncoderBuffer &buffer,
+               int64_t num_encoded_points, int64_t num_encoded_faces);
+
+  // Encodes |mesh| with |encoder| into |out_buffer| unless the result is
+  // already cached. Failures to store the result in the cache are logged but
+  // not returned because the encoded data is still valid. Note that the
+  // encoder does not track encoded properties such as the number of encoded
+  // faces when the result comes from the cache. The cache stores the numbers
+  // tracked by |encoder|, see SetTrackEncodedProperties(), and Lookup()
+  // returns them.
+  Status EncodeMeshToBuffer(const Mesh &mesh, Encoder *encoder,
+                            EncoderBuffer *out_buffer);
+
+  // Same as above for point clouds.
+  Status EncodePointCloudToBuffer(const PointCloud &pc, Encoder *encoder,
+                                  EncoderBuffer *out_buffer);
+
+  // Removes all entries from the cache.
+  Status Clear();
+
+  // Rewrites the index file of the cache. This stores the access order of the
+  // entries read by Lookup() and compacts the records appended by Store().
+  Status Flush();
+
+  int num_entries() const;
+  int64_t size_bytes() const;
+  int64_t num_hits() const;
+  int64_t num_misses() const;
+
+ private:
+  struct Entry {
+    int64_t size;
+    // Value of |access_counter_| at the last access of the entry.
+    uint64_t last_access;
+    int64_t num_encoded_points;
+    int64_t num_encoded_faces;
+  };
+
+  // |mesh| is either the same object as |pc| or nullptr for point clouds.
+  template <typename AttributeKeyT>
+  static std::string ComputeKeyInternal(
+      const PointCloud &pc, const Mesh *mesh,
+      const EncoderOptionsBase<AttributeKeyT> &options);
+  static void HashLibraryVersion(ContentHasher *hasher);
+  static void HashGeometry(const PointCloud &pc, const Mesh *mesh,
+                           ContentHasher *hasher);
+  static void HashOptions(const Options &options, ContentHasher *hasher);
+  static std::string DigestToString(const ContentHasher::Digest &digest);
+
+  // Stores an encoded asset and logs failures.
+  void StoreEncodedAsset(const std::string &key, const EncoderBuffer &buffer,
+                         int64_t num_encoded_points, int64_t num_encoded_faces);
+
+  std::string GetEntryPath(const std::string &key) const;
+  std::string GetIndexPath() const;
+  void LoadIndex();
+  Status WriteIndex();
+  // Adds an index record of |entry| to |pending_index_records_|.
+  void AddIndexRecord(const std::string &key, const Entry &entry);
+  // Appends |pending_index_records_| to the index file.
+  Status AppendIndexRecords();
+  void RemoveEntry(std::map<std::string, Entry>::iterator it);
+  void EvictEntries();
+
+  std::string cache_dir_;
+  int64_t max_size_bytes_;
+  int64_t size_bytes_;
+  uint64_t access_counter_;
+  std::map<std::string, Entry> entries_;
+  bool index_dirty_;
+  // Index records of stored and removed entries that are not yet written to
+  // the index file.
+  std::string pending_index_records_;
+  int64_t num_hits_;
+  int64_t num_misses_;
+  mutable std::mutex mutex_;
+};
+
+template <typename AttributeKeyT>
+std::string EncodedAssetCache::ComputeKeyInternal(
+    const PointCloud &pc, const Mesh *mesh,
+    const EncoderOptionsBase<AttributeKeyT> &options) {
+  ContentHasher hasher;
+  HashLibraryVersion(&hasher);
+  HashGeometry(pc, mesh, &hasher);
+  HashOptions(options.GetGlobalOptions(), &hasher);
+  hasher.UpdateValue(
+      static_cast<uint64_t>(options.GetAllAttributeOptions().size()));
+  for (const auto &it : options.GetAllAttributeOptions()) {
+    // Attribute keys are attribute types or attribute ids.
+    hasher.UpdateValue(static_cast<int64_t>(it.first));
+    HashOptions(it.second, &hasher);
+  }
+  HashOptions(options.GetFeaturelOptions(), &hasher);
+  return DigestToString(hasher.GetDigest());
+}
+
+}  // namespace draco
+
+#endif  // DRACO_IO_ENCODED_ASSET_CACHE_H_
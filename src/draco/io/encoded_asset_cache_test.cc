@@ -0,0 +1,271 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/encoded_asset_cache.h"
+
+#include <memory>
+#include <string>
+#include <utility>
+
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/io/file_utils.h"
+
+namespace draco {
+
+namespace {
+
+class EncodedAssetCacheTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    DRACO_ASSERT_OK(cache_.Open(GetCacheDir(), 1 << 20));
+    DRACO_ASSERT_OK(cache_.Clear());
+  }
+
+  // Returns the test temp directory.
+  static std::string GetCacheDir() {
+    std::string dir;
+    std::string file_name;
+    SplitPath(GetTestTempFileFullPath("cache"), &dir, &file_name);
+    return dir;
+  }
+
+  EncoderBuffer CreateBuffer(int size, char value) const {
+    EncoderBuffer buffer;
+    const std::string data(size, value);
+    buffer.Encode(data.data(), data.size());
+    return buffer;
+  }
+
+  EncodedAssetCache cache_;
+};
+
+TEST_F(EncodedAssetCacheTest, TestComputeKey) {
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh, nullptr);
+  Encoder encoder;
+  encoder.SetAttributeQuantization(GeometryAttribute::POSITION, 11);
+  const std::string key =
+      EncodedAssetCache::ComputeKey(*mesh, encoder.options());
+  ASSERT_EQ(key.size(), 32);
+
+  // Separately loaded copies of the mesh have the same key.
+  std::unique_ptr<Mesh> mesh_copy = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh_copy, nullptr);
+  ASSERT_EQ(EncodedAssetCache::ComputeKey(*mesh_copy, encoder.options()), key);
+
+  // The key depends on whether the geometry is encoded as a mesh.
+  ASSERT_NE(EncodedAssetCache::ComputeKey(
+                static_cast<const PointCloud &>(*mesh), encoder.options()),
+            key);
+
+  // The key depends on the encoder options.
+  Encoder encoder2;
+  encoder2.SetAttributeQuantization(GeometryAttribute::POSITION, 12);
+  ASSERT_NE(EncodedAssetCache::ComputeKey(*mesh, encoder2.options()), key);
+  encoder2.SetAttributeQuantization(GeometryAttribute::POSITION, 11);
+  ASSERT_EQ(EncodedAssetCache::ComputeKey(*mesh, encoder2.options()), key);
+  encoder2.SetSpeedOptions(3, 3);
+  ASSERT_NE(EncodedAssetCache::ComputeKey(*mesh, encoder2.options()), key);
+
+  // The key depends on the attribute values.
+  PointAttribute *const pos_att = mesh_copy->attribute(
+      mesh_copy->GetNamedAttributeId(GeometryAttribute::POSITION));
+  float value[3];
+  pos_att->GetValue(AttributeValueIndex(0), value);
+  value[0] += 1e-3f;
+  pos_att->SetAttributeValue(AttributeValueIndex(0), value);
+  ASSERT_NE(EncodedAssetCache::ComputeKey(*mesh_copy, encoder.options()), key);
+
+  // The key depends on the faces.
+  mesh_copy = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh_copy, nullptr);
+  Mesh::Face face = mesh_copy->face(FaceIndex(0));
+  std::swap(face[0], face[1]);
+  mesh_copy->SetFace(FaceIndex(0), face);
+  ASSERT_NE(EncodedAssetCache::ComputeKey(*mesh_copy, encoder.options()), key);
+
+  // The key depends on the element types of the mesh attributes.
+  mesh_copy = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh_copy, nullptr);
+  mesh_copy->SetAttributeElementType(
+      mesh_copy->GetNamedAttributeId(GeometryAttribute::POSITION),
+      MESH_VERTEX_ATTRIBUTE);
+  ASSERT_NE(EncodedAssetCache::ComputeKey(*mesh_copy, encoder.options()), key);
+}
+
+TEST_F(EncodedAssetCacheTest, TestEncodeMeshToBuffer) {
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("test_nm.obj");
+  ASSERT_NE(mesh, nullptr);
+  Encoder encoder;
+  encoder.SetAttributeQuantization(GeometryAttribute::POSITION, 14);
+  encoder.SetTrackEncodedProperties(true);
+
+  EncoderBuffer expected_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeMeshToBuffer(*mesh, &expected_buffer));
+  const int64_t expected_num_points = encoder.num_encoded_points();
+  const int64_t expected_num_faces = encoder.num_encoded_faces();
+  ASSERT_GT(expected_num_faces, 0);
+
+  EncoderBuffer buffer;
+  DRACO_ASSERT_OK(cache_.EncodeMeshToBuffer(*mesh, &encoder, &buffer));
+  ASSERT_EQ(cache_.num_hits(), 0);
+  ASSERT_EQ(cache_.num_misses(), 1);
+  ASSERT_EQ(cache_.num_entries(), 1);
+
+  EncoderBuffer cached_buffer;
+  DRACO_ASSERT_OK(cache_.EncodeMeshToBuffer(*mesh, &encoder, &cached_buffer));
+  ASSERT_EQ(cache_.num_hits(), 1);
+  ASSERT_EQ(cached_buffer.size(), expected_buffer.size());
+  ASSERT_EQ(std::string(cached_buffer.data(), cached_buffer.size()),
+            std::string(expected_buffer.data(), expected_buffer.size()));
+
+  // A point cloud encoding of the same geometry is not a cache hit.
+  EncoderBuffer pc_buffer;
+  DRACO_ASSERT_OK(cache_.EncodePointCloudToBuffer(*mesh, &encoder, &pc_buffer));
+  ASSERT_EQ(cache_.num_hits(), 1);
+  ASSERT_EQ(cache_.num_entries(), 2);
+
+  // The cached assets persist across cache instances.
+  DRACO_ASSERT_OK(cache_.Flush());
+  EncodedAssetCache cache2;
+  DRACO_ASSERT_OK(cache2.Open(GetCacheDir(), 1 << 20));
+  ASSERT_EQ(cache2.num_entries(), 2);
+  ASSERT_EQ(cache2.size_bytes(), cache_.size_bytes());
+  cached_buffer.Clear();
+  DRACO_ASSERT_OK(cache2.EncodeMeshToBuffer(*mesh, &encoder, &cached_buffer));
+  ASSERT_EQ(cache2.num_hits(), 1);
+  ASSERT_EQ(std::string(cached_buffer.data(), cached_buffer.size()),
+            std::string(expected_buffer.data(), expected_buffer.size()));
+
+  // The number of encoded points and faces is cached with the asset.
+  int64_t num_encoded_points = 0;
+  int64_t num_encoded_faces = 0;
+  ASSERT_TRUE(
+      cache2.Lookup(EncodedAssetCache::ComputeKey(*mesh, encoder.options()),
+                    &cached_buffer, &num_encoded_points, &num_encoded_faces));
+  ASSERT_EQ(num_encoded_points, expected_num_points);
+  ASSERT_EQ(num_encoded_faces, expected_num_faces);
+}
+
+TEST_F(EncodedAssetCacheTest, TestStoreFailure) {
+  // Encoding succeeds even when the result can't be stored in the cache.
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("test_nm.obj");
+  ASSERT_NE(mesh, nullptr);
+  Encoder encoder;
+  EncoderBuffer expected_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeMeshToBuffer(*mesh, &expected_buffer));
+
+  EncodedAssetCache closed_cache;
+  EncoderBuffer buffer;
+  DRACO_ASSERT_OK(closed_cache.EncodeMeshToBuffer(*mesh, &encoder, &buffer));
+  ASSERT_EQ(closed_cache.num_entries(), 0);
+  ASSERT_EQ(std::string(buffer.data(), buffer.size()),
+            std::string(expected_buffer.data(), expected_buffer.size()));
+}
+
+TEST_F(EncodedAssetCacheTest, TestLeastRecentlyUsedEviction) {
+  DRACO_ASSERT_OK(cache_.Open(GetCacheDir(), 250));
+  const std::string key0(32, '0');
+  const std::string key1(32, '1');
+  const std::string key2(32, '2');
+  DRACO_ASSERT_OK(cache_.Store(key0, CreateBuffer(100, 'a'), 0, 0));
+  DRACO_ASSERT_OK(cache_.Store(key1, CreateBuffer(100, 'b'), 0, 0));
+  ASSERT_EQ(cache_.size_bytes(), 200);
+
+  // Accessing |key0| makes |key1| the least recently used entry.
+  EncoderBuffer buffer;
+  ASSERT_TRUE(cache_.Lookup(key0, &buffer));
+  ASSERT_EQ(buffer.size(), 100);
+  ASSERT_EQ(buffer.data()[0], 'a');
+
+  DRACO_ASSERT_OK(cache_.Store(key2, CreateBuffer(100, 'c'), 0, 0));
+  ASSERT_EQ(cache_.num_entries(), 2);
+  ASSERT_EQ(cache_.size_bytes(), 200);
+  ASSERT_TRUE(cache_.Lookup(key0, &buffer));
+  ASSERT_FALSE(cache_.Lookup(key1, &buffer));
+  ASSERT_TRUE(cache_.Lookup(key2, &buffer));
+  ASSERT_EQ(buffer.data()[0], 'c');
+
+  // Reopening the cache with a smaller limit evicts the least recently used
+  // entries.
+  DRACO_ASSERT_OK(cache_.Flush());
+  EncodedAssetCache cache2;
+  DRACO_ASSERT_OK(cache2.Open(GetCacheDir(), 150));
+  ASSERT_EQ(cache2.num_entries(), 1);
+  ASSERT_TRUE(cache2.Lookup(key2, &buffer));
+
+  // Invalid keys are rejected.
+  ASSERT_FALSE(cache2.Store("../file", CreateBuffer(10, 'd'), 0, 0).ok());
+}
+
+TEST_F(EncodedAssetCacheTest, TestOpenCreatesDirectory) {
+  const std::string cache_dir =
+      GetTestTempFileFullPath("created_cache/nested_dir");
+  EncodedAssetCache cache;
+  DRACO_ASSERT_OK(cache.Open(cache_dir, 1 << 20));
+  const std::string key(32, '0');
+  DRACO_ASSERT_OK(cache.Store(key, CreateBuffer(10, 'a'), 0, 0));
+  EncoderBuffer buffer;
+  ASSERT_TRUE(cache.Lookup(key, &buffer));
+
+  // The entry is stored on disk.
+  EncodedAssetCache cache2;
+  DRACO_ASSERT_OK(cache2.Open(cache_dir, 1 << 20));
+  ASSERT_TRUE(cache2.Lookup(key, &buffer));
+  ASSERT_EQ(buffer.size(), 10);
+}
+
+TEST_F(EncodedAssetCacheTest, TestStoreAppendsIndexRecords) {
+  const std::string key0(32, '0');
+  const std::string key1(32, '1');
+  DRACO_ASSERT_OK(cache_.Store(key0, CreateBuffer(10, 'a'), 3, 1));
+  DRACO_ASSERT_OK(cache_.Store(key1, CreateBuffer(20, 'b'), 0, 0));
+
+  // The entries are recorded in the index without an explicit Flush().
+  std::string index;
+  ASSERT_TRUE(
+      ReadFileToString(GetCacheDir() + "/draco_asset_cache_index", &index));
+  ASSERT_NE(index.find(key0), std::string::npos);
+  ASSERT_NE(index.find(key1), std::string::npos);
+
+  EncodedAssetCache cache2;
+  DRACO_ASSERT_OK(cache2.Open(GetCacheDir(), 1 << 20));
+  ASSERT_EQ(cache2.num_entries(), 2);
+  ASSERT_EQ(cache2.size_bytes(), 30);
+  EncoderBuffer buffer;
+  int64_t num_encoded_points = 0;
+  int64_t num_encoded_faces = 0;
+  ASSERT_TRUE(
+      cache2.Lookup(key0, &buffer, &num_encoded_points, &num_encoded_faces));
+  ASSERT_EQ(num_encoded_points, 3);
+  ASSERT_EQ(num_encoded_faces, 1);
+
+  // Records of evicted entries are appended to the index as well.
+  const std::string key2(32, '2');
+  DRACO_ASSERT_OK(cache2.Open(GetCacheDir(), 25));
+  ASSERT_EQ(cache2.num_entries(), 1);
+  DRACO_ASSERT_OK(cache2.Store(key2, CreateBuffer(10, 'c'), 0, 0));
+  ASSERT_EQ(cache2.num_entries(), 1);
+  EncodedAssetCache cache3;
+  DRACO_ASSERT_OK(cache3.Open(GetCacheDir(), 1 << 20));
+  ASSERT_EQ(cache3.num_entries(), 1);
+  ASSERT_FALSE(cache3.Lookup(key1, &buffer));
+  ASSERT_TRUE(cache3.Lookup(key2, &buffer));
+  ASSERT_EQ(buffer.size(), 10);
+}
+
+}  // namespace
+
+}  // namespace draco
@@ -0,0 +1,57 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/file_decoder_buffer.h"
+
+#include <string>
+#include <utility>
+
+#include "draco/io/file_reader_factory.h"
+#include "draco/io/mmap_file_reader.h"
+
+namespace draco {
+
+Status FileDecoderBuffer::Open(const std::string &file_name) {
+  file_reader_.reset();
+  data_.clear();
+  size_ = 0;
+  buffer_ = DecoderBuffer();
+
+  // Prefer the memory mapped reader regardless of the order in which the
+  // readers were registered in FileReaderFactory.
+  std::unique_ptr<FileReaderInterface> reader = MmapFileReader::Open(file_name);
+  if (reader == nullptr) {
+    reader = FileReaderFactory::OpenReader(file_name);
+  }
+  if (reader == nullptr) {
+    return Status(Status::IO_ERROR, "Unable to open input file.");
+  }
+
+  const char *const file_data = reader->GetFileData();
+  if (file_data != nullptr) {
+    size_ = reader->GetFileSize();
+    buffer_.Init(file_data, size_);
+    file_reader_ = std::move(reader);
+    return OkStatus();
+  }
+
+  if (!reader->ReadFileToBuffer(&data_)) {
+    return Status(Status::IO_ERROR, "Unable to read input file.");
+  }
+  size_ = data_.size();
+  buffer_.Init(data_.data(), size_);
+  return OkStatus();
+}
+
+}  // namespace draco
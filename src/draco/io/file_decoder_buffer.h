@@ -0,0 +1,65 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_IO_FILE_DECODER_BUFFER_H_
+#define DRACO_IO_FILE_DECODER_BUFFER_H_
+
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "draco/core/decoder_buffer.h"
+#include "draco/core/status.h"
+#include "draco/io/file_reader_interface.h"
+
+namespace draco {
+
+// Provides a DecoderBuffer over the contents of a file. Whenever possible the
+// file is memory mapped and the DecoderBuffer points directly into the mapping,
+// so the file is never copied to the heap and the decoder only touches the
+// pages it actually reads. When the file cannot be mapped, its contents are
+// read into memory through FileReaderFactory.
+//
+// The data referenced by buffer() is owned by this class and it must outlive
+// any decoder that uses the buffer.
+class FileDecoderBuffer {
+ public:
+  FileDecoderBuffer() = default;
+  FileDecoderBuffer(const FileDecoderBuffer &) = delete;
+  FileDecoderBuffer &operator=(const FileDecoderBuffer &) = delete;
+
+  // Opens |file_name| and initializes buffer() with the file contents. Any
+  // previously opened file is released.
+  Status Open(const std::string &file_name);
+
+  DecoderBuffer *buffer() { return &buffer_; }
+
+  // Returns the size of the opened file in bytes.
+  size_t size() const { return size_; }
+
+  // Returns true when buffer() decodes directly from a memory mapped file.
+  bool is_memory_mapped() const { return file_reader_ != nullptr; }
+
+ private:
+  // Reader that owns the memory mapped file contents, if any.
+  std::unique_ptr<FileReaderInterface> file_reader_;
+  // File contents when the file could not be mapped.
+  std::vector<char> data_;
+  size_t size_ = 0;
+  DecoderBuffer buffer_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_IO_FILE_DECODER_BUFFER_H_
@@ -0,0 +1,58 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/file_decoder_buffer.h"
+
+#include "draco/compression/decode.h"
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/io/file_reader_test_common.h"
+
+namespace draco {
+namespace {
+
+TEST(FileDecoderBufferTest, FailOpen) {
+  FileDecoderBuffer file_buffer;
+  EXPECT_FALSE(file_buffer.Open("").ok());
+  EXPECT_FALSE(file_buffer.Open("file decoder buffer fake file").ok());
+}
+
+TEST(FileDecoderBufferTest, DecodeMesh) {
+  FileDecoderBuffer file_buffer;
+  DRACO_ASSERT_OK(file_buffer.Open(GetTestFileFullPath("car.drc")));
+  ASSERT_EQ(file_buffer.size(), kFileSizeCarDrc);
+
+  Decoder decoder;
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<Mesh> mesh,
+                         decoder.DecodeMeshFromBuffer(file_buffer.buffer()));
+  ASSERT_NE(mesh, nullptr);
+  ASSERT_GT(mesh->num_faces(), 0);
+}
+
+TEST(FileDecoderBufferTest, ReopenPointCloud) {
+  FileDecoderBuffer file_buffer;
+  DRACO_ASSERT_OK(file_buffer.Open(GetTestFileFullPath("car.drc")));
+  DRACO_ASSERT_OK(file_buffer.Open(GetTestFileFullPath("cube_pc.drc")));
+  ASSERT_EQ(file_buffer.size(), kFileSizeCubePcDrc);
+
+  Decoder decoder;
+  DRACO_ASSIGN_OR_ASSERT(
+      std::unique_ptr<PointCloud> pc,
+      decoder.DecodePointCloudFromBuffer(file_buffer.buffer()));
+  ASSERT_NE(pc, nullptr);
+  ASSERT_GT(pc->num_points(), 0);
+}
+
+}  // namespace
+}  // namespace draco
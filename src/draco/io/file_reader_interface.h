@@ -25,6 +25,11 @@ class FileReaderInterface {
 
   // Returns the size of the file.
   virtual size_t GetFileSize() = 0;
+
+  // Returns a pointer to the contents of the file when the reader keeps the
+  // entire file addressable in memory (e.g. memory mapped), or nullptr
+  // otherwise. The data stays valid for the lifetime of the reader.
+  virtual const char *GetFileData() { return nullptr; }
 };
 
 }  // namespace draco
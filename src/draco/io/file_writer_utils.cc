@@ -9,10 +9,35 @@
 
 #ifdef DRACO_TRANSCODER_SUPPORTED
 #include "ghc/filesystem.hpp"
+#elif defined(_WIN32)
+#include <direct.h>
 #endif  // DRACO_TRANSCODER_SUPPORTED
 
 namespace draco {
 
+namespace {
+
+#ifndef DRACO_TRANSCODER_SUPPORTED
+// Creates directory |path| including all its missing parent directories.
+void CreateDirectories(const std::string &path) {
+  if (path.empty() || DirectoryExists(path)) {
+    return;
+  }
+  std::string parent_path;
+  SplitPathPrivate(path, &parent_path, nullptr);
+  if (parent_path != "." && parent_path != path) {
+    CreateDirectories(parent_path);
+  }
+#if defined(_WIN32)
+  _mkdir(path.c_str());
+#else
+  mkdir(path.c_str(), S_IRWXU | S_IRWXG | S_IRWXO);
+#endif
+}
+#endif  // DRACO_TRANSCODER_SUPPORTED
+
+}  // namespace
+
 void SplitPathPrivate(const std::string &full_path,
                       std::string *out_folder_path,
                       std::string *out_file_name) {
@@ -66,6 +91,8 @@ bool CheckAndCreatePathForFile(const std::string &filename) {
 #ifdef DRACO_TRANSCODER_SUPPORTED
   const ghc::filesystem::path ghc_path(path);
   ghc::filesystem::create_directories(ghc_path);
+#else
+  CreateDirectories(path);
 #endif  // DRACO_TRANSCODER_SUPPORTED
   return DirectoryExists(path);
 }
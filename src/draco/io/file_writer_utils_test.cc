@@ -31,7 +31,6 @@ TEST(FileWriterUtilsTest, DirectoryExistsTest) {
   ASSERT_FALSE(DirectoryExists("fake/test/subdir"));
 }
 
-#ifdef DRACO_TRANSCODER_SUPPORTED
 TEST(FileWriterUtilsTest, CheckAndCreatePathForFileTest) {
   const std::string fake_file = "fake.file";
   const std::string fake_file_subdir = "a/few/dirs/down";
@@ -43,7 +42,6 @@ TEST(FileWriterUtilsTest, CheckAndCreatePathForFileTest) {
   ASSERT_TRUE(CheckAndCreatePathForFile(fake_full_path));
   ASSERT_TRUE(DirectoryExists(fake_file_directory));
 }
-#endif  // DRACO_TRANSCODER_SUPPORTED
 
 }  // namespace
 }  // namespace draco
@@ -37,6 +37,7 @@
 #include "draco/compression/draco_compression_options.h"
 #include "draco/compression/expert_encode.h"
 #include "draco/core/draco_types.h"
+#include "draco/core/thread_pool.h"
 #include "draco/core/vector_d.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/file_writer_utils.h"
@@ -309,6 +310,12 @@ class GltfAsset {
   void set_output_type(GltfEncoder::OutputType type) { output_type_ = type; }
   GltfEncoder::OutputType output_type() const { return output_type_; }
   void set_json_output_mode(JsonWriter::Mode mode) { gltf_json_.SetMode(mode); }
+  void set_num_encoding_threads(int num_threads) {
+    num_encoding_threads_ = num_threads;
+  }
+  void set_encoded_asset_cache(EncodedAssetCache *cache) {
+    encoded_asset_cache_ = cache;
+  }
 
  private:
   // Pad |buffer_| to 4 byte boundary.
@@ -330,6 +337,24 @@ class GltfAsset {
                                int64_t *num_encoded_points,
                                int64_t *num_encoded_faces);
 
+  // Encodes |mesh| using Draco into |buffer| and returns the number of encoded
+  // points and faces. The asset is not modified, so multiple meshes can be
+  // encoded concurrently. When |cache| is not null, the compressed mesh is
+  // looked up in the cache first and stored in it after the compression.
+  static Status EncodeMeshWithDraco(const Mesh &mesh,
+                                    const Eigen::Matrix4d &transform,
+                                    EncodedAssetCache *cache,
+                                    EncoderBuffer *buffer,
+                                    int64_t *num_encoded_points,
+                                    int64_t *num_encoded_faces);
+
+  // Encodes all Draco compressed base meshes of |scene| on
+  // |num_encoding_threads_| threads and stores the results in
+  // |encoded_meshes_|. The encoded data is later added to |buffer_| in the
+  // regular scene traversal order, so the output does not depend on the
+  // number of threads.
+  void EncodeSceneMeshesInParallel(const Scene &scene);
+
   // Adds a Draco mesh associated with a material id and material variants.
   bool AddDracoMesh(const Mesh &mesh, int material_id,
                     const std::vector<MeshGroup::MaterialsVariantsMapping>
@@ -689,6 +714,25 @@ class GltfAsset {
   // We need to store them here to ensure their content doesn't get deleted
   // before it is used by the encoder.
   std::vector<std::unique_ptr<Mesh>> local_meshes_;
+
+  // Number of threads used to compress the meshes of a scene.
+  int num_encoding_threads_;
+
+  // Optional cache of compressed meshes. Not owned.
+  EncodedAssetCache *encoded_asset_cache_;
+
+  // Result of the Draco compression of a single base mesh.
+  struct EncodedMesh {
+    Status status;
+    EncoderBuffer buffer;
+    int64_t num_encoded_points = 0;
+    int64_t num_encoded_faces = 0;
+  };
+
+  // Meshes compressed ahead of the scene traversal by
+  // EncodeSceneMeshesInParallel().
+  std::unordered_map<const Mesh *, std::unique_ptr<EncodedMesh>>
+      encoded_meshes_;
 };
 
 int GltfAsset::UnsignedIntComponentSize(unsigned int max_value) {
@@ -725,7 +769,9 @@ GltfAsset::GltfAsset()
       structural_metadata_used_(false),
       mesh_features_texture_index_(0),
       add_images_to_buffer_(false),
-      output_type_(GltfEncoder::COMPACT) {}
+      output_type_(GltfEncoder::COMPACT),
+      num_encoding_threads_(1),
+      encoded_asset_cache_(nullptr) {}
 
 bool GltfAsset::AddDracoMesh(const Mesh &mesh) {
   const int scene_index = AddScene();
@@ -882,6 +928,44 @@ Status GltfAsset::CompressMeshWithDraco(const Mesh &mesh,
                                         GltfPrimitive *primitive,
                                         int64_t *num_encoded_points,
                                         int64_t *num_encoded_faces) {
+  EncoderBuffer local_buffer;
+  const EncoderBuffer *buffer = &local_buffer;
+  const auto encoded_it = encoded_meshes_.find(&mesh);
+  if (encoded_it != encoded_meshes_.end()) {
+    // The mesh was already encoded by EncodeSceneMeshesInParallel().
+    const EncodedMesh &encoded_mesh = *encoded_it->second;
+    DRACO_RETURN_IF_ERROR(encoded_mesh.status);
+    buffer = &encoded_mesh.buffer;
+    *num_encoded_points = encoded_mesh.num_encoded_points;
+    *num_encoded_faces = encoded_mesh.num_encoded_faces;
+  } else {
+    DRACO_RETURN_IF_ERROR(EncodeMeshWithDraco(
+        mesh, transform, encoded_asset_cache_, &local_buffer,
+        num_encoded_points, num_encoded_faces));
+  }
+  const size_t buffer_start_offset = buffer_.size();
+  if (!buffer_.Encode(buffer->data(), buffer->size())) {
+    return Status(Status::DRACO_ERROR, "Could not copy Draco compressed data.");
+  }
+  if (!PadBuffer()) {
+    return Status(Status::DRACO_ERROR, "Could not pad glTF buffer.");
+  }
+
+  GltfBufferView buffer_view;
+  buffer_view.buffer_byte_offset = buffer_start_offset;
+  buffer_view.byte_length = buffer_.size() - buffer_start_offset;
+  buffer_views_.push_back(buffer_view);
+  primitive->compressed_mesh_info.buffer_view_index =
+      static_cast<int>(buffer_views_.size() - 1);
+  return OkStatus();
+}
+
+Status GltfAsset::EncodeMeshWithDraco(const Mesh &mesh,
+                                      const Eigen::Matrix4d &transform,
+                                      EncodedAssetCache *cache,
+                                      EncoderBuffer *buffer,
+                                      int64_t *num_encoded_points,
+                                      int64_t *num_encoded_faces) {
   // Check that geometry comression options are valid.
   DracoCompressionOptions compression_options = mesh.GetCompressionOptions();
   DRACO_RETURN_IF_ERROR(compression_options.Check());
@@ -905,7 +989,6 @@ Status GltfAsset::CompressMeshWithDraco(const Mesh &mesh,
   }
 
   // Create Draco encoder.
-  EncoderBuffer buffer;
   std::unique_ptr<ExpertEncoder> encoder;
   if (mesh_copy->num_faces() > 0) {
     // Encode mesh.
@@ -1013,28 +1096,71 @@ Status GltfAsset::CompressMeshWithDraco(const Mesh &mesh,
   // |compression_options| may have been modified and we need to update them
   // before we start the encoding.
   mesh_copy->SetCompressionOptions(compression_options);
-  DRACO_RETURN_IF_ERROR(encoder->EncodeToBuffer(&buffer));
+  std::string cache_key;
+  if (cache != nullptr) {
+    cache_key = EncodedAssetCache::ComputeKey(*mesh_copy, encoder->options());
+    if (cache->Lookup(cache_key, buffer, num_encoded_points,
+                      num_encoded_faces)) {
+      return OkStatus();
+    }
+  }
+  DRACO_RETURN_IF_ERROR(encoder->EncodeToBuffer(buffer));
   *num_encoded_points = encoder->num_encoded_points();
   if (mesh_copy->num_faces() > 0) {
     *num_encoded_faces = encoder->num_encoded_faces();
   } else {
     *num_encoded_faces = 0;
   }
-  const size_t buffer_start_offset = buffer_.size();
-  if (!buffer_.Encode(buffer.data(), buffer.size())) {
-    return Status(Status::DRACO_ERROR, "Could not copy Draco compressed data.");
+  if (cache != nullptr) {
+    const Status status = cache->Store(cache_key, *buffer, *num_encoded_points,
+                                       *num_encoded_faces);
+    if (!status.ok()) {
+      // The compressed mesh is still valid, so only report the failure.
+      DRACO_LOGE("Failed to store the compressed mesh in the cache: %s\n",
+                 status.error_msg());
+    }
   }
-  if (!PadBuffer()) {
-    return Status(Status::DRACO_ERROR, "Could not pad glTF buffer.");
+  return OkStatus();
+}
+
+void GltfAsset::EncodeSceneMeshesInParallel(const Scene &scene) {
+  // Collect the base meshes that AddDracoMesh() is going to compress.
+  std::vector<MeshIndex> mesh_indices;
+  std::unordered_set<int> visited_meshes;
+  for (SceneNodeIndex i(0); i < scene.NumNodes(); ++i) {
+    const MeshGroupIndex mesh_group_index =
+        scene.GetNode(i)->GetMeshGroupIndex();
+    if (mesh_group_index == kInvalidMeshGroupIndex) {
+      continue;
+    }
+    const MeshGroup *const mesh_group = scene.GetMeshGroup(mesh_group_index);
+    for (int j = 0; j < mesh_group->NumMeshInstances(); ++j) {
+      const MeshIndex mesh_index = mesh_group->GetMeshInstance(j).mesh_index;
+      const Mesh &mesh = scene.GetMesh(mesh_index);
+      if (mesh.num_faces() == 0 || !mesh.IsCompressionEnabled() ||
+          !visited_meshes.insert(mesh_index.value()).second) {
+        continue;
+      }
+      mesh_indices.push_back(mesh_index);
+    }
   }
 
-  GltfBufferView buffer_view;
-  buffer_view.buffer_byte_offset = buffer_start_offset;
-  buffer_view.byte_length = buffer_.size() - buffer_start_offset;
-  buffer_views_.push_back(buffer_view);
-  primitive->compressed_mesh_info.buffer_view_index =
-      static_cast<int>(buffer_views_.size() - 1);
-  return OkStatus();
+  std::vector<std::unique_ptr<EncodedMesh>> encoded_meshes(mesh_indices.size());
+  ParallelFor(num_encoding_threads_, static_cast<int>(mesh_indices.size()),
+              [&](int i) {
+                const MeshIndex mesh_index = mesh_indices[i];
+                std::unique_ptr<EncodedMesh> encoded_mesh(new EncodedMesh());
+                encoded_mesh->status = EncodeMeshWithDraco(
+                    scene.GetMesh(mesh_index),
+                    base_mesh_transforms_[mesh_index], encoded_asset_cache_,
+                    &encoded_mesh->buffer, &encoded_mesh->num_encoded_points,
+                    &encoded_mesh->num_encoded_faces);
+                encoded_meshes[i] = std::move(encoded_mesh);
+              });
+  for (size_t i = 0; i < mesh_indices.size(); ++i) {
+    encoded_meshes_[&scene.GetMesh(mesh_indices[i])] =
+        std::move(encoded_meshes[i]);
+  }
 }
 
 bool CheckAndGetTexCoordAttributeOrder(const Mesh &mesh,
@@ -1590,9 +1716,13 @@ Status GltfAsset::AddScene(const Scene &scene) {
   // Initialize base mesh transforms that may be needed when the base meshes are
   // compressed with Draco.
   base_mesh_transforms_ = SceneUtils::FindLargestBaseMeshTransforms(scene);
+  if (num_encoding_threads_ > 1) {
+    EncodeSceneMeshesInParallel(scene);
+  }
   for (SceneNodeIndex i(0); i < scene.NumNodes(); ++i) {
     DRACO_RETURN_IF_ERROR(AddSceneNode(scene, i));
   }
+  encoded_meshes_.clear();
   // There is 1:1 mapping between draco::Scene node indices and |nodes_|.
   for (int i = 0; i < scene.NumRootNodes(); ++i) {
     nodes_[scene.GetRootNodeIndex(i).value()].root_node = true;
@@ -3522,7 +3652,11 @@ void GltfAsset::SetCopyrightFromMesh(const Mesh &mesh) {
 const char GltfEncoder::kDracoMetadataGltfAttributeName[] =
     "//GLTF/ApplicationSpecificAttributeName";
 
-GltfEncoder::GltfEncoder() : out_buffer_(nullptr), output_type_(COMPACT) {}
+GltfEncoder::GltfEncoder()
+    : out_buffer_(nullptr),
+      output_type_(COMPACT),
+      num_encoding_threads_(1),
+      encoded_asset_cache_(nullptr) {}
 
 template <typename T>
 bool GltfEncoder::EncodeToFile(const T &geometry, const std::string &file_name,
@@ -3574,6 +3708,8 @@ Status GltfEncoder::EncodeFile(const T &geometry, const std::string &filename,
   GltfAsset gltf_asset;
   gltf_asset.set_copyright(copyright_);
   gltf_asset.set_output_type(output_type_);
+  gltf_asset.set_num_encoding_threads(num_encoding_threads_);
+  gltf_asset.set_encoded_asset_cache(encoded_asset_cache_);
 
   if (extension == "gltf") {
     std::string bin_path;
@@ -3603,6 +3739,8 @@ Status GltfEncoder::EncodeToBuffer(const T &geometry,
   gltf_asset.buffer_name("");
   gltf_asset.set_add_images_to_buffer(true);
   gltf_asset.set_copyright(copyright_);
+  gltf_asset.set_num_encoding_threads(num_encoding_threads_);
+  gltf_asset.set_encoded_asset_cache(encoded_asset_cache_);
 
   // Encode the geometry into a buffer.
   EncoderBuffer buffer;
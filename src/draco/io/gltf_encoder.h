@@ -26,6 +26,7 @@
 #include <vector>
 
 #include "draco/core/encoder_buffer.h"
+#include "draco/io/encoded_asset_cache.h"
 #include "draco/io/file_writer_factory.h"
 #include "draco/io/file_writer_interface.h"
 #include "draco/io/texture_io.h"
@@ -87,6 +88,21 @@ class GltfEncoder {
   void set_copyright(const std::string &copyright) { copyright_ = copyright; }
   std::string copyright() const { return copyright_; }
 
+  // Sets the number of threads used to compress the meshes of a scene with
+  // Draco. The encoded output is identical for any number of threads.
+  void set_num_encoding_threads(int num_threads) {
+    num_encoding_threads_ = num_threads;
+  }
+  int num_encoding_threads() const { return num_encoding_threads_; }
+
+  // Sets a cache of Draco compressed meshes. Meshes that are found in the
+  // cache are not compressed again and newly compressed meshes are stored in
+  // the cache. The cache is not owned by the encoder and must outlive it.
+  // Passing nullptr disables the cache.
+  void set_encoded_asset_cache(EncodedAssetCache *cache) {
+    encoded_asset_cache_ = cache;
+  }
+
   // The name of the attribute metadata that contains the glTF attribute
   // name. For application-specific generic attributes, if the metadata for
   // an attribute contains this key, then the value will be used as the
@@ -130,6 +146,8 @@ class GltfEncoder {
   EncoderBuffer *out_buffer_;
   OutputType output_type_;
   std::string copyright_;
+  int num_encoding_threads_;
+  EncodedAssetCache *encoded_asset_cache_;
 };
 
 }  // namespace draco
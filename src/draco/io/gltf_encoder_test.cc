@@ -652,6 +652,29 @@ TEST_F(GltfEncoderTest, EncodeTangentsWithDracoCompression) {
   EncodeSceneToGltfAndCompare(scene.get());
 }
 
+// Tests that compressing the scene meshes on multiple threads produces the
+// same output as the serial encoding.
+TEST_F(GltfEncoderTest, EncodeWithDracoCompressionMultithreaded) {
+  const std::string file_name = "CesiumMilkTruck/glTF/CesiumMilkTruck.gltf";
+  const std::unique_ptr<Scene> scene(DecodeTestGltfFileToScene(file_name));
+  ASSERT_NE(scene, nullptr);
+  const DracoCompressionOptions options;
+  SceneUtils::SetDracoCompressionOptions(&options, scene.get());
+
+  GltfEncoder encoder;
+  EncoderBuffer serial_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeToBuffer(*scene, &serial_buffer));
+
+  encoder.set_num_encoding_threads(4);
+  EncoderBuffer threaded_buffer;
+  DRACO_ASSERT_OK(encoder.EncodeToBuffer(*scene, &threaded_buffer));
+
+  ASSERT_EQ(serial_buffer.size(), threaded_buffer.size());
+  ASSERT_EQ(memcmp(serial_buffer.data(), threaded_buffer.data(),
+                   serial_buffer.size()),
+            0);
+}
+
 TEST_F(GltfEncoderTest, TestDracoCompressionWithGeneratedPoints) {
   const std::string basename = "test_nm.obj";
   std::unique_ptr<draco::Mesh> mesh = draco::ReadMeshFromTestFile(basename);
@@ -17,6 +17,7 @@
 #include <fstream>
 #include <string>
 
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/file_writer_interface.h"
 #include "draco/io/obj_decoder.h"
@@ -66,6 +67,10 @@ StatusOr<std::unique_ptr<Mesh>> ReadMeshFromFile(
     ObjDecoder obj_decoder;
     obj_decoder.set_use_metadata(options.GetBool("use_metadata", false));
     obj_decoder.set_preserve_polygons(options.GetBool("preserve_polygons"));
+    obj_decoder.set_streaming_chunk_size(
+        options.GetInt("streaming_chunk_size", 0));
+    obj_decoder.set_num_deduplication_threads(
+        options.GetInt("dedup_threads", 1));
     const Status obj_status =
         obj_decoder.DecodeFromFile(file_name, mesh.get(), mesh_files);
     if (!obj_status.ok()) {
@@ -76,12 +81,18 @@ StatusOr<std::unique_ptr<Mesh>> ReadMeshFromFile(
   if (extension == "ply") {
     // Stanford PLY file format.
     PlyDecoder ply_decoder;
+    ply_decoder.set_streaming_chunk_size(
+        options.GetInt("streaming_chunk_size", 0));
+    ply_decoder.set_num_deduplication_threads(
+        options.GetInt("dedup_threads", 1));
     DRACO_RETURN_IF_ERROR(ply_decoder.DecodeFromFile(file_name, mesh.get()));
     return std::move(mesh);
   }
   if (extension == "stl") {
     // STL file format.
     StlDecoder stl_decoder;
+    stl_decoder.set_num_deduplication_threads(
+        options.GetInt("dedup_threads", 1));
     return stl_decoder.DecodeFromFile(file_name);
   }
 #ifdef DRACO_TRANSCODER_SUPPORTED
@@ -93,14 +104,12 @@ StatusOr<std::unique_ptr<Mesh>> ReadMeshFromFile(
 
   // Otherwise not an obj file. Assume the file was encoded with one of the
   // draco encoding methods.
-  std::vector<char> file_data;
-  if (!ReadFileToBuffer(file_name, &file_data)) {
+  FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(file_name).ok()) {
     return Status(Status::DRACO_ERROR, "Unable to read input file.");
   }
-  DecoderBuffer buffer;
-  buffer.Init(file_data.data(), file_data.size());
   Decoder decoder;
-  auto statusor = decoder.DecodeMeshFromBuffer(&buffer);
+  auto statusor = decoder.DecodeMeshFromBuffer(file_buffer.buffer());
   if (!statusor.ok() || statusor.value() == nullptr) {
     return Status(Status::DRACO_ERROR, "Error decoding input.");
   }
@@ -93,6 +93,10 @@ StatusOr<std::unique_ptr<Mesh>> ReadMeshFromFile(const std::string &file_name,
 // Reads a mesh from a file. Reading is configured with |options|:
 // use_metadata  : Read obj file info like material names and object names into
 // metadata. Default is false.
+// streaming_chunk_size : When non-zero, obj and ply files are parsed in chunks
+// of this many bytes instead of being loaded whole into memory. Default is 0.
+// dedup_threads : Number of threads used to deduplicate the values and points
+// of obj, ply and stl files. Default is 1.
 // The second form returns the files associated with the mesh via the
 // |mesh_files| argument.
 // Returns nullptr with an error status if the decoding failed.
@@ -0,0 +1,113 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/mmap_file_reader.h"
+
+#include <cstdint>
+#include <cstdio>
+#include <string>
+#include <vector>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#define DRACO_MMAP_SUPPORTED 1
+#endif
+
+#include "draco/io/file_reader_factory.h"
+
+namespace draco {
+
+#define FILEREADER_LOG_ERROR(error_string)                             \
+  do {                                                                 \
+    fprintf(stderr, "%s:%d (%s): %s.\n", __FILE__, __LINE__, __func__, \
+            error_string);                                             \
+  } while (false)
+
+bool MmapFileReader::registered_in_factory_ =
+    FileReaderFactory::RegisterReader(MmapFileReader::Open);
+
+MmapFileReader::~MmapFileReader() {
+#ifdef DRACO_MMAP_SUPPORTED
+  munmap(const_cast<char *>(data_), file_size_);
+#endif
+}
+
+std::unique_ptr<FileReaderInterface> MmapFileReader::Open(
+    const std::string &file_name) {
+#ifdef DRACO_MMAP_SUPPORTED
+  if (file_name.empty()) {
+    return nullptr;
+  }
+
+  const int fd = open(file_name.c_str(), O_RDONLY);
+  if (fd < 0) {
+    return nullptr;
+  }
+
+  // Only regular, non-empty files can be mapped. Everything else is left to
+  // the other registered readers.
+  struct stat file_stat;
+  if (fstat(fd, &file_stat) != 0 || !S_ISREG(file_stat.st_mode) ||
+      file_stat.st_size <= 0) {
+    close(fd);
+    return nullptr;
+  }
+  const size_t file_size = static_cast<size_t>(file_stat.st_size);
+
+  void *const data = mmap(nullptr, file_size, PROT_READ, MAP_PRIVATE, fd, 0);
+  // The mapping stays valid after the descriptor is closed.
+  close(fd);
+  if (data == MAP_FAILED) {
+    return nullptr;
+  }
+#ifdef MADV_SEQUENTIAL
+  // Decoders consume the data front to back, let the kernel read ahead.
+  madvise(data, file_size, MADV_SEQUENTIAL);
+#endif
+
+  std::unique_ptr<FileReaderInterface> file(new (std::nothrow) MmapFileReader(
+      static_cast<const char *>(data), file_size));
+  if (file == nullptr) {
+    FILEREADER_LOG_ERROR("Out of memory");
+    munmap(data, file_size);
+    return nullptr;
+  }
+
+  return file;
+#else
+  return nullptr;
+#endif
+}
+
+bool MmapFileReader::ReadFileToBuffer(std::vector<char> *buffer) {
+  if (buffer == nullptr) {
+    return false;
+  }
+  buffer->assign(data_, data_ + file_size_);
+  return true;
+}
+
+bool MmapFileReader::ReadFileToBuffer(std::vector<uint8_t> *buffer) {
+  if (buffer == nullptr) {
+    return false;
+  }
+  const uint8_t *const data = reinterpret_cast<const uint8_t *>(data_);
+  buffer->assign(data, data + file_size_);
+  return true;
+}
+
+}  // namespace draco
@@ -0,0 +1,73 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_IO_MMAP_FILE_READER_H_
+#define DRACO_IO_MMAP_FILE_READER_H_
+
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include "draco/io/file_reader_interface.h"
+
+namespace draco {
+
+// File reader that maps the whole input file into memory instead of reading it
+// into a heap allocated buffer. The mapped contents are exposed through
+// GetFileData() so that decoders can work directly on the mapping. Memory
+// mapping is currently supported on POSIX platforms only, elsewhere Open()
+// always fails and FileReaderFactory falls back to the other readers.
+class MmapFileReader : public FileReaderInterface {
+ public:
+  // Creates and returns a MmapFileReader that maps |file_name|. Returns nullptr
+  // when the file does not exist, is empty or cannot be mapped.
+  static std::unique_ptr<FileReaderInterface> Open(
+      const std::string &file_name);
+
+  MmapFileReader() = delete;
+  MmapFileReader(const MmapFileReader &) = delete;
+  MmapFileReader &operator=(const MmapFileReader &) = delete;
+
+  // The reader owns the mapping, so it can't be moved either.
+  MmapFileReader(MmapFileReader &&) = delete;
+  MmapFileReader &operator=(MmapFileReader &&) = delete;
+
+  // Unmaps the file.
+  ~MmapFileReader() override;
+
+  // Copies the entire contents of the mapped file into |buffer| and returns
+  // true.
+  bool ReadFileToBuffer(std::vector<char> *buffer) override;
+  bool ReadFileToBuffer(std::vector<uint8_t> *buffer) override;
+
+  // Returns the size of the file.
+  size_t GetFileSize() override { return file_size_; }
+
+  // Returns the mapped contents of the file.
+  const char *GetFileData() override { return data_; }
+
+ private:
+  MmapFileReader(const char *data, size_t file_size)
+      : data_(data), file_size_(file_size) {}
+
+  const char *data_ = nullptr;
+  size_t file_size_ = 0;
+  static bool registered_in_factory_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_IO_MMAP_FILE_READER_H_
@@ -0,0 +1,67 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/mmap_file_reader.h"
+
+#include <cstring>
+
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/io/file_reader_test_common.h"
+#include "draco/io/file_utils.h"
+
+namespace draco {
+namespace {
+
+TEST(MmapFileReaderTest, FailOpen) {
+  EXPECT_EQ(MmapFileReader::Open(""), nullptr);
+  EXPECT_EQ(MmapFileReader::Open("mmap reader fake file"), nullptr);
+}
+
+TEST(MmapFileReaderTest, ReadFile) {
+  std::vector<char> buffer;
+
+  auto reader = MmapFileReader::Open(GetTestFileFullPath("car.drc"));
+  if (reader == nullptr) {
+    // Memory mapping is not supported on this platform.
+    return;
+  }
+  EXPECT_TRUE(reader->ReadFileToBuffer(&buffer));
+  EXPECT_EQ(buffer.size(), kFileSizeCarDrc);
+
+  reader = MmapFileReader::Open(GetTestFileFullPath("cube_pc.drc"));
+  ASSERT_NE(reader, nullptr);
+  EXPECT_TRUE(reader->ReadFileToBuffer(&buffer));
+  EXPECT_EQ(buffer.size(), kFileSizeCubePcDrc);
+}
+
+TEST(MmapFileReaderTest, GetFileData) {
+  const std::string file_name = GetTestFileFullPath("car.drc");
+  auto reader = MmapFileReader::Open(file_name);
+  if (reader == nullptr) {
+    return;
+  }
+  ASSERT_EQ(reader->GetFileSize(), kFileSizeCarDrc);
+  ASSERT_NE(reader->GetFileData(), nullptr);
+
+  // The mapped data must match the contents read through the regular path.
+  std::vector<char> expected;
+  ASSERT_TRUE(ReadFileToBuffer(file_name, &expected));
+  ASSERT_EQ(expected.size(), kFileSizeCarDrc);
+  EXPECT_EQ(memcmp(reader->GetFileData(), expected.data(), expected.size()),
+            0);
+}
+
+}  // namespace
+}  // namespace draco
@@ -19,6 +19,7 @@
 #include <cmath>
 #include <utility>
 
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/parser_utils.h"
 #include "draco/metadata/geometry_metadata.h"
@@ -40,11 +41,13 @@ ObjDecoder::ObjDecoder()
       sub_obj_att_id_(-1),
       added_edge_att_id_(-1),
       deduplicate_input_values_(true),
+      num_deduplication_threads_(1),
       last_material_id_(0),
       use_metadata_(false),
       preserve_polygons_(false),
       has_polygons_(false),
       mesh_files_(nullptr),
+      streaming_chunk_size_(0),
       out_mesh_(nullptr),
       out_point_cloud_(nullptr) {}
 
@@ -62,14 +65,23 @@ Status ObjDecoder::DecodeFromFile(const std::string &file_name, Mesh *out_mesh,
 
 Status ObjDecoder::DecodeFromFile(const std::string &file_name,
                                   PointCloud *out_point_cloud) {
-  std::vector<char> buffer;
-  if (!ReadFileToBuffer(file_name, &buffer)) {
-    return Status(Status::DRACO_ERROR, "Unable to read input file.");
-  }
-  buffer_.Init(buffer.data(), buffer.size());
-
   out_point_cloud_ = out_point_cloud;
   input_file_name_ = file_name;
+  if (streaming_chunk_size_ > 0) {
+    DRACO_ASSIGN_OR_RETURN(
+        chunked_reader_,
+        ChunkedFileReader::Open(file_name, streaming_chunk_size_));
+    const Status status = DecodeInternal();
+    chunked_reader_ = nullptr;
+    buffer_ = DecoderBuffer();
+    return status;
+  }
+
+  FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(file_name).ok()) {
+    return Status(Status::DRACO_ERROR, "Unable to read input file.");
+  }
+  buffer_ = *file_buffer.buffer();
   return DecodeInternal();
 }
 
@@ -95,12 +107,7 @@ Status ObjDecoder::DecodeInternal() {
   material_name_to_id_.clear();
   last_sub_obj_id_ = 0;
   // Parse all lines.
-  Status status(Status::OK);
-  while (ParseDefinition(&status) && status.ok()) {
-  }
-  if (!status.ok()) {
-    return status;
-  }
+  DRACO_RETURN_IF_ERROR(ParseAllDefinitions());
 
   if (mesh_files_ && !input_file_name_.empty()) {
     mesh_files_->push_back(input_file_name_);
@@ -250,13 +257,7 @@ Status ObjDecoder::DecodeInternal() {
   // Perform a second iteration of parsing and fill all the data.
   counting_mode_ = false;
   ResetCounters();
-  // Start parsing from the beginning of the buffer again.
-  buffer()->StartDecodingFrom(0);
-  while (ParseDefinition(&status) && status.ok()) {
-  }
-  if (!status.ok()) {
-    return status;
-  }
+  DRACO_RETURN_IF_ERROR(ParseAllDefinitions());
   if (out_mesh_) {
     // Add faces with identity mapping between vertex and corner indices.
     // Duplicate vertices will get removed later.
@@ -271,12 +272,39 @@ Status ObjDecoder::DecodeInternal() {
 
 #ifdef DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED
   if (deduplicate_input_values_) {
-    out_point_cloud_->DeduplicateAttributeValues();
+    out_point_cloud_->DeduplicateAttributeValues(num_deduplication_threads_);
   }
 #endif
 #ifdef DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED
-  out_point_cloud_->DeduplicatePointIds();
+  out_point_cloud_->DeduplicatePointIds(num_deduplication_threads_);
 #endif
+  return OkStatus();
+}
+
+Status ObjDecoder::ParseAllDefinitions() {
+  Status status(Status::OK);
+  if (chunked_reader_ == nullptr) {
+    // Start parsing from the beginning of the buffer.
+    buffer()->StartDecodingFrom(0);
+    while (ParseDefinition(&status) && status.ok()) {
+    }
+    return status;
+  }
+
+  // Parse the input file chunk by chunk. Each chunk contains only whole lines
+  // so no definition is ever split between two chunks.
+  DRACO_RETURN_IF_ERROR(chunked_reader_->Rewind());
+  buffer_ = DecoderBuffer();
+  while (true) {
+    DRACO_ASSIGN_OR_RETURN(const bool has_data,
+                           chunked_reader_->Refill(buffer(), true));
+    if (!has_data) {
+      break;
+    }
+    while (ParseDefinition(&status) && status.ok()) {
+    }
+    DRACO_RETURN_IF_ERROR(status);
+  }
   return status;
 }
 
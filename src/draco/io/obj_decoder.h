@@ -15,12 +15,14 @@
 #ifndef DRACO_IO_OBJ_DECODER_H_
 #define DRACO_IO_OBJ_DECODER_H_
 
+#include <memory>
 #include <string>
 #include <unordered_map>
 
 #include "draco/core/decoder_buffer.h"
 #include "draco/core/status.h"
 #include "draco/draco_features.h"
+#include "draco/io/chunked_file_reader.h"
 #include "draco/mesh/mesh.h"
 
 namespace draco {
@@ -51,11 +53,25 @@ class ObjDecoder {
   // contain any duplicate entries.
   // Default: true
   void set_deduplicate_input_values(bool v) { deduplicate_input_values_ = v; }
+  // Number of threads used to deduplicate the decoded values and points. The
+  // result is the same for any number of threads.
+  // Default: 1
+  void set_num_deduplication_threads(int num_threads) {
+    num_deduplication_threads_ = num_threads;
+  }
   // Flag for whether using metadata to record other information in the obj
   // file, e.g. material names, object names.
   void set_use_metadata(bool flag) { use_metadata_ = flag; }
   // Enables preservation of polygons.
   void set_preserve_polygons(bool flag) { preserve_polygons_ = flag; }
+  // When set to a non-zero value, DecodeFromFile() streams the input file in
+  // chunks of |num_bytes| instead of loading the whole file into memory. The
+  // memory used by the decoder is then bounded by the chunk size and the size
+  // of the decoded geometry.
+  // Default: 0 (disabled)
+  void set_streaming_chunk_size(size_t num_bytes) {
+    streaming_chunk_size_ = num_bytes;
+  }
 
  protected:
   Status DecodeInternal();
@@ -65,6 +81,10 @@ class ObjDecoder {
   // Resets internal counters for attributes and faces.
   void ResetCounters();
 
+  // Parses all definitions of the input, either from |buffer_| or chunk by
+  // chunk from |chunked_reader_| when streaming is enabled.
+  Status ParseAllDefinitions();
+
   // Parses the next mesh property definition (position, tex coord, normal, or
   // face). If the parsed data is unrecognized, it will be skipped.
   // Returns false when the end of file was reached.
@@ -117,6 +137,7 @@ class ObjDecoder {
   int added_edge_att_id_;  // Attribute id for polygon reconstruction.
 
   bool deduplicate_input_values_;
+  int num_deduplication_threads_;
 
   int last_material_id_;
   std::string material_file_name_;
@@ -134,6 +155,10 @@ class ObjDecoder {
 
   std::vector<std::string> *mesh_files_;
 
+  size_t streaming_chunk_size_;
+  // Source of the input data when the input file is streamed.
+  std::unique_ptr<ChunkedFileReader> chunked_reader_;
+
   DecoderBuffer buffer_;
 
   // Data structure that stores the decoded data. |out_point_cloud_| must be
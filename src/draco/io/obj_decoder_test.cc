@@ -18,6 +18,7 @@
 
 #include "draco/core/draco_test_base.h"
 #include "draco/core/draco_test_utils.h"
+#include "draco/mesh/mesh_are_equivalent.h"
 
 namespace draco {
 
@@ -41,6 +42,20 @@ class ObjDecoderTest : public ::testing::Test {
     return geometry;
   }
 
+  template <class Geometry>
+  std::unique_ptr<Geometry> DecodeObjStreaming(const std::string &file_name,
+                                               size_t chunk_size) const {
+    const std::string path = GetTestFileFullPath(file_name);
+    ObjDecoder decoder;
+    decoder.set_use_metadata(true);
+    decoder.set_streaming_chunk_size(chunk_size);
+    std::unique_ptr<Geometry> geometry(new Geometry());
+    if (!decoder.DecodeFromFile(path, geometry.get()).ok()) {
+      return nullptr;
+    }
+    return geometry;
+  }
+
   template <class Geometry>
   std::unique_ptr<Geometry> DecodeObjWithMetadata(
       const std::string &file_name) const {
@@ -306,4 +321,41 @@ TEST_F(ObjDecoderTest, TestObjDecodingAll) {
   test_decoding("inf_nan.obj");
 }
 
+TEST_F(ObjDecoderTest, TestStreamingDecoding) {
+  // Tests that decoding of OBJ files in chunks produces the same geometry as
+  // decoding of the whole file. Small chunk sizes are used to exercise the
+  // handling of lines at chunk boundaries.
+  for (const std::string file_name :
+       {"cube_att.obj", "test_nm.obj", "mat_test.obj", "test_sphere.obj"}) {
+    const std::unique_ptr<Mesh> mesh(DecodeObjWithMetadata<Mesh>(file_name));
+    ASSERT_NE(mesh, nullptr) << "Failed to load test model " << file_name;
+    for (const size_t chunk_size : {1, 17, 4096}) {
+      const std::unique_ptr<Mesh> streamed_mesh(
+          DecodeObjStreaming<Mesh>(file_name, chunk_size));
+      ASSERT_NE(streamed_mesh, nullptr)
+          << "Failed to stream test model " << file_name;
+      MeshAreEquivalent equiv;
+      ASSERT_TRUE(equiv(*mesh, *streamed_mesh))
+          << file_name << " with chunk size " << chunk_size;
+    }
+  }
+}
+
+TEST_F(ObjDecoderTest, TestMultithreadedDeduplication) {
+  // Tests that deduplication on multiple threads produces the same geometry
+  // as deduplication on a single thread.
+  for (const std::string file_name : {"cube_att.obj", "test_nm.obj"}) {
+    const std::unique_ptr<Mesh> mesh(DecodeObj<Mesh>(file_name, true));
+    ASSERT_NE(mesh, nullptr) << "Failed to load test model " << file_name;
+    ObjDecoder decoder;
+    decoder.set_num_deduplication_threads(4);
+    Mesh threaded_mesh;
+    DRACO_ASSERT_OK(
+        decoder.DecodeFromFile(GetTestFileFullPath(file_name), &threaded_mesh));
+    ASSERT_EQ(threaded_mesh.num_points(), mesh->num_points()) << file_name;
+    MeshAreEquivalent equiv;
+    ASSERT_TRUE(equiv(*mesh, threaded_mesh)) << file_name;
+  }
+}
+
 }  // namespace draco
@@ -46,11 +46,13 @@ void SkipCharacters(DecoderBuffer *buffer, const char *skip_chars) {
 }
 
 void SkipWhitespace(DecoderBuffer *buffer) {
-  bool end_reached = false;
-  while (PeekWhitespace(buffer, &end_reached) && !end_reached) {
-    // Skip the whitespace character
-    buffer->Advance(1);
+  const char *const head = buffer->data_head();
+  const char *const end = head + buffer->remaining_size();
+  const char *ptr = head;
+  while (ptr != end && IsWhitespace(*ptr)) {
+    ++ptr;
   }
+  buffer->Advance(ptr - head);
 }
 
 bool PeekWhitespace(DecoderBuffer *buffer, bool *end_reached) {
@@ -59,7 +61,7 @@ bool PeekWhitespace(DecoderBuffer *buffer, bool *end_reached) {
     *end_reached = true;
     return false;  // eof reached.
   }
-  if (!isspace(c)) {
+  if (!IsWhitespace(c)) {
     return false;  // Non-whitespace character reached.
   }
   return true;
@@ -67,42 +69,79 @@ bool PeekWhitespace(DecoderBuffer *buffer, bool *end_reached) {
 
 void SkipLine(DecoderBuffer *buffer) { ParseLine(buffer, nullptr); }
 
+namespace {
+
+// Exact powers of ten representable by a double.
+constexpr double kExactPowersOfTen[] = {
+    1e0,  1e1,  1e2,  1e3,  1e4,  1e5,  1e6,  1e7,  1e8,  1e9,  1e10, 1e11,
+    1e12, 1e13, 1e14, 1e15, 1e16, 1e17, 1e18, 1e19, 1e20, 1e21, 1e22};
+
+// Largest mantissa that can still accept another decimal digit without
+// overflowing uint64_t.
+constexpr uint64_t kMaxMantissa = 999999999999999999ull;
+
+// Largest magnitude of an explicit exponent that is tracked. Anything larger
+// over- or underflows a double regardless of the mantissa.
+constexpr int32_t kMaxExplicitExponent = 100000;
+
+inline bool IsDigit(char c) { return c >= '0' && c <= '9'; }
+
+}  // namespace
+
 bool ParseFloat(DecoderBuffer *buffer, float *value) {
-  // Read optional sign.
-  char ch;
-  if (!buffer->Peek(&ch)) {
+  // The number is parsed directly from the underlying memory. All digits are
+  // accumulated into an integer mantissa and a decimal exponent, which are
+  // then combined with a single multiplication or division. When both the
+  // mantissa and the power of ten are exactly representable by a double, the
+  // result is correctly rounded (i.e. the usual fast path of float parsers).
+  // The parsing does not depend on the current locale.
+  const char *const head = buffer->data_head();
+  const char *const end = head + buffer->remaining_size();
+  const char *ptr = head;
+  if (ptr == end) {
     return false;
   }
-  int sign = GetSignValue(ch);
+
+  // Read optional sign.
+  int sign = GetSignValue(*ptr);
   if (sign != 0) {
-    buffer->Advance(1);
+    ++ptr;
   } else {
     sign = 1;
   }
 
   // Parse integer component.
   bool have_digits = false;
-  double v = 0.0;
-  while (buffer->Peek(&ch) && ch >= '0' && ch <= '9') {
-    v *= 10.0;
-    v += (ch - '0');
-    buffer->Advance(1);
+  uint64_t mantissa = 0;
+  int32_t exponent = 0;
+  while (ptr != end && IsDigit(*ptr)) {
+    if (mantissa <= kMaxMantissa) {
+      mantissa = mantissa * 10 + (*ptr - '0');
+    } else {
+      // Digits that do not fit into the mantissa only scale the value.
+      ++exponent;
+    }
+    ++ptr;
     have_digits = true;
   }
-  if (ch == '.') {
-    // Parse fractional component.
-    buffer->Advance(1);
-    double fraction = 1.0;
-    while (buffer->Peek(&ch) && ch >= '0' && ch <= '9') {
-      fraction *= 0.1;
-      v += (ch - '0') * fraction;
-      buffer->Advance(1);
+  if (ptr != end && *ptr == '.') {
+    // Parse fractional component. Digits that do not fit into the mantissa
+    // are below the precision of a double and are ignored.
+    ++ptr;
+    while (ptr != end && IsDigit(*ptr)) {
+      if (mantissa <= kMaxMantissa) {
+        mantissa = mantissa * 10 + (*ptr - '0');
+        --exponent;
+      }
+      ++ptr;
       have_digits = true;
     }
   }
 
+  double v = 0.0;
   if (!have_digits) {
     // Check for special constants (inf, nan, ...).
+    buffer->Advance(ptr - head);
     std::string text;
     if (!ParseString(buffer, &text)) {
       return false;
@@ -117,17 +156,49 @@ bool ParseFloat(DecoderBuffer *buffer, float *value) {
     }
   } else {
     // Handle exponent if present.
-    if (ch == 'e' || ch == 'E') {
-      buffer->Advance(1);  // Skip 'e' marker.
+    if (ptr != end && (*ptr == 'e' || *ptr == 'E')) {
+      ++ptr;  // Skip 'e' marker.
 
       // Parse integer exponent.
-      int32_t exponent = 0;
-      if (!ParseSignedInt(buffer, &exponent)) {
+      bool negative_exponent = false;
+      if (ptr != end && (*ptr == '-' || *ptr == '+')) {
+        negative_exponent = *ptr == '-';
+        ++ptr;
+      }
+      if (ptr == end || !IsDigit(*ptr)) {
+        // Consume everything up to the invalid character.
+        buffer->Advance(ptr - head);
         return false;
       }
+      int32_t explicit_exponent = 0;
+      while (ptr != end && IsDigit(*ptr)) {
+        if (explicit_exponent < kMaxExplicitExponent) {
+          explicit_exponent = explicit_exponent * 10 + (*ptr - '0');
+        }
+        ++ptr;
+      }
+      exponent += negative_exponent ? -explicit_exponent : explicit_exponent;
+    }
+    buffer->Advance(ptr - head);
 
-      // Apply exponent scaling to value.
-      v *= pow(static_cast<double>(10.0), exponent);
+    // Apply exponent scaling to value.
+    v = static_cast<double>(mantissa);
+    if (mantissa == 0 || exponent == 0) {
+      // Nothing to scale.
+    } else if (exponent > 0 && exponent <= 22 && mantissa < (1ull << 53)) {
+      v *= kExactPowersOfTen[exponent];
+    } else if (exponent < 0 && exponent >= -22 && mantissa < (1ull << 53)) {
+      v /= kExactPowersOfTen[-exponent];
+    } else if (exponent > 0) {
+      v *= pow(10.0, exponent);
+    } else if (exponent >= -308) {
+      // Dividing by the (normal) power of ten is more accurate than
+      // multiplying by its inexact reciprocal.
+      v /= pow(10.0, -exponent);
+    } else {
+      // 10^-exponent is not representable, scale in two steps.
+      v /= 1e308;
+      v /= pow(10.0, -exponent - 308);
     }
   }
 
@@ -158,18 +229,19 @@ bool ParseSignedInt(DecoderBuffer *buffer, int32_t *value) {
 
 bool ParseUnsignedInt(DecoderBuffer *buffer, uint32_t *value) {
   // Parse the number until we run out of digits.
+  const char *const head = buffer->data_head();
+  const char *const end = head + buffer->remaining_size();
+  const char *ptr = head;
   uint32_t v = 0;
-  char ch;
-  bool have_digits = false;
-  while (buffer->Peek(&ch) && ch >= '0' && ch <= '9') {
+  while (ptr != end && IsDigit(*ptr)) {
     v *= 10;
-    v += (ch - '0');
-    buffer->Advance(1);
-    have_digits = true;
+    v += (*ptr - '0');
+    ++ptr;
   }
-  if (!have_digits) {
+  if (ptr == head) {
     return false;
   }
+  buffer->Advance(ptr - head);
   *value = v;
   return true;
 }
@@ -20,6 +20,12 @@
 namespace draco {
 namespace parser {
 
+// Returns true if |c| is a whitespace character (' ', '\t', '\n', '\v', '\f' or
+// '\r'). Unlike isspace(), the result does not depend on the current locale.
+inline bool IsWhitespace(char c) {
+  return c == ' ' || (c >= '\t' && c <= '\r');
+}
+
 // Skips to first character not included in |skip_chars|.
 void SkipCharacters(DecoderBuffer *buffer, const char *skip_chars);
 
@@ -0,0 +1,170 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/io/parser_utils.h"
+
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <limits>
+
+#include "draco/core/draco_test_base.h"
+
+namespace {
+
+// Parses a float from |text| and stores the number of unparsed characters in
+// |remaining_size|.
+bool ParseFloatFromString(const char *text, float *value,
+                          int64_t *remaining_size) {
+  draco::DecoderBuffer buffer;
+  buffer.Init(text, std::strlen(text));
+  const bool result = draco::parser::ParseFloat(&buffer, value);
+  *remaining_size = buffer.remaining_size();
+  return result;
+}
+
+TEST(ParserUtilsTest, TestParseFloat) {
+  float value;
+  int64_t remaining_size;
+  ASSERT_TRUE(ParseFloatFromString("1.5 2", &value, &remaining_size));
+  ASSERT_EQ(value, 1.5f);
+  ASSERT_EQ(remaining_size, 2);
+  ASSERT_TRUE(ParseFloatFromString("-0.125", &value, &remaining_size));
+  ASSERT_EQ(value, -0.125f);
+  ASSERT_EQ(remaining_size, 0);
+  ASSERT_TRUE(ParseFloatFromString("+7.", &value, &remaining_size));
+  ASSERT_EQ(value, 7.f);
+  ASSERT_TRUE(ParseFloatFromString(".5", &value, &remaining_size));
+  ASSERT_EQ(value, 0.5f);
+  ASSERT_TRUE(ParseFloatFromString("1.5e3", &value, &remaining_size));
+  ASSERT_EQ(value, 1500.f);
+  ASSERT_TRUE(ParseFloatFromString("-2.5E-2", &value, &remaining_size));
+  ASSERT_EQ(value, -0.025f);
+  ASSERT_TRUE(ParseFloatFromString("0.1", &value, &remaining_size));
+  ASSERT_EQ(value, 0.1f);
+  ASSERT_TRUE(ParseFloatFromString("0.333333333", &value, &remaining_size));
+  ASSERT_EQ(value, 0.333333333f);
+  ASSERT_TRUE(ParseFloatFromString("123456.789", &value, &remaining_size));
+  ASSERT_EQ(value, 123456.789f);
+  ASSERT_TRUE(ParseFloatFromString("inf", &value, &remaining_size));
+  ASSERT_EQ(value, std::numeric_limits<float>::infinity());
+  ASSERT_TRUE(ParseFloatFromString("-inf", &value, &remaining_size));
+  ASSERT_EQ(value, -std::numeric_limits<float>::infinity());
+  ASSERT_TRUE(ParseFloatFromString("nan", &value, &remaining_size));
+  ASSERT_TRUE(std::isnan(value));
+}
+
+TEST(ParserUtilsTest, TestParseFloatInvalid) {
+  float value;
+  int64_t remaining_size;
+  ASSERT_FALSE(ParseFloatFromString("", &value, &remaining_size));
+  ASSERT_FALSE(ParseFloatFromString("abc", &value, &remaining_size));
+  // A malformed exponent fails after the characters up to the invalid one
+  // were consumed.
+  ASSERT_FALSE(ParseFloatFromString("1e+x", &value, &remaining_size));
+  ASSERT_EQ(remaining_size, 1);
+  ASSERT_FALSE(ParseFloatFromString("2.5ex", &value, &remaining_size));
+  ASSERT_EQ(remaining_size, 1);
+  ASSERT_FALSE(ParseFloatFromString("3e-", &value, &remaining_size));
+  ASSERT_EQ(remaining_size, 0);
+  ASSERT_FALSE(ParseFloatFromString("4E 5", &value, &remaining_size));
+  ASSERT_EQ(remaining_size, 2);
+}
+
+TEST(ParserUtilsTest, TestParseFloatExponent) {
+  float value;
+  int64_t remaining_size;
+  ASSERT_TRUE(ParseFloatFromString("1e+2 x", &value, &remaining_size));
+  ASSERT_EQ(value, 100.f);
+  ASSERT_EQ(remaining_size, 2);
+  ASSERT_TRUE(ParseFloatFromString("12e-1", &value, &remaining_size));
+  ASSERT_EQ(value, 1.2f);
+  ASSERT_TRUE(ParseFloatFromString("0.0e5", &value, &remaining_size));
+  ASSERT_EQ(value, 0.f);
+  ASSERT_TRUE(ParseFloatFromString("-0", &value, &remaining_size));
+  ASSERT_EQ(value, 0.f);
+  ASSERT_TRUE(std::signbit(value));
+  // Exponents outside of the exactly representable powers of ten.
+  ASSERT_TRUE(ParseFloatFromString("3.4e38", &value, &remaining_size));
+  ASSERT_EQ(value, 3.4e38f);
+  ASSERT_TRUE(ParseFloatFromString("1.17549435e-38", &value, &remaining_size));
+  ASSERT_EQ(value, std::numeric_limits<float>::min());
+  ASSERT_TRUE(ParseFloatFromString("1.4e-45", &value, &remaining_size));
+  ASSERT_EQ(value, std::numeric_limits<float>::denorm_min());
+  ASSERT_TRUE(ParseFloatFromString("1e39", &value, &remaining_size));
+  ASSERT_EQ(value, std::numeric_limits<float>::infinity());
+  ASSERT_TRUE(ParseFloatFromString("1e-46", &value, &remaining_size));
+  ASSERT_EQ(value, 0.f);
+  // Large mantissas combined with exponents that cancel out.
+  ASSERT_TRUE(ParseFloatFromString("1000000000000000000000000e-24", &value,
+                                   &remaining_size));
+  ASSERT_EQ(value, 1.f);
+  ASSERT_TRUE(ParseFloatFromString("0.0000000000000000000000001e25", &value,
+                                   &remaining_size));
+  ASSERT_EQ(value, 1.f);
+  // Huge exponents saturate instead of wrapping around.
+  ASSERT_TRUE(ParseFloatFromString("1e99999999999", &value, &remaining_size));
+  ASSERT_EQ(value, std::numeric_limits<float>::infinity());
+  ASSERT_EQ(remaining_size, 0);
+  ASSERT_TRUE(ParseFloatFromString("1e-99999999999", &value, &remaining_size));
+  ASSERT_EQ(value, 0.f);
+}
+
+TEST(ParserUtilsTest, TestParseFloatRounding) {
+  // The parsed values must match the correctly rounded values of strtof() for
+  // numbers written with the precision used by common OBJ and PLY exporters.
+  const char *const kNumbers[] = {
+      "0.1",        "0.2",           "0.3",         "0.7",
+      "1.1",        "2.675",         "-0.0000123",  "3.14159265358979",
+      "0.1234567",  "-0.987654321",  "65504.0",     "16777217",
+      "33554431",   "0.000001",      "1.0000001",   "0.99999994",
+      "1.23456e-7", "9.999999e-11",  "-123.456e7",  "5e-324",
+      "0.15625",    "2.2250738e-30", "7.006492e-46"};
+  for (const char *number : kNumbers) {
+    float value;
+    int64_t remaining_size;
+    ASSERT_TRUE(ParseFloatFromString(number, &value, &remaining_size))
+        << number;
+    ASSERT_EQ(value, std::strtof(number, nullptr)) << number;
+    ASSERT_EQ(remaining_size, 0);
+  }
+  // Check a dense range of numbers with six fractional digits.
+  char number[32];
+  for (int i = -2000000; i <= 2000000; i += 7) {
+    snprintf(number, sizeof(number), "%.6f", i / 1000000.0);
+    float value;
+    int64_t remaining_size;
+    ASSERT_TRUE(ParseFloatFromString(number, &value, &remaining_size));
+    ASSERT_EQ(value, std::strtof(number, nullptr)) << number;
+  }
+}
+
+TEST(ParserUtilsTest, TestParseInt) {
+  draco::DecoderBuffer buffer;
+  const char text[] = "-42 17 x";
+  buffer.Init(text, std::strlen(text));
+  int32_t signed_value;
+  ASSERT_TRUE(draco::parser::ParseSignedInt(&buffer, &signed_value));
+  ASSERT_EQ(signed_value, -42);
+  draco::parser::SkipWhitespace(&buffer);
+  uint32_t unsigned_value;
+  ASSERT_TRUE(draco::parser::ParseUnsignedInt(&buffer, &unsigned_value));
+  ASSERT_EQ(unsigned_value, 17u);
+  draco::parser::SkipWhitespace(&buffer);
+  ASSERT_FALSE(draco::parser::ParseUnsignedInt(&buffer, &unsigned_value));
+  ASSERT_EQ(buffer.remaining_size(), 1);
+}
+
+}  // namespace
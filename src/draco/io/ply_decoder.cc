@@ -16,7 +16,7 @@
 
 #include "draco/core/macros.h"
 #include "draco/core/status.h"
-#include "draco/io/file_utils.h"
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/io/ply_property_reader.h"
 
 namespace draco {
@@ -36,7 +36,11 @@ int64_t CountNumTriangles(const PlyElement &face_element,
 }
 }  // namespace
 
-PlyDecoder::PlyDecoder() : out_mesh_(nullptr), out_point_cloud_(nullptr) {}
+PlyDecoder::PlyDecoder()
+    : streaming_chunk_size_(0),
+      num_deduplication_threads_(1),
+      out_mesh_(nullptr),
+      out_point_cloud_(nullptr) {}
 
 Status PlyDecoder::DecodeFromFile(const std::string &file_name,
                                   Mesh *out_mesh) {
@@ -46,11 +50,20 @@ Status PlyDecoder::DecodeFromFile(const std::string &file_name,
 
 Status PlyDecoder::DecodeFromFile(const std::string &file_name,
                                   PointCloud *out_point_cloud) {
-  std::vector<char> data;
-  if (!ReadFileToBuffer(file_name, &data)) {
+  if (streaming_chunk_size_ > 0) {
+    out_point_cloud_ = out_point_cloud;
+    DRACO_ASSIGN_OR_RETURN(
+        chunked_reader_,
+        ChunkedFileReader::Open(file_name, streaming_chunk_size_));
+    const Status status = DecodeInternal();
+    chunked_reader_ = nullptr;
+    return status;
+  }
+  FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(file_name).ok()) {
     return Status(Status::DRACO_ERROR, "Unable to read input file.");
   }
-  buffer_.Init(data.data(), data.size());
+  buffer_ = *file_buffer.buffer();
   return DecodeFromBuffer(&buffer_, out_point_cloud);
 }
 
@@ -68,7 +81,11 @@ Status PlyDecoder::DecodeFromBuffer(DecoderBuffer *buffer,
 
 Status PlyDecoder::DecodeInternal() {
   PlyReader ply_reader;
-  DRACO_RETURN_IF_ERROR(ply_reader.Read(buffer()));
+  if (chunked_reader_ != nullptr) {
+    DRACO_RETURN_IF_ERROR(ply_reader.Read(chunked_reader_.get()));
+  } else {
+    DRACO_RETURN_IF_ERROR(ply_reader.Read(buffer()));
+  }
   // First, decode the connectivity data.
   if (out_mesh_)
     DRACO_RETURN_IF_ERROR(DecodeFaceData(ply_reader.GetElementByName("face")));
@@ -79,13 +96,14 @@ Status PlyDecoder::DecodeInternal() {
   // not require deduplication.
   if (out_mesh_ && out_mesh_->num_faces() != 0) {
 #ifdef DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED
-    if (!out_point_cloud_->DeduplicateAttributeValues()) {
+    if (!out_point_cloud_->DeduplicateAttributeValues(
+            num_deduplication_threads_)) {
       return Status(Status::DRACO_ERROR,
                     "Could not deduplicate attribute values");
     }
 #endif
 #ifdef DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED
-    out_point_cloud_->DeduplicatePointIds();
+    out_point_cloud_->DeduplicatePointIds(num_deduplication_threads_);
 #endif
   }
   return OkStatus();
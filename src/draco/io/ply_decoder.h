@@ -15,11 +15,13 @@
 #ifndef DRACO_IO_PLY_DECODER_H_
 #define DRACO_IO_PLY_DECODER_H_
 
+#include <memory>
 #include <string>
 
 #include "draco/core/decoder_buffer.h"
 #include "draco/core/status.h"
 #include "draco/draco_features.h"
+#include "draco/io/chunked_file_reader.h"
 #include "draco/io/ply_reader.h"
 #include "draco/mesh/mesh.h"
 
@@ -43,6 +45,20 @@ class PlyDecoder {
   Status DecodeFromBuffer(DecoderBuffer *buffer, Mesh *out_mesh);
   Status DecodeFromBuffer(DecoderBuffer *buffer, PointCloud *out_point_cloud);
 
+  // When set to a non-zero value, DecodeFromFile() streams the input file in
+  // chunks of |num_bytes| instead of loading the whole file into memory.
+  // Default: 0 (disabled)
+  void set_streaming_chunk_size(size_t num_bytes) {
+    streaming_chunk_size_ = num_bytes;
+  }
+
+  // Number of threads used to deduplicate the decoded values and points. The
+  // result is the same for any number of threads.
+  // Default: 1
+  void set_num_deduplication_threads(int num_threads) {
+    num_deduplication_threads_ = num_threads;
+  }
+
  protected:
   Status DecodeInternal();
   DecoderBuffer *buffer() { return &buffer_; }
@@ -58,6 +74,11 @@ class PlyDecoder {
 
   DecoderBuffer buffer_;
 
+  size_t streaming_chunk_size_;
+  // Source of the input data when the input file is streamed.
+  std::unique_ptr<ChunkedFileReader> chunked_reader_;
+  int num_deduplication_threads_;
+
   // Data structure that stores the decoded data. |out_point_cloud_| must be
   // always set but |out_mesh_| is optional.
   Mesh *out_mesh_;
@@ -16,6 +16,7 @@
 
 #include "draco/core/draco_test_base.h"
 #include "draco/core/draco_test_utils.h"
+#include "draco/mesh/mesh_are_equivalent.h"
 
 namespace draco {
 
@@ -34,6 +35,21 @@ class PlyDecoderTest : public ::testing::Test {
     return geometry;
   }
 
+  template <class Geometry>
+  std::unique_ptr<Geometry> DecodePlyStreaming(const std::string &file_name,
+                                               size_t chunk_size) const {
+    const std::string path = GetTestFileFullPath(file_name);
+    PlyDecoder decoder;
+    decoder.set_streaming_chunk_size(chunk_size);
+    std::unique_ptr<Geometry> geometry(new Geometry());
+    Status status = decoder.DecodeFromFile(path, geometry.get());
+    if (!status.ok()) {
+      LOG(ERROR) << "Failed to stream " << file_name << ": " << status;
+      return nullptr;
+    }
+    return geometry;
+  }
+
   void test_decoding(const std::string &file_name, int num_faces,
                      uint32_t num_points, std::unique_ptr<Mesh> *out_mesh) {
     std::unique_ptr<Mesh> mesh(DecodePly<Mesh>(file_name));
@@ -88,4 +104,41 @@ TEST_F(PlyDecoderTest, TestPlyDecodingAll) {
   test_decoding("delim_test.ply");
 }
 
+TEST_F(PlyDecoderTest, TestStreamingDecoding) {
+  // Tests that decoding of both binary and ascii PLY files in chunks produces
+  // the same geometry as decoding of the whole file.
+  for (const std::string file_name :
+       {"test_pos_color.ply", "test_pos_color_ascii.ply", "cube_att.ply",
+        "test_extra_whitespace.ply"}) {
+    const std::unique_ptr<Mesh> mesh(DecodePly<Mesh>(file_name));
+    ASSERT_NE(mesh, nullptr) << "Failed to load test model " << file_name;
+    for (const size_t chunk_size : {1, 17, 4096}) {
+      const std::unique_ptr<Mesh> streamed_mesh(
+          DecodePlyStreaming<Mesh>(file_name, chunk_size));
+      ASSERT_NE(streamed_mesh, nullptr)
+          << "Failed to stream test model " << file_name;
+      MeshAreEquivalent equiv;
+      ASSERT_TRUE(equiv(*mesh, *streamed_mesh))
+          << file_name << " with chunk size " << chunk_size;
+    }
+  }
+}
+
+TEST_F(PlyDecoderTest, TestMultithreadedDeduplication) {
+  // Tests that deduplication on multiple threads produces the same geometry
+  // as deduplication on a single thread.
+  for (const std::string file_name : {"cube_att.ply", "bun_zipper.ply"}) {
+    const std::unique_ptr<Mesh> mesh(DecodePly<Mesh>(file_name));
+    ASSERT_NE(mesh, nullptr) << "Failed to load test model " << file_name;
+    PlyDecoder decoder;
+    decoder.set_num_deduplication_threads(4);
+    Mesh threaded_mesh;
+    DRACO_ASSERT_OK(
+        decoder.DecodeFromFile(GetTestFileFullPath(file_name), &threaded_mesh));
+    ASSERT_EQ(threaded_mesh.num_points(), mesh->num_points()) << file_name;
+    MeshAreEquivalent equiv;
+    ASSERT_TRUE(equiv(*mesh, threaded_mesh)) << file_name;
+  }
+}
+
 }  // namespace draco
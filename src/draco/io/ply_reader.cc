@@ -33,17 +33,27 @@ PlyProperty::PlyProperty(const std::string &name, DataType data_type,
 PlyElement::PlyElement(const std::string &name, int64_t num_entries)
     : name_(name), num_entries_(num_entries) {}
 
-PlyReader::PlyReader() : format_(kLittleEndian) {}
+PlyReader::PlyReader() : format_(kLittleEndian), chunked_reader_(nullptr) {}
+
+Status PlyReader::Read(ChunkedFileReader *reader) {
+  chunked_reader_ = reader;
+  DecoderBuffer buffer;
+  const Status status = Read(&buffer);
+  chunked_reader_ = nullptr;
+  return status;
+}
 
 Status PlyReader::Read(DecoderBuffer *buffer) {
   std::string value;
   // The first line needs to by "ply".
+  EnsureData(buffer, 1, true);
   if (!parser::ParseString(buffer, &value) || value != "ply") {
     return Status(Status::INVALID_PARAMETER, "Not a valid ply file");
   }
   parser::SkipLine(buffer);
 
   // The second line needs to be the format of the ply file.
+  EnsureData(buffer, 1, true);
   parser::ParseLine(buffer, &value);
   std::string format, version;
   const std::vector<std::string> words = SplitWords(value);
@@ -75,6 +85,10 @@ Status PlyReader::Read(DecoderBuffer *buffer) {
 
 Status PlyReader::ParseHeader(DecoderBuffer *buffer) {
   while (true) {
+    SkipWhitespace(buffer);
+    // When reading in chunks, the current chunk may end with a line that is
+    // shorter than the "end_header" keyword checked below.
+    EnsureData(buffer, 10, true);
     DRACO_ASSIGN_OR_RETURN(bool end, ParseEndHeader(buffer));
     if (end) {
       break;
@@ -193,6 +207,9 @@ bool PlyReader::ParseElementData(DecoderBuffer *buffer, int element_index) {
       if (prop.is_list()) {
         // Parse the number of entries for the list element.
         int64_t num_entries = 0;
+        if (!EnsureData(buffer, prop.list_data_type_num_bytes(), false)) {
+          return false;
+        }
         buffer->Decode(&num_entries, prop.list_data_type_num_bytes());
         // Store offset to the main data entry.
         prop.list_data_.push_back(prop.data_.size() /
@@ -202,11 +219,17 @@ bool PlyReader::ParseElementData(DecoderBuffer *buffer, int element_index) {
         // Read and store the actual property data
         const int64_t num_bytes_to_read =
             prop.data_type_num_bytes() * num_entries;
+        if (!EnsureData(buffer, num_bytes_to_read, false)) {
+          return false;
+        }
         prop.data_.insert(prop.data_.end(), buffer->data_head(),
                           buffer->data_head() + num_bytes_to_read);
         buffer->Advance(num_bytes_to_read);
       } else {
         // Non-list property
+        if (!EnsureData(buffer, prop.data_type_num_bytes(), false)) {
+          return false;
+        }
         prop.data_.insert(prop.data_.end(), buffer->data_head(),
                           buffer->data_head() + prop.data_type_num_bytes());
         buffer->Advance(prop.data_type_num_bytes());
@@ -225,7 +248,7 @@ bool PlyReader::ParseElementDataAscii(DecoderBuffer *buffer,
       PlyPropertyWriter<double> prop_writer(&prop);
       int32_t num_entries = 1;
       if (prop.is_list()) {
-        parser::SkipWhitespace(buffer);
+        SkipWhitespace(buffer);
         // Parse the number of entries for the list element.
         if (!parser::ParseSignedInt(buffer, &num_entries)) {
           return false;
@@ -239,7 +262,7 @@ bool PlyReader::ParseElementDataAscii(DecoderBuffer *buffer,
       }
       // Read and store the actual property data.
       for (int v = 0; v < num_entries; ++v) {
-        parser::SkipWhitespace(buffer);
+        SkipWhitespace(buffer);
         if (prop.data_type() == DT_FLOAT32 || prop.data_type() == DT_FLOAT64) {
           float val;
           if (!parser::ParseFloat(buffer, &val)) {
@@ -259,6 +282,27 @@ bool PlyReader::ParseElementDataAscii(DecoderBuffer *buffer,
   return true;
 }
 
+bool PlyReader::EnsureData(DecoderBuffer *buffer, int64_t num_bytes,
+                           bool text_mode) {
+  while (buffer->remaining_size() < num_bytes) {
+    if (chunked_reader_ == nullptr) {
+      return false;
+    }
+    const StatusOr<bool> refilled = chunked_reader_->Refill(buffer, text_mode);
+    if (!refilled.ok() || !refilled.value()) {
+      return false;
+    }
+  }
+  return true;
+}
+
+void PlyReader::SkipWhitespace(DecoderBuffer *buffer) {
+  parser::SkipWhitespace(buffer);
+  while (buffer->remaining_size() == 0 && EnsureData(buffer, 1, true)) {
+    parser::SkipWhitespace(buffer);
+  }
+}
+
 std::vector<std::string> PlyReader::SplitWords(const std::string &line) {
   std::vector<std::string> output;
   std::string::size_type start = 0;
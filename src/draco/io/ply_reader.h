@@ -28,6 +28,7 @@
 #include "draco/core/draco_types.h"
 #include "draco/core/status.h"
 #include "draco/core/status_or.h"
+#include "draco/io/chunked_file_reader.h"
 
 namespace draco {
 
@@ -116,6 +117,9 @@ class PlyReader {
  public:
   PlyReader();
   Status Read(DecoderBuffer *buffer);
+  // Reads the PLY data from |reader| chunk by chunk. Only the parsed elements
+  // are kept in memory, not the source data.
+  Status Read(ChunkedFileReader *reader);
 
   const PlyElement *GetElementByName(const std::string &name) const {
     const auto it = element_index_.find(name);
@@ -141,6 +145,14 @@ class PlyReader {
   bool ParseElementData(DecoderBuffer *buffer, int element_index);
   bool ParseElementDataAscii(DecoderBuffer *buffer, int element_index);
 
+  // Ensures that at least |num_bytes| are available in |buffer|, reading more
+  // data from |chunked_reader_| when needed. In text mode only whole lines are
+  // read. Returns false when not enough data is available.
+  bool EnsureData(DecoderBuffer *buffer, int64_t num_bytes, bool text_mode);
+  // Skips whitespace in |buffer|, reading more data from |chunked_reader_|
+  // when the end of the current chunk is reached.
+  void SkipWhitespace(DecoderBuffer *buffer);
+
   // Splits |line| by whitespace characters.
   std::vector<std::string> SplitWords(const std::string &line);
   DataType GetDataTypeFromString(const std::string &name) const;
@@ -148,6 +160,8 @@ class PlyReader {
   std::vector<PlyElement> elements_;
   std::map<std::string, int> element_index_;
   Format format_;
+  // Optional source of data that is read in chunks.
+  ChunkedFileReader *chunked_reader_;
 };
 
 }  // namespace draco
@@ -14,7 +14,7 @@
 //
 #include "draco/io/point_cloud_io.h"
 
-#include "draco/io/file_utils.h"
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/io/obj_decoder.h"
 #include "draco/io/parser_utils.h"
 #include "draco/io/ply_decoder.h"
@@ -23,6 +23,12 @@ namespace draco {
 
 StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
     const std::string &file_name) {
+  const Options options;
+  return ReadPointCloudFromFile(file_name, options);
+}
+
+StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
+    const std::string &file_name, const Options &options) {
   std::unique_ptr<PointCloud> pc(new PointCloud());
   // Analyze file extension.
   const std::string extension = parser::ToLower(
@@ -31,6 +37,10 @@ StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
   if (extension == ".obj") {
     // Wavefront OBJ file format.
     ObjDecoder obj_decoder;
+    obj_decoder.set_streaming_chunk_size(
+        options.GetInt("streaming_chunk_size", 0));
+    obj_decoder.set_num_deduplication_threads(
+        options.GetInt("dedup_threads", 1));
     const Status obj_status = obj_decoder.DecodeFromFile(file_name, pc.get());
     if (!obj_status.ok()) {
       return obj_status;
@@ -40,18 +50,18 @@ StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
   if (extension == ".ply") {
     // Wavefront PLY file format.
     PlyDecoder ply_decoder;
+    ply_decoder.set_streaming_chunk_size(
+        options.GetInt("streaming_chunk_size", 0));
     DRACO_RETURN_IF_ERROR(ply_decoder.DecodeFromFile(file_name, pc.get()));
     return std::move(pc);
   }
 
-  std::vector<char> buffer;
-  if (!ReadFileToBuffer(file_name, &buffer)) {
+  FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(file_name).ok()) {
     return Status(Status::DRACO_ERROR, "Unable to read input file.");
   }
-  DecoderBuffer decoder_buffer;
-  decoder_buffer.Init(buffer.data(), buffer.size());
   Decoder decoder;
-  auto status_or = decoder.DecodePointCloudFromBuffer(&decoder_buffer);
+  auto status_or = decoder.DecodePointCloudFromBuffer(file_buffer.buffer());
   return std::move(status_or).value();
 }
 
@@ -18,6 +18,7 @@
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/decode.h"
 #include "draco/compression/expert_encode.h"
+#include "draco/core/options.h"
 
 namespace draco {
 
@@ -84,6 +85,15 @@ InStreamT &ReadPointCloudFromStream(std::unique_ptr<PointCloud> *point_cloud,
 StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
     const std::string &file_name);
 
+// Reads a point cloud from a file. Reading is configured with |options|:
+// streaming_chunk_size : When non-zero, obj and ply files are parsed in chunks
+// of this many bytes instead of being loaded whole into memory. Default is 0.
+// dedup_threads : Number of threads used to deduplicate the values and points
+// of obj files. Default is 1.
+// Returns nullptr with an error status if the decoding failed.
+StatusOr<std::unique_ptr<PointCloud>> ReadPointCloudFromFile(
+    const std::string &file_name, const Options &options);
+
 }  // namespace draco
 
 #endif  // DRACO_IO_POINT_CLOUD_IO_H_
@@ -14,6 +14,7 @@
 //
 #include "draco/io/point_cloud_io.h"
 
+#include <cstring>
 #include <sstream>
 
 #include "draco/core/draco_test_base.h"
@@ -95,6 +96,36 @@ TEST_F(IoPointCloudIoTest, ObjFileInput) {
   EXPECT_EQ(pc->num_points(), 97) << "Obj point cloud not loaded properly.";
 }
 
+TEST_F(IoPointCloudIoTest, StreamingFileInput) {
+  // Tests that point clouds streamed from files in chunks are the same as
+  // point clouds loaded from whole files.
+  for (const std::string file_name :
+       {"test_nm.obj", "point_cloud_test_pos_norm.ply"}) {
+    DRACO_ASSIGN_OR_ASSERT(
+        const std::unique_ptr<PointCloud> pc,
+        ReadPointCloudFromFile(GetTestFileFullPath(file_name)));
+    Options options;
+    options.SetInt("streaming_chunk_size", 17);
+    DRACO_ASSIGN_OR_ASSERT(
+        const std::unique_ptr<PointCloud> streamed_pc,
+        ReadPointCloudFromFile(GetTestFileFullPath(file_name), options));
+    ASSERT_EQ(streamed_pc->num_points(), pc->num_points()) << file_name;
+    ASSERT_EQ(streamed_pc->num_attributes(), pc->num_attributes()) << file_name;
+    for (int i = 0; i < pc->num_attributes(); ++i) {
+      const PointAttribute *const att = pc->attribute(i);
+      const PointAttribute *const streamed_att = streamed_pc->attribute(i);
+      ASSERT_EQ(streamed_att->size(), att->size()) << file_name;
+      for (PointIndex pi(0); pi < pc->num_points(); ++pi) {
+        ASSERT_EQ(
+            memcmp(streamed_att->GetAddress(streamed_att->mapped_index(pi)),
+                   att->GetAddress(att->mapped_index(pi)), att->byte_stride()),
+            0)
+            << file_name;
+      }
+    }
+  }
+}
+
 // Test if we handle wrong input for all file extensions.
 TEST_F(IoPointCloudIoTest, WrongFileObj) {
   const std::unique_ptr<PointCloud> pc =
@@ -19,20 +19,18 @@
 #include "draco/core/macros.h"
 #include "draco/core/status.h"
 #include "draco/core/status_or.h"
-#include "draco/io/file_utils.h"
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/mesh/triangle_soup_mesh_builder.h"
 
 namespace draco {
 
 StatusOr<std::unique_ptr<Mesh>> StlDecoder::DecodeFromFile(
     const std::string &file_name) {
-  std::vector<char> data;
-  if (!ReadFileToBuffer(file_name, &data)) {
+  FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(file_name).ok()) {
     return Status(Status::IO_ERROR, "Unable to read input file.");
   }
-  DecoderBuffer buffer;
-  buffer.Init(data.data(), data.size());
-  return DecodeFromBuffer(&buffer);
+  return DecodeFromBuffer(file_buffer.buffer());
 }
 
 StatusOr<std::unique_ptr<Mesh>> StlDecoder::DecodeFromBuffer(
@@ -46,6 +44,7 @@ StatusOr<std::unique_ptr<Mesh>> StlDecoder::DecodeFromBuffer(
   buffer->Decode(&face_count, 4);
 
   TriangleSoupMeshBuilder builder;
+  builder.SetNumDeduplicationThreads(num_deduplication_threads_);
   builder.Start(face_count);
 
   const int32_t pos_att_id =
@@ -29,8 +29,20 @@ namespace draco {
 // connectivity data is not needed).
 class StlDecoder {
  public:
+  StlDecoder() : num_deduplication_threads_(1) {}
+
   StatusOr<std::unique_ptr<Mesh>> DecodeFromFile(const std::string &file_name);
   StatusOr<std::unique_ptr<Mesh>> DecodeFromBuffer(DecoderBuffer *buffer);
+
+  // Number of threads used to deduplicate the decoded values and points. The
+  // result is the same for any number of threads.
+  // Default: 1
+  void set_num_deduplication_threads(int num_threads) {
+    num_deduplication_threads_ = num_threads;
+  }
+
+ private:
+  int num_deduplication_threads_;
 };
 
 }  // namespace draco
@@ -16,6 +16,7 @@
 
 #include <limits>
 #include <memory>
+#include <utility>
 
 #include "draco/attributes/geometry_indices.h"
 #include "draco/mesh/corner_table_iterators.h"
@@ -37,6 +38,15 @@ std::unique_ptr<CornerTable> CornerTable::Create(
   return ct;
 }
 
+std::unique_ptr<CornerTable> CornerTable::Create(
+    IndexTypeVector<CornerIndex, VertexIndex> &&corner_to_vertex_map) {
+  std::unique_ptr<CornerTable> ct(new CornerTable());
+  if (!ct->Init(std::move(corner_to_vertex_map))) {
+    return nullptr;
+  }
+  return ct;
+}
+
 bool CornerTable::Init(const IndexTypeVector<FaceIndex, FaceType> &faces) {
   valence_cache_.ClearValenceCache();
   valence_cache_.ClearValenceCacheInaccurate();
@@ -46,6 +56,21 @@ bool CornerTable::Init(const IndexTypeVector<FaceIndex, FaceType> &faces) {
       corner_to_vertex_map_[FirstCorner(fi) + i] = faces[fi][i];
     }
   }
+  return ComputeConnectivity();
+}
+
+bool CornerTable::Init(
+    IndexTypeVector<CornerIndex, VertexIndex> &&corner_to_vertex_map) {
+  if (corner_to_vertex_map.size() % 3 != 0) {
+    return false;
+  }
+  valence_cache_.ClearValenceCache();
+  valence_cache_.ClearValenceCacheInaccurate();
+  corner_to_vertex_map_ = std::move(corner_to_vertex_map);
+  return ComputeConnectivity();
+}
+
+bool CornerTable::ComputeConnectivity() {
   int num_vertices = -1;
   if (!ComputeOppositeCorners(&num_vertices)) {
     return false;
@@ -74,7 +99,12 @@ bool CornerTable::Reset(int num_faces, int num_vertices) {
   }
   corner_to_vertex_map_.assign(num_faces_unsigned * 3, kInvalidVertexIndex);
   opposite_corners_.assign(num_faces_unsigned * 3, kInvalidCornerIndex);
+  vertex_corners_.clear();
   vertex_corners_.reserve(num_vertices);
+  non_manifold_vertex_parents_.clear();
+  num_original_vertices_ = 0;
+  num_degenerated_faces_ = 0;
+  num_isolated_vertices_ = 0;
   valence_cache_.ClearValenceCache();
   valence_cache_.ClearValenceCacheInaccurate();
   return true;
@@ -85,7 +115,7 @@ bool CornerTable::ComputeOppositeCorners(int *num_vertices) {
   if (num_vertices == nullptr) {
     return false;
   }
-  opposite_corners_.resize(num_corners(), kInvalidCornerIndex);
+  opposite_corners_.assign(num_corners(), kInvalidCornerIndex);
 
   // Out implementation for finding opposite corners is based on keeping track
   // of outgoing half-edges for each vertex of the mesh. Half-edges (defined by
@@ -95,48 +125,28 @@ bool CornerTable::ComputeOppositeCorners(int *num_vertices) {
   // remove the sibling half-edge from the sink vertex, otherwise we add the new
   // half-edge to its source vertex.
 
-  // First compute the number of outgoing half-edges (corners) attached to each
-  // vertex.
-  std::vector<int> num_corners_on_vertices;
-  num_corners_on_vertices.reserve(num_corners());
+  // First compute the number of vertices referenced by the corners.
+  int num_referenced_vertices = 0;
   for (CornerIndex c(0); c < num_corners(); ++c) {
-    const VertexIndex v1 = Vertex(c);
-    if (v1.value() >= static_cast<int>(num_corners_on_vertices.size())) {
-      num_corners_on_vertices.resize(v1.value() + 1, 0);
+    const int v = static_cast<int>(Vertex(c).value());
+    if (v >= num_referenced_vertices) {
+      num_referenced_vertices = v + 1;
     }
-    // For each corner there is always exactly one outgoing half-edge attached
-    // to its vertex.
-    num_corners_on_vertices[v1.value()]++;
   }
 
-  // Create a storage for half-edges on each vertex. We store all half-edges in
-  // one array, where each entry is identified by the half-edge's sink vertex id
-  // and the associated half-edge corner id (corner opposite to the half-edge).
-  // Each vertex will be assigned storage for up to
-  // |num_corners_on_vertices[vert_id]| half-edges. Unused half-edges are marked
-  // with |sink_vert| == kInvalidVertexIndex.
-  struct VertexEdgePair {
-    VertexEdgePair()
-        : sink_vert(kInvalidVertexIndex), edge_corner(kInvalidCornerIndex) {}
-    VertexIndex sink_vert;
-    CornerIndex edge_corner;
-  };
-  std::vector<VertexEdgePair> vertex_edges(num_corners(), VertexEdgePair());
-
-  // For each vertex compute the offset (location where the first half-edge
-  // entry of a given vertex is going to be stored). This way each vertex is
-  // guaranteed to have a non-overlapping storage with respect to the other
-  // vertices.
-  std::vector<int> vertex_offset(num_corners_on_vertices.size());
-  int offset = 0;
-  for (size_t i = 0; i < num_corners_on_vertices.size(); ++i) {
-    vertex_offset[i] = offset;
-    offset += num_corners_on_vertices[i];
-  }
+  // The outgoing half-edges that haven't been connected yet are stored in one
+  // singly linked list per vertex, ordered by the time of their insertion. To
+  // avoid any additional per-corner storage, the link to the next half-edge in
+  // the list is stored in |opposite_corners_| of the half-edge's corner until
+  // the half-edge is connected (and the entry is overwritten by the actual
+  // opposite corner). The first half-edges of the lists are temporarily stored
+  // in |vertex_corners_| that is recomputed in ComputeVertexCorners().
+  vertex_corners_.assign(num_referenced_vertices, kInvalidCornerIndex);
+  IndexTypeVector<VertexIndex, CornerIndex> last_vertex_edges(
+      num_referenced_vertices, kInvalidCornerIndex);
 
   // Now go over the all half-edges (using their opposite corners) and either
-  // insert them to the |vertex_edge| array or connect them with existing
-  // half-edges.
+  // insert them to the lists or connect them with existing half-edges.
   for (CornerIndex c(0); c < num_corners(); ++c) {
     const VertexIndex tip_v = Vertex(c);
     const VertexIndex source_v = Vertex(Next(c));
@@ -154,58 +164,60 @@ bool CornerTable::ComputeOppositeCorners(int *num_vertices) {
     }
 
     CornerIndex opposite_c(kInvalidCornerIndex);
-    // The maximum number of half-edges attached to the sink vertex.
-    const int num_corners_on_vert = num_corners_on_vertices[sink_v.value()];
-    // Where to look for the first half-edge on the sink vertex.
-    offset = vertex_offset[sink_v.value()];
-    for (int i = 0; i < num_corners_on_vert; ++i, ++offset) {
-      const VertexIndex other_v = vertex_edges[offset].sink_vert;
-      if (other_v == kInvalidVertexIndex) {
-        break;  // No matching half-edge found on the sink vertex.
+    CornerIndex previous_edge_c(kInvalidCornerIndex);
+    // Look for a matching half-edge on the sink vertex.
+    for (CornerIndex edge_c = vertex_corners_[sink_v];
+         edge_c != kInvalidCornerIndex;
+         previous_edge_c = edge_c, edge_c = opposite_corners_[edge_c]) {
+      if (Vertex(Previous(edge_c)) != source_v) {
+        continue;
       }
-      if (other_v == source_v) {
-        if (tip_v == Vertex(vertex_edges[offset].edge_corner)) {
-          continue;  // Don't connect mirrored faces.
-        }
-        // A matching half-edge was found on the sink vertex. Mark the
-        // half-edge's opposite corner.
-        opposite_c = vertex_edges[offset].edge_corner;
-        // Remove the half-edge from the sink vertex. We remap all subsequent
-        // half-edges one slot down.
-        // TODO(ostava): This can be optimized a little bit, by remapping only
-        // the half-edge on the last valid slot into the deleted half-edge's
-        // slot.
-        for (int j = i + 1; j < num_corners_on_vert; ++j, ++offset) {
-          vertex_edges[offset] = vertex_edges[offset + 1];
-          if (vertex_edges[offset].sink_vert == kInvalidVertexIndex) {
-            break;  // Unused half-edge reached.
-          }
-        }
-        // Mark the last entry as unused.
-        vertex_edges[offset].sink_vert = kInvalidVertexIndex;
-        break;
+      if (tip_v == Vertex(edge_c)) {
+        continue;  // Don't connect mirrored faces.
       }
+      // A matching half-edge was found on the sink vertex. Mark the
+      // half-edge's opposite corner and remove the half-edge from the list.
+      opposite_c = edge_c;
+      const CornerIndex next_edge_c = opposite_corners_[edge_c];
+      if (previous_edge_c == kInvalidCornerIndex) {
+        vertex_corners_[sink_v] = next_edge_c;
+      } else {
+        opposite_corners_[previous_edge_c] = next_edge_c;
+      }
+      if (last_vertex_edges[sink_v] == edge_c) {
+        last_vertex_edges[sink_v] = previous_edge_c;
+      }
+      break;
     }
     if (opposite_c == kInvalidCornerIndex) {
-      // No opposite corner found. Insert the new edge
-      const int num_corners_on_source_vert =
-          num_corners_on_vertices[source_v.value()];
-      offset = vertex_offset[source_v.value()];
-      for (int i = 0; i < num_corners_on_source_vert; ++i, ++offset) {
-        // Find the first unused half-edge slot on the source vertex.
-        if (vertex_edges[offset].sink_vert == kInvalidVertexIndex) {
-          vertex_edges[offset].sink_vert = sink_v;
-          vertex_edges[offset].edge_corner = c;
-          break;
-        }
+      // No opposite corner found. Append the new half-edge to the list of the
+      // source vertex. |opposite_corners_[c]| is already invalid, which marks
+      // the end of the list.
+      const CornerIndex last_edge_c = last_vertex_edges[source_v];
+      if (last_edge_c == kInvalidCornerIndex) {
+        vertex_corners_[source_v] = c;
+      } else {
+        opposite_corners_[last_edge_c] = c;
       }
+      last_vertex_edges[source_v] = c;
     } else {
       // Opposite corner found.
       opposite_corners_[c] = opposite_c;
       opposite_corners_[opposite_c] = c;
     }
   }
-  *num_vertices = static_cast<int>(num_corners_on_vertices.size());
+
+  // Half-edges that remained in the lists don't have any opposite corner.
+  for (VertexIndex v(0); v < num_referenced_vertices; ++v) {
+    CornerIndex edge_c = vertex_corners_[v];
+    while (edge_c != kInvalidCornerIndex) {
+      const CornerIndex next_edge_c = opposite_corners_[edge_c];
+      opposite_corners_[edge_c] = kInvalidCornerIndex;
+      edge_c = next_edge_c;
+    }
+  }
+  vertex_corners_.clear();
+  *num_vertices = num_referenced_vertices;
   return true;
 }
 
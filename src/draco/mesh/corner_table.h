@@ -59,11 +59,22 @@ class CornerTable {
   static std::unique_ptr<CornerTable> Create(
       const IndexTypeVector<FaceIndex, FaceType> &faces);
 
+  // Same as Create() above but the faces are given by vertex indices of all
+  // corners, where each three consecutive corners define one face. The corner
+  // table takes ownership of the data, which avoids making a copy of the
+  // input faces.
+  static std::unique_ptr<CornerTable> Create(
+      IndexTypeVector<CornerIndex, VertexIndex> &&corner_to_vertex_map);
+
   // Initializes the CornerTable from provides set of indexed faces.
   // The input faces can represent a non-manifold topology, in which case the
   // non-manifold edges and vertices are going to be split.
   bool Init(const IndexTypeVector<FaceIndex, FaceType> &faces);
 
+  // Initializes the CornerTable from vertex indices of all corners. See
+  // Create() for more details.
+  bool Init(IndexTypeVector<CornerIndex, VertexIndex> &&corner_to_vertex_map);
+
   // Resets the corner table to the given number of invalid faces.
   bool Reset(int num_faces);
 
@@ -361,6 +372,10 @@ class CornerTable {
   }
 
  private:
+  // Computes the connectivity from the data stored in
+  // |corner_to_vertex_map_|.
+  bool ComputeConnectivity();
+
   // Computes opposite corners mapping from the data stored in
   // |corner_to_vertex_map_|.
   bool ComputeOppositeCorners(int *num_vertices);
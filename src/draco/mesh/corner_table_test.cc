@@ -1,6 +1,7 @@
 #include "draco/mesh/corner_table.h"
 
 #include <memory>
+#include <utility>
 
 #include "draco/core/draco_test_utils.h"
 #include "draco/io/obj_decoder.h"
@@ -123,4 +124,43 @@ TEST_F(CornerTableTest, TestNewFace) {
   ASSERT_EQ(ct->Vertex(CornerIndex(3 * 12) + 2), new_vi);
 }
 
+TEST_F(CornerTableTest, TestInitFromCornerToVertexMap) {
+  // Tests that a corner table initialized directly from the corner to vertex
+  // map is the same as the corner table initialized from faces.
+  std::unique_ptr<Mesh> mesh = DecodeObj("non_manifold_wrap.obj");
+  ASSERT_NE(mesh, nullptr);
+
+  IndexTypeVector<FaceIndex, CornerTable::FaceType> faces(mesh->num_faces());
+  IndexTypeVector<CornerIndex, VertexIndex> corner_to_vertex_map(
+      mesh->num_faces() * 3);
+  for (FaceIndex fi(0); fi < mesh->num_faces(); ++fi) {
+    for (int c = 0; c < 3; ++c) {
+      const VertexIndex vi(mesh->face(fi)[c].value());
+      faces[fi][c] = vi;
+      corner_to_vertex_map[CornerIndex(3 * fi.value() + c)] = vi;
+    }
+  }
+  std::unique_ptr<CornerTable> ct_faces = CornerTable::Create(faces);
+  ASSERT_NE(ct_faces, nullptr);
+  std::unique_ptr<CornerTable> ct =
+      CornerTable::Create(std::move(corner_to_vertex_map));
+  ASSERT_NE(ct, nullptr);
+
+  ASSERT_EQ(ct->num_faces(), ct_faces->num_faces());
+  ASSERT_EQ(ct->num_vertices(), ct_faces->num_vertices());
+  ASSERT_EQ(ct->NumNewVertices(), ct_faces->NumNewVertices());
+  ASSERT_EQ(ct->NumDegeneratedFaces(), ct_faces->NumDegeneratedFaces());
+  for (CornerIndex ci(0); ci < ct->num_corners(); ++ci) {
+    ASSERT_EQ(ct->Vertex(ci), ct_faces->Vertex(ci));
+    ASSERT_EQ(ct->Opposite(ci), ct_faces->Opposite(ci));
+  }
+  for (VertexIndex vi(0); vi < ct->num_vertices(); ++vi) {
+    ASSERT_EQ(ct->LeftMostCorner(vi), ct_faces->LeftMostCorner(vi));
+  }
+
+  // The number of corners must be a multiple of three.
+  IndexTypeVector<CornerIndex, VertexIndex> invalid_map(4);
+  ASSERT_EQ(CornerTable::Create(std::move(invalid_map)), nullptr);
+}
+
 }  // namespace draco
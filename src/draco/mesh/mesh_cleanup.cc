@@ -14,16 +14,84 @@
 //
 #include "draco/mesh/mesh_cleanup.h"
 
+#include <algorithm>
 #include <array>
+#include <atomic>
 #include <memory>
-#include <unordered_set>
 #include <utility>
 #include <vector>
 
-#include "draco/core/hash_utils.h"
+#include "draco/core/bit_utils.h"
+#include "draco/core/deduplication_utils.h"
+#include "draco/core/thread_pool.h"
 
 namespace draco {
 
+namespace {
+
+// Faces and points are processed in blocks of this size. Each block is
+// processed by a single thread.
+constexpr uint32_t kBlockSize = 1 << 16;
+
+int GetNumBlocks(uint32_t num_items) {
+  return static_cast<int>((static_cast<uint64_t>(num_items) + kBlockSize - 1) /
+                          kBlockSize);
+}
+
+uint32_t GetBlockBegin(int block) { return block * kBlockSize; }
+
+uint32_t GetBlockEnd(int block, uint32_t num_items) {
+  return std::min<uint32_t>(GetBlockBegin(block) + kBlockSize, num_items);
+}
+
+// Replaces all faces of |mesh| with |faces|.
+void SetFaces(const std::vector<Mesh::Face> &faces, int num_threads,
+              Mesh *mesh) {
+  const uint32_t num_faces = static_cast<uint32_t>(faces.size());
+  mesh->SetNumFaces(num_faces);
+  ParallelFor(num_threads, GetNumBlocks(num_faces), [&](int b) {
+    for (uint32_t f = GetBlockBegin(b); f < GetBlockEnd(b, num_faces); ++f) {
+      mesh->SetFace(FaceIndex(f), faces[f]);
+    }
+  });
+}
+
+// Removes all faces of |mesh| that are marked in |is_face_removed|. The
+// remaining faces keep their order.
+void RemoveFaces(const std::vector<uint8_t> &is_face_removed, int num_threads,
+                 Mesh *mesh) {
+  const uint32_t num_faces = mesh->num_faces();
+  const int num_blocks = GetNumBlocks(num_faces);
+  // Count the remaining faces in each block and turn the counts into offsets
+  // of the first remaining face of each block.
+  std::vector<uint32_t> block_offsets(num_blocks + 1, 0);
+  ParallelFor(num_threads, num_blocks, [&](int b) {
+    uint32_t num_remaining_faces = 0;
+    for (uint32_t f = GetBlockBegin(b); f < GetBlockEnd(b, num_faces); ++f) {
+      num_remaining_faces += !is_face_removed[f];
+    }
+    block_offsets[b + 1] = num_remaining_faces;
+  });
+  for (int b = 0; b < num_blocks; ++b) {
+    block_offsets[b + 1] += block_offsets[b];
+  }
+  if (block_offsets[num_blocks] == num_faces) {
+    return;  // No face was removed.
+  }
+  std::vector<Mesh::Face> faces(block_offsets[num_blocks]);
+  ParallelFor(num_threads, num_blocks, [&](int b) {
+    uint32_t offset = block_offsets[b];
+    for (uint32_t f = GetBlockBegin(b); f < GetBlockEnd(b, num_faces); ++f) {
+      if (!is_face_removed[f]) {
+        faces[offset++] = mesh->face(FaceIndex(f));
+      }
+    }
+  });
+  SetFaces(faces, num_threads, mesh);
+}
+
+}  // namespace
+
 Status MeshCleanup::Cleanup(Mesh *mesh, const MeshCleanupOptions &options) {
   if (!options.remove_degenerated_faces && !options.remove_unused_attributes &&
       !options.remove_duplicate_faces && !options.make_geometry_manifold) {
@@ -36,113 +104,161 @@ Status MeshCleanup::Cleanup(Mesh *mesh, const MeshCleanupOptions &options) {
   }
 
   if (options.remove_degenerated_faces) {
-    RemoveDegeneratedFaces(mesh);
+    RemoveDegeneratedFaces(mesh, options.num_threads);
   }
 
   if (options.remove_duplicate_faces) {
-    RemoveDuplicateFaces(mesh);
+    RemoveDuplicateFaces(mesh, options.num_threads);
   }
 
   if (options.remove_unused_attributes) {
-    RemoveUnusedAttributes(mesh);
+    RemoveUnusedAttributes(mesh, options.num_threads);
   }
 
   return OkStatus();
 }
 
-void MeshCleanup::RemoveDegeneratedFaces(Mesh *mesh) {
+void MeshCleanup::RemoveDegeneratedFaces(Mesh *mesh, int num_threads) {
   const PointAttribute *const pos_att =
       mesh->GetNamedAttribute(GeometryAttribute::POSITION);
-  FaceIndex::ValueType num_degenerated_faces = 0;
-  // Array for storing position indices on a face.
-  std::array<AttributeValueIndex, 3> pos_indices;
-  for (FaceIndex f(0); f < mesh->num_faces(); ++f) {
-    const Mesh::Face &face = mesh->face(f);
-    for (int p = 0; p < 3; ++p) {
-      pos_indices[p] = pos_att->mapped_index(face[p]);
-    }
-    if (pos_indices[0] == pos_indices[1] || pos_indices[0] == pos_indices[2] ||
-        pos_indices[1] == pos_indices[2]) {
-      ++num_degenerated_faces;
-    } else if (num_degenerated_faces > 0) {
-      // Copy the face to its new location.
-      mesh->SetFace(f - num_degenerated_faces, face);
+  const uint32_t num_faces = mesh->num_faces();
+  std::vector<uint8_t> is_face_degenerated(num_faces);
+  ParallelFor(num_threads, GetNumBlocks(num_faces), [&](int b) {
+    // Array for storing position indices on a face.
+    std::array<AttributeValueIndex, 3> pos_indices;
+    for (FaceIndex f(GetBlockBegin(b)); f < GetBlockEnd(b, num_faces); ++f) {
+      const Mesh::Face &face = mesh->face(f);
+      for (int p = 0; p < 3; ++p) {
+        pos_indices[p] = pos_att->mapped_index(face[p]);
+      }
+      is_face_degenerated[f.value()] = pos_indices[0] == pos_indices[1] ||
+                                       pos_indices[0] == pos_indices[2] ||
+                                       pos_indices[1] == pos_indices[2];
     }
-  }
-  if (num_degenerated_faces > 0) {
-    mesh->SetNumFaces(mesh->num_faces() - num_degenerated_faces);
-  }
+  });
+  RemoveFaces(is_face_degenerated, num_threads, mesh);
 }
 
-void MeshCleanup::RemoveDuplicateFaces(Mesh *mesh) {
-  std::unordered_set<Mesh::Face, HashArray<Mesh::Face>> is_face_used;
-
-  uint32_t num_duplicate_faces = 0;
-  for (FaceIndex fi(0); fi < mesh->num_faces(); ++fi) {
-    auto face = mesh->face(fi);
+void MeshCleanup::RemoveDuplicateFaces(Mesh *mesh, int num_threads) {
+  const uint32_t num_faces = mesh->num_faces();
+  std::vector<Mesh::Face> rotated_faces(num_faces);
+  ParallelFor(num_threads, GetNumBlocks(num_faces), [&](int b) {
+    for (FaceIndex fi(GetBlockBegin(b)); fi < GetBlockEnd(b, num_faces);
+         ++fi) {
+      auto face = mesh->face(fi);
 
-    // Shift the face indices until the smallest index is the first one.
-    while (face[0] > face[1] || face[0] > face[2]) {
-      // Shift to the left.
-      std::swap(face[0], face[1]);
-      std::swap(face[1], face[2]);
-    }
-    // Check if have encountered the same face before.
-    if (is_face_used.find(face) != is_face_used.end()) {
-      // Duplicate face. Ignore it.
-      num_duplicate_faces++;
-    } else {
-      // Insert new face to the set.
-      is_face_used.insert(face);
-      if (num_duplicate_faces > 0) {
-        // Copy the face to its new location.
-        mesh->SetFace(fi - num_duplicate_faces, face);
+      // Shift the face indices until the smallest index is the first one.
+      while (face[0] > face[1] || face[0] > face[2]) {
+        // Shift to the left.
+        std::swap(face[0], face[1]);
+        std::swap(face[1], face[2]);
       }
+      rotated_faces[fi.value()] = face;
     }
+  });
+
+  // Find the first occurrence of every rotated face.
+  std::vector<uint32_t> face_ids;
+  std::vector<uint32_t> unique_faces;
+  const uint32_t num_unique_faces = DeduplicateRecords(
+      reinterpret_cast<const uint8_t *>(rotated_faces.data()),
+      sizeof(Mesh::Face), sizeof(Mesh::Face), num_faces, num_threads,
+      &face_ids, &unique_faces);
+  if (num_unique_faces == num_faces) {
+    return;  // No duplicate faces.
   }
-  if (num_duplicate_faces > 0) {
-    mesh->SetNumFaces(mesh->num_faces() - num_duplicate_faces);
-  }
+
+  std::vector<Mesh::Face> faces(num_unique_faces);
+  ParallelFor(num_threads, GetNumBlocks(num_unique_faces), [&](int b) {
+    for (uint32_t i = GetBlockBegin(b); i < GetBlockEnd(b, num_unique_faces);
+         ++i) {
+      // Faces that precede the first duplicate are not moved and they keep
+      // their original orientation.
+      const uint32_t f = unique_faces[i];
+      faces[i] = f == i ? mesh->face(FaceIndex(f)) : rotated_faces[f];
+    }
+  });
+  SetFaces(faces, num_threads, mesh);
 }
 
-void MeshCleanup::RemoveUnusedAttributes(Mesh *mesh) {
-  // Array that is going to store whether a corresponding point is used.
-  std::vector<bool> is_point_used;
-  PointIndex::ValueType num_new_points = 0;
-  is_point_used.resize(mesh->num_points(), false);
-  for (FaceIndex f(0); f < mesh->num_faces(); ++f) {
-    const Mesh::Face &face = mesh->face(f);
-    for (int p = 0; p < 3; ++p) {
-      if (!is_point_used[face[p].value()]) {
-        is_point_used[face[p].value()] = true;
-        ++num_new_points;
+void MeshCleanup::RemoveUnusedAttributes(Mesh *mesh, int num_threads) {
+  const PointIndex::ValueType num_original_points = mesh->num_points();
+  const uint32_t num_faces = mesh->num_faces();
+
+  // Bit mask that is going to store whether a corresponding point is used.
+  // Faces are processed in parallel so the bits are set atomically.
+  std::vector<std::atomic<uint32_t>> is_point_used((num_original_points + 31) /
+                                                   32);
+  for (std::atomic<uint32_t> &word : is_point_used) {
+    word.store(0, std::memory_order_relaxed);
+  }
+  ParallelFor(num_threads, GetNumBlocks(num_faces), [&](int b) {
+    for (FaceIndex f(GetBlockBegin(b)); f < GetBlockEnd(b, num_faces); ++f) {
+      const Mesh::Face &face = mesh->face(f);
+      for (int p = 0; p < 3; ++p) {
+        const uint32_t point = face[p].value();
+        std::atomic<uint32_t> &word = is_point_used[point / 32];
+        const uint32_t bit = 1u << (point % 32);
+        // Most points are shared by several faces. Avoid the atomic update
+        // when the bit is already set.
+        if (!(word.load(std::memory_order_relaxed) & bit)) {
+          word.fetch_or(bit, std::memory_order_relaxed);
+        }
       }
     }
+  });
+  const auto is_used = [&is_point_used](uint32_t point) {
+    return (is_point_used[point / 32].load(std::memory_order_relaxed) >>
+            (point % 32)) &
+           1;
+  };
+
+  // Count the used points in each block of points. The blocks are aligned
+  // with the words of the mask.
+  const int num_point_blocks = GetNumBlocks(num_original_points);
+  std::vector<uint32_t> block_offsets(num_point_blocks + 1, 0);
+  ParallelFor(num_threads, num_point_blocks, [&](int b) {
+    const uint32_t begin_word = GetBlockBegin(b) / 32;
+    const uint32_t end_word = (GetBlockEnd(b, num_original_points) + 31) / 32;
+    uint32_t num_used_points = 0;
+    for (uint32_t w = begin_word; w < end_word; ++w) {
+      num_used_points +=
+          CountOneBits32(is_point_used[w].load(std::memory_order_relaxed));
+    }
+    block_offsets[b + 1] = num_used_points;
+  });
+  for (int b = 0; b < num_point_blocks; ++b) {
+    block_offsets[b + 1] += block_offsets[b];
   }
+  const PointIndex::ValueType num_new_points = block_offsets[num_point_blocks];
 
   bool points_changed = false;
-  const PointIndex::ValueType num_original_points = mesh->num_points();
   // Map from old points to the new ones.
   IndexTypeVector<PointIndex, PointIndex> point_map(num_original_points);
-  if (num_new_points < static_cast<int>(mesh->num_points())) {
+  if (num_new_points < num_original_points) {
     // Some of the points were removed. We need to remap the old points to the
     // new ones.
-    num_new_points = 0;
-    for (PointIndex i(0); i < num_original_points; ++i) {
-      if (is_point_used[i.value()]) {
-        point_map[i] = num_new_points++;
-      } else {
-        point_map[i] = kInvalidPointIndex;
+    ParallelFor(num_threads, num_point_blocks, [&](int b) {
+      PointIndex::ValueType new_point = block_offsets[b];
+      for (PointIndex i(GetBlockBegin(b));
+           i < GetBlockEnd(b, num_original_points); ++i) {
+        if (is_used(i.value())) {
+          point_map[i] = new_point++;
+        } else {
+          point_map[i] = kInvalidPointIndex;
+        }
       }
-    }
+    });
     // Go over faces and update their points.
-    for (FaceIndex f(0); f < mesh->num_faces(); ++f) {
-      Mesh::Face face = mesh->face(f);
-      for (int p = 0; p < 3; ++p) {
-        face[p] = point_map[face[p]];
+    ParallelFor(num_threads, GetNumBlocks(num_faces), [&](int b) {
+      for (FaceIndex f(GetBlockBegin(b)); f < GetBlockEnd(b, num_faces); ++f) {
+        Mesh::Face face = mesh->face(f);
+        for (int p = 0; p < 3; ++p) {
+          face[p] = point_map[face[p]];
+        }
+        mesh->SetFace(f, face);
       }
-      mesh->SetFace(f, face);
-    }
+    });
     // Set the new number of points.
     mesh->set_num_points(num_new_points);
     points_changed = true;
@@ -154,14 +270,14 @@ void MeshCleanup::RemoveUnusedAttributes(Mesh *mesh) {
     }
   }
 
-  // Update index mapping for attributes.
-  IndexTypeVector<AttributeValueIndex, uint8_t> is_att_index_used;
-  IndexTypeVector<AttributeValueIndex, AttributeValueIndex> att_index_map;
-  for (int a = 0; a < mesh->num_attributes(); ++a) {
+  // Update index mapping for attributes. Attributes are independent of each
+  // other so they can be processed in parallel.
+  ParallelFor(num_threads, mesh->num_attributes(), [&](int a) {
     PointAttribute *const att = mesh->attribute(a);
     // First detect which attribute entries are used (included in a point).
-    is_att_index_used.assign(att->size(), 0);
-    att_index_map.clear();
+    IndexTypeVector<AttributeValueIndex, uint8_t> is_att_index_used(
+        att->size(), 0);
+    IndexTypeVector<AttributeValueIndex, AttributeValueIndex> att_index_map;
     AttributeValueIndex::ValueType num_used_entries = 0;
     for (PointIndex i(0); i < num_original_points; ++i) {
       if (point_map[i] != kInvalidPointIndex) {
@@ -238,7 +354,7 @@ void MeshCleanup::RemoveUnusedAttributes(Mesh *mesh) {
         att->SetExplicitMapping(mesh->num_points());
       }
     }
-  }
+  });
 }
 
 Status MeshCleanup::MakeGeometryManifold(Mesh *mesh) {
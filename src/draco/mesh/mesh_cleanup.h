@@ -41,6 +41,10 @@ struct MeshCleanupOptions {
   // vertices. This ensures that the connectivity defined by position indices
   // is manifold.
   bool make_geometry_manifold = false;
+
+  // Number of threads used by the cleanup. The result is the same for any
+  // number of threads.
+  int num_threads = 1;
 };
 
 // Tool that can be used for removing bad or unused data from draco::Meshes.
@@ -50,9 +54,9 @@ class MeshCleanup {
   static Status Cleanup(Mesh *mesh, const MeshCleanupOptions &options);
 
  private:
-  static void RemoveDegeneratedFaces(Mesh *mesh);
-  static void RemoveDuplicateFaces(Mesh *mesh);
-  static void RemoveUnusedAttributes(Mesh *mesh);
+  static void RemoveDegeneratedFaces(Mesh *mesh, int num_threads);
+  static void RemoveDuplicateFaces(Mesh *mesh, int num_threads);
+  static void RemoveUnusedAttributes(Mesh *mesh, int num_threads);
   static Status MakeGeometryManifold(Mesh *mesh);
 };
 
@@ -207,4 +207,72 @@ TEST_F(MeshCleanupTest, TestDuplicateFaces) {
   ASSERT_EQ(mesh->num_faces(), 3);
 }
 
+// Creates a grid mesh with enough faces to be processed in multiple blocks.
+// The mesh contains degenerate faces, duplicate faces and unused points.
+std::unique_ptr<Mesh> CreateLargeTestMesh() {
+  const int grid_size = 300;
+  std::unique_ptr<Mesh> mesh(new Mesh());
+  // Add one unused point after every grid row.
+  const int num_points = grid_size * (grid_size + 1);
+  mesh->set_num_points(num_points);
+  GeometryAttribute pos_att;
+  pos_att.Init(GeometryAttribute::POSITION, nullptr, 3, DT_FLOAT32, false,
+               sizeof(float) * 3, 0);
+  const int pos_att_id = mesh->AddAttribute(pos_att, true, num_points);
+  for (int i = 0; i < num_points; ++i) {
+    const Vector3f pos(static_cast<float>(i % (grid_size + 1)),
+                       static_cast<float>(i / (grid_size + 1)), 0.f);
+    mesh->attribute(pos_att_id)
+        ->SetAttributeValue(AttributeValueIndex(i), pos.data());
+  }
+  const auto point = [grid_size](int x, int y) {
+    return PointIndex(y * (grid_size + 1) + x);
+  };
+  for (int y = 0; y + 1 < grid_size; ++y) {
+    for (int x = 0; x + 1 < grid_size; ++x) {
+      mesh->AddFace({{point(x, y), point(x + 1, y), point(x, y + 1)}});
+      mesh->AddFace({{point(x + 1, y), point(x + 1, y + 1), point(x, y + 1)}});
+      if ((x + y) % 7 == 0) {
+        // Rotated copy of the previous face.
+        mesh->AddFace(
+            {{point(x + 1, y + 1), point(x, y + 1), point(x + 1, y)}});
+      }
+      if ((x * y) % 11 == 0) {
+        mesh->AddFace({{point(x, y), point(x, y), point(x + 1, y)}});
+      }
+    }
+  }
+  return mesh;
+}
+
+TEST_F(MeshCleanupTest, TestMultithreadedCleanup) {
+  // This test verifies that the result of the cleanup does not depend on the
+  // number of threads.
+  std::unique_ptr<Mesh> mesh = CreateLargeTestMesh();
+  const uint32_t num_input_faces = mesh->num_faces();
+  const uint32_t num_input_points = mesh->num_points();
+  MeshCleanupOptions cleanup_options;
+  DRACO_ASSERT_OK(MeshCleanup::Cleanup(mesh.get(), cleanup_options));
+  ASSERT_LT(mesh->num_faces(), num_input_faces);
+  ASSERT_LT(mesh->num_points(), num_input_points);
+
+  std::unique_ptr<Mesh> mt_mesh = CreateLargeTestMesh();
+  cleanup_options.num_threads = 4;
+  DRACO_ASSERT_OK(MeshCleanup::Cleanup(mt_mesh.get(), cleanup_options));
+  ASSERT_EQ(mt_mesh->num_faces(), mesh->num_faces());
+  ASSERT_EQ(mt_mesh->num_points(), mesh->num_points());
+  for (FaceIndex f(0); f < mesh->num_faces(); ++f) {
+    ASSERT_EQ(mt_mesh->face(f), mesh->face(f));
+  }
+  const PointAttribute *const pos_att = mesh->attribute(0);
+  const PointAttribute *const mt_pos_att = mt_mesh->attribute(0);
+  ASSERT_EQ(mt_pos_att->size(), pos_att->size());
+  for (PointIndex i(0); i < mesh->num_points(); ++i) {
+    Vector3f pos, mt_pos;
+    pos_att->GetMappedValue(i, pos.data());
+    mt_pos_att->GetMappedValue(i, mt_pos.data());
+    ASSERT_EQ(mt_pos, pos);
+  }
+}
+
 }  // namespace draco
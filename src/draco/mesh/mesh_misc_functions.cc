@@ -14,6 +14,8 @@
 //
 #include "draco/mesh/mesh_misc_functions.h"
 
+#include <utility>
+
 namespace draco {
 
 std::unique_ptr<CornerTable> CreateCornerTableFromPositionAttribute(
@@ -23,41 +25,40 @@ std::unique_ptr<CornerTable> CreateCornerTableFromPositionAttribute(
 
 std::unique_ptr<CornerTable> CreateCornerTableFromAttribute(
     const Mesh *mesh, GeometryAttribute::Type type) {
-  typedef CornerTable::FaceType FaceType;
-
   const PointAttribute *const att = mesh->GetNamedAttribute(type);
   if (att == nullptr) {
     return nullptr;
   }
-  IndexTypeVector<FaceIndex, FaceType> faces(mesh->num_faces());
-  FaceType new_face;
+  // Fill the corner to vertex map directly to avoid building an intermediate
+  // copy of all faces.
+  IndexTypeVector<CornerIndex, VertexIndex> corner_to_vertex_map(
+      mesh->num_faces() * 3);
+  CornerIndex ci(0);
   for (FaceIndex i(0); i < mesh->num_faces(); ++i) {
     const Mesh::Face &face = mesh->face(i);
-    for (int j = 0; j < 3; ++j) {
+    for (int j = 0; j < 3; ++j, ++ci) {
       // Map general vertex indices to attribute indices.
-      new_face[j] = att->mapped_index(face[j]).value();
+      corner_to_vertex_map[ci] = att->mapped_index(face[j]).value();
     }
-    faces[FaceIndex(i)] = new_face;
   }
   // Build the corner table.
-  return CornerTable::Create(faces);
+  return CornerTable::Create(std::move(corner_to_vertex_map));
 }
 
 std::unique_ptr<CornerTable> CreateCornerTableFromAllAttributes(
     const Mesh *mesh) {
-  typedef CornerTable::FaceType FaceType;
-  IndexTypeVector<FaceIndex, FaceType> faces(mesh->num_faces());
-  FaceType new_face;
+  IndexTypeVector<CornerIndex, VertexIndex> corner_to_vertex_map(
+      mesh->num_faces() * 3);
+  CornerIndex ci(0);
   for (FaceIndex i(0); i < mesh->num_faces(); ++i) {
     const Mesh::Face &face = mesh->face(i);
     // Each face is identified by point indices that automatically split the
     // mesh along attribute seams.
-    for (int j = 0; j < 3; ++j) {
-      new_face[j] = face[j].value();
+    for (int j = 0; j < 3; ++j, ++ci) {
+      corner_to_vertex_map[ci] = face[j].value();
     }
-    faces[i] = new_face;
   }
   // Build the corner table.
-  return CornerTable::Create(faces);
+  return CornerTable::Create(std::move(corner_to_vertex_map));
 }
 }  // namespace draco
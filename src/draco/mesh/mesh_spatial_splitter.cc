@@ -0,0 +1,232 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/mesh/mesh_spatial_splitter.h"
+
+#include <algorithm>
+#include <utility>
+
+#include "draco/core/bounding_box.h"
+#include "draco/core/vector_d.h"
+
+namespace draco {
+
+namespace {
+
+// Helper class that builds sub-meshes of a single source mesh. The mapping
+// between the source and the sub-mesh indices is kept in vectors that are
+// reused for all extracted sub-meshes so the cost of each extraction is
+// proportional to the size of the sub-mesh.
+class SubMeshExtractor {
+ public:
+  explicit SubMeshExtractor(const Mesh &mesh)
+      : mesh_(mesh),
+        point_map_(mesh.num_points(), kInvalidPointIndex),
+        value_maps_(mesh.num_attributes()) {
+    for (int att_id = 0; att_id < mesh.num_attributes(); ++att_id) {
+      const PointAttribute *const att = mesh.attribute(att_id);
+      if (!att->is_mapping_identity()) {
+        value_maps_[att_id].resize(att->size(), kInvalidAttributeValueIndex);
+      }
+    }
+  }
+
+  std::unique_ptr<Mesh> Extract(const std::vector<FaceIndex> &faces) {
+    std::unique_ptr<Mesh> sub_mesh(new Mesh());
+
+    // Map the points of the source faces to the points of the sub-mesh in the
+    // order of their first use.
+    source_points_.clear();
+    sub_mesh->SetNumFaces(faces.size());
+    for (FaceIndex::ValueType fi = 0; fi < faces.size(); ++fi) {
+      const Mesh::Face &source_face = mesh_.face(faces[fi]);
+      Mesh::Face face;
+      for (int c = 0; c < 3; ++c) {
+        const PointIndex source_pi = source_face[c];
+        if (point_map_[source_pi] == kInvalidPointIndex) {
+          point_map_[source_pi] =
+              PointIndex(static_cast<uint32_t>(source_points_.size()));
+          source_points_.push_back(source_pi);
+        }
+        face[c] = point_map_[source_pi];
+      }
+      sub_mesh->SetFace(FaceIndex(fi), face);
+    }
+    sub_mesh->set_num_points(static_cast<uint32_t>(source_points_.size()));
+
+    for (int att_id = 0; att_id < mesh_.num_attributes(); ++att_id) {
+      CopyAttribute(att_id, sub_mesh.get());
+    }
+    if (mesh_.GetMetadata() != nullptr) {
+      sub_mesh->AddMetadata(std::unique_ptr<GeometryMetadata>(
+          new GeometryMetadata(*mesh_.GetMetadata())));
+    }
+
+    // Reset the point mapping for the next extraction.
+    for (const PointIndex source_pi : source_points_) {
+      point_map_[source_pi] = kInvalidPointIndex;
+    }
+    return sub_mesh;
+  }
+
+ private:
+  void CopyAttribute(int att_id, Mesh *sub_mesh) {
+    const PointAttribute *const att = mesh_.attribute(att_id);
+    const uint32_t num_points = static_cast<uint32_t>(source_points_.size());
+    std::unique_ptr<PointAttribute> sub_att;
+    if (att->is_mapping_identity()) {
+      sub_att = sub_mesh->CreateAttribute(*att, true, num_points);
+      for (PointIndex pi(0); pi < num_points; ++pi) {
+        sub_att->SetAttributeValue(
+            AttributeValueIndex(pi.value()),
+            att->GetAddress(AttributeValueIndex(source_points_[pi.value()]
+                                                    .value())));
+      }
+    } else {
+      // Collect the used attribute values in the order of their first use.
+      IndexTypeVector<AttributeValueIndex, AttributeValueIndex> &value_map =
+          value_maps_[att_id];
+      source_values_.clear();
+      for (PointIndex pi(0); pi < num_points; ++pi) {
+        const AttributeValueIndex source_avi =
+            att->mapped_index(source_points_[pi.value()]);
+        if (value_map[source_avi] == kInvalidAttributeValueIndex) {
+          value_map[source_avi] = AttributeValueIndex(
+              static_cast<uint32_t>(source_values_.size()));
+          source_values_.push_back(source_avi);
+        }
+      }
+      sub_att = sub_mesh->CreateAttribute(
+          *att, false, static_cast<uint32_t>(source_values_.size()));
+      for (PointIndex pi(0); pi < num_points; ++pi) {
+        sub_att->SetPointMapEntry(
+            pi, value_map[att->mapped_index(source_points_[pi.value()])]);
+      }
+      for (uint32_t i = 0; i < source_values_.size(); ++i) {
+        sub_att->SetAttributeValue(AttributeValueIndex(i),
+                                   att->GetAddress(source_values_[i]));
+        value_map[source_values_[i]] = kInvalidAttributeValueIndex;
+      }
+    }
+    const int sub_att_id = sub_mesh->AddAttribute(std::move(sub_att));
+    sub_mesh->attribute(sub_att_id)->set_unique_id(att->unique_id());
+    sub_mesh->SetAttributeElementType(sub_att_id,
+                                      mesh_.GetAttributeElementType(att_id));
+  }
+
+  const Mesh &mesh_;
+  IndexTypeVector<PointIndex, PointIndex> point_map_;
+  std::vector<IndexTypeVector<AttributeValueIndex, AttributeValueIndex>>
+      value_maps_;
+  std::vector<PointIndex> source_points_;
+  std::vector<AttributeValueIndex> source_values_;
+};
+
+}  // namespace
+
+MeshSpatialSplitter::MeshSpatialSplitter() : max_faces_per_chunk_(65536) {}
+
+StatusOr<MeshSpatialSplitter::MeshVector> MeshSpatialSplitter::SplitMesh(
+    const Mesh &mesh) const {
+  DRACO_ASSIGN_OR_RETURN(const std::vector<std::vector<FaceIndex>> chunk_faces,
+                         ComputeChunkFaces(mesh));
+  MeshVector meshes;
+  meshes.reserve(chunk_faces.size());
+  SubMeshExtractor extractor(mesh);
+  for (const std::vector<FaceIndex> &faces : chunk_faces) {
+    meshes.push_back(extractor.Extract(faces));
+  }
+  return std::move(meshes);
+}
+
+StatusOr<std::vector<std::vector<FaceIndex>>>
+MeshSpatialSplitter::ComputeChunkFaces(const Mesh &mesh) const {
+  if (max_faces_per_chunk_ <= 0) {
+    return Status(Status::INVALID_PARAMETER,
+                  "Maximum number of faces per chunk must be positive.");
+  }
+  const PointAttribute *const pos_att =
+      mesh.GetNamedAttribute(GeometryAttribute::POSITION);
+  if (pos_att == nullptr) {
+    return Status(Status::DRACO_ERROR, "Mesh has no position attribute.");
+  }
+
+  // Compute the centroids of all faces.
+  std::vector<Vector3f> centroids(mesh.num_faces());
+  for (FaceIndex fi(0); fi < mesh.num_faces(); ++fi) {
+    const Mesh::Face &face = mesh.face(fi);
+    Vector3f centroid(0.f, 0.f, 0.f);
+    for (int c = 0; c < 3; ++c) {
+      Vector3f pos;
+      if (!pos_att->ConvertValue<float, 3>(pos_att->mapped_index(face[c]),
+                                           &pos[0])) {
+        return Status(Status::DRACO_ERROR, "Failed to read face position.");
+      }
+      centroid += pos;
+    }
+    centroids[fi.value()] = centroid / 3.f;
+  }
+
+  std::vector<FaceIndex> faces(mesh.num_faces());
+  for (FaceIndex fi(0); fi < mesh.num_faces(); ++fi) {
+    faces[fi.value()] = fi;
+  }
+
+  // Recursively split the faces at the median centroid along the longest axis
+  // of the centroid bounds. Ranges are processed depth first so that the
+  // chunks from the same part of the tree end up next to each other.
+  std::vector<std::vector<FaceIndex>> chunk_faces;
+  std::vector<std::pair<size_t, size_t>> ranges;
+  if (!faces.empty()) {
+    ranges.push_back(std::make_pair(0, faces.size()));
+  }
+  while (!ranges.empty()) {
+    const size_t begin = ranges.back().first;
+    const size_t end = ranges.back().second;
+    ranges.pop_back();
+    if (end - begin <= static_cast<size_t>(max_faces_per_chunk_)) {
+      // Keep the source order of the faces within the chunk.
+      std::sort(faces.begin() + begin, faces.begin() + end);
+      chunk_faces.push_back(std::vector<FaceIndex>(faces.begin() + begin,
+                                                   faces.begin() + end));
+      continue;
+    }
+    BoundingBox bounds;
+    for (size_t i = begin; i < end; ++i) {
+      bounds.Update(centroids[faces[i].value()]);
+    }
+    const Vector3f size = bounds.Size();
+    int axis = 0;
+    if (size[1] > size[axis]) {
+      axis = 1;
+    }
+    if (size[2] > size[axis]) {
+      axis = 2;
+    }
+    const size_t mid = begin + (end - begin) / 2;
+    std::nth_element(faces.begin() + begin, faces.begin() + mid,
+                     faces.begin() + end,
+                     [&centroids, axis](FaceIndex a, FaceIndex b) {
+                       const float ca = centroids[a.value()][axis];
+                       const float cb = centroids[b.value()][axis];
+                       return ca < cb || (ca == cb && a < b);
+                     });
+    // Push the second half first so that the first half is processed next.
+    ranges.push_back(std::make_pair(mid, end));
+    ranges.push_back(std::make_pair(begin, mid));
+  }
+  return std::move(chunk_faces);
+}
+
+}  // namespace draco
@@ -0,0 +1,61 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_MESH_MESH_SPATIAL_SPLITTER_H_
+#define DRACO_MESH_MESH_SPATIAL_SPLITTER_H_
+
+#include <memory>
+#include <vector>
+
+#include "draco/core/status_or.h"
+#include "draco/mesh/mesh.h"
+
+namespace draco {
+
+// Class that splits a single mesh into spatially coherent sub-meshes (chunks).
+// The faces are recursively partitioned by the median of their centroids
+// along the longest axis of the centroid bounds until each chunk contains at
+// most a given number of faces. Unlike MeshSplitter, the split doesn't depend
+// on any attribute values and the splitter is available in all builds.
+class MeshSpatialSplitter {
+ public:
+  typedef std::vector<std::unique_ptr<Mesh>> MeshVector;
+  MeshSpatialSplitter();
+
+  // Sets the maximum number of faces stored in a single chunk. Must be
+  // positive.
+  // Default = 65536.
+  void SetMaxFacesPerChunk(int max_faces) { max_faces_per_chunk_ = max_faces; }
+
+  // Splits the input |mesh| into chunks. Each chunk contains only the points
+  // and attribute values used by its faces. All attributes keep their ids and
+  // unique ids, and the geometry metadata is copied to every chunk. The chunks
+  // are ordered so that spatially close chunks are next to each other. The
+  // mesh must contain a position attribute. A mesh without faces results in
+  // no chunks.
+  StatusOr<MeshVector> SplitMesh(const Mesh &mesh) const;
+
+  // Same as SplitMesh() but the faces of each chunk are returned as indices
+  // of the source |mesh| faces (in increasing order), without building the
+  // sub-meshes.
+  StatusOr<std::vector<std::vector<FaceIndex>>> ComputeChunkFaces(
+      const Mesh &mesh) const;
+
+ private:
+  int max_faces_per_chunk_;
+};
+
+}  // namespace draco
+
+#endif  // DRACO_MESH_MESH_SPATIAL_SPLITTER_H_
@@ -0,0 +1,113 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/mesh/mesh_spatial_splitter.h"
+
+#include <cstring>
+#include <vector>
+
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+
+namespace draco {
+
+namespace {
+
+// Verifies that all attribute values of the |chunk| faces match the values of
+// the corresponding |source_faces| of the |mesh|.
+void VerifyChunkValues(const Mesh &mesh, const Mesh &chunk,
+                       const std::vector<FaceIndex> &source_faces) {
+  ASSERT_EQ(chunk.num_faces(), source_faces.size());
+  ASSERT_EQ(chunk.num_attributes(), mesh.num_attributes());
+  for (int att_id = 0; att_id < mesh.num_attributes(); ++att_id) {
+    const PointAttribute *const att = mesh.attribute(att_id);
+    const PointAttribute *const chunk_att = chunk.attribute(att_id);
+    ASSERT_EQ(chunk_att->attribute_type(), att->attribute_type());
+    ASSERT_EQ(chunk_att->unique_id(), att->unique_id());
+    ASSERT_LE(chunk_att->size(), att->size());
+    const int entry_size = DataTypeLength(att->data_type()) *
+                           att->num_components();
+    for (FaceIndex fi(0); fi < chunk.num_faces(); ++fi) {
+      for (int c = 0; c < 3; ++c) {
+        const PointIndex source_pi = mesh.face(source_faces[fi.value()])[c];
+        const PointIndex chunk_pi = chunk.face(fi)[c];
+        ASSERT_EQ(memcmp(att->GetAddressOfMappedIndex(source_pi),
+                         chunk_att->GetAddressOfMappedIndex(chunk_pi),
+                         entry_size),
+                  0);
+      }
+    }
+  }
+}
+
+}  // namespace
+
+TEST(MeshSpatialSplitterTest, TestSplitToChunks) {
+  // Tests that the chunks cover all faces of the source mesh and that they
+  // preserve all attribute values.
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("bun_zipper.ply");
+  ASSERT_NE(mesh, nullptr);
+
+  MeshSpatialSplitter splitter;
+  splitter.SetMaxFacesPerChunk(1000);
+  DRACO_ASSIGN_OR_ASSERT(const auto chunk_faces,
+                         splitter.ComputeChunkFaces(*mesh));
+  DRACO_ASSIGN_OR_ASSERT(const auto chunks, splitter.SplitMesh(*mesh));
+  ASSERT_EQ(chunks.size(), chunk_faces.size());
+  ASSERT_GE(chunks.size(), mesh->num_faces() / 1000);
+
+  std::vector<bool> is_face_used(mesh->num_faces(), false);
+  for (size_t i = 0; i < chunks.size(); ++i) {
+    ASSERT_LE(chunk_faces[i].size(), 1000);
+    for (const FaceIndex fi : chunk_faces[i]) {
+      ASSERT_FALSE(is_face_used[fi.value()]);
+      is_face_used[fi.value()] = true;
+    }
+    VerifyChunkValues(*mesh, *chunks[i], chunk_faces[i]);
+  }
+  for (const bool is_used : is_face_used) {
+    ASSERT_TRUE(is_used);
+  }
+}
+
+TEST(MeshSpatialSplitterTest, TestSplitWithAttributeSeams) {
+  // Tests splitting of a mesh with explicitly mapped attributes.
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh, nullptr);
+
+  MeshSpatialSplitter splitter;
+  splitter.SetMaxFacesPerChunk(3);
+  DRACO_ASSIGN_OR_ASSERT(const auto chunk_faces,
+                         splitter.ComputeChunkFaces(*mesh));
+  DRACO_ASSIGN_OR_ASSERT(const auto chunks, splitter.SplitMesh(*mesh));
+  ASSERT_EQ(chunks.size(), 4);
+  for (size_t i = 0; i < chunks.size(); ++i) {
+    VerifyChunkValues(*mesh, *chunks[i], chunk_faces[i]);
+  }
+}
+
+TEST(MeshSpatialSplitterTest, TestInvalidInput) {
+  const std::unique_ptr<Mesh> mesh = ReadMeshFromTestFile("cube_att.obj");
+  ASSERT_NE(mesh, nullptr);
+  MeshSpatialSplitter splitter;
+  splitter.SetMaxFacesPerChunk(0);
+  ASSERT_FALSE(splitter.SplitMesh(*mesh).ok());
+
+  // A mesh without positions can't be split.
+  Mesh empty_mesh;
+  splitter.SetMaxFacesPerChunk(10);
+  ASSERT_FALSE(splitter.SplitMesh(empty_mesh).ok());
+}
+
+}  // namespace draco
@@ -14,6 +14,8 @@
 //
 #include "draco/mesh/mesh_utils.h"
 
+#include <algorithm>
+#include <array>
 #include <unordered_map>
 #include <unordered_set>
 #include <vector>
@@ -21,6 +23,7 @@
 #ifdef DRACO_TRANSCODER_SUPPORTED
 #include "draco/attributes/attribute_quantization_transform.h"
 #include "draco/core/quantization_utils.h"
+#include "draco/core/thread_pool.h"
 
 namespace draco {
 
@@ -339,7 +342,8 @@ int MeshUtils::CountDegenerateFaces(const Mesh &mesh, int att_id) {
 
 StatusOr<int> MeshUtils::FindLowestTextureQuantization(
     const Mesh &mesh, const PointAttribute &pos_att, int pos_quantization_bits,
-    const PointAttribute &tex_att, int tex_target_quantization_bits) {
+    const PointAttribute &tex_att, int tex_target_quantization_bits,
+    int num_threads) {
   if (tex_target_quantization_bits < 0 || tex_target_quantization_bits >= 30) {
     return Status(Status::DRACO_ERROR,
                   "Target texture quantization is out of range.");
@@ -361,7 +365,8 @@ StatusOr<int> MeshUtils::FindLowestTextureQuantization(
   // because the faces would not have been rendered anyway.
   const std::vector<FaceIndex> pos_degenerate_faces_sorted =
       MeshUtils::ListDegenerateQuantizedFaces(
-          mesh, pos_att, pos_transform.range(), pos_max_quantized_value, false);
+          mesh, pos_att, pos_transform.range(), pos_max_quantized_value, false,
+          num_threads);
 
   // Initialize return value to zero signifying that it could not find a
   // quantization that did not cause any new degenerate faces.
@@ -385,8 +390,10 @@ StatusOr<int> MeshUtils::FindLowestTextureQuantization(
     // take into account those faces in the source, because those faces would
     // not have been rendered correctly anyway.
     const std::vector<FaceIndex> tex_degenerate_faces_sorted =
-        MeshUtils::ListDegenerateQuantizedFaces(
-            mesh, tex_att, transform.range(), max_quantized_value, true);
+        MeshUtils::ListDegenerateQuantizedFaces(mesh, tex_att,
+                                                transform.range(),
+                                                max_quantized_value, true,
+                                                num_threads);
 
     if (tex_degenerate_faces_sorted.size() <=
         pos_degenerate_faces_sorted.size()) {
@@ -457,21 +464,25 @@ int MeshUtils::CountDegenerateFaces(const Mesh &mesh,
 
 std::vector<FaceIndex> MeshUtils::ListDegenerateQuantizedFaces(
     const Mesh &mesh, const PointAttribute &att, float range,
-    uint32_t max_quantized_value, bool quantized_degenerate_only) {
+    uint32_t max_quantized_value, bool quantized_degenerate_only,
+    int num_threads) {
   const int num_components = att.num_components();
   switch (num_components) {
     case 2:
       return MeshUtils::ListDegenerateQuantizedFaces<Vector2f,
                                                      VectorD<int32_t, 2>>(
-          mesh, att, range, max_quantized_value, quantized_degenerate_only);
+          mesh, att, range, max_quantized_value, quantized_degenerate_only,
+          num_threads);
     case 3:
       return MeshUtils::ListDegenerateQuantizedFaces<Vector3f,
                                                      VectorD<int32_t, 3>>(
-          mesh, att, range, max_quantized_value, quantized_degenerate_only);
+          mesh, att, range, max_quantized_value, quantized_degenerate_only,
+          num_threads);
     case 4:
       return MeshUtils::ListDegenerateQuantizedFaces<Vector4f,
                                                      VectorD<int32_t, 4>>(
-          mesh, att, range, max_quantized_value, quantized_degenerate_only);
+          mesh, att, range, max_quantized_value, quantized_degenerate_only,
+          num_threads);
     default:
       break;
   }
@@ -481,34 +492,65 @@ std::vector<FaceIndex> MeshUtils::ListDegenerateQuantizedFaces(
 template <typename att_components_t, typename quantized_components_t>
 std::vector<FaceIndex> MeshUtils::ListDegenerateQuantizedFaces(
     const Mesh &mesh, const PointAttribute &att, float range,
-    uint32_t max_quantized_value, bool quantized_degenerate_only) {
-  std::array<att_components_t, 3> values;
-  std::array<quantized_components_t, 3> quantized_values;
-
+    uint32_t max_quantized_value, bool quantized_degenerate_only,
+    int num_threads) {
   Quantizer quantizer;
   quantizer.Init(range, max_quantized_value);
-  std::vector<FaceIndex> degenerate_faces;
 
-  for (FaceIndex fi(0); fi < mesh.num_faces(); ++fi) {
-    const auto &face = mesh.face(fi);
-    for (int c = 0; c < 3; ++c) {
-      att.GetMappedValue(face[c], &values[c][0]);
-      for (int i = 0; i < att_components_t::dimension; ++i) {
-        quantized_values[c][i] = quantizer.QuantizeFloat(values[c][i]);
+  // Faces are processed in blocks, each block by a single thread. Degenerate
+  // faces are marked first, then the number of degenerate faces of each block
+  // is turned into the offset of its first degenerate face in the output, so
+  // the output is sorted for any number of threads.
+  constexpr uint32_t kBlockSize = 1 << 16;
+  const uint32_t num_faces = mesh.num_faces();
+  const int num_blocks = static_cast<int>(
+      (static_cast<uint64_t>(num_faces) + kBlockSize - 1) / kBlockSize);
+  const auto block_end = [num_faces](int b) {
+    return static_cast<uint32_t>(std::min<uint64_t>(
+        static_cast<uint64_t>(b + 1) * kBlockSize, num_faces));
+  };
+  std::vector<uint8_t> is_face_degenerate(num_faces);
+  std::vector<uint32_t> block_offsets(num_blocks + 1, 0);
+  ParallelFor(num_threads, num_blocks, [&](int b) {
+    std::array<att_components_t, 3> values;
+    std::array<quantized_components_t, 3> quantized_values;
+    uint32_t num_degenerate_faces = 0;
+    for (FaceIndex fi(b * kBlockSize); fi < block_end(b); ++fi) {
+      const auto &face = mesh.face(fi);
+      for (int c = 0; c < 3; ++c) {
+        att.GetMappedValue(face[c], &values[c][0]);
+        for (int i = 0; i < att_components_t::dimension; ++i) {
+          quantized_values[c][i] = quantizer.QuantizeFloat(values[c][i]);
+        }
       }
-    }
 
-    if (quantized_degenerate_only &&
-        (values[0] == values[1] || values[0] == values[2] ||
-         values[1] == values[2])) {
-      continue;
+      if (quantized_degenerate_only &&
+          (values[0] == values[1] || values[0] == values[2] ||
+           values[1] == values[2])) {
+        continue;
+      }
+      if (quantized_values[0] == quantized_values[1] ||
+          quantized_values[0] == quantized_values[2] ||
+          quantized_values[1] == quantized_values[2]) {
+        is_face_degenerate[fi.value()] = 1;
+        ++num_degenerate_faces;
+      }
     }
-    if (quantized_values[0] == quantized_values[1] ||
-        quantized_values[0] == quantized_values[2] ||
-        quantized_values[1] == quantized_values[2]) {
-      degenerate_faces.push_back(fi);
+    block_offsets[b + 1] = num_degenerate_faces;
+  });
+  for (int b = 0; b < num_blocks; ++b) {
+    block_offsets[b + 1] += block_offsets[b];
+  }
+
+  std::vector<FaceIndex> degenerate_faces(block_offsets[num_blocks]);
+  ParallelFor(num_threads, num_blocks, [&](int b) {
+    uint32_t offset = block_offsets[b];
+    for (uint32_t f = b * kBlockSize; f < block_end(b); ++f) {
+      if (is_face_degenerate[f]) {
+        degenerate_faces[offset++] = FaceIndex(f);
+      }
     }
-  }
+  });
   return degenerate_faces;
 }
 
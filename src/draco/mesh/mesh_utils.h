@@ -61,11 +61,13 @@ class MeshUtils {
   // subset of new position degenerate faces created from the quantization of
   // |pos_att| using |pos_quantization_bits|. Returns the lowest quantization
   // bits within the specified range or zero signifying that it could not find a
-  // quantization that did not cause any new degenerate faces.
+  // quantization that did not cause any new degenerate faces. The faces are
+  // processed by up to |num_threads| threads and the result is the same for
+  // any number of threads.
   static StatusOr<int> FindLowestTextureQuantization(
       const Mesh &mesh, const PointAttribute &pos_att,
       int pos_quantization_bits, const PointAttribute &tex_att,
-      int tex_target_quantization_bits);
+      int tex_target_quantization_bits, int num_threads = 1);
 
   // Helper function that checks whether a mesh has auto-generated tangents.
   // See go/tangents_and_draco_simplifier.
@@ -83,10 +85,11 @@ class MeshUtils {
   // passed into the quantizer. |quantized_degenerate_only|, is true will only
   // include degenerate faces caused by the quantization. Otherwise all
   // degenerate faces will be included, those made by the quantization and those
-  // already in the source.
+  // already in the source. Faces are processed by up to |num_threads| threads.
   static std::vector<FaceIndex> ListDegenerateQuantizedFaces(
       const Mesh &mesh, const PointAttribute &att, float range,
-      uint32_t max_quantized_value, bool quantized_degenerate_only);
+      uint32_t max_quantized_value, bool quantized_degenerate_only,
+      int num_threads);
 
   // Returns a sorted list of degenerate faces for |att|. |att_components_t| is
   // the component count for |att| as a VectorD. E.g. Vector2f, Vector3f, or
@@ -96,7 +99,8 @@ class MeshUtils {
   template <typename att_components_t, typename quantized_components_t>
   static std::vector<FaceIndex> ListDegenerateQuantizedFaces(
       const Mesh &mesh, const PointAttribute &att, float range,
-      uint32_t max_quantized_value, bool quantized_degenerate_only);
+      uint32_t max_quantized_value, bool quantized_degenerate_only,
+      int num_threads);
 };
 
 }  // namespace draco
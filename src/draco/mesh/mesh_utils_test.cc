@@ -253,6 +253,77 @@ TEST(MeshUtilsTest, FindLowsetTextureQuantizationLanternScene) {
   }
 }
 
+// Creates a grid mesh with enough faces to be processed in multiple blocks.
+// Texture coordinates of neighboring grid points are close to each other, so
+// that faces become degenerate at low texture quantizations. Some faces are
+// degenerate in the source.
+std::unique_ptr<draco::Mesh> CreateLargeTexturedMesh() {
+  const int grid_size = 300;
+  const int num_points = grid_size * grid_size;
+  std::unique_ptr<draco::Mesh> mesh(new draco::Mesh());
+  mesh->set_num_points(num_points);
+  draco::GeometryAttribute pos_att;
+  pos_att.Init(draco::GeometryAttribute::POSITION, nullptr, 3,
+               draco::DT_FLOAT32, false, sizeof(float) * 3, 0);
+  const int pos_att_id = mesh->AddAttribute(pos_att, true, num_points);
+  draco::GeometryAttribute tex_att;
+  tex_att.Init(draco::GeometryAttribute::TEX_COORD, nullptr, 2,
+               draco::DT_FLOAT32, false, sizeof(float) * 2, 0);
+  const int tex_att_id = mesh->AddAttribute(tex_att, true, num_points);
+  for (int i = 0; i < num_points; ++i) {
+    const int x = i % grid_size;
+    const int y = i / grid_size;
+    const draco::Vector3f pos(static_cast<float>(x), static_cast<float>(y),
+                              0.f);
+    mesh->attribute(pos_att_id)
+        ->SetAttributeValue(draco::AttributeValueIndex(i), pos.data());
+    const draco::Vector2f uv(
+        (x + 0.001f * ((x * 7 + y * 3) % 5)) / grid_size,
+        static_cast<float>(y) / grid_size);
+    mesh->attribute(tex_att_id)
+        ->SetAttributeValue(draco::AttributeValueIndex(i), uv.data());
+  }
+  const auto point = [grid_size](int x, int y) {
+    return draco::PointIndex(y * grid_size + x);
+  };
+  for (int y = 0; y + 1 < grid_size; ++y) {
+    for (int x = 0; x + 1 < grid_size; ++x) {
+      mesh->AddFace({{point(x, y), point(x + 1, y), point(x, y + 1)}});
+      mesh->AddFace({{point(x + 1, y), point(x + 1, y + 1), point(x, y + 1)}});
+      if ((x * y) % 13 == 0) {
+        mesh->AddFace({{point(x, y), point(x, y), point(x + 1, y)}});
+      }
+    }
+  }
+  return mesh;
+}
+
+// Tests that the lowest texture quantization does not depend on the number of
+// threads.
+TEST(MeshUtilsTest, FindLowestTextureQuantizationMultithreaded) {
+  const std::unique_ptr<draco::Mesh> mesh = CreateLargeTexturedMesh();
+  ASSERT_GT(mesh->num_faces(), 1 << 17);
+  const draco::PointAttribute *const pos_att =
+      mesh->GetNamedAttribute(draco::GeometryAttribute::Type::POSITION, 0);
+  const draco::PointAttribute *const tex_att =
+      mesh->GetNamedAttribute(draco::GeometryAttribute::Type::TEX_COORD, 0);
+
+  const int pos_quantization_bits = 11;
+  const int target_bits = 6;
+  DRACO_ASSIGN_OR_ASSERT(
+      const int lowest_bits,
+      draco::MeshUtils::FindLowestTextureQuantization(
+          *mesh, *pos_att, pos_quantization_bits, *tex_att, target_bits));
+  ASSERT_GT(lowest_bits, target_bits);
+  for (const int num_threads : {2, 4}) {
+    DRACO_ASSIGN_OR_ASSERT(const int mt_lowest_bits,
+                           draco::MeshUtils::FindLowestTextureQuantization(
+                               *mesh, *pos_att, pos_quantization_bits,
+                               *tex_att, target_bits, num_threads));
+    ASSERT_EQ(mt_lowest_bits, lowest_bits);
+  }
+}
+
 TEST(MeshUtilsTest, CheckAutoGeneratedTangents) {
   // Test verifies that MeshUtils::HasAutoGeneratedTangents works as intended.
   std::unique_ptr<draco::Mesh> mesh =
@@ -80,13 +80,13 @@ void TriangleSoupMeshBuilder::SetPerFaceAttributeValueForFace(
 std::unique_ptr<Mesh> TriangleSoupMeshBuilder::Finalize() {
 #ifdef DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED
   // First deduplicate attribute values.
-  if (!mesh_->DeduplicateAttributeValues()) {
+  if (!mesh_->DeduplicateAttributeValues(num_deduplication_threads_)) {
     return nullptr;
   }
 #endif
 #ifdef DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED
   // Also deduplicate vertex indices.
-  mesh_->DeduplicatePointIds();
+  mesh_->DeduplicatePointIds(num_deduplication_threads_);
 #endif
   for (size_t i = 0; i < attribute_element_types_.size(); ++i) {
     if (attribute_element_types_[i] >= 0) {
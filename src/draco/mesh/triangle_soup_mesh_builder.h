@@ -35,6 +35,8 @@ class TriangleSoupMeshBuilder {
   // Index type of the inserted element.
   typedef FaceIndex ElementIndex;
 
+  TriangleSoupMeshBuilder() : num_deduplication_threads_(1) {}
+
   // Starts mesh building for a given number of faces.
   // TODO(ostava): Currently it's necessary to select the correct number of
   // faces upfront. This should be generalized, but it will require us to
@@ -94,6 +96,13 @@ class TriangleSoupMeshBuilder {
     mesh_->AddAttributeMetadata(att_id, std::move(metadata));
   }
 
+  // Sets the number of threads used by Finalize() to deduplicate the attribute
+  // values and points. The result is the same for any number of threads.
+  // Default: 1
+  void SetNumDeduplicationThreads(int num_threads) {
+    num_deduplication_threads_ = num_threads;
+  }
+
   // Finalizes the mesh or returns nullptr on error.
   // Once this function is called, the builder becomes invalid and cannot be
   // used until the method Start() is called again.
@@ -101,6 +110,7 @@ class TriangleSoupMeshBuilder {
 
  private:
   std::vector<int8_t> attribute_element_types_;
+  int num_deduplication_threads_;
 
   std::unique_ptr<Mesh> mesh_;
 };
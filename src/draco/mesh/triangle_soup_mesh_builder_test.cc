@@ -227,6 +227,39 @@ TEST_F(TriangleSoupMeshBuilderTest, PropagatesAttributeUniqueIds) {
   ASSERT_EQ(mesh->GetAttributeByUniqueId(1234), mesh->attribute(pos_att_id));
 }
 
+TEST_F(TriangleSoupMeshBuilderTest, MultithreadedDeduplication) {
+  // Tests that deduplication on multiple threads produces the same mesh as
+  // deduplication on a single thread.
+  constexpr int kGridSize = 32;
+  std::unique_ptr<Mesh> meshes[2];
+  for (int i = 0; i < 2; ++i) {
+    TriangleSoupMeshBuilder mb;
+    mb.SetNumDeduplicationThreads(i == 0 ? 1 : 4);
+    mb.Start(2 * kGridSize * kGridSize);
+    const int pos_att_id =
+        mb.AddAttribute(GeometryAttribute::POSITION, 3, DT_FLOAT32);
+    int face = 0;
+    for (int y = 0; y < kGridSize; ++y) {
+      for (int x = 0; x < kGridSize; ++x) {
+        const float x0 = x, y0 = y, x1 = x + 1, y1 = y + 1;
+        mb.SetAttributeValuesForFace(
+            pos_att_id, FaceIndex(face++), Vector3f(x0, y0, 0.f).data(),
+            Vector3f(x1, y0, 0.f).data(), Vector3f(x1, y1, 0.f).data());
+        mb.SetAttributeValuesForFace(
+            pos_att_id, FaceIndex(face++), Vector3f(x0, y0, 0.f).data(),
+            Vector3f(x1, y1, 0.f).data(), Vector3f(x0, y1, 0.f).data());
+      }
+    }
+    meshes[i] = mb.Finalize();
+    ASSERT_NE(meshes[i], nullptr);
+  }
+  ASSERT_EQ(meshes[0]->num_points(), (kGridSize + 1) * (kGridSize + 1));
+  ASSERT_EQ(meshes[1]->num_points(), meshes[0]->num_points());
+  for (FaceIndex f(0); f < meshes[0]->num_faces(); ++f) {
+    ASSERT_EQ(meshes[1]->face(f), meshes[0]->face(f));
+  }
+}
+
 #ifdef DRACO_TRANSCODER_SUPPORTED
 TEST_F(TriangleSoupMeshBuilderTest, NormalizedColor) {
   // This tests, verifies that the mesh builder constructs a valid model with
@@ -15,8 +15,11 @@
 #include "draco/point_cloud/point_cloud.h"
 
 #include <algorithm>
-#include <unordered_map>
 #include <utility>
+#include <vector>
+
+#include "draco/core/deduplication_utils.h"
+#include "draco/core/thread_pool.h"
 
 #ifdef DRACO_TRANSCODER_SUPPORTED
 #include "draco/attributes/point_attribute.h"
@@ -214,49 +217,47 @@ void PointCloud::DeleteAttribute(int att_id) {
 }
 
 #ifdef DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED
-void PointCloud::DeduplicatePointIds() {
-  // Hashing function for a single vertex.
-  auto point_hash = [this](PointIndex p) {
-    PointIndex::ValueType hash = 0;
-    for (int32_t i = 0; i < this->num_attributes(); ++i) {
-      const AttributeValueIndex att_id = attribute(i)->mapped_index(p);
-      hash = static_cast<uint32_t>(HashCombine(att_id.value(), hash));
-    }
-    return hash;
-  };
-  // Comparison function between two vertices.
-  auto point_compare = [this](PointIndex p0, PointIndex p1) {
-    for (int32_t i = 0; i < this->num_attributes(); ++i) {
-      const AttributeValueIndex att_id0 = attribute(i)->mapped_index(p0);
-      const AttributeValueIndex att_id1 = attribute(i)->mapped_index(p1);
-      if (att_id0 != att_id1) {
-        return false;
+void PointCloud::DeduplicatePointIds() { DeduplicatePointIds(1); }
+
+void PointCloud::DeduplicatePointIds(int num_threads) {
+  // Points are duplicates when they are mapped to the same values of all
+  // attributes. Store the value indices of each point next to each other so
+  // that the points can be compared as raw records.
+  const int num_atts = num_attributes();
+  std::vector<uint32_t> point_values(static_cast<size_t>(num_points_) *
+                                     num_atts);
+  const int kNumPointsPerBlock = 1 << 16;
+  const int num_blocks =
+      (num_points_ + kNumPointsPerBlock - 1) / kNumPointsPerBlock;
+  ParallelFor(num_threads, num_blocks, [&](int b) {
+    const uint32_t begin = b * kNumPointsPerBlock;
+    const uint32_t end = std::min<uint32_t>(begin + kNumPointsPerBlock,
+                                            num_points_);
+    for (int32_t a = 0; a < num_atts; ++a) {
+      const PointAttribute *const att = attribute(a);
+      for (PointIndex p(begin); p < end; ++p) {
+        point_values[static_cast<size_t>(p.value()) * num_atts + a] =
+            att->mapped_index(p).value();
       }
     }
-    return true;
-  };
+  });
 
-  std::unordered_map<PointIndex, PointIndex, decltype(point_hash),
-                     decltype(point_compare)>
-      unique_point_map(num_points_, point_hash, point_compare);
-  int32_t num_unique_points = 0;
-  IndexTypeVector<PointIndex, PointIndex> index_map(num_points_);
-  std::vector<PointIndex> unique_points;
-  // Go through all vertices and find their duplicates.
-  for (PointIndex i(0); i < num_points_; ++i) {
-    const auto it = unique_point_map.find(i);
-    if (it != unique_point_map.end()) {
-      index_map[i] = it->second;
-    } else {
-      unique_point_map.insert(std::make_pair(i, PointIndex(num_unique_points)));
-      index_map[i] = num_unique_points++;
-      unique_points.push_back(i);
-    }
-  }
+  std::vector<uint32_t> point_ids;
+  std::vector<uint32_t> first_points;
+  const uint32_t num_unique_points = DeduplicateRecords(
+      reinterpret_cast<const uint8_t *>(point_values.data()),
+      num_atts * sizeof(uint32_t), num_atts * sizeof(uint32_t), num_points_,
+      num_threads, &point_ids, &first_points);
   if (num_unique_points == num_points_) {
     return;  // All vertices are already unique.
   }
 
+  IndexTypeVector<PointIndex, PointIndex> index_map(num_points_);
+  for (PointIndex i(0); i < num_points_; ++i) {
+    index_map[i] = point_ids[i.value()];
+  }
+  const std::vector<PointIndex> unique_points(first_points.begin(),
+                                              first_points.end());
   ApplyPointIdDeduplication(index_map, unique_points);
   set_num_points(num_unique_points);
 }
@@ -285,13 +286,18 @@ void PointCloud::ApplyPointIdDeduplication(
 
 #ifdef DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED
 bool PointCloud::DeduplicateAttributeValues() {
+  return DeduplicateAttributeValues(1);
+}
+
+bool PointCloud::DeduplicateAttributeValues(int num_threads) {
   // Go over all attributes and create mapping between duplicate entries.
   if (num_points() == 0) {
     return true;  // Nothing to deduplicate.
   }
   // Deduplicate all attributes.
   for (int32_t att_id = 0; att_id < num_attributes(); ++att_id) {
-    if (!attribute(att_id)->DeduplicateValues(*attribute(att_id))) {
+    if (!attribute(att_id)->DeduplicateValues(
+            *attribute(att_id), AttributeValueIndex(0), num_threads)) {
       return false;
     }
   }
@@ -126,12 +126,20 @@ class PointCloud {
   // Deduplicates all attribute values (all attribute entries with the same
   // value are merged into a single entry).
   virtual bool DeduplicateAttributeValues();
+
+  // Same as above but the values are compared on up to |num_threads| threads.
+  // The result is the same for any number of threads.
+  bool DeduplicateAttributeValues(int num_threads);
 #endif
 
 #ifdef DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED
   // Removes duplicate point ids (two point ids are duplicate when all of their
   // attributes are mapped to the same entry ids).
   virtual void DeduplicatePointIds();
+
+  // Same as above but the points are compared on up to |num_threads| threads.
+  // The result is the same for any number of threads.
+  void DeduplicatePointIds(int num_threads);
 #endif
 
   // Get bounding box.
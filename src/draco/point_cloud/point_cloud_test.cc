@@ -14,12 +14,16 @@
 //
 #include "draco/point_cloud/point_cloud.h"
 
+#include <cstring>
+#include <memory>
 #include <string>
 #include <utility>
 
 #include "draco/core/draco_test_base.h"
 #include "draco/core/draco_test_utils.h"
+#include "draco/core/vector_d.h"
 #include "draco/metadata/geometry_metadata.h"
+#include "draco/point_cloud/point_cloud_builder.h"
 
 namespace {
 
@@ -248,4 +252,58 @@ TEST_F(PointCloudTest, TestPointCloudWithMetadata) {
   ASSERT_NE(pc.GetAttributeMetadataByAttributeId(0), nullptr);
 }
 
+#if defined(DRACO_ATTRIBUTE_VALUES_DEDUPLICATION_SUPPORTED) && \
+    defined(DRACO_ATTRIBUTE_INDICES_DEDUPLICATION_SUPPORTED)
+// Creates a point cloud with enough points to be deduplicated on multiple
+// threads. Many of the points share their position or color values.
+std::unique_ptr<draco::PointCloud> CreateLargePointCloud() {
+  const int num_points = 1 << 19;
+  draco::PointCloudBuilder builder;
+  builder.Start(num_points);
+  const int pos_att_id =
+      builder.AddAttribute(draco::GeometryAttribute::POSITION, 3,
+                           draco::DT_FLOAT32);
+  const int color_att_id = builder.AddAttribute(
+      draco::GeometryAttribute::COLOR, 3, draco::DT_UINT8);
+  for (draco::PointIndex i(0); i < num_points; ++i) {
+    const int pos_value = (i.value() * 7919) % (num_points / 4);
+    const draco::Vector3f pos(static_cast<float>(pos_value % 100),
+                              static_cast<float>(pos_value / 100), 1.f);
+    builder.SetAttributeValueForPoint(pos_att_id, i, pos.data());
+    const uint8_t color[3] = {static_cast<uint8_t>(i.value() % 3), 0, 255};
+    builder.SetAttributeValueForPoint(color_att_id, i, color);
+  }
+  return builder.Finalize(false);
+}
+
+TEST_F(PointCloudTest, TestMultithreadedDeduplication) {
+  // This test verifies that the result of the deduplication does not depend
+  // on the number of threads.
+  std::unique_ptr<draco::PointCloud> pc = CreateLargePointCloud();
+  ASSERT_NE(pc, nullptr);
+  ASSERT_TRUE(pc->DeduplicateAttributeValues());
+  pc->DeduplicatePointIds();
+  ASSERT_LT(pc->num_points(), 1 << 19);
+
+  std::unique_ptr<draco::PointCloud> mt_pc = CreateLargePointCloud();
+  ASSERT_NE(mt_pc, nullptr);
+  ASSERT_TRUE(mt_pc->DeduplicateAttributeValues(4));
+  mt_pc->DeduplicatePointIds(4);
+  ASSERT_EQ(mt_pc->num_points(), pc->num_points());
+  for (int a = 0; a < pc->num_attributes(); ++a) {
+    const draco::PointAttribute *const att = pc->attribute(a);
+    const draco::PointAttribute *const mt_att = mt_pc->attribute(a);
+    ASSERT_EQ(mt_att->size(), att->size());
+    for (draco::PointIndex i(0); i < pc->num_points(); ++i) {
+      ASSERT_EQ(mt_att->mapped_index(i), att->mapped_index(i));
+    }
+    for (draco::AttributeValueIndex i(0); i < att->size(); ++i) {
+      ASSERT_EQ(memcmp(mt_att->GetAddress(i), att->GetAddress(i),
+                       att->byte_stride()),
+                0);
+    }
+  }
+}
+#endif
+
 }  // namespace
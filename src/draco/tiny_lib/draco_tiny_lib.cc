@@ -1,43 +1,37 @@
-#include "draco/draco_features.h"
+#include "draco/tiny_lib/draco_tiny_lib.h"
 
 #ifdef DRACO_TINY_LIB
 
-#include "draco/attributes/geometry_attribute.h"
-#include "draco/compression/decode.h"
+#include <atomic>
+#include <condition_variable>
+#include <mutex>
+#include <thread>
 
-// If compiling with Visual Studio.
-#if defined(_MSC_VER)
-	#define EXPORT_API __declspec(dllexport)
-#else
-	// Other platforms don't need this.
-	#define EXPORT_API
-#endif  // defined(_MSC_VER)
+#include "draco/compression/decode.h"
+#include "draco/core/thread_pool.h"
 
 namespace draco {
-extern "C" {
-
-struct DecompressedMesh { void* internalPtr; };
-struct Attribute { void* internalPtr; };
 
-struct Data {
-	DataType dataType : 32;
-	uint32_t dataSize;
-	void* data;
-};
-
-enum DecompressReturnCode : int {
-	DecompressReturnCode_ok = 0,
-	DecompressReturnCode_nullParams = -1,
-	DecompressReturnCode_cantParseGeomType = -2,
-	DecompressReturnCode_cantParseTriangularMesh = -3,
-	DecompressReturnCode_invalidGeomType = -3,
+// Gathers |numVerts| mapped values of a fixed size. Having the value size as a
+// compile time constant lets the compiler turn each memcpy into plain register
+// moves instead of a call per vertex.
+template <size_t attribSize>
+static void GatherAttributeData(const PointAttribute* attrib, uint32_t numVerts, char* dst)
+{
+	const uint8_t* const src = attrib->buffer()->data() + attrib->byte_offset();
+	const int64_t stride = attrib->byte_stride();
+	for (uint32_t i = 0; i < numVerts; i++, dst += attribSize) {
+		const int64_t valueIndex = attrib->mapped_index(PointIndex(i)).value();
+		memcpy(dst, src + stride * valueIndex, attribSize);
+	}
+}
 
-	DecompressReturnCode_pointCloudsNotSupportedYet = -1000,
-};
+extern "C" {
 
-int EXPORT_API Draco_Decompress(
+static int DecompressMesh(
 	const char* compressedData, size_t compressedDataSize,
-	DecompressedMesh* decompressedMesh)
+	const std::atomic<bool>* cancellationFlag, DecoderContext* context,
+	DecoderStats* stats, DecompressedMesh* decompressedMesh)
 {
 	if (compressedData == nullptr || decompressedMesh == nullptr)
 		return DecompressReturnCode_nullParams;
@@ -49,11 +43,17 @@ int EXPORT_API Draco_Decompress(
 		return DecompressReturnCode_cantParseGeomType;
 
 	draco::Decoder decoder;
+	decoder.SetCancellationFlag(cancellationFlag);
+	decoder.SetDecoderContext(context);
+	decoder.SetStats(stats);
 	const auto geomType = statusOr_geomType.value();
 	if (geomType == TRIANGULAR_MESH) {
 		auto statusOr_mesh = decoder.DecodeMeshFromBuffer(&buffer);
-		if (!statusOr_mesh.ok())
+		if (!statusOr_mesh.ok()) {
+			if (cancellationFlag != nullptr && cancellationFlag->load())
+				return DecompressReturnCode_cancelled;
 			return DecompressReturnCode_cantParseTriangularMesh;
+		}
 
 		auto mesh = std::move(statusOr_mesh).value();
 		auto meshPtr = mesh.release();
@@ -69,6 +69,232 @@ int EXPORT_API Draco_Decompress(
 	return DecompressReturnCode_ok;
 }
 
+int EXPORT_API Draco_Decompress(
+	const char* compressedData, size_t compressedDataSize,
+	DecompressedMesh* decompressedMesh)
+{
+	return DecompressMesh(compressedData, compressedDataSize, nullptr, nullptr, nullptr, decompressedMesh);
+}
+
+// A decompress context keeps the decoder state and its working memory alive
+// between decodes, which avoids reallocating it for every mesh when many
+// (small) meshes are decoded one after another. A context must not be used
+// from multiple threads at the same time; create one context per thread.
+static DecoderContext* InternalContext(DecompressContext c) { return (DecoderContext*)c.internalPtr; }
+
+int EXPORT_API Draco_DecompressContext_Create(DecompressContext* context)
+{
+	if (context == nullptr)
+		return DecompressReturnCode_nullParams;
+	context->internalPtr = (void*)new DecoderContext();
+	return DecompressReturnCode_ok;
+}
+
+void EXPORT_API Draco_DecompressContext_Release(DecompressContext c) { delete InternalContext(c); }
+
+// Limits the memory retained by the context between decodes. The default is
+// 64 MB. Decoders whose working memory exceeds the limit are released after
+// the decode.
+void EXPORT_API Draco_DecompressContext_SetMaxRetainedMemory(DecompressContext c, size_t maxBytes) { InternalContext(c)->set_max_retained_memory(maxBytes); }
+size_t EXPORT_API Draco_DecompressContext_GetRetainedMemory(DecompressContext c) { return InternalContext(c)->retained_memory(); }
+
+// Releases all the memory retained by the context.
+void EXPORT_API Draco_DecompressContext_Clear(DecompressContext c) { InternalContext(c)->Clear(); }
+
+// Same as Draco_Decompress() but reuses the decoder state kept in |context|.
+int EXPORT_API Draco_DecompressWithContext(
+	DecompressContext context,
+	const char* compressedData, size_t compressedDataSize,
+	DecompressedMesh* decompressedMesh)
+{
+	if (context.internalPtr == nullptr)
+		return DecompressReturnCode_nullParams;
+	return DecompressMesh(compressedData, compressedDataSize, nullptr, InternalContext(context), nullptr, decompressedMesh);
+}
+
+// Decode statistics record the time, consumed bytes and allocations of each
+// decoding stage (header, connectivity, attribute values, prediction and
+// transforms). Stages of consecutive decodes are appended until the stats are
+// cleared. Allocations are not counted by the library and are always 0.
+static DecoderStats* InternalStats(DecodeStats s) { return (DecoderStats*)s.internalPtr; }
+
+int EXPORT_API Draco_DecodeStats_Create(DecodeStats* stats)
+{
+	if (stats == nullptr)
+		return DecompressReturnCode_nullParams;
+	stats->internalPtr = (void*)new DecoderStats();
+	return DecompressReturnCode_ok;
+}
+
+void EXPORT_API Draco_DecodeStats_Release(DecodeStats s) { delete InternalStats(s); }
+void EXPORT_API Draco_DecodeStats_Clear(DecodeStats s) { InternalStats(s)->Clear(); }
+int EXPORT_API Draco_DecodeStats_GetNumStages(DecodeStats s) { return (int)InternalStats(s)->stages().size(); }
+double EXPORT_API Draco_DecodeStats_GetTotalTimeMs(DecodeStats s) { return InternalStats(s)->TotalTimeMs(); }
+
+int EXPORT_API Draco_DecodeStats_GetStage(DecodeStats s, int index, DecodeStageStats* stage)
+{
+	const auto& stages = InternalStats(s)->stages();
+	if (stage == nullptr || index < 0 || index >= (int)stages.size())
+		return DecompressReturnCode_nullParams;
+	const DecoderStats::StageStats& src = stages[index];
+	stage->stage = src.stage;
+	stage->attributeId = src.attribute_id;
+	stage->timeMs = src.time_ms;
+	stage->numBytes = src.num_bytes;
+	stage->numAllocations = src.num_allocations;
+	return DecompressReturnCode_ok;
+}
+
+// Returns a static name of a DecodeStageStats::stage value, e.g. "connectivity".
+const char* EXPORT_API Draco_DecodeStats_GetStageName(int32_t stage)
+{
+	if (stage < 0 || stage >= DecoderStats::NUM_STAGES)
+		return "unknown";
+	return DecoderStats::StageName((DecoderStats::Stage)stage);
+}
+
+// Same as Draco_Decompress() but records the decoding stages into |stats|.
+int EXPORT_API Draco_DecompressWithStats(
+	DecodeStats stats,
+	const char* compressedData, size_t compressedDataSize,
+	DecompressedMesh* decompressedMesh)
+{
+	if (stats.internalPtr == nullptr)
+		return DecompressReturnCode_nullParams;
+	return DecompressMesh(compressedData, compressedDataSize, nullptr, nullptr, InternalStats(stats), decompressedMesh);
+}
+
+// Decodes |numInputs| compressed blobs, distributing them over up to
+// |numThreads| threads (the calling one included). |numThreads| <= 0 uses one
+// thread per hardware core and larger values are limited to it. The decode result of input i is stored in
+// |returnCodes[i]| and, on success, its mesh in |decompressedMeshes[i]|, which
+// must be released with Draco_DecompressedMesh_Release() as usual. Handles of
+// failed items are set to null.
+int EXPORT_API Draco_DecompressBatch(
+	const CompressedData* inputs, int numInputs, int numThreads,
+	DecompressedMesh* decompressedMeshes, int* returnCodes)
+{
+	if (numInputs < 0 || (numInputs > 0 && (inputs == nullptr || decompressedMeshes == nullptr || returnCodes == nullptr)))
+		return DecompressReturnCode_nullParams;
+
+	const int numHardwareThreads = GetHardwareNumThreads();
+	if (numThreads <= 0 || numThreads > numHardwareThreads)
+		numThreads = numHardwareThreads;
+
+	ParallelFor(numThreads, numInputs, [&](int i) {
+		decompressedMeshes[i].internalPtr = nullptr;
+		returnCodes[i] = Draco_Decompress(inputs[i].data, inputs[i].dataSize, &decompressedMeshes[i]);
+	});
+	return DecompressReturnCode_ok;
+}
+
+struct DecompressJobState {
+	const char* compressedData;
+	size_t compressedDataSize;
+	DecompressJobCallback callback;
+	void* userData;
+
+	std::thread worker;
+	std::atomic<bool> cancelled;
+	std::mutex mutex;
+	std::condition_variable finishedCondition;
+	bool finished;
+	int returnCode;
+	DecompressedMesh mesh;
+};
+
+static DecompressJobState* InternalJob(DecompressJob job) { return (DecompressJobState*)job.internalPtr; }
+
+static void RunDecompressJob(DecompressJobState* state)
+{
+	DecompressedMesh mesh = { nullptr };
+	const int returnCode = DecompressMesh(state->compressedData, state->compressedDataSize, &state->cancelled, nullptr, nullptr, &mesh);
+	{
+		std::lock_guard<std::mutex> lock(state->mutex);
+		state->returnCode = returnCode;
+		state->mesh = mesh;
+		state->finished = true;
+	}
+	state->finishedCondition.notify_all();
+	if (state->callback != nullptr) {
+		DecompressJob job = { state };
+		state->callback(job, returnCode, state->userData);
+	}
+}
+
+// Starts decoding a mesh on a background thread and returns immediately. The
+// |compressedData| must stay valid until the job has finished. The optional
+// |callback| is invoked on the worker thread once the decode has finished (or
+// was cancelled); it must not release the job. Every job must eventually be
+// released with Draco_DecompressJob_Release().
+int EXPORT_API Draco_DecompressAsync(
+	const char* compressedData, size_t compressedDataSize,
+	DecompressJobCallback callback, void* userData, DecompressJob* job)
+{
+	if (compressedData == nullptr || job == nullptr)
+		return DecompressReturnCode_nullParams;
+
+	auto state = new DecompressJobState();
+	state->compressedData = compressedData;
+	state->compressedDataSize = compressedDataSize;
+	state->callback = callback;
+	state->userData = userData;
+	state->cancelled = false;
+	state->finished = false;
+	state->returnCode = DecompressReturnCode_ok;
+	state->mesh.internalPtr = nullptr;
+	job->internalPtr = state;
+
+	if (AreThreadsSupported())
+		state->worker = std::thread(RunDecompressJob, state);
+	else
+		RunDecompressJob(state);
+	return DecompressReturnCode_ok;
+}
+
+// Returns 1 when the job has finished, successfully or not, and 0 otherwise.
+int EXPORT_API Draco_DecompressJob_IsFinished(DecompressJob job)
+{
+	auto state = InternalJob(job);
+	std::lock_guard<std::mutex> lock(state->mutex);
+	return state->finished ? 1 : 0;
+}
+
+// Requests the job to stop. Decoding stops at the next stage boundary (after
+// the connectivity or between attribute decoders) and the job then finishes
+// with DecompressReturnCode_cancelled.
+void EXPORT_API Draco_DecompressJob_Cancel(DecompressJob job) { InternalJob(job)->cancelled = true; }
+
+// Blocks until the job has finished and returns its DecompressReturnCode. On
+// success the ownership of the decoded mesh is transferred to |decompressedMesh|
+// (which may be null to leave it with the job).
+int EXPORT_API Draco_DecompressJob_Wait(DecompressJob job, DecompressedMesh* decompressedMesh)
+{
+	auto state = InternalJob(job);
+	std::unique_lock<std::mutex> lock(state->mutex);
+	state->finishedCondition.wait(lock, [state] { return state->finished; });
+	if (decompressedMesh != nullptr) {
+		*decompressedMesh = state->mesh;
+		state->mesh.internalPtr = nullptr;
+	}
+	return state->returnCode;
+}
+
+// Cancels the job if it is still running, waits for the worker and frees the
+// job together with any decoded mesh that was not taken by
+// Draco_DecompressJob_Wait().
+void EXPORT_API Draco_DecompressJob_Release(DecompressJob job)
+{
+	auto state = InternalJob(job);
+	if (state == nullptr)
+		return;
+	state->cancelled = true;
+	if (state->worker.joinable())
+		state->worker.join();
+	delete (Mesh*)state->mesh.internalPtr;
+	delete state;
+}
+
 static Mesh* InternalMesh(DecompressedMesh m) { return (Mesh*)m.internalPtr; }
 
 void EXPORT_API Draco_DecompressedMesh_Release(DecompressedMesh m) {
@@ -82,66 +308,82 @@ uint32_t EXPORT_API Draco_DecompressedMesh_GetNumAttributes(DecompressedMesh m)
 
 static PointAttribute* InternalAttribute(Attribute a) { return (PointAttribute*)a.internalPtr; }
 
-void EXPORT_API Draco_DecompressedMesh_GetAttribute(DecompressedMesh m, int index, Attribute* attribute)
+static void SetAttribute(const PointAttribute* attr, Attribute* attribute)
 {
-	attribute->internalPtr = nullptr;
 	if (attribute == nullptr)
 		return;
-
-	const auto mesh = InternalMesh(m);
-	const PointAttribute* const attr = mesh->attribute(index);
-	if (attr == nullptr)
-		return;
-
 	attribute->internalPtr = (void*)attr;
 }
 
-void EXPORT_API Draco_DecompressedMesh_GetAttributeByType(DecompressedMesh m, GeometryAttribute::Type attribType, int index, Attribute* attribute)
+void EXPORT_API Draco_DecompressedMesh_GetAttribute(DecompressedMesh m, int index, Attribute* attribute)
 {
-	attribute->internalPtr = nullptr;
-	if (attribute == nullptr)
-		return;
-
-	const auto mesh = InternalMesh(m);
-	const PointAttribute* const attr = mesh->GetNamedAttribute(attribType, index);
-	if (attr == nullptr)
-		return;
+	SetAttribute(InternalMesh(m)->attribute(index), attribute);
+}
 
-	attribute->internalPtr = (void*)attr;
+void EXPORT_API Draco_DecompressedMesh_GetAttributeByType(DecompressedMesh m, GeometryAttribute::Type attribType, int index, Attribute* attribute)
+{
+	SetAttribute(InternalMesh(m)->GetNamedAttribute(attribType, index), attribute);
 }
 
 void EXPORT_API Draco_DecompressedMesh_GetAttributeByUniqueId(DecompressedMesh m, uint8_t uniqueId, Attribute* attribute)
 {
-	attribute->internalPtr = nullptr;
-	if (attribute == nullptr)
-		return;
-	
-	const auto mesh = InternalMesh(m);
-	const PointAttribute* const attr = mesh->GetAttributeByUniqueId(uniqueId);
-	if (attr == nullptr)
-		return;
-	
-	attribute->internalPtr = (void*)attr;
+	SetAttribute(InternalMesh(m)->GetAttributeByUniqueId(uniqueId), attribute);
+}
+
+static size_t IndicesSize(const Mesh* mesh) { return size_t(mesh->num_faces()) * 3 * sizeof(uint32_t); }
+
+static void CopyIndices(const Mesh* mesh, uint32_t* dst)
+{
+	// Faces are stored contiguously as three 32-bit point indices each.
+	static_assert(sizeof(Mesh::Face) == sizeof(uint32_t) * 3, "Unexpected face layout.");
+	const uint32_t numFaces = mesh->num_faces();
+	if (numFaces > 0)
+		memcpy(dst, mesh->face(FaceIndex(0)).data(), sizeof(Mesh::Face) * numFaces);
 }
 
 void EXPORT_API Draco_DecompressedMesh_GetIndices(DecompressedMesh m, Data* indices)
 {
-	indices->data = nullptr;
 	if (indices == nullptr)
 		return;
-	
-	const auto mesh = InternalMesh(m);
-	uint32_t numFaces = mesh->num_faces();
+	indices->data = nullptr;
 
-	auto inds = new uint32_t[numFaces * 3];
-	for (draco::FaceIndex faceI(0); faceI < numFaces; faceI++) {
-		const Mesh::Face& face = mesh->face(faceI);
-		auto dst = inds + faceI.value() * 3;
-		memcpy(dst, face.data(), sizeof(uint32_t) * 3);
-	}
+	const auto mesh = InternalMesh(m);
+	const size_t dataSize = IndicesSize(mesh);
+	auto inds = new uint32_t[dataSize / sizeof(uint32_t)];
+	CopyIndices(mesh, inds);
 	indices->data = inds;
 	indices->dataType = DT_INT32;
-	indices->dataSize = numFaces * 3 * sizeof(uint32_t);
+	indices->dataSize = dataSize;
+}
+
+// Returns the number of bytes Draco_DecompressedMesh_CopyIndices() writes.
+size_t EXPORT_API Draco_DecompressedMesh_GetIndicesSize(DecompressedMesh m) { return IndicesSize(InternalMesh(m)); }
+
+// Writes the triangle indices (3 x uint32 per face) into the caller-provided
+// |dst| buffer, avoiding the intermediate allocation of
+// Draco_DecompressedMesh_GetIndices().
+int EXPORT_API Draco_DecompressedMesh_CopyIndices(DecompressedMesh m, void* dst, size_t dstCapacity)
+{
+	if (dst == nullptr)
+		return CopyDataReturnCode_nullParams;
+
+	const auto mesh = InternalMesh(m);
+	if (dstCapacity < IndicesSize(mesh))
+		return CopyDataReturnCode_bufferTooSmall;
+
+	CopyIndices(mesh, (uint32_t*)dst);
+	return CopyDataReturnCode_ok;
+}
+
+// Returns a read-only pointer to the triangle indices (3 x uint32 per face)
+// stored in the mesh, or nullptr when the mesh has no faces. The pointer stays
+// valid until the mesh is released.
+const void* EXPORT_API Draco_DecompressedMesh_GetIndicesView(DecompressedMesh m)
+{
+	const auto mesh = InternalMesh(m);
+	if (mesh->num_faces() == 0)
+		return nullptr;
+	return mesh->face(FaceIndex(0)).data();
 }
 
 int32_t EXPORT_API Draco_Attribute_GetAttributeType(Attribute a) { return InternalAttribute(a)->attribute_type(); }
@@ -149,34 +391,169 @@ uint32_t EXPORT_API Draco_Attribute_GetDataType(Attribute a) { return InternalAt
 uint32_t EXPORT_API Draco_Attribute_GetNumComponents(Attribute a) { return InternalAttribute(a)->num_components(); }
 uint32_t EXPORT_API Draco_Attribute_GetUniqueId(Attribute a) { return InternalAttribute(a)->unique_id(); }
 
-void EXPORT_API Draco_Attribute_GetData(DecompressedMesh m, Attribute a, Data* data)
+static size_t AttributeDataSize(const PointCloud* pc, const PointAttribute* attrib)
 {
-	data->data = nullptr;
-	if (data == nullptr)
+	const size_t attribSize = DataTypeLength(attrib->data_type()) * attrib->num_components();
+	return attribSize * pc->num_points();
+}
+
+// Returns true when the values of |attrib| are already stored tightly packed
+// in point order, so they can be copied (or viewed) as one contiguous block.
+static bool IsAttributeDataContiguous(const PointCloud* pc, const PointAttribute* attrib)
+{
+	const int64_t attribSize = DataTypeLength(attrib->data_type()) * attrib->num_components();
+	if (!attrib->is_mapping_identity() || attrib->byte_offset() != 0 || attrib->byte_stride() != attribSize)
+		return false;
+	const DataBuffer* buffer = attrib->buffer();
+	return buffer != nullptr && buffer->data_size() >= size_t(attribSize) * pc->num_points();
+}
+
+static void CopyAttributeData(const PointCloud* pc, const PointAttribute* attrib, char* dst)
+{
+	const uint32_t attribSize = DataTypeLength(attrib->data_type()) * attrib->num_components();
+	const uint32_t numVerts = pc->num_points();
+	if (IsAttributeDataContiguous(pc, attrib)) {
+		memcpy(dst, attrib->buffer()->data(), size_t(attribSize) * numVerts);
 		return;
+	}
 
-	const auto mesh = InternalMesh(m);
-	auto attrib = InternalAttribute(a);
+	switch (attribSize) {
+	case 1: GatherAttributeData<1>(attrib, numVerts, dst); return;
+	case 2: GatherAttributeData<2>(attrib, numVerts, dst); return;
+	case 4: GatherAttributeData<4>(attrib, numVerts, dst); return;
+	case 6: GatherAttributeData<6>(attrib, numVerts, dst); return;
+	case 8: GatherAttributeData<8>(attrib, numVerts, dst); return;
+	case 12: GatherAttributeData<12>(attrib, numVerts, dst); return;
+	case 16: GatherAttributeData<16>(attrib, numVerts, dst); return;
+	default: break;
+	}
 
-	const DataType dataType = attrib->data_type();
-	const uint32_t numComps = attrib->num_components();
-	const uint32_t numVerts = mesh->num_points();
-	const uint32_t attribSize = DataTypeLength(dataType) * numComps;
-	const size_t dataSize = attribSize * numVerts;
-	auto dataPtr = new char[dataSize];
-	if (dataPtr == nullptr)
+	for (uint32_t i = 0; i < numVerts; i++) {
+		memcpy(dst, attrib->GetAddressOfMappedIndex(PointIndex(i)), attribSize);
+		dst += attribSize;
+	}
+}
+
+static void GetAttributeData(const PointCloud* pc, Attribute a, Data* data)
+{
+	if (data == nullptr)
 		return;
+	data->data = nullptr;
+	if (a.internalPtr == nullptr)
+		return;
+
+	const auto attrib = InternalAttribute(a);
+	const size_t dataSize = AttributeDataSize(pc, attrib);
+	auto dataPtr = new char[dataSize];
+	CopyAttributeData(pc, attrib, dataPtr);
 
 	data->data = dataPtr;
-	data->dataType = dataType;
+	data->dataType = attrib->data_type();
 	data->dataSize = dataSize;
+}
 
-	for (uint32_t i = 0; i < numVerts; i++) {
-		attrib->GetMappedValue(PointIndex(i), dataPtr);
-		dataPtr += attribSize;
-	}
+static int CopyAttributeDataChecked(const PointCloud* pc, Attribute a, void* dst, size_t dstCapacity)
+{
+	if (dst == nullptr || a.internalPtr == nullptr)
+		return CopyDataReturnCode_nullParams;
+
+	const auto attrib = InternalAttribute(a);
+	if (dstCapacity < AttributeDataSize(pc, attrib))
+		return CopyDataReturnCode_bufferTooSmall;
+
+	CopyAttributeData(pc, attrib, (char*)dst);
+	return CopyDataReturnCode_ok;
+}
+
+static const void* GetAttributeDataView(const PointCloud* pc, Attribute a)
+{
+	if (a.internalPtr == nullptr)
+		return nullptr;
+
+	const auto attrib = InternalAttribute(a);
+	if (!IsAttributeDataContiguous(pc, attrib))
+		return nullptr;
+	return attrib->buffer()->data();
 }
 
+void EXPORT_API Draco_Attribute_GetData(DecompressedMesh m, Attribute a, Data* data) { GetAttributeData(InternalMesh(m), a, data); }
+
+// Returns the number of bytes Draco_Attribute_CopyData() writes for |a|.
+size_t EXPORT_API Draco_Attribute_GetDataSize(DecompressedMesh m, Attribute a) { return AttributeDataSize(InternalMesh(m), InternalAttribute(a)); }
+
+// Writes the per-vertex values of |a| into the caller-provided |dst| buffer
+// (e.g. a pinned managed array or a mapped GPU upload buffer). Unlike
+// Draco_Attribute_GetData() no intermediate block is allocated and no
+// Draco_Data_Release() call is needed.
+int EXPORT_API Draco_Attribute_CopyData(DecompressedMesh m, Attribute a, void* dst, size_t dstCapacity) { return CopyAttributeDataChecked(InternalMesh(m), a, dst, dstCapacity); }
+
+// Returns a read-only pointer to the decoded values of |a| when they are stored
+// contiguously in point order (identity mapping, tightly packed), or nullptr
+// otherwise, in which case Draco_Attribute_CopyData() must be used. The
+// pointer stays valid until the mesh is released.
+const void* EXPORT_API Draco_Attribute_GetDataView(DecompressedMesh m, Attribute a) { return GetAttributeDataView(InternalMesh(m), a); }
+
+// Decodes any Draco geometry (point cloud or triangular mesh) as a point
+// cloud, e.g. the output of the kd-tree point cloud encoder. Connectivity of
+// meshes is dropped; only the points and their attributes are kept.
+int EXPORT_API Draco_DecompressPointCloud(
+	const char* compressedData, size_t compressedDataSize,
+	DecompressedPointCloud* decompressedPointCloud)
+{
+	if (compressedData == nullptr || decompressedPointCloud == nullptr)
+		return DecompressReturnCode_nullParams;
+
+	draco::DecoderBuffer buffer;
+	buffer.Init(compressedData, compressedDataSize);
+	auto statusOr_geomType = draco::Decoder::GetEncodedGeometryType(&buffer);
+	if (!statusOr_geomType.ok())
+		return DecompressReturnCode_cantParseGeomType;
+
+	const auto geomType = statusOr_geomType.value();
+	if (geomType != POINT_CLOUD && geomType != TRIANGULAR_MESH)
+		return DecompressReturnCode_invalidGeomType;
+
+	draco::Decoder decoder;
+	auto statusOr_pc = decoder.DecodePointCloudFromBuffer(&buffer);
+	if (!statusOr_pc.ok())
+		return DecompressReturnCode_cantParsePointCloud;
+
+	decompressedPointCloud->internalPtr = (void*)std::move(statusOr_pc).value().release();
+	return DecompressReturnCode_ok;
+}
+
+static PointCloud* InternalPointCloud(DecompressedPointCloud pc) { return (PointCloud*)pc.internalPtr; }
+
+void EXPORT_API Draco_DecompressedPointCloud_Release(DecompressedPointCloud pc) {
+	auto pointCloud = InternalPointCloud(pc);
+	delete pointCloud;
+}
+
+uint32_t EXPORT_API Draco_DecompressedPointCloud_GetNumVertices(DecompressedPointCloud pc) { return InternalPointCloud(pc)->num_points(); }
+uint32_t EXPORT_API Draco_DecompressedPointCloud_GetNumAttributes(DecompressedPointCloud pc) { return InternalPointCloud(pc)->num_attributes(); }
+
+void EXPORT_API Draco_DecompressedPointCloud_GetAttribute(DecompressedPointCloud pc, int index, Attribute* attribute)
+{
+	SetAttribute(InternalPointCloud(pc)->attribute(index), attribute);
+}
+
+void EXPORT_API Draco_DecompressedPointCloud_GetAttributeByType(DecompressedPointCloud pc, GeometryAttribute::Type attribType, int index, Attribute* attribute)
+{
+	SetAttribute(InternalPointCloud(pc)->GetNamedAttribute(attribType, index), attribute);
+}
+
+void EXPORT_API Draco_DecompressedPointCloud_GetAttributeByUniqueId(DecompressedPointCloud pc, uint8_t uniqueId, Attribute* attribute)
+{
+	SetAttribute(InternalPointCloud(pc)->GetAttributeByUniqueId(uniqueId), attribute);
+}
+
+// Point cloud counterparts of Draco_Attribute_GetData(), Draco_Attribute_GetDataSize(),
+// Draco_Attribute_CopyData() and Draco_Attribute_GetDataView().
+void EXPORT_API Draco_PointCloudAttribute_GetData(DecompressedPointCloud pc, Attribute a, Data* data) { GetAttributeData(InternalPointCloud(pc), a, data); }
+size_t EXPORT_API Draco_PointCloudAttribute_GetDataSize(DecompressedPointCloud pc, Attribute a) { return AttributeDataSize(InternalPointCloud(pc), InternalAttribute(a)); }
+int EXPORT_API Draco_PointCloudAttribute_CopyData(DecompressedPointCloud pc, Attribute a, void* dst, size_t dstCapacity) { return CopyAttributeDataChecked(InternalPointCloud(pc), a, dst, dstCapacity); }
+const void* EXPORT_API Draco_PointCloudAttribute_GetDataView(DecompressedPointCloud pc, Attribute a) { return GetAttributeDataView(InternalPointCloud(pc), a); }
+
 void EXPORT_API Draco_Data_Release(Data d) { delete[] (char*)d.data; }
 
 }
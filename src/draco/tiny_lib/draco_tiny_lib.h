@@ -0,0 +1,228 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#ifndef DRACO_TINY_LIB_DRACO_TINY_LIB_H_
+#define DRACO_TINY_LIB_DRACO_TINY_LIB_H_
+
+#include <cstddef>
+#include <cstdint>
+
+#include "draco/attributes/geometry_attribute.h"
+#include "draco/core/draco_types.h"
+#include "draco/draco_features.h"
+
+#ifdef DRACO_TINY_LIB
+
+// If compiling with Visual Studio.
+#if defined(_MSC_VER)
+#define EXPORT_API __declspec(dllexport)
+#else
+// Other platforms don't need this.
+#define EXPORT_API
+#endif  // defined(_MSC_VER)
+
+namespace draco {
+
+extern "C" {
+
+// Opaque handles of the objects owned by the library. Each handle returned by
+// the library must be released with the matching *_Release() function.
+struct DecompressedMesh {
+  void *internalPtr;
+};
+struct DecompressedPointCloud {
+  void *internalPtr;
+};
+struct DecompressJob {
+  void *internalPtr;
+};
+struct DecompressContext {
+  void *internalPtr;
+};
+struct DecodeStats {
+  void *internalPtr;
+};
+
+// Attributes are owned by their mesh or point cloud and are not released.
+struct Attribute {
+  void *internalPtr;
+};
+
+// One compressed blob of Draco_DecompressBatch().
+struct CompressedData {
+  const char *data;
+  size_t dataSize;
+};
+
+// One recorded decoding stage, see draco::DecoderStats.
+struct DecodeStageStats {
+  int32_t stage;
+  int32_t attributeId;
+  double timeMs;
+  int64_t numBytes;
+  int64_t numAllocations;
+};
+
+// Data allocated by the library that must be released with
+// Draco_Data_Release().
+struct Data {
+  DataType dataType : 32;
+  uint32_t dataSize;
+  void *data;
+};
+
+enum DecompressReturnCode : int {
+  DecompressReturnCode_ok = 0,
+  DecompressReturnCode_nullParams = -1,
+  DecompressReturnCode_cantParseGeomType = -2,
+  DecompressReturnCode_cantParseTriangularMesh = -3,
+  DecompressReturnCode_invalidGeomType = -3,
+  DecompressReturnCode_cantParsePointCloud = -4,
+  DecompressReturnCode_cancelled = -5,
+
+  // Returned by Draco_Decompress(), use Draco_DecompressPointCloud() instead.
+  DecompressReturnCode_pointCloudsNotSupportedYet = -1000,
+};
+
+enum CopyDataReturnCode : int {
+  CopyDataReturnCode_ok = 0,
+  CopyDataReturnCode_nullParams = -1,
+  CopyDataReturnCode_bufferTooSmall = -2,
+};
+
+// Decodes a triangular mesh. Returns a DecompressReturnCode.
+int EXPORT_API Draco_Decompress(const char *compressedData,
+                                size_t compressedDataSize,
+                                DecompressedMesh *decompressedMesh);
+
+// Decoder contexts that keep the decoder state between decodes.
+int EXPORT_API Draco_DecompressContext_Create(DecompressContext *context);
+void EXPORT_API Draco_DecompressContext_Release(DecompressContext c);
+void EXPORT_API Draco_DecompressContext_SetMaxRetainedMemory(
+    DecompressContext c, size_t maxBytes);
+size_t EXPORT_API
+Draco_DecompressContext_GetRetainedMemory(DecompressContext c);
+void EXPORT_API Draco_DecompressContext_Clear(DecompressContext c);
+int EXPORT_API Draco_DecompressWithContext(DecompressContext context,
+                                           const char *compressedData,
+                                           size_t compressedDataSize,
+                                           DecompressedMesh *decompressedMesh);
+
+// Statistics of the decoding stages.
+int EXPORT_API Draco_DecodeStats_Create(DecodeStats *stats);
+void EXPORT_API Draco_DecodeStats_Release(DecodeStats s);
+void EXPORT_API Draco_DecodeStats_Clear(DecodeStats s);
+int EXPORT_API Draco_DecodeStats_GetNumStages(DecodeStats s);
+double EXPORT_API Draco_DecodeStats_GetTotalTimeMs(DecodeStats s);
+int EXPORT_API Draco_DecodeStats_GetStage(DecodeStats s, int index,
+                                          DecodeStageStats *stage);
+const char *EXPORT_API Draco_DecodeStats_GetStageName(int32_t stage);
+int EXPORT_API Draco_DecompressWithStats(DecodeStats stats,
+                                         const char *compressedData,
+                                         size_t compressedDataSize,
+                                         DecompressedMesh *decompressedMesh);
+
+// Decodes multiple meshes on up to |numThreads| threads.
+int EXPORT_API Draco_DecompressBatch(const CompressedData *inputs,
+                                     int numInputs, int numThreads,
+                                     DecompressedMesh *decompressedMeshes,
+                                     int *returnCodes);
+
+// Decodes a mesh on a background thread.
+typedef void (*DecompressJobCallback)(DecompressJob job, int returnCode,
+                                      void *userData);
+int EXPORT_API Draco_DecompressAsync(const char *compressedData,
+                                     size_t compressedDataSize,
+                                     DecompressJobCallback callback,
+                                     void *userData, DecompressJob *job);
+int EXPORT_API Draco_DecompressJob_IsFinished(DecompressJob job);
+void EXPORT_API Draco_DecompressJob_Cancel(DecompressJob job);
+int EXPORT_API Draco_DecompressJob_Wait(DecompressJob job,
+                                        DecompressedMesh *decompressedMesh);
+void EXPORT_API Draco_DecompressJob_Release(DecompressJob job);
+
+// Decoded meshes.
+void EXPORT_API Draco_DecompressedMesh_Release(DecompressedMesh m);
+uint32_t EXPORT_API Draco_DecompressedMesh_GetNumFaces(DecompressedMesh m);
+uint32_t EXPORT_API Draco_DecompressedMesh_GetNumVertices(DecompressedMesh m);
+uint32_t EXPORT_API Draco_DecompressedMesh_GetNumAttributes(DecompressedMesh m);
+void EXPORT_API Draco_DecompressedMesh_GetAttribute(DecompressedMesh m,
+                                                    int index,
+                                                    Attribute *attribute);
+void EXPORT_API Draco_DecompressedMesh_GetAttributeByType(
+    DecompressedMesh m, GeometryAttribute::Type attribType, int index,
+    Attribute *attribute);
+void EXPORT_API Draco_DecompressedMesh_GetAttributeByUniqueId(
+    DecompressedMesh m, uint8_t uniqueId, Attribute *attribute);
+void EXPORT_API Draco_DecompressedMesh_GetIndices(DecompressedMesh m,
+                                                  Data *indices);
+size_t EXPORT_API Draco_DecompressedMesh_GetIndicesSize(DecompressedMesh m);
+int EXPORT_API Draco_DecompressedMesh_CopyIndices(DecompressedMesh m,
+                                                  void *dst,
+                                                  size_t dstCapacity);
+const void *EXPORT_API Draco_DecompressedMesh_GetIndicesView(
+    DecompressedMesh m);
+
+// Attributes of decoded meshes.
+int32_t EXPORT_API Draco_Attribute_GetAttributeType(Attribute a);
+uint32_t EXPORT_API Draco_Attribute_GetDataType(Attribute a);
+uint32_t EXPORT_API Draco_Attribute_GetNumComponents(Attribute a);
+uint32_t EXPORT_API Draco_Attribute_GetUniqueId(Attribute a);
+void EXPORT_API Draco_Attribute_GetData(DecompressedMesh m, Attribute a,
+                                        Data *data);
+size_t EXPORT_API Draco_Attribute_GetDataSize(DecompressedMesh m, Attribute a);
+int EXPORT_API Draco_Attribute_CopyData(DecompressedMesh m, Attribute a,
+                                        void *dst, size_t dstCapacity);
+const void *EXPORT_API Draco_Attribute_GetDataView(DecompressedMesh m,
+                                                   Attribute a);
+
+// Decodes any Draco geometry as a point cloud. Returns a DecompressReturnCode.
+int EXPORT_API Draco_DecompressPointCloud(
+    const char *compressedData, size_t compressedDataSize,
+    DecompressedPointCloud *decompressedPointCloud);
+
+// Decoded point clouds.
+void EXPORT_API Draco_DecompressedPointCloud_Release(DecompressedPointCloud pc);
+uint32_t EXPORT_API
+Draco_DecompressedPointCloud_GetNumVertices(DecompressedPointCloud pc);
+uint32_t EXPORT_API
+Draco_DecompressedPointCloud_GetNumAttributes(DecompressedPointCloud pc);
+void EXPORT_API Draco_DecompressedPointCloud_GetAttribute(
+    DecompressedPointCloud pc, int index, Attribute *attribute);
+void EXPORT_API Draco_DecompressedPointCloud_GetAttributeByType(
+    DecompressedPointCloud pc, GeometryAttribute::Type attribType, int index,
+    Attribute *attribute);
+void EXPORT_API Draco_DecompressedPointCloud_GetAttributeByUniqueId(
+    DecompressedPointCloud pc, uint8_t uniqueId, Attribute *attribute);
+
+// Attributes of decoded point clouds.
+void EXPORT_API Draco_PointCloudAttribute_GetData(DecompressedPointCloud pc,
+                                                  Attribute a, Data *data);
+size_t EXPORT_API Draco_PointCloudAttribute_GetDataSize(
+    DecompressedPointCloud pc, Attribute a);
+int EXPORT_API Draco_PointCloudAttribute_CopyData(DecompressedPointCloud pc,
+                                                  Attribute a, void *dst,
+                                                  size_t dstCapacity);
+const void *EXPORT_API Draco_PointCloudAttribute_GetDataView(
+    DecompressedPointCloud pc, Attribute a);
+
+void EXPORT_API Draco_Data_Release(Data d);
+
+}  // extern "C"
+
+}  // namespace draco
+
+#endif  // DRACO_TINY_LIB
+
+#endif  // DRACO_TINY_LIB_DRACO_TINY_LIB_H_
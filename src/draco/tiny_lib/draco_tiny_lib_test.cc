@@ -0,0 +1,436 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+#include "draco/tiny_lib/draco_tiny_lib.h"
+
+#include <atomic>
+#include <cstring>
+#include <memory>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include "draco/compression/decode.h"
+#include "draco/core/draco_test_base.h"
+#include "draco/core/draco_test_utils.h"
+#include "draco/io/file_utils.h"
+
+namespace draco {
+
+namespace {
+
+class DracoTinyLibTest : public ::testing::Test {
+ protected:
+  void SetUp() override {
+    ASSERT_TRUE(ReadTestFile("test_nm.obj.edgebreaker.cl4.2.2.drc",
+                             &mesh_data_));
+    ASSERT_TRUE(ReadTestFile("test_nm.obj.sequential.cl3.2.2.drc",
+                             &sequential_mesh_data_));
+    ASSERT_TRUE(ReadTestFile("pc_kd_color.drc", &point_cloud_data_));
+  }
+
+  static bool ReadTestFile(const std::string &file_name,
+                           std::vector<char> *data) {
+    return ReadFileToBuffer(GetTestFileFullPath(file_name), data) &&
+           !data->empty();
+  }
+
+  // Returns the mesh decoded by the Decoder API for comparison.
+  static std::unique_ptr<Mesh> DecodeReferenceMesh(
+      const std::vector<char> &data) {
+    DecoderBuffer buffer;
+    buffer.Init(data.data(), data.size());
+    Decoder decoder;
+    auto statusor = decoder.DecodeMeshFromBuffer(&buffer);
+    if (!statusor.ok()) {
+      return nullptr;
+    }
+    return std::move(statusor).value();
+  }
+
+  // Checks that |m| matches the mesh decoded from |data| by the Decoder API.
+  static void CheckMesh(DecompressedMesh m, const std::vector<char> &data) {
+    const std::unique_ptr<Mesh> mesh = DecodeReferenceMesh(data);
+    ASSERT_NE(mesh, nullptr);
+    ASSERT_EQ(Draco_DecompressedMesh_GetNumFaces(m), mesh->num_faces());
+    ASSERT_EQ(Draco_DecompressedMesh_GetNumVertices(m), mesh->num_points());
+    ASSERT_EQ(Draco_DecompressedMesh_GetNumAttributes(m),
+              mesh->num_attributes());
+
+    std::vector<uint32_t> indices(mesh->num_faces() * 3);
+    ASSERT_EQ(Draco_DecompressedMesh_GetIndicesSize(m),
+              indices.size() * sizeof(uint32_t));
+    ASSERT_EQ(Draco_DecompressedMesh_CopyIndices(
+                  m, indices.data(), indices.size() * sizeof(uint32_t)),
+              CopyDataReturnCode_ok);
+    for (FaceIndex f(0); f < mesh->num_faces(); ++f) {
+      for (int c = 0; c < 3; ++c) {
+        ASSERT_EQ(indices[f.value() * 3 + c], mesh->face(f)[c].value());
+      }
+    }
+  }
+
+  std::vector<char> mesh_data_;
+  std::vector<char> sequential_mesh_data_;
+  std::vector<char> point_cloud_data_;
+};
+
+TEST_F(DracoTinyLibTest, TestDecompress) {
+  DecompressedMesh m = {nullptr};
+  ASSERT_EQ(Draco_Decompress(mesh_data_.data(), mesh_data_.size(), &m),
+            DecompressReturnCode_ok);
+  ASSERT_NE(m.internalPtr, nullptr);
+  CheckMesh(m, mesh_data_);
+
+  // Indices returned in library owned data match the copied indices.
+  const size_t indices_size = Draco_DecompressedMesh_GetIndicesSize(m);
+  std::vector<char> indices(indices_size);
+  ASSERT_EQ(
+      Draco_DecompressedMesh_CopyIndices(m, indices.data(), indices.size()),
+      CopyDataReturnCode_ok);
+  Data indices_data;
+  Draco_DecompressedMesh_GetIndices(m, &indices_data);
+  ASSERT_NE(indices_data.data, nullptr);
+  ASSERT_EQ(indices_data.dataSize, indices_size);
+  ASSERT_EQ(memcmp(indices_data.data, indices.data(), indices_size), 0);
+  Draco_Data_Release(indices_data);
+  const void *const indices_view = Draco_DecompressedMesh_GetIndicesView(m);
+  ASSERT_NE(indices_view, nullptr);
+  ASSERT_EQ(memcmp(indices_view, indices.data(), indices_size), 0);
+
+  // Attribute values are the same through all the data accessors.
+  Attribute pos = {nullptr};
+  Draco_DecompressedMesh_GetAttributeByType(m, GeometryAttribute::POSITION, 0,
+                                            &pos);
+  ASSERT_NE(pos.internalPtr, nullptr);
+  ASSERT_EQ(Draco_Attribute_GetAttributeType(pos), GeometryAttribute::POSITION);
+  ASSERT_EQ(Draco_Attribute_GetDataType(pos), DT_FLOAT32);
+  ASSERT_EQ(Draco_Attribute_GetNumComponents(pos), 3);
+  Attribute pos_by_id = {nullptr};
+  Draco_DecompressedMesh_GetAttributeByUniqueId(
+      m, Draco_Attribute_GetUniqueId(pos), &pos_by_id);
+  ASSERT_EQ(pos_by_id.internalPtr, pos.internalPtr);
+
+  const size_t pos_size = Draco_Attribute_GetDataSize(m, pos);
+  ASSERT_EQ(pos_size, Draco_DecompressedMesh_GetNumVertices(m) * 3 *
+                          sizeof(float));
+  std::vector<char> pos_values(pos_size);
+  ASSERT_EQ(
+      Draco_Attribute_CopyData(m, pos, pos_values.data(), pos_values.size()),
+      CopyDataReturnCode_ok);
+  Data pos_data;
+  Draco_Attribute_GetData(m, pos, &pos_data);
+  ASSERT_NE(pos_data.data, nullptr);
+  ASSERT_EQ(pos_data.dataType, DT_FLOAT32);
+  ASSERT_EQ(pos_data.dataSize, pos_size);
+  ASSERT_EQ(memcmp(pos_data.data, pos_values.data(), pos_size), 0);
+  Draco_Data_Release(pos_data);
+
+  // Caller buffers that are too small are rejected.
+  ASSERT_EQ(Draco_Attribute_CopyData(m, pos, pos_values.data(), pos_size - 1),
+            CopyDataReturnCode_bufferTooSmall);
+  ASSERT_EQ(Draco_Attribute_CopyData(m, pos, nullptr, pos_size),
+            CopyDataReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressedMesh_CopyIndices(m, indices.data(),
+                                               indices_size - 1),
+            CopyDataReturnCode_bufferTooSmall);
+
+  // Missing attributes are returned as null handles.
+  Attribute missing = {&m};
+  Draco_DecompressedMesh_GetAttributeByType(m, GeometryAttribute::POSITION, 1,
+                                            &missing);
+  ASSERT_EQ(missing.internalPtr, nullptr);
+  Data missing_data;
+  Draco_Attribute_GetData(m, missing, &missing_data);
+  ASSERT_EQ(missing_data.data, nullptr);
+  ASSERT_EQ(Draco_Attribute_GetDataView(m, missing), nullptr);
+  Draco_DecompressedMesh_Release(m);
+}
+
+TEST_F(DracoTinyLibTest, TestAttributeDataView) {
+  // Sequentially encoded attributes are stored in point order and can be
+  // accessed without a copy.
+  DecompressedMesh m = {nullptr};
+  ASSERT_EQ(Draco_Decompress(sequential_mesh_data_.data(),
+                             sequential_mesh_data_.size(), &m),
+            DecompressReturnCode_ok);
+  CheckMesh(m, sequential_mesh_data_);
+  Attribute pos = {nullptr};
+  Draco_DecompressedMesh_GetAttributeByType(m, GeometryAttribute::POSITION, 0,
+                                            &pos);
+  ASSERT_NE(pos.internalPtr, nullptr);
+  const void *const view = Draco_Attribute_GetDataView(m, pos);
+  ASSERT_NE(view, nullptr);
+  std::vector<char> values(Draco_Attribute_GetDataSize(m, pos));
+  ASSERT_EQ(Draco_Attribute_CopyData(m, pos, values.data(), values.size()),
+            CopyDataReturnCode_ok);
+  ASSERT_EQ(memcmp(view, values.data(), values.size()), 0);
+  Draco_DecompressedMesh_Release(m);
+}
+
+TEST_F(DracoTinyLibTest, TestMalformedInput) {
+  DecompressedMesh m = {nullptr};
+  ASSERT_EQ(Draco_Decompress(nullptr, 0, &m), DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_Decompress(mesh_data_.data(), mesh_data_.size(), nullptr),
+            DecompressReturnCode_nullParams);
+
+  const std::string garbage = "not a draco file";
+  ASSERT_EQ(Draco_Decompress(garbage.data(), garbage.size(), &m),
+            DecompressReturnCode_cantParseGeomType);
+  ASSERT_EQ(m.internalPtr, nullptr);
+
+  // Truncated data can't be decoded.
+  ASSERT_EQ(Draco_Decompress(mesh_data_.data(), mesh_data_.size() / 2, &m),
+            DecompressReturnCode_cantParseTriangularMesh);
+  ASSERT_EQ(m.internalPtr, nullptr);
+
+  // Point clouds must be decoded with Draco_DecompressPointCloud().
+  ASSERT_EQ(
+      Draco_Decompress(point_cloud_data_.data(), point_cloud_data_.size(), &m),
+      DecompressReturnCode_pointCloudsNotSupportedYet);
+  ASSERT_EQ(m.internalPtr, nullptr);
+
+  DecompressedPointCloud pc = {nullptr};
+  ASSERT_EQ(Draco_DecompressPointCloud(nullptr, 0, &pc),
+            DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressPointCloud(garbage.data(), garbage.size(), &pc),
+            DecompressReturnCode_cantParseGeomType);
+  ASSERT_EQ(Draco_DecompressPointCloud(point_cloud_data_.data(),
+                                       point_cloud_data_.size() / 2, &pc),
+            DecompressReturnCode_cantParsePointCloud);
+  ASSERT_EQ(pc.internalPtr, nullptr);
+}
+
+TEST_F(DracoTinyLibTest, TestDecompressPointCloud) {
+  DecompressedPointCloud pc = {nullptr};
+  ASSERT_EQ(Draco_DecompressPointCloud(point_cloud_data_.data(),
+                                       point_cloud_data_.size(), &pc),
+            DecompressReturnCode_ok);
+  ASSERT_NE(pc.internalPtr, nullptr);
+  const uint32_t num_points = Draco_DecompressedPointCloud_GetNumVertices(pc);
+  ASSERT_GT(num_points, 0);
+  ASSERT_GT(Draco_DecompressedPointCloud_GetNumAttributes(pc), 1);
+
+  Attribute color = {nullptr};
+  Draco_DecompressedPointCloud_GetAttributeByType(pc, GeometryAttribute::COLOR,
+                                                  0, &color);
+  ASSERT_NE(color.internalPtr, nullptr);
+  Attribute color_by_id = {nullptr};
+  Draco_DecompressedPointCloud_GetAttributeByUniqueId(
+      pc, Draco_Attribute_GetUniqueId(color), &color_by_id);
+  ASSERT_EQ(color_by_id.internalPtr, color.internalPtr);
+
+  const size_t color_size = Draco_PointCloudAttribute_GetDataSize(pc, color);
+  ASSERT_EQ(color_size % num_points, 0);
+  std::vector<char> values(color_size);
+  ASSERT_EQ(Draco_PointCloudAttribute_CopyData(pc, color, values.data(),
+                                               values.size()),
+            CopyDataReturnCode_ok);
+  Data data;
+  Draco_PointCloudAttribute_GetData(pc, color, &data);
+  ASSERT_NE(data.data, nullptr);
+  ASSERT_EQ(data.dataSize, color_size);
+  ASSERT_EQ(memcmp(data.data, values.data(), color_size), 0);
+  Draco_Data_Release(data);
+  ASSERT_EQ(Draco_PointCloudAttribute_CopyData(pc, color, values.data(),
+                                               color_size - 1),
+            CopyDataReturnCode_bufferTooSmall);
+  Draco_DecompressedPointCloud_Release(pc);
+
+  // Meshes can be decoded as point clouds as well.
+  ASSERT_EQ(
+      Draco_DecompressPointCloud(mesh_data_.data(), mesh_data_.size(), &pc),
+      DecompressReturnCode_ok);
+  const std::unique_ptr<Mesh> mesh = DecodeReferenceMesh(mesh_data_);
+  ASSERT_NE(mesh, nullptr);
+  ASSERT_EQ(Draco_DecompressedPointCloud_GetNumVertices(pc),
+            mesh->num_points());
+  Draco_DecompressedPointCloud_Release(pc);
+}
+
+TEST_F(DracoTinyLibTest, TestDecompressWithContextAndStats) {
+  DecompressContext context = {nullptr};
+  ASSERT_EQ(Draco_DecompressContext_Create(nullptr),
+            DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressContext_Create(&context), DecompressReturnCode_ok);
+  for (int i = 0; i < 2; ++i) {
+    DecompressedMesh m = {nullptr};
+    ASSERT_EQ(Draco_DecompressWithContext(context, mesh_data_.data(),
+                                          mesh_data_.size(), &m),
+              DecompressReturnCode_ok);
+    CheckMesh(m, mesh_data_);
+    Draco_DecompressedMesh_Release(m);
+  }
+  // The decoder state is retained between the decodes until it is cleared.
+  ASSERT_GT(Draco_DecompressContext_GetRetainedMemory(context), 0);
+  Draco_DecompressContext_Clear(context);
+  ASSERT_EQ(Draco_DecompressContext_GetRetainedMemory(context), 0);
+  Draco_DecompressContext_Release(context);
+
+  DecodeStats stats = {nullptr};
+  ASSERT_EQ(Draco_DecodeStats_Create(&stats), DecompressReturnCode_ok);
+  DecompressedMesh m = {nullptr};
+  ASSERT_EQ(Draco_DecompressWithStats(stats, mesh_data_.data(),
+                                      mesh_data_.size(), &m),
+            DecompressReturnCode_ok);
+  CheckMesh(m, mesh_data_);
+  Draco_DecompressedMesh_Release(m);
+  const int num_stages = Draco_DecodeStats_GetNumStages(stats);
+  ASSERT_GT(num_stages, 0);
+  ASSERT_GE(Draco_DecodeStats_GetTotalTimeMs(stats), 0.0);
+  DecodeStageStats stage;
+  ASSERT_EQ(Draco_DecodeStats_GetStage(stats, 0, &stage),
+            DecompressReturnCode_ok);
+  ASSERT_STREQ(Draco_DecodeStats_GetStageName(stage.stage), "header");
+  ASSERT_EQ(Draco_DecodeStats_GetStage(stats, num_stages, &stage),
+            DecompressReturnCode_nullParams);
+  ASSERT_STREQ(Draco_DecodeStats_GetStageName(-1), "unknown");
+  Draco_DecodeStats_Clear(stats);
+  ASSERT_EQ(Draco_DecodeStats_GetNumStages(stats), 0);
+  Draco_DecodeStats_Release(stats);
+
+  // Null handles are rejected.
+  ASSERT_EQ(Draco_DecompressWithContext(DecompressContext{nullptr},
+                                        mesh_data_.data(), mesh_data_.size(),
+                                        &m),
+            DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressWithStats(DecodeStats{nullptr}, mesh_data_.data(),
+                                      mesh_data_.size(), &m),
+            DecompressReturnCode_nullParams);
+}
+
+TEST_F(DracoTinyLibTest, TestDecompressBatch) {
+  const std::string garbage = "not a draco file";
+  const std::vector<CompressedData> inputs = {
+      {mesh_data_.data(), mesh_data_.size()},
+      {garbage.data(), garbage.size()},
+      {sequential_mesh_data_.data(), sequential_mesh_data_.size()},
+      {point_cloud_data_.data(), point_cloud_data_.size()}};
+  const int num_inputs = static_cast<int>(inputs.size());
+  for (const int num_threads : {1, 2, 0, 1000}) {
+    std::vector<DecompressedMesh> meshes(num_inputs);
+    std::vector<int> return_codes(num_inputs);
+    ASSERT_EQ(Draco_DecompressBatch(inputs.data(), num_inputs, num_threads,
+                                    meshes.data(), return_codes.data()),
+              DecompressReturnCode_ok);
+    ASSERT_EQ(return_codes[0], DecompressReturnCode_ok);
+    ASSERT_EQ(return_codes[1], DecompressReturnCode_cantParseGeomType);
+    ASSERT_EQ(return_codes[2], DecompressReturnCode_ok);
+    ASSERT_EQ(return_codes[3], DecompressReturnCode_pointCloudsNotSupportedYet);
+    CheckMesh(meshes[0], mesh_data_);
+    CheckMesh(meshes[2], sequential_mesh_data_);
+    // Handles of failed items are null.
+    ASSERT_EQ(meshes[1].internalPtr, nullptr);
+    ASSERT_EQ(meshes[3].internalPtr, nullptr);
+    for (const DecompressedMesh &m : meshes) {
+      Draco_DecompressedMesh_Release(m);
+    }
+  }
+
+  ASSERT_EQ(Draco_DecompressBatch(nullptr, 0, 1, nullptr, nullptr),
+            DecompressReturnCode_ok);
+  ASSERT_EQ(Draco_DecompressBatch(inputs.data(), -1, 1, nullptr, nullptr),
+            DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressBatch(inputs.data(), num_inputs, 1, nullptr,
+                                  nullptr),
+            DecompressReturnCode_nullParams);
+}
+
+// Callback of the asynchronous decodes that records its invocation.
+struct AsyncCallbackData {
+  std::atomic<int> num_calls;
+  std::atomic<int> return_code;
+};
+
+void OnDecompressFinished(DecompressJob /* job */, int return_code,
+                          void *user_data) {
+  AsyncCallbackData *const data = static_cast<AsyncCallbackData *>(user_data);
+  data->return_code = return_code;
+  ++data->num_calls;
+}
+
+TEST_F(DracoTinyLibTest, TestDecompressAsync) {
+  AsyncCallbackData callback_data;
+  callback_data.num_calls = 0;
+  callback_data.return_code = 1;
+  DecompressJob job = {nullptr};
+  ASSERT_EQ(Draco_DecompressAsync(mesh_data_.data(), mesh_data_.size(),
+                                  OnDecompressFinished, &callback_data, &job),
+            DecompressReturnCode_ok);
+  ASSERT_NE(job.internalPtr, nullptr);
+
+  // The decoded mesh is transferred to the caller by the wait.
+  DecompressedMesh m = {nullptr};
+  ASSERT_EQ(Draco_DecompressJob_Wait(job, &m), DecompressReturnCode_ok);
+  ASSERT_EQ(Draco_DecompressJob_IsFinished(job), 1);
+  ASSERT_NE(m.internalPtr, nullptr);
+  CheckMesh(m, mesh_data_);
+  // The mesh is owned by the caller and stays valid after the job is
+  // released.
+  Draco_DecompressJob_Release(job);
+  ASSERT_EQ(callback_data.num_calls, 1);
+  ASSERT_EQ(callback_data.return_code, DecompressReturnCode_ok);
+  CheckMesh(m, mesh_data_);
+  Draco_DecompressedMesh_Release(m);
+
+  // Meshes that are not taken by the caller are released with the job.
+  ASSERT_EQ(Draco_DecompressAsync(mesh_data_.data(), mesh_data_.size(),
+                                  nullptr, nullptr, &job),
+            DecompressReturnCode_ok);
+  ASSERT_EQ(Draco_DecompressJob_Wait(job, nullptr), DecompressReturnCode_ok);
+  Draco_DecompressJob_Release(job);
+
+  // Failures are reported by the wait and the callback.
+  const std::string garbage = "not a draco file";
+  ASSERT_EQ(Draco_DecompressAsync(garbage.data(), garbage.size(),
+                                  OnDecompressFinished, &callback_data, &job),
+            DecompressReturnCode_ok);
+  m.internalPtr = nullptr;
+  ASSERT_EQ(Draco_DecompressJob_Wait(job, &m),
+            DecompressReturnCode_cantParseGeomType);
+  ASSERT_EQ(m.internalPtr, nullptr);
+  Draco_DecompressJob_Release(job);
+  ASSERT_EQ(callback_data.num_calls, 2);
+  ASSERT_EQ(callback_data.return_code, DecompressReturnCode_cantParseGeomType);
+
+  // Cancelled jobs either finish before the cancellation is noticed or
+  // report it.
+  ASSERT_EQ(Draco_DecompressAsync(mesh_data_.data(), mesh_data_.size(),
+                                  nullptr, nullptr, &job),
+            DecompressReturnCode_ok);
+  Draco_DecompressJob_Cancel(job);
+  const int return_code = Draco_DecompressJob_Wait(job, &m);
+  ASSERT_TRUE(return_code == DecompressReturnCode_ok ||
+              return_code == DecompressReturnCode_cancelled);
+  ASSERT_EQ(m.internalPtr != nullptr,
+            return_code == DecompressReturnCode_ok);
+  Draco_DecompressedMesh_Release(m);
+  Draco_DecompressJob_Release(job);
+
+  // Released jobs that are still running are cancelled.
+  ASSERT_EQ(Draco_DecompressAsync(mesh_data_.data(), mesh_data_.size(),
+                                  nullptr, nullptr, &job),
+            DecompressReturnCode_ok);
+  Draco_DecompressJob_Release(job);
+
+  ASSERT_EQ(Draco_DecompressAsync(nullptr, 0, nullptr, nullptr, &job),
+            DecompressReturnCode_nullParams);
+  ASSERT_EQ(Draco_DecompressAsync(mesh_data_.data(), mesh_data_.size(),
+                                  nullptr, nullptr, nullptr),
+            DecompressReturnCode_nullParams);
+}
+
+}  // namespace
+
+}  // namespace draco
@@ -0,0 +1,687 @@
+// Copyright 2026 The Draco Authors.
+//
+// Licensed under the Apache License, Version 2.0 (the "License");
+// you may not use this file except in compliance with the License.
+// You may obtain a copy of the License at
+//
+//      http://www.apache.org/licenses/LICENSE-2.0
+//
+// Unless required by applicable law or agreed to in writing, software
+// distributed under the License is distributed on an "AS IS" BASIS,
+// WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+// See the License for the specific language governing permissions and
+// limitations under the License.
+//
+// Benchmark of the encode and decode hot paths. The tool encodes and decodes
+// the given input files and a set of synthetic models with every compression
+// level and encoding method and reports the timings in JSON so that the
+// results of different builds can be compared. Where supported, each case runs
+// in a separate process so that its peak memory usage can be reported.
+#include <algorithm>
+#include <chrono>
+#include <cinttypes>
+#include <cmath>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <string>
+#include <vector>
+
+#if defined(__unix__) || defined(__APPLE__)
+#include <sys/resource.h>
+#include <sys/wait.h>
+#define DRACO_BENCHMARK_RUSAGE_SUPPORTED
+#endif
+
+#include "draco/compression/config/compression_shared.h"
+#include "draco/compression/decode.h"
+#include "draco/compression/encode.h"
+#include "draco/core/draco_version.h"
+#include "draco/io/mesh_io.h"
+#include "draco/io/point_cloud_io.h"
+#include "draco/mesh/triangle_soup_mesh_builder.h"
+#include "draco/point_cloud/point_cloud_builder.h"
+#include "draco/tiny_lib/draco_tiny_lib.h"
+
+namespace {
+
+struct Options {
+  Options();
+
+  std::vector<std::string> inputs;
+  std::string output;
+  int iterations;
+  std::vector<int> compression_levels;
+  int synthetic_mesh_resolution;
+  int synthetic_num_points;
+  bool use_interleaved_rans;
+  // Set by -single_case. Index of the input, index of the encoding method and
+  // compression level of the only case run by the process.
+  int single_case_input;
+  int single_case_method;
+  int single_case_level;
+};
+
+Options::Options()
+    : iterations(10),
+      synthetic_mesh_resolution(256),
+      synthetic_num_points(100000),
+      use_interleaved_rans(false),
+      single_case_input(-1),
+      single_case_method(-1),
+      single_case_level(-1) {}
+
+void Usage() {
+  printf("Usage: draco_benchmark [options] [input files]\n");
+  printf("\n");
+  printf("Main options:\n");
+  printf("  -h | -?               show help.\n");
+  printf("  -o <output>           output JSON file name, default=stdout.\n");
+  printf("  -iterations <value>   timed runs per measurement, default=10.\n");
+  printf(
+      "  -cl <list>            comma separated compression levels, "
+      "default=0,1,...,10.\n");
+  printf(
+      "  -synthetic_mesh <n>   resolution of the synthetic grid mesh "
+      "(2*n*n faces), 0 to skip, default=256.\n");
+  printf(
+      "  -synthetic_points <n> number of points of the synthetic point cloud, "
+      "0 to skip, default=100000.\n");
+  printf(
+      "  -interleaved_rans     encode with interleaved rANS entropy coding.\n");
+  printf(
+      "\nInput files can be meshes or point clouds in any format supported "
+      "by\ndraco_encoder, including .drc.\n");
+}
+
+int StringToInt(const std::string &s) {
+  char *end;
+  return strtol(s.c_str(), &end, 10);  // NOLINT
+}
+
+// Geometry used as an input of the benchmark.
+struct BenchmarkInput {
+  std::string name;
+  std::unique_ptr<draco::PointCloud> pc;
+  // Set when |pc| is a mesh with faces.
+  const draco::Mesh *mesh = nullptr;
+};
+
+// Timing statistics of a single measured operation.
+struct Timings {
+  double p50_ms = 0;
+  double p99_ms = 0;
+  double mean_ms = 0;
+};
+
+// Runs |fn| |iterations| times after one warm-up run and returns the timings.
+// Returns false when any of the runs fails.
+template <class FnT>
+bool Measure(int iterations, const FnT &fn, Timings *timings) {
+  if (!fn()) {
+    return false;
+  }
+  std::vector<double> times;
+  for (int i = 0; i < iterations; ++i) {
+    const auto start = std::chrono::steady_clock::now();
+    if (!fn()) {
+      return false;
+    }
+    const std::chrono::duration<double, std::milli> elapsed =
+        std::chrono::steady_clock::now() - start;
+    times.push_back(elapsed.count());
+  }
+  std::sort(times.begin(), times.end());
+  // Nearest-rank percentiles.
+  const auto percentile = [&times](double p) {
+    const size_t rank = static_cast<size_t>(p * times.size() + 0.999999);
+    return times[std::max<size_t>(rank, 1) - 1];
+  };
+  timings->p50_ms = percentile(0.5);
+  timings->p99_ms = percentile(0.99);
+  double sum = 0;
+  for (const double t : times) {
+    sum += t;
+  }
+  timings->mean_ms = sum / times.size();
+  return true;
+}
+
+// Returns the peak resident set size of the process in kilobytes or -1 when
+// it is not available on the current platform.
+int64_t PeakRssKb() {
+#ifdef DRACO_BENCHMARK_RUSAGE_SUPPORTED
+  struct rusage usage;
+  if (getrusage(RUSAGE_SELF, &usage) == 0) {
+#ifdef __APPLE__
+    return usage.ru_maxrss / 1024;  // Reported in bytes.
+#else
+    return usage.ru_maxrss;
+#endif
+  }
+#endif
+  return -1;
+}
+
+// Returns the size of the uncompressed geometry data in bytes.
+size_t RawSize(const BenchmarkInput &input) {
+  size_t size = 0;
+  for (int i = 0; i < input.pc->num_attributes(); ++i) {
+    const draco::PointAttribute *const att = input.pc->attribute(i);
+    size += static_cast<size_t>(input.pc->num_points()) * att->byte_stride();
+  }
+  if (input.mesh) {
+    size += input.mesh->num_faces() * sizeof(draco::Mesh::Face);
+  }
+  return size;
+}
+
+std::unique_ptr<draco::PointCloud> CreateGridMesh(int resolution) {
+  // Gently curved grid with per-vertex normals and texture coordinates.
+  const int num_faces = 2 * resolution * resolution;
+  draco::TriangleSoupMeshBuilder builder;
+  builder.Start(num_faces);
+  const int pos_att_id = builder.AddAttribute(
+      draco::GeometryAttribute::POSITION, 3, draco::DT_FLOAT32);
+  const int norm_att_id = builder.AddAttribute(draco::GeometryAttribute::NORMAL,
+                                               3, draco::DT_FLOAT32);
+  const int tex_att_id = builder.AddAttribute(
+      draco::GeometryAttribute::TEX_COORD, 2, draco::DT_FLOAT32);
+  const auto vertex = [resolution](int x, int y, float *pos, float *norm,
+                                   float *tex) {
+    tex[0] = static_cast<float>(x) / resolution;
+    tex[1] = static_cast<float>(y) / resolution;
+    pos[0] = tex[0];
+    pos[1] = tex[1];
+    pos[2] = 0.1f * tex[0] * tex[0] - 0.05f * tex[1];
+    const float nx = -0.2f * tex[0];
+    const float ny = 0.05f;
+    const float len = std::sqrt(nx * nx + ny * ny + 1.f);
+    norm[0] = nx / len;
+    norm[1] = ny / len;
+    norm[2] = 1.f / len;
+  };
+  float pos[4][3], norm[4][3], tex[4][2];
+  draco::FaceIndex face(0);
+  for (int y = 0; y < resolution; ++y) {
+    for (int x = 0; x < resolution; ++x) {
+      vertex(x, y, pos[0], norm[0], tex[0]);
+      vertex(x + 1, y, pos[1], norm[1], tex[1]);
+      vertex(x + 1, y + 1, pos[2], norm[2], tex[2]);
+      vertex(x, y + 1, pos[3], norm[3], tex[3]);
+      const int quad_faces[2][3] = {{0, 1, 2}, {0, 2, 3}};
+      for (int f = 0; f < 2; ++f, ++face) {
+        const int *const c = quad_faces[f];
+        builder.SetAttributeValuesForFace(pos_att_id, face, pos[c[0]],
+                                          pos[c[1]], pos[c[2]]);
+        builder.SetAttributeValuesForFace(norm_att_id, face, norm[c[0]],
+                                          norm[c[1]], norm[c[2]]);
+        builder.SetAttributeValuesForFace(tex_att_id, face, tex[c[0]],
+                                          tex[c[1]], tex[c[2]]);
+      }
+    }
+  }
+  return builder.Finalize();
+}
+
+std::unique_ptr<draco::PointCloud> CreatePointCloud(int num_points) {
+  // Points on a sphere with colors, generated with a fixed seed.
+  draco::PointCloudBuilder builder;
+  builder.Start(num_points);
+  const int pos_att_id = builder.AddAttribute(
+      draco::GeometryAttribute::POSITION, 3, draco::DT_FLOAT32);
+  const int color_att_id =
+      builder.AddAttribute(draco::GeometryAttribute::COLOR, 3, draco::DT_UINT8);
+  uint32_t seed = 12345;
+  const auto random = [&seed]() {
+    seed = seed * 1664525u + 1013904223u;
+    return static_cast<float>(seed >> 8) / (1 << 24);
+  };
+  for (draco::PointIndex i(0); i < num_points; ++i) {
+    const float theta = 6.2831853f * random();
+    const float z = 2.f * random() - 1.f;
+    const float r = std::sqrt(1.f - z * z);
+    const float pos[3] = {r * std::cos(theta), r * std::sin(theta), z};
+    const uint8_t color[3] = {static_cast<uint8_t>(127 * (pos[0] + 1.f)),
+                              static_cast<uint8_t>(127 * (pos[1] + 1.f)),
+                              static_cast<uint8_t>(127 * (pos[2] + 1.f))};
+    builder.SetAttributeValueForPoint(pos_att_id, i, pos);
+    builder.SetAttributeValueForPoint(color_att_id, i, color);
+  }
+  return builder.Finalize(false);
+}
+
+void InitInput(const std::string &name, std::unique_ptr<draco::PointCloud> pc,
+               BenchmarkInput *input) {
+  input->name = name;
+  input->pc = std::move(pc);
+  const draco::Mesh *const mesh =
+      dynamic_cast<const draco::Mesh *>(input->pc.get());
+  input->mesh = mesh && mesh->num_faces() > 0 ? mesh : nullptr;
+}
+
+// Returns the number of inputs. Input files come first, followed by the
+// synthetic mesh and the synthetic point cloud.
+int GetNumInputs(const Options &options) {
+  return static_cast<int>(options.inputs.size()) +
+         (options.synthetic_mesh_resolution > 0 ? 1 : 0) +
+         (options.synthetic_num_points > 0 ? 1 : 0);
+}
+
+// Loads the input with |index|. Returns false when the input can't be loaded.
+bool LoadInput(const Options &options, int index, BenchmarkInput *input) {
+  if (index < static_cast<int>(options.inputs.size())) {
+    const std::string &file_name = options.inputs[index];
+    auto maybe_mesh = draco::ReadMeshFromFile(file_name);
+    if (maybe_mesh.ok()) {
+      InitInput(file_name, std::move(maybe_mesh).value(), input);
+      return true;
+    }
+    // Point cloud files, e.g. kd-tree encoded .drc files, can't be loaded as
+    // meshes.
+    auto maybe_pc = draco::ReadPointCloudFromFile(file_name);
+    if (!maybe_pc.ok()) {
+      fprintf(stderr, "Failed loading %s, skipping: %s\n", file_name.c_str(),
+              maybe_pc.status().error_msg());
+      return false;
+    }
+    InitInput(file_name, std::move(maybe_pc).value(), input);
+    return true;
+  }
+  index -= static_cast<int>(options.inputs.size());
+  if (options.synthetic_mesh_resolution > 0 && index-- == 0) {
+    InitInput(
+        "synthetic_grid_" + std::to_string(options.synthetic_mesh_resolution),
+        CreateGridMesh(options.synthetic_mesh_resolution), input);
+    return true;
+  }
+  InitInput("synthetic_points_" + std::to_string(options.synthetic_num_points),
+            CreatePointCloud(options.synthetic_num_points), input);
+  return true;
+}
+
+#ifdef DRACO_TINY_LIB
+// Decodes |data| through the tiny_lib C interface including the copies of the
+// decoded data to the caller owned memory.
+bool DecodeWithTinyLib(const std::vector<char> &data, bool is_mesh,
+                       std::vector<char> *scratch) {
+  if (is_mesh) {
+    draco::DecompressedMesh mesh;
+    if (draco::Draco_Decompress(data.data(), data.size(), &mesh) != 0) {
+      return false;
+    }
+    bool ok = true;
+    scratch->resize(draco::Draco_DecompressedMesh_GetIndicesSize(mesh));
+    ok &= draco::Draco_DecompressedMesh_CopyIndices(mesh, scratch->data(),
+                                                    scratch->size()) == 0;
+    const int num_attributes =
+        draco::Draco_DecompressedMesh_GetNumAttributes(mesh);
+    for (int i = 0; i < num_attributes; ++i) {
+      draco::Attribute att;
+      draco::Draco_DecompressedMesh_GetAttribute(mesh, i, &att);
+      scratch->resize(draco::Draco_Attribute_GetDataSize(mesh, att));
+      ok &= draco::Draco_Attribute_CopyData(mesh, att, scratch->data(),
+                                            scratch->size()) == 0;
+    }
+    draco::Draco_DecompressedMesh_Release(mesh);
+    return ok;
+  }
+  draco::DecompressedPointCloud pc;
+  if (draco::Draco_DecompressPointCloud(data.data(), data.size(), &pc) != 0) {
+    return false;
+  }
+  bool ok = true;
+  const int num_attributes =
+      draco::Draco_DecompressedPointCloud_GetNumAttributes(pc);
+  for (int i = 0; i < num_attributes; ++i) {
+    draco::Attribute att;
+    draco::Draco_DecompressedPointCloud_GetAttribute(pc, i, &att);
+    scratch->resize(draco::Draco_PointCloudAttribute_GetDataSize(pc, att));
+    ok &= draco::Draco_PointCloudAttribute_CopyData(pc, att, scratch->data(),
+                                                    scratch->size()) == 0;
+  }
+  draco::Draco_DecompressedPointCloud_Release(pc);
+  return ok;
+}
+#endif  // DRACO_TINY_LIB
+
+std::string JsonString(const std::string &s) {
+  std::string out = "\"";
+  for (const char c : s) {
+    if (c == '"' || c == '\\') {
+      out += '\\';
+      out += c;
+    } else if (static_cast<unsigned char>(c) < 0x20) {
+      char escaped[8];
+      snprintf(escaped, sizeof(escaped), "\\u%04x", c);
+      out += escaped;
+    } else {
+      out += c;
+    }
+  }
+  return out + "\"";
+}
+
+// Returns a JSON object with the timings and the derived throughput of an
+// operation that processed |input|.
+std::string TimingsJson(const Timings &timings, const BenchmarkInput &input,
+                        size_t raw_size) {
+  const double seconds = timings.mean_ms / 1000.0;
+  const double num_faces = input.mesh ? input.mesh->num_faces() : 0;
+  char json[512];
+  snprintf(json, sizeof(json),
+           "{\"p50_ms\": %.4f, \"p99_ms\": %.4f, \"mean_ms\": %.4f, "
+           "\"mb_per_s\": %.3f, \"mfaces_per_s\": %.3f, "
+           "\"mpoints_per_s\": %.3f}",
+           timings.p50_ms, timings.p99_ms, timings.mean_ms,
+           seconds > 0 ? raw_size / seconds / 1e6 : 0.0,
+           seconds > 0 ? num_faces / seconds / 1e6 : 0.0,
+           seconds > 0 ? input.pc->num_points() / seconds / 1e6 : 0.0);
+  return json;
+}
+
+// Benchmarks one input with one encoding method and compression level.
+// Returns a JSON object with the results.
+std::string RunCase(const BenchmarkInput &input, int method,
+                    const char *method_name, int compression_level,
+                    bool use_interleaved_rans, int iterations) {
+  const size_t raw_size = RawSize(input);
+  std::string json = "{\"input\": " + JsonString(input.name);
+  json += ", \"geometry\": ";
+  json += input.mesh ? "\"mesh\"" : "\"point_cloud\"";
+  json += ", \"method\": " + JsonString(method_name);
+  json += ", \"compression_level\": " + std::to_string(compression_level);
+  json += ", \"interleaved_rans\": ";
+  json += use_interleaved_rans ? "true" : "false";
+  json += ", \"num_points\": " + std::to_string(input.pc->num_points());
+  json += ", \"num_faces\": " +
+          std::to_string(input.mesh ? input.mesh->num_faces() : 0);
+  json += ", \"raw_bytes\": " + std::to_string(raw_size);
+
+  // Same default quantization as draco_encoder.
+  const int speed = 10 - compression_level;
+  draco::Encoder encoder;
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::POSITION, 11);
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::TEX_COORD, 10);
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::NORMAL, 8);
+  encoder.SetAttributeQuantization(draco::GeometryAttribute::GENERIC, 8);
+  encoder.SetSpeedOptions(speed, speed);
+  encoder.SetEncodingMethod(method);
+  encoder.SetUseInterleavedRAns(use_interleaved_rans);
+
+  draco::EncoderBuffer buffer;
+  draco::Status status;
+  Timings encode_timings;
+  const bool encoded = Measure(
+      iterations,
+      [&]() {
+        buffer.Clear();
+        status = input.mesh
+                     ? encoder.EncodeMeshToBuffer(*input.mesh, &buffer)
+                     : encoder.EncodePointCloudToBuffer(*input.pc, &buffer);
+        return status.ok();
+      },
+      &encode_timings);
+  if (!encoded) {
+    json += ", \"error\": " + JsonString(status.error_msg_string());
+    json += ", \"peak_rss_kb\": " + std::to_string(PeakRssKb()) + "}";
+    return json;
+  }
+  const std::vector<char> data(buffer.data(), buffer.data() + buffer.size());
+  json += ", \"encoded_bytes\": " + std::to_string(data.size());
+  json += ", \"encode\": " + TimingsJson(encode_timings, input, raw_size);
+
+  // Decodes through the draco::Decoder API into a new geometry each time,
+  // optionally sharing |context| between the runs.
+  const auto decode = [&data, &input](draco::DecoderContext *context) {
+    draco::DecoderBuffer in_buffer;
+    in_buffer.Init(data.data(), data.size());
+    draco::Decoder decoder;
+    decoder.SetDecoderContext(context);
+    if (input.mesh) {
+      return decoder.DecodeMeshFromBuffer(&in_buffer).ok();
+    }
+    return decoder.DecodePointCloudFromBuffer(&in_buffer).ok();
+  };
+  json += ", \"decode\": {";
+  Timings timings;
+  if (Measure(
+          iterations, [&]() { return decode(nullptr); }, &timings)) {
+    json += "\"decoder\": " + TimingsJson(timings, input, raw_size);
+  } else {
+    json += "\"decoder\": null";
+  }
+  draco::DecoderContext context;
+  if (Measure(
+          iterations, [&]() { return decode(&context); }, &timings)) {
+    json += ", \"decoder_context\": " + TimingsJson(timings, input, raw_size);
+  } else {
+    json += ", \"decoder_context\": null";
+  }
+#ifdef DRACO_TINY_LIB
+  std::vector<char> scratch;
+  if (Measure(
+          iterations,
+          [&]() {
+            return DecodeWithTinyLib(data, input.mesh != nullptr, &scratch);
+          },
+          &timings)) {
+    json += ", \"tiny_lib\": " + TimingsJson(timings, input, raw_size);
+  } else {
+    json += ", \"tiny_lib\": null";
+  }
+#endif
+  json += "}, \"peak_rss_kb\": " + std::to_string(PeakRssKb()) + "}";
+  return json;
+}
+
+// Number of encoding methods benchmarked for each geometry type.
+constexpr int kNumMethods = 2;
+
+// Benchmarks |input| with the encoding method with |method_index| and
+// |compression_level|. Returns a JSON object with the results.
+std::string RunMethodCase(const BenchmarkInput &input, int method_index,
+                          int compression_level, const Options &options) {
+  struct Method {
+    int method;
+    const char *name;
+  };
+  static const Method kMeshMethods[kNumMethods] = {
+      {draco::MESH_SEQUENTIAL_ENCODING, "sequential"},
+      {draco::MESH_EDGEBREAKER_ENCODING, "edgebreaker"}};
+  static const Method kPointCloudMethods[kNumMethods] = {
+      {draco::POINT_CLOUD_SEQUENTIAL_ENCODING, "sequential"},
+      {draco::POINT_CLOUD_KD_TREE_ENCODING, "kd_tree"}};
+  const Method &method = input.mesh ? kMeshMethods[method_index]
+                                    : kPointCloudMethods[method_index];
+  fprintf(stderr, "%s %s cl%d\n", input.name.c_str(), method.name,
+          compression_level);
+  return RunCase(input, method.method, method.name, compression_level,
+                 options.use_interleaved_rans, options.iterations);
+}
+
+// Exit code of a -single_case process whose input can't be loaded.
+constexpr int kExitInputNotLoaded = 2;
+
+#ifdef DRACO_BENCHMARK_RUSAGE_SUPPORTED
+// Returns |arg| quoted for the POSIX shell.
+std::string ShellQuote(const std::string &arg) {
+  std::string out = "'";
+  for (const char c : arg) {
+    if (c == '\'') {
+      out += "'\\''";
+    } else {
+      out += c;
+    }
+  }
+  return out + "'";
+}
+
+// Runs |command| and stores its standard output in |output|. Returns the exit
+// code of the command or -1 when it could not be run.
+int RunCommand(const std::string &command, std::string *output) {
+  FILE *const pipe = popen(command.c_str(), "r");
+  if (!pipe) {
+    return -1;
+  }
+  char chunk[4096];
+  size_t size;
+  while ((size = fread(chunk, 1, sizeof(chunk), pipe)) > 0) {
+    output->append(chunk, size);
+  }
+  const int status = pclose(pipe);
+  if (status == -1 || !WIFEXITED(status)) {
+    return -1;
+  }
+  return WEXITSTATUS(status);
+}
+#endif  // DRACO_BENCHMARK_RUSAGE_SUPPORTED
+
+}  // namespace
+
+int main(int argc, char **argv) {
+  Options options;
+  const int argc_check = argc - 1;
+
+  for (int i = 1; i < argc; ++i) {
+    if (!strcmp("-h", argv[i]) || !strcmp("-?", argv[i])) {
+      Usage();
+      return 0;
+    } else if (!strcmp("-o", argv[i]) && i < argc_check) {
+      options.output = argv[++i];
+    } else if (!strcmp("-iterations", argv[i]) && i < argc_check) {
+      options.iterations = std::max(1, StringToInt(argv[++i]));
+    } else if (!strcmp("-cl", argv[i]) && i < argc_check) {
+      const std::string list = argv[++i];
+      size_t pos = 0;
+      while (pos < list.size()) {
+        const size_t end = std::min(list.find(',', pos), list.size());
+        const int level = StringToInt(list.substr(pos, end - pos));
+        options.compression_levels.push_back(std::min(std::max(level, 0), 10));
+        pos = end + 1;
+      }
+    } else if (!strcmp("-synthetic_mesh", argv[i]) && i < argc_check) {
+      options.synthetic_mesh_resolution = StringToInt(argv[++i]);
+    } else if (!strcmp("-synthetic_points", argv[i]) && i < argc_check) {
+      options.synthetic_num_points = StringToInt(argv[++i]);
+    } else if (!strcmp("-interleaved_rans", argv[i])) {
+      options.use_interleaved_rans = true;
+    } else if (!strcmp("-single_case", argv[i]) && i < argc_check) {
+      // Internal option used to run each case in a separate process.
+      if (sscanf(argv[++i], "%d,%d,%d", &options.single_case_input,
+                 &options.single_case_method,
+                 &options.single_case_level) != 3) {
+        printf("Invalid case %s.\n", argv[i]);
+        return -1;
+      }
+    } else if (argv[i][0] == '-') {
+      printf("Unknown option %s.\n", argv[i]);
+      Usage();
+      return -1;
+    } else {
+      options.inputs.push_back(argv[i]);
+    }
+  }
+  if (options.compression_levels.empty()) {
+    for (int level = 0; level <= 10; ++level) {
+      options.compression_levels.push_back(level);
+    }
+  }
+
+  const int num_inputs = GetNumInputs(options);
+  if (num_inputs == 0) {
+    Usage();
+    return -1;
+  }
+
+  if (options.single_case_input >= 0) {
+    if (options.single_case_input >= num_inputs ||
+        options.single_case_method < 0 ||
+        options.single_case_method >= kNumMethods ||
+        options.single_case_level < 0 || options.single_case_level > 10) {
+      printf("Invalid case.\n");
+      return -1;
+    }
+    BenchmarkInput input;
+    if (!LoadInput(options, options.single_case_input, &input)) {
+      return kExitInputNotLoaded;
+    }
+    fputs(RunMethodCase(input, options.single_case_method,
+                        options.single_case_level, options)
+              .c_str(),
+          stdout);
+    return 0;
+  }
+
+  std::vector<std::string> results;
+#ifdef DRACO_BENCHMARK_RUSAGE_SUPPORTED
+  // Every case runs in a child process, which reports its own peak memory
+  // usage. This process never loads any input, so the peak of the child is
+  // not inflated by the memory of other cases.
+  std::string command = ShellQuote(argv[0]);
+  for (int i = 1; i < argc; ++i) {
+    command += " " + ShellQuote(argv[i]);
+  }
+  for (int i = 0; i < num_inputs; ++i) {
+    bool input_loaded = true;
+    for (int m = 0; m < kNumMethods && input_loaded; ++m) {
+      for (const int level : options.compression_levels) {
+        std::string result;
+        const int exit_code =
+            RunCommand(command + " -single_case " + std::to_string(i) + "," +
+                           std::to_string(m) + "," + std::to_string(level),
+                       &result);
+        if (exit_code == kExitInputNotLoaded) {
+          input_loaded = false;
+          break;
+        }
+        if (exit_code != 0 || result.empty()) {
+          fprintf(stderr, "Failed running case %d,%d,%d.\n", i, m, level);
+          continue;
+        }
+        results.push_back(result);
+      }
+    }
+  }
+#else
+  for (int i = 0; i < num_inputs; ++i) {
+    BenchmarkInput input;
+    if (!LoadInput(options, i, &input)) {
+      continue;
+    }
+    for (int m = 0; m < kNumMethods; ++m) {
+      for (const int level : options.compression_levels) {
+        results.push_back(RunMethodCase(input, m, level, options));
+      }
+    }
+  }
+#endif  // DRACO_BENCHMARK_RUSAGE_SUPPORTED
+
+  std::string json = "{\"draco_version\": " + JsonString(draco::kDracoVersion) +
+                     ", \"iterations\": " + std::to_string(options.iterations);
+#ifdef DRACO_TINY_LIB
+  json += ", \"tiny_lib\": true";
+#else
+  json += ", \"tiny_lib\": false";
+#endif
+  json += ", \"results\": [\n";
+  for (size_t i = 0; i < results.size(); ++i) {
+    json += "  " + results[i] + (i + 1 < results.size() ? ",\n" : "\n");
+  }
+  json += "]}\n";
+
+  if (options.output.empty()) {
+    fputs(json.c_str(), stdout);
+    return 0;
+  }
+  FILE *const file = fopen(options.output.c_str(), "w");
+  if (!file || fwrite(json.data(), 1, json.size(), file) != json.size()) {
+    printf("Failed writing %s.\n", options.output.c_str());
+    if (file) {
+      fclose(file);
+    }
+    return -1;
+  }
+  fclose(file);
+  return 0;
+}
@@ -16,12 +16,19 @@
 
 #include "draco/compression/decode.h"
 #include "draco/core/cycle_timer.h"
-#include "draco/io/file_utils.h"
+#include "draco/draco_features.h"
+#include "draco/io/file_decoder_buffer.h"
 #include "draco/io/obj_encoder.h"
 #include "draco/io/parser_utils.h"
 #include "draco/io/ply_encoder.h"
 #include "draco/io/stl_encoder.h"
 
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+#include <atomic>
+#include <cstdlib>
+#include <new>
+#endif
+
 namespace {
 
 struct Options {
@@ -29,9 +36,10 @@ struct Options {
 
   std::string input;
   std::string output;
+  bool print_stats;
 };
 
-Options::Options() {}
+Options::Options() : print_stats(false) {}
 
 void Usage() {
   printf("Usage: draco_decoder [options] -i input\n");
@@ -39,6 +47,15 @@ void Usage() {
   printf("Main options:\n");
   printf("  -h | -?               show help.\n");
   printf("  -o <output>           output file name.\n");
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+  printf(
+      "  -stats                print the time, consumed bytes and allocations "
+      "of each decoding stage.\n");
+#else
+  printf(
+      "  -stats                print the time and consumed bytes of each "
+      "decoding stage.\n");
+#endif
 }
 
 int ReturnError(const draco::Status &status) {
@@ -46,8 +63,139 @@ int ReturnError(const draco::Status &status) {
   return -1;
 }
 
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+// Number of allocations made by the process, reported by -stats.
+std::atomic<int64_t> num_allocations(0);
+
+void *CountedMalloc(size_t size) {
+  ++num_allocations;
+  return malloc(size == 0 ? 1 : size);
+}
+
+void *CountedMallocOrThrow(size_t size) {
+  void *const ptr = CountedMalloc(size);
+  if (ptr == nullptr) {
+    throw std::bad_alloc();
+  }
+  return ptr;
+}
+
+#ifdef __cpp_aligned_new
+void *CountedAlignedMalloc(size_t size, std::align_val_t alignment) {
+  ++num_allocations;
+  size = size == 0 ? 1 : size;
+#ifdef _WIN32
+  return _aligned_malloc(size, static_cast<size_t>(alignment));
+#else
+  void *ptr = nullptr;
+  if (posix_memalign(&ptr, static_cast<size_t>(alignment), size) != 0) {
+    return nullptr;
+  }
+  return ptr;
+#endif
+}
+
+void *CountedAlignedMallocOrThrow(size_t size, std::align_val_t alignment) {
+  void *const ptr = CountedAlignedMalloc(size, alignment);
+  if (ptr == nullptr) {
+    throw std::bad_alloc();
+  }
+  return ptr;
+}
+
+void AlignedFree(void *ptr) {
+#ifdef _WIN32
+  _aligned_free(ptr);
+#else
+  free(ptr);
+#endif
+}
+#endif  // __cpp_aligned_new
+#endif  // DRACO_DECODER_ALLOCATION_STATS
+
+void PrintStats(const draco::DecoderStats &stats) {
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+  printf("%-24s %9s %10s %12s %11s\n", "Stage", "Attribute", "Time (ms)",
+         "Bytes", "Allocations");
+#else
+  printf("%-24s %9s %10s %12s\n", "Stage", "Attribute", "Time (ms)",
+         "Bytes");
+#endif
+  for (const draco::DecoderStats::StageStats &stage : stats.stages()) {
+    char attribute[16] = "-";
+    if (stage.attribute_id >= 0) {
+      snprintf(attribute, sizeof(attribute), "%d", stage.attribute_id);
+    }
+    printf("%-24s %9s %10.3f %12" PRId64,
+           draco::DecoderStats::StageName(stage.stage), attribute,
+           stage.time_ms, stage.num_bytes);
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+    printf(" %11" PRId64, stage.num_allocations);
+#endif
+    printf("\n");
+  }
+  printf("%-24s %9s %10.3f\n", "Total", "", stats.TotalTimeMs());
+}
+
 }  // namespace
 
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+// Replacements of all global allocation functions that count the allocations
+// of the process.
+void *operator new(size_t size) { return CountedMallocOrThrow(size); }
+void *operator new[](size_t size) { return CountedMallocOrThrow(size); }
+void *operator new(size_t size, const std::nothrow_t &) noexcept {
+  return CountedMalloc(size);
+}
+void *operator new[](size_t size, const std::nothrow_t &) noexcept {
+  return CountedMalloc(size);
+}
+void operator delete(void *ptr) noexcept { free(ptr); }
+void operator delete[](void *ptr) noexcept { free(ptr); }
+void operator delete(void *ptr, const std::nothrow_t &) noexcept { free(ptr); }
+void operator delete[](void *ptr, const std::nothrow_t &) noexcept {
+  free(ptr);
+}
+#if __cplusplus >= 201402L
+void operator delete(void *ptr, size_t) noexcept { free(ptr); }
+void operator delete[](void *ptr, size_t) noexcept { free(ptr); }
+#endif
+#ifdef __cpp_aligned_new
+void *operator new(size_t size, std::align_val_t alignment) {
+  return CountedAlignedMallocOrThrow(size, alignment);
+}
+void *operator new[](size_t size, std::align_val_t alignment) {
+  return CountedAlignedMallocOrThrow(size, alignment);
+}
+void *operator new(size_t size, std::align_val_t alignment,
+                   const std::nothrow_t &) noexcept {
+  return CountedAlignedMalloc(size, alignment);
+}
+void *operator new[](size_t size, std::align_val_t alignment,
+                     const std::nothrow_t &) noexcept {
+  return CountedAlignedMalloc(size, alignment);
+}
+void operator delete(void *ptr, std::align_val_t) noexcept { AlignedFree(ptr); }
+void operator delete[](void *ptr, std::align_val_t) noexcept {
+  AlignedFree(ptr);
+}
+void operator delete(void *ptr, size_t, std::align_val_t) noexcept {
+  AlignedFree(ptr);
+}
+void operator delete[](void *ptr, size_t, std::align_val_t) noexcept {
+  AlignedFree(ptr);
+}
+void operator delete(void *ptr, std::align_val_t,
+                     const std::nothrow_t &) noexcept {
+  AlignedFree(ptr);
+}
+void operator delete[](void *ptr, std::align_val_t,
+                       const std::nothrow_t &) noexcept {
+  AlignedFree(ptr);
+}
+#endif  // __cpp_aligned_new
+#endif  // DRACO_DECODER_ALLOCATION_STATS
+
 int main(int argc, char **argv) {
   Options options;
   const int argc_check = argc - 1;
@@ -60,6 +208,8 @@ int main(int argc, char **argv) {
       options.input = argv[++i];
     } else if (!strcmp("-o", argv[i]) && i < argc_check) {
       options.output = argv[++i];
+    } else if (!strcmp("-stats", argv[i])) {
+      options.print_stats = true;
     }
   }
   if (argc < 3 || options.input.empty()) {
@@ -67,20 +217,25 @@ int main(int argc, char **argv) {
     return -1;
   }
 
-  std::vector<char> data;
-  if (!draco::ReadFileToBuffer(options.input, &data)) {
+  // Create a draco decoding buffer. When possible the input file is memory
+  // mapped and decoded in place, otherwise it is read into memory.
+  draco::FileDecoderBuffer file_buffer;
+  if (!file_buffer.Open(options.input).ok()) {
     printf("Failed opening the input file.\n");
     return -1;
   }
 
-  if (data.empty()) {
+  if (file_buffer.size() == 0) {
     printf("Empty input file.\n");
     return -1;
   }
+  draco::DecoderBuffer &buffer = *file_buffer.buffer();
 
-  // Create a draco decoding buffer. Note that no data is copied in this step.
-  draco::DecoderBuffer buffer;
-  buffer.Init(data.data(), data.size());
+  draco::DecoderStats stats;
+#ifdef DRACO_DECODER_ALLOCATION_STATS
+  stats.set_allocation_counter([]() { return num_allocations.load(); });
+#endif
+  draco::DecoderStats *const stats_ptr = options.print_stats ? &stats : nullptr;
 
   draco::CycleTimer timer;
   // Decode the input data into a geometry.
@@ -94,6 +249,7 @@ int main(int argc, char **argv) {
   if (geom_type == draco::TRIANGULAR_MESH) {
     timer.Start();
     draco::Decoder decoder;
+    decoder.SetStats(stats_ptr);
     auto statusor = decoder.DecodeMeshFromBuffer(&buffer);
     if (!statusor.ok()) {
       return ReturnError(statusor.status());
@@ -108,6 +264,7 @@ int main(int argc, char **argv) {
     // Failed to decode it as mesh, so let's try to decode it as a point cloud.
     timer.Start();
     draco::Decoder decoder;
+    decoder.SetStats(stats_ptr);
     auto statusor = decoder.DecodePointCloudFromBuffer(&buffer);
     if (!statusor.ok()) {
       return ReturnError(statusor.status());
@@ -176,5 +333,8 @@ int main(int argc, char **argv) {
   }
   printf("Decoded geometry saved to %s (%" PRId64 " ms to decode)\n",
          options.output.c_str(), timer.GetInMs());
+  if (options.print_stats) {
+    PrintStats(stats);
+  }
   return 0;
 }
@@ -17,8 +17,10 @@
 
 #include "draco/compression/config/compression_shared.h"
 #include "draco/compression/encode.h"
+#include "draco/compression/encoder_option_search.h"
 #include "draco/compression/expert_encode.h"
 #include "draco/core/cycle_timer.h"
+#include "draco/io/encoded_asset_cache.h"
 #include "draco/io/file_utils.h"
 #include "draco/io/mesh_io.h"
 #include "draco/io/point_cloud_io.h"
@@ -39,8 +41,17 @@ struct Options {
   int compression_level;
   bool preserve_polygons;
   bool use_metadata;
+  bool use_interleaved_rans;
+  bool use_realtime_encoding;
+  bool auto_tune;
+  double max_position_error;
+  double max_decode_time_ms;
+  int num_threads;
   std::string input;
   std::string output;
+  std::string cache_dir;
+  int cache_size_mb;
+  int streaming_chunk_size;
 };
 
 Options::Options()
@@ -54,7 +65,15 @@ Options::Options()
       generic_deleted(false),
       compression_level(7),
       preserve_polygons(false),
-      use_metadata(false) {}
+      use_metadata(false),
+      use_interleaved_rans(false),
+      use_realtime_encoding(false),
+      auto_tune(false),
+      max_position_error(0.0),
+      max_decode_time_ms(0.0),
+      num_threads(1),
+      cache_size_mb(1024),
+      streaming_chunk_size(0) {}
 
 void Usage() {
   printf("Usage: draco_encoder [options] -i input\n");
@@ -91,6 +110,44 @@ void Usage() {
   // mesh and polygon reconstruction information is encoded into a new generic
   // attribute.
   printf("  -preserve_polygons    encode polygon info as an attribute.\n");
+  printf(
+      "  -interleaved_rans     use interleaved rANS entropy coding for faster "
+      "decoding\n"
+      "                        (requires a decoder supporting bitstream 2.3+)."
+      "\n");
+  printf(
+      "  -realtime             use the realtime encoding profile with a "
+      "bounded encoding\n"
+      "                        time at the cost of compression.\n");
+  printf(
+      "  -auto_tune            search for the position quantization and "
+      "compression level\n"
+      "                        with the smallest output within the budget "
+      "below.\n");
+  printf(
+      "  -max_error <value>    maximum position error allowed by -auto_tune "
+      "(default: the\n"
+      "                        error of -qp).\n");
+  printf(
+      "  -max_decode_ms <val>  maximum decoding time in milliseconds allowed "
+      "by -auto_tune.\n");
+  printf(
+      "  -threads <value>      number of threads used by -auto_tune and to "
+      "deduplicate\n"
+      "                        the input, default=1.\n");
+  printf(
+      "  -cache_dir <dir>      reuse encoded assets stored in <dir> when the "
+      "input and\n"
+      "                        options are unchanged.\n");
+  printf(
+      "  -cache_size_mb <val>  maximum size of the cached assets in MB "
+      "(default: 1024).\n");
+  printf(
+      "  -streaming_chunk_size <val>\n"
+      "                        parse obj and ply input in chunks of <val> "
+      "bytes instead of\n"
+      "                        loading the whole file, default=0 "
+      "(disabled).\n");
 
   printf(
       "\nUse negative quantization values to skip the specified attribute\n");
@@ -101,9 +158,17 @@ int StringToInt(const std::string &s) {
   return strtol(s.c_str(), &end, 10);  // NOLINT
 }
 
+double StringToDouble(const std::string &s) {
+  char *end;
+  return strtod(s.c_str(), &end);  // NOLINT
+}
+
 void PrintOptions(const draco::PointCloud &pc, const Options &options) {
   printf("Encoder options:\n");
   printf("  Compression level = %d\n", options.compression_level);
+  if (options.use_realtime_encoding) {
+    printf("  Realtime encoding profile enabled\n");
+  }
   if (options.pos_quantization_bits == 0) {
     printf("  Positions: No quantization\n");
   } else {
@@ -146,13 +211,43 @@ void PrintOptions(const draco::PointCloud &pc, const Options &options) {
   printf("\n");
 }
 
+// Encodes the geometry of |encoder| into |buffer|. When |cache| is not null,
+// the encoded geometry is looked up in the cache under |cache_key| first and
+// stored there after encoding.
+draco::Status EncodeToBuffer(const std::string &cache_key,
+                             draco::ExpertEncoder *encoder,
+                             draco::EncodedAssetCache *cache,
+                             draco::EncoderBuffer *buffer) {
+  if (cache == nullptr) {
+    return encoder->EncodeToBuffer(buffer);
+  }
+  if (cache->Lookup(cache_key, buffer)) {
+    printf("Using cached encoding of the input.\n");
+    return draco::OkStatus();
+  }
+  DRACO_RETURN_IF_ERROR(encoder->EncodeToBuffer(buffer));
+  const draco::Status status =
+      cache->Store(cache_key, *buffer, encoder->num_encoded_points(),
+                   encoder->num_encoded_faces());
+  if (!status.ok()) {
+    // The encoded geometry is still valid, so only report the failure.
+    printf("Failed to store the encoded geometry in the cache: %s\n",
+           status.error_msg());
+  }
+  return draco::OkStatus();
+}
+
 int EncodePointCloudToFile(const draco::PointCloud &pc, const std::string &file,
-                           draco::ExpertEncoder *encoder) {
+                           draco::ExpertEncoder *encoder,
+                           draco::EncodedAssetCache *cache) {
   draco::CycleTimer timer;
   // Encode the geometry.
   draco::EncoderBuffer buffer;
   timer.Start();
-  const draco::Status status = encoder->EncodeToBuffer(&buffer);
+  const draco::Status status = EncodeToBuffer(
+      cache ? draco::EncodedAssetCache::ComputeKey(pc, encoder->options())
+            : std::string(),
+      encoder, cache, &buffer);
   if (!status.ok()) {
     printf("Failed to encode the point cloud.\n");
     printf("%s\n", status.error_msg());
@@ -171,12 +266,16 @@ int EncodePointCloudToFile(const draco::PointCloud &pc, const std::string &file,
 }
 
 int EncodeMeshToFile(const draco::Mesh &mesh, const std::string &file,
-                     draco::ExpertEncoder *encoder) {
+                     draco::ExpertEncoder *encoder,
+                     draco::EncodedAssetCache *cache) {
   draco::CycleTimer timer;
   // Encode the geometry.
   draco::EncoderBuffer buffer;
   timer.Start();
-  const draco::Status status = encoder->EncodeToBuffer(&buffer);
+  const draco::Status status = EncodeToBuffer(
+      cache ? draco::EncodedAssetCache::ComputeKey(mesh, encoder->options())
+            : std::string(),
+      encoder, cache, &buffer);
   if (!status.ok()) {
     printf("Failed to encode the mesh.\n");
     printf("%s\n", status.error_msg());
@@ -260,6 +359,24 @@ int main(int argc, char **argv) {
       options.use_metadata = true;
     } else if (!strcmp("-preserve_polygons", argv[i])) {
       options.preserve_polygons = true;
+    } else if (!strcmp("-interleaved_rans", argv[i])) {
+      options.use_interleaved_rans = true;
+    } else if (!strcmp("-realtime", argv[i])) {
+      options.use_realtime_encoding = true;
+    } else if (!strcmp("-auto_tune", argv[i])) {
+      options.auto_tune = true;
+    } else if (!strcmp("-max_error", argv[i]) && i < argc_check) {
+      options.max_position_error = StringToDouble(argv[++i]);
+    } else if (!strcmp("-max_decode_ms", argv[i]) && i < argc_check) {
+      options.max_decode_time_ms = StringToDouble(argv[++i]);
+    } else if (!strcmp("-threads", argv[i]) && i < argc_check) {
+      options.num_threads = StringToInt(argv[++i]);
+    } else if (!strcmp("-cache_dir", argv[i]) && i < argc_check) {
+      options.cache_dir = argv[++i];
+    } else if (!strcmp("-cache_size_mb", argv[i]) && i < argc_check) {
+      options.cache_size_mb = StringToInt(argv[++i]);
+    } else if (!strcmp("-streaming_chunk_size", argv[i]) && i < argc_check) {
+      options.streaming_chunk_size = StringToInt(argv[++i]);
     }
   }
   if (argc < 3 || options.input.empty()) {
@@ -269,8 +386,10 @@ int main(int argc, char **argv) {
 
   std::unique_ptr<draco::PointCloud> pc;
   draco::Mesh *mesh = nullptr;
+  draco::Options load_options;
+  load_options.SetInt("streaming_chunk_size", options.streaming_chunk_size);
+  load_options.SetInt("dedup_threads", options.num_threads);
   if (!options.is_point_cloud) {
-    draco::Options load_options;
     load_options.SetBool("use_metadata", options.use_metadata);
     load_options.SetBool("preserve_polygons", options.preserve_polygons);
     auto maybe_mesh = draco::ReadMeshFromFile(options.input, load_options);
@@ -282,7 +401,7 @@ int main(int argc, char **argv) {
     mesh = maybe_mesh.value().get();
     pc = std::move(maybe_mesh).value();
   } else {
-    auto maybe_pc = draco::ReadPointCloudFromFile(options.input);
+    auto maybe_pc = draco::ReadPointCloudFromFile(options.input, load_options);
     if (!maybe_pc.ok()) {
       printf("Failed loading the input point cloud: %s.\n",
              maybe_pc.status().error_msg());
@@ -330,7 +449,7 @@ int main(int argc, char **argv) {
   // as some points can be possibly combined.
   if (options.tex_coords_deleted || options.normals_deleted ||
       options.generic_deleted) {
-    pc->DeduplicatePointIds();
+    pc->DeduplicatePointIds(options.num_threads);
   }
 #endif
 
@@ -357,6 +476,8 @@ int main(int argc, char **argv) {
                                      options.generic_quantization_bits);
   }
   encoder.SetSpeedOptions(speed, speed);
+  encoder.SetUseInterleavedRAns(options.use_interleaved_rans);
+  encoder.SetRealtimeEncoding(options.use_realtime_encoding);
 
   if (options.output.empty()) {
     // Create a default output file by attaching .drc to the input file name.
@@ -386,15 +507,54 @@ int main(int argc, char **argv) {
         poly_att_id, draco::PredictionSchemeMethod::PREDICTION_NONE);
   }
 
+  if (options.auto_tune) {
+    draco::EncoderOptionSearch search;
+    search.SetMaxPositionError(options.max_position_error);
+    search.SetMaxDecodeTimeMs(options.max_decode_time_ms);
+    search.SetNumThreads(options.num_threads);
+    const draco::StatusOr<draco::EncoderOptionSearchResult> result =
+        input_is_mesh ? search.SearchMesh(*mesh, expert_encoder->options())
+                      : search.SearchPointCloud(*pc, expert_encoder->options());
+    if (!result.ok()) {
+      printf("Failed to find encoder options within the budget.\n");
+      printf("%s\n", result.status().error_msg());
+      return -1;
+    }
+    printf("Auto-tuned encoder options (%d configurations evaluated):\n",
+           result.value().num_evaluated_configurations);
+    printf("  Compression level = %d\n", result.value().compression_level);
+    if (result.value().position_quantization_bits > 0) {
+      printf("  Positions: Quantization = %d bits (max error %g)\n",
+             result.value().position_quantization_bits,
+             result.value().position_error);
+    }
+    printf("  Decoding time = %.3f ms\n\n", result.value().decode_time_ms);
+    expert_encoder->Reset(result.value().options);
+  }
+
+  std::unique_ptr<draco::EncodedAssetCache> cache;
+  if (!options.cache_dir.empty()) {
+    cache.reset(new draco::EncodedAssetCache());
+    const draco::Status status = cache->Open(
+        options.cache_dir, static_cast<int64_t>(options.cache_size_mb) << 20);
+    if (!status.ok()) {
+      printf("Failed to open the cache: %s\n", status.error_msg());
+      return -1;
+    }
+  }
+
   int ret = -1;
 
   if (input_is_mesh) {
-    ret = EncodeMeshToFile(*mesh, options.output, expert_encoder.get());
+    ret = EncodeMeshToFile(*mesh, options.output, expert_encoder.get(),
+                           cache.get());
   } else {
-    ret = EncodePointCloudToFile(*pc, options.output, expert_encoder.get());
+    ret = EncodePointCloudToFile(*pc, options.output, expert_encoder.get(),
+                                 cache.get());
   }
 
-  if (ret != -1 && options.compression_level < 10) {
+  if (ret != -1 && options.compression_level < 10 &&
+      !options.use_realtime_encoding && !options.auto_tune) {
     printf(
         "For better compression, increase the compression level up to '-cl 10' "
         ".\n\n");
@@ -45,6 +45,12 @@ void Usage() {
   printf("default=8.\n");
   printf("  -qg <value>     quantization bits for any generic attribute, ");
   printf("default=8.\n");
+  printf("  -threads <value> number of threads used to compress meshes, ");
+  printf("default=1.\n");
+  printf("  -cache_dir <dir> reuse meshes compressed in <dir> when the ");
+  printf("input and options are unchanged.\n");
+  printf("  -cache_size_mb <value> maximum size of the cached meshes in MB, ");
+  printf("default=1024.\n");
 
   printf("\nBoolean options may be negated by prefixing 'no'.\n");
 }
@@ -112,6 +118,13 @@ int main(int argc, char **argv) {
     } else if (!strcmp("-qg", argv[i]) && i < argc_check) {
       transcode_options.geometry.quantization_bits_generic =
           StringToInt(argv[++i]);
+    } else if (!strcmp("-threads", argv[i]) && i < argc_check) {
+      transcode_options.num_threads = StringToInt(argv[++i]);
+    } else if (!strcmp("-cache_dir", argv[i]) && i < argc_check) {
+      transcode_options.cache_dir = argv[++i];
+    } else if (!strcmp("-cache_size_mb", argv[i]) && i < argc_check) {
+      transcode_options.cache_size_bytes =
+          static_cast<int64_t>(StringToInt(argv[++i])) << 20;
     }
   }
   if (argc < 3 || file_options.input_filename.empty() ||
@@ -30,6 +30,13 @@ StatusOr<std::unique_ptr<DracoTranscoder>> DracoTranscoder::Create(
   DRACO_RETURN_IF_ERROR(options.geometry.Check());
   std::unique_ptr<DracoTranscoder> dt(new DracoTranscoder());
   dt->transcoding_options_ = options;
+  dt->gltf_encoder_.set_num_encoding_threads(options.num_threads);
+  if (!options.cache_dir.empty()) {
+    dt->cache_.reset(new EncodedAssetCache());
+    DRACO_RETURN_IF_ERROR(
+        dt->cache_->Open(options.cache_dir, options.cache_size_bytes));
+    dt->gltf_encoder_.set_encoded_asset_cache(dt->cache_.get());
+  }
   return dt;
 }
 
@@ -18,10 +18,13 @@
 #include "draco/draco_features.h"
 
 #ifdef DRACO_TRANSCODER_SUPPORTED
+#include <cstdint>
+#include <memory>
 #include <string>
 
 #include "draco/compression/draco_compression_options.h"
 #include "draco/core/options.h"
+#include "draco/io/encoded_asset_cache.h"
 #include "draco/io/gltf_encoder.h"
 #include "draco/io/image_compression_options.h"
 
@@ -33,6 +36,18 @@ struct DracoTranscodingOptions {
 
   // Options used when geometry compression optimization is disabled.
   DracoCompressionOptions geometry;
+
+  // Number of threads used to compress the meshes of a scene. The output is
+  // identical for any number of threads.
+  int num_threads = 1;
+
+  // Directory of a cache of compressed meshes. Meshes that were already
+  // compressed with the same options are read from the cache instead of being
+  // compressed again. The cache is disabled when the directory is empty.
+  std::string cache_dir;
+
+  // Maximum size of the compressed meshes stored in |cache_dir|.
+  int64_t cache_size_bytes = int64_t{1} << 30;
 };
 
 // Class that supports input of glTF (and some simple USD) files, encodes
@@ -95,6 +110,9 @@ class DracoTranscoder {
 
   // Copy of the transcoding options passed into the Create function.
   DracoTranscodingOptions transcoding_options_;
+
+  // Cache of compressed meshes. Null when the cache is disabled.
+  std::unique_ptr<EncodedAssetCache> cache_;
 };
 
 }  // namespace draco
@@ -12,12 +12,15 @@
 // See the License for the specific language governing permissions and
 // limitations under the License.
 //
-#ifdef DRACO_TRANSCODER_SUPPORTED
-
 #include "draco/tools/draco_transcoder_lib.h"
 
+#ifdef DRACO_TRANSCODER_SUPPORTED
+#include <string>
+#include <vector>
+
 #include "draco/core/draco_test_base.h"
 #include "draco/core/draco_test_utils.h"
+#include "draco/io/encoded_asset_cache.h"
 #include "draco/io/file_utils.h"
 
 // Tests encoding a .gltf file with default Draco compression.
@@ -169,4 +172,74 @@ TEST(DracoTranscoderTest, TestPositionQuantization) {
   ASSERT_GT(first_glb_size, second_glb_size);
 }
 
+// Tests that compressing the meshes of a scene on multiple threads produces
+// the same file as compressing them on a single thread.
+TEST(DracoTranscoderTest, MultithreadedOutputMatchesSerial) {
+  draco::DracoTranscoder::FileOptions file_options;
+  file_options.input_filename =
+      draco::GetTestFileFullPath("CesiumMilkTruck/glTF/CesiumMilkTruck.gltf");
+
+  draco::DracoTranscodingOptions options;
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::DracoTranscoder> dt,
+                         draco::DracoTranscoder::Create(options));
+  const std::string serial_filename =
+      draco::GetTestTempFileFullPath("serial.glb");
+  file_options.output_filename = serial_filename;
+  DRACO_ASSERT_OK(dt->Transcode(file_options));
+
+  options.num_threads = 4;
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::DracoTranscoder> dt2,
+                         draco::DracoTranscoder::Create(options));
+  const std::string threaded_filename =
+      draco::GetTestTempFileFullPath("threaded.glb");
+  file_options.output_filename = threaded_filename;
+  DRACO_ASSERT_OK(dt2->Transcode(file_options));
+
+  std::vector<char> serial_data;
+  std::vector<char> threaded_data;
+  ASSERT_TRUE(draco::ReadFileToBuffer(serial_filename, &serial_data));
+  ASSERT_TRUE(draco::ReadFileToBuffer(threaded_filename, &threaded_data));
+  ASSERT_FALSE(serial_data.empty());
+  ASSERT_EQ(serial_data, threaded_data);
+}
+
+TEST(DracoTranscoderTest, CachedOutputMatchesUncached) {
+  draco::DracoTranscoder::FileOptions file_options;
+  file_options.input_filename =
+      draco::GetTestFileFullPath("CesiumMilkTruck/glTF/CesiumMilkTruck.gltf");
+
+  draco::DracoTranscodingOptions options;
+  DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::DracoTranscoder> dt,
+                         draco::DracoTranscoder::Create(options));
+  const std::string uncached_filename =
+      draco::GetTestTempFileFullPath("uncached.glb");
+  file_options.output_filename = uncached_filename;
+  DRACO_ASSERT_OK(dt->Transcode(file_options));
+
+  // The first transcoding fills the cache and the second one reads from it.
+  options.cache_dir = draco::GetTestTempFileFullPath("transcoder_cache");
+  std::vector<std::string> cached_filenames;
+  for (int i = 0; i < 2; ++i) {
+    DRACO_ASSIGN_OR_ASSERT(std::unique_ptr<draco::DracoTranscoder> dt2,
+                           draco::DracoTranscoder::Create(options));
+    cached_filenames.push_back(
+        draco::GetTestTempFileFullPath("cached" + std::to_string(i) + ".glb"));
+    file_options.output_filename = cached_filenames.back();
+    DRACO_ASSERT_OK(dt2->Transcode(file_options));
+  }
+
+  draco::EncodedAssetCache cache;
+  DRACO_ASSERT_OK(cache.Open(options.cache_dir, options.cache_size_bytes));
+  ASSERT_GT(cache.num_entries(), 0);
+
+  std::vector<char> uncached_data;
+  ASSERT_TRUE(draco::ReadFileToBuffer(uncached_filename, &uncached_data));
+  ASSERT_FALSE(uncached_data.empty());
+  for (const std::string &filename : cached_filenames) {
+    std::vector<char> cached_data;
+    ASSERT_TRUE(draco::ReadFileToBuffer(filename, &cached_data));
+    ASSERT_EQ(cached_data, uncached_data);
+  }
+}
+
 #endif  // DRACO_TRANSCODER_SUPPORTED
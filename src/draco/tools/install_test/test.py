@@ -21,6 +21,10 @@ configurations.
 """
 
 import argparse
+import concurrent.futures
+import contextlib
+import hashlib
+import json
 import multiprocessing
 import os
 import pathlib
@@ -28,6 +32,8 @@ import shlex
 import shutil
 import subprocess
 import sys
+import threading
+import time
 
 # CMake executable.
 CMAKE = shutil.which('cmake')
@@ -65,9 +71,23 @@ DRACO_SHARED_INSTALL_BIN_PATH = os.path.join(DRACO_SHARED_INSTALL_PATH, 'bin')
 
 DRACO_SHARED_INSTALL_LIB_PATH = os.path.join(DRACO_SHARED_INSTALL_PATH, 'lib')
 
+# The transcoder dependency install roots. These are kept between runs and
+# reused as long as the dependency sources and the build configuration do not
+# change.
+DEPS_SHARED_INSTALL_PATH = os.path.join(TEST_SOURCES_PATH,
+                                        '_deps_install_shared')
+DEPS_STATIC_INSTALL_PATH = os.path.join(TEST_SOURCES_PATH,
+                                        '_deps_install_static')
+
+# Name of the file that identifies the contents of a dependency install root.
+DEPS_STAMP_FILE = '.draco_deps_stamp'
+
+# Rebuild the transcoder dependencies even when a matching install exists.
+REBUILD_DEPENDENCIES = False
+
 # Argument for -j when using make, or -m when using Visual Studio. Number of
-# build jobs.
-NUM_PROCESSES = multiprocessing.cpu_count() - 1
+# build jobs. The budget is split between the shared and static builds.
+NUM_PROCESSES = max(multiprocessing.cpu_count() - 1, 1)
 
 # The test project build directories.
 TEST_SHARED_BUILD_PATH = os.path.join(TEST_SOURCES_PATH, '_test_build_shared')
@@ -82,6 +102,40 @@ TEST_STATIC_INSTALL_PATH = os.path.join(TEST_SOURCES_PATH,
 # Show configuration and build output.
 VERBOSE = False
 
+# Optional path of a JSON file receiving the phase timings.
+TIMINGS_FILE = None
+
+# List of (configuration, phase, seconds) tuples recorded by timed_phase().
+PHASE_TIMINGS = []
+PHASE_TIMINGS_LOCK = threading.Lock()
+
+
+@contextlib.contextmanager
+def timed_phase(config, phase):
+  """Records the wall time of the enclosed block in PHASE_TIMINGS."""
+  start = time.monotonic()
+  try:
+    yield
+  finally:
+    elapsed = time.monotonic() - start
+    with PHASE_TIMINGS_LOCK:
+      PHASE_TIMINGS.append((config, phase, elapsed))
+    if VERBOSE:
+      print(f'{config}: {phase} took {elapsed:.1f}s')
+
+
+def print_phase_timings():
+  """Prints PHASE_TIMINGS and writes them to TIMINGS_FILE when set."""
+  print('Phase timings:')
+  for config, phase, elapsed in PHASE_TIMINGS:
+    print(f'  {config:<8} {phase:<32} {elapsed:8.1f}s')
+
+  if TIMINGS_FILE:
+    with open(TIMINGS_FILE, 'w') as timings_file:
+      json.dump([{'config': config, 'phase': phase, 'seconds': elapsed}
+                 for config, phase, elapsed in PHASE_TIMINGS],
+                timings_file, indent=2)
+
 
 def cmake_get_available_generators():
   """Returns list of generators available in current CMake executable."""
@@ -104,9 +158,9 @@ def cmake_get_available_generators():
   return generators
 
 
-def cmake_get_generator():
-  """Returns the CMake generator from CMakeCache.txt in the current dir."""
-  cmake_cache_file_path = os.path.join(os.getcwd(), 'CMakeCache.txt')
+def cmake_get_generator(build_path):
+  """Returns the CMake generator from CMakeCache.txt in |build_path|."""
+  cmake_cache_file_path = os.path.join(build_path, 'CMakeCache.txt')
   cmake_cache_text = ''
   with open(cmake_cache_file_path, 'r') as cmake_cache_file:
     cmake_cache_text = cmake_cache_file.read()
@@ -122,7 +176,7 @@ def cmake_get_generator():
   return generator
 
 
-def run_process_and_capture_output(cmd, env=None):
+def run_process_and_capture_output(cmd, env=None, cwd=None):
   """Runs |cmd| as a child process.
 
   Returns process exit code and output. Streams process output to stdout when
@@ -131,6 +185,7 @@ def run_process_and_capture_output(cmd, env=None):
   Args:
     cmd: String containing the command to execute.
     env: Optional dict of environment variables.
+    cwd: Optional working directory of the child process.
 
   Returns:
     Tuple of exit code and output.
@@ -145,7 +200,7 @@ def run_process_and_capture_output(cmd, env=None):
     cmd = shlex.split(cmd)
 
   proc = subprocess.Popen(
-      cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env)
+      cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, env=env, cwd=cwd)
 
   if VERBOSE:
     print('COMMAND output:')
@@ -172,7 +227,11 @@ def create_output_directories():
 
 
 def cleanup():
-  """Removes the build output directories from the test."""
+  """Removes the build output directories from the test.
+
+  The transcoder dependency installs are kept so that later runs can reuse
+  them.
+  """
   shutil.rmtree(DRACO_SHARED_BUILD_PATH)
   shutil.rmtree(DRACO_STATIC_BUILD_PATH)
   shutil.rmtree(DRACO_SHARED_INSTALL_PATH)
@@ -183,8 +242,8 @@ def cleanup():
   shutil.rmtree(TEST_STATIC_INSTALL_PATH)
 
 
-def cmake_configure(source_path, cmake_args=None):
-  """Configures a CMake build."""
+def cmake_configure(build_path, source_path, cmake_args=None):
+  """Configures a CMake build in |build_path|."""
   command = f'{CMAKE} {source_path}'
 
   if CMAKE_GENERATOR:
@@ -204,14 +263,15 @@ def cmake_configure(source_path, cmake_args=None):
   if VERBOSE:
     print(f'CONFIGURE command:\n{command}')
 
-  result = run_process_and_capture_output(command)
+  pathlib.Path(build_path).mkdir(parents=True, exist_ok=True)
+  result = run_process_and_capture_output(command, cwd=build_path)
 
   if result[0] != 0:
     raise Exception(f'CONFIGURE failed!\nexit_code: {result[0]}\n{result[1]}')
 
 
-def cmake_build(cmake_args=None, build_args=None):
-  """Runs a CMake build."""
+def cmake_build(build_path, num_processes, cmake_args=None, build_args=None):
+  """Runs a CMake build in |build_path| using |num_processes| build jobs."""
   command = f'{CMAKE} --build .'
 
   if cmake_args:
@@ -221,11 +281,11 @@ def cmake_build(cmake_args=None, build_args=None):
   if not build_args:
     build_args = []
 
-  generator = cmake_get_generator()
-  if generator.endswith('Makefiles'):
-    build_args.append(f'-j {NUM_PROCESSES}')
+  generator = cmake_get_generator(build_path)
+  if generator.endswith('Makefiles') or generator == 'Ninja':
+    build_args.append(f'-j {num_processes}')
   elif generator.startswith('Visual'):
-    build_args.append(f'-m:{NUM_PROCESSES}')
+    build_args.append(f'-m:{num_processes}')
 
   if build_args:
     command += ' --'
@@ -235,7 +295,7 @@ def cmake_build(cmake_args=None, build_args=None):
   if VERBOSE:
     print(f'BUILD command:\n{command}')
 
-  result = run_process_and_capture_output(f'{command}')
+  result = run_process_and_capture_output(f'{command}', cwd=build_path)
 
   if result[0] != 0:
     raise Exception(f'BUILD failed!\nexit_code: {result[0]}\n{result[1]}')
@@ -257,149 +317,183 @@ def run_install_check(install_path):
         f'install_check run failed!\nexit_code: {result[0]}\n{result[1]}')
 
 
-def build_and_install_transcoder_dependencies():
-  """Builds and installs Draco dependencies for transcoder enabled builds."""
-  orig_dir = os.getcwd()
-
-  # The Eigen CMake build in the release Draco has pinned is, to put it mildly,
-  # user unfriendly. Instead of wasting time trying to integrate it here, just
-  # shutil.copytree() everything in $eigen_submodule_path to
-  # $CMAKE_INSTALL_PREFIX/include/Eigen.
-  # Eigen claims to be header-only, so this should be adequate for Draco's
-  # needs here.
-  eigen_submodule_path = os.path.join(
-      DRACO_SOURCES_PATH, 'third_party', 'eigen', 'Eigen')
-
-  # "Install" Eigen for the shared install root.
-  eigen_install_path = os.path.join(
-      DRACO_SHARED_INSTALL_PATH, 'include', 'Eigen')
-  shutil.copytree(src=eigen_submodule_path, dst=eigen_install_path)
-
-  # "Install" Eigen for the static install root.
-  eigen_install_path = os.path.join(
-      DRACO_STATIC_INSTALL_PATH, 'include', 'Eigen')
-  shutil.copytree(src=eigen_submodule_path, dst=eigen_install_path)
-
-  # Build and install gulrak/filesystem for shared and static configurations.
-  # Note that this is basically running gulrak/filesystem's CMake build as an
-  # install script.
-  fs_submodule_path = os.path.join(
-      DRACO_SOURCES_PATH, 'third_party', 'filesystem')
-
-  # Install gulrak/filesystem in the shared draco install root.
-  fs_shared_build = os.path.join(DRACO_SHARED_BUILD_PATH, '_fs')
-  pathlib.Path(fs_shared_build).mkdir(parents=True, exist_ok=True)
-  os.chdir(fs_shared_build)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_SHARED_INSTALL_PATH}')
-  cmake_args.append('-DBUILD_SHARED_LIBS=ON')
-  cmake_args.append('-DGHC_FILESYSTEM_BUILD_TESTING=OFF')
-  cmake_args.append('-DGHC_FILESYSTEM_BUILD_EXAMPLES=OFF')
-  cmake_configure(source_path=fs_submodule_path, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-
-  # Install gulrak/filesystem in the shared draco install root.
-  fs_static_build = os.path.join(DRACO_STATIC_BUILD_PATH, '_fs')
-  pathlib.Path(fs_static_build).mkdir(parents=True, exist_ok=True)
-  os.chdir(fs_static_build)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_SHARED_INSTALL_PATH}')
-  cmake_args.append('-DBUILD_SHARED_LIBS=OFF')
-  cmake_args.append('-DGHC_FILESYSTEM_BUILD_TESTING=OFF')
-  cmake_args.append('-DGHC_FILESYSTEM_BUILD_EXAMPLES=OFF')
-  cmake_configure(source_path=fs_submodule_path, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-
-  # Build and install TinyGLTF for shared and static configurations.
-  # Note, as above, that this is basically running TinyGLTF's CMake build as an
-  # install script.
-  tinygltf_submodule_path = os.path.join(
-      DRACO_SOURCES_PATH, 'third_party', 'tinygltf')
-
-  # Install TinyGLTF in the shared draco install root.
-  tinygltf_shared_build = os.path.join(DRACO_SHARED_BUILD_PATH, '_TinyGLTF')
-  pathlib.Path(tinygltf_shared_build).mkdir(parents=True, exist_ok=True)
-  os.chdir(tinygltf_shared_build)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_SHARED_INSTALL_PATH}')
-  cmake_args.append('-DTINYGLTF_BUILD_EXAMPLES=OFF')
-  cmake_configure(source_path=tinygltf_submodule_path, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-
-  # Install TinyGLTF in the static draco install root.
-  tinygltf_static_build = os.path.join(DRACO_STATIC_BUILD_PATH, '_TinyGLTF')
-  pathlib.Path(tinygltf_static_build).mkdir(parents=True, exist_ok=True)
-  os.chdir(tinygltf_static_build)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_STATIC_INSTALL_PATH}')
-  cmake_args.append('-DTINYGLTF_BUILD_EXAMPLES=OFF')
-  cmake_configure(source_path=tinygltf_submodule_path, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
+def compute_dependencies_stamp(shared):
+  """Returns a string identifying a transcoder dependency install.
 
-  os.chdir(orig_dir)
+  The stamp covers the contents of the dependency sources and the CMake
+  configuration used to build them.
+  """
+  sha = hashlib.sha256()
+  sha.update(f'shared={shared}\n'.encode())
+  sha.update(f'generator={CMAKE_GENERATOR}\n'.encode())
+  sha.update(f'defines={CMAKE_DEFINES}\n'.encode())
+  for submodule in ('eigen', 'filesystem', 'tinygltf'):
+    submodule_path = pathlib.Path(DRACO_SOURCES_PATH, 'third_party', submodule)
+    for file_path in sorted(submodule_path.rglob('*')):
+      if '.git' in file_path.parts or not file_path.is_file():
+        continue
+      sha.update(file_path.relative_to(submodule_path).as_posix().encode())
+      sha.update(file_path.read_bytes())
+  return sha.hexdigest()
+
+
+def build_and_install_transcoder_dependencies(shared, draco_build_path,
+                                              draco_install_path,
+                                              num_processes):
+  """Builds and installs Draco dependencies for transcoder enabled builds.
+
+  The dependencies are installed into a dependency install root that is reused
+  by later runs when it is up to date. Its contents are then copied into
+  |draco_install_path|.
+  """
+  config = 'shared' if shared else 'static'
+  deps_install_path = (
+      DEPS_SHARED_INSTALL_PATH if shared else DEPS_STATIC_INSTALL_PATH)
+  stamp_path = os.path.join(deps_install_path, DEPS_STAMP_FILE)
 
+  with timed_phase(config, 'hash dependencies'):
+    stamp = compute_dependencies_stamp(shared)
 
-def build_and_install_draco():
-  """Builds Draco in shared and static configurations."""
-  orig_dir = os.getcwd()
+  up_to_date = False
+  if not REBUILD_DEPENDENCIES and os.path.isfile(stamp_path):
+    with open(stamp_path, 'r') as stamp_file:
+      up_to_date = stamp_file.read() == stamp
 
-  if ENABLE_TRANSCODER:
-    build_and_install_transcoder_dependencies()
+  if up_to_date:
+    if VERBOSE:
+      print(f'Reusing transcoder dependencies in {deps_install_path}.')
+  else:
+    shutil.rmtree(deps_install_path, ignore_errors=True)
+
+    # The Eigen CMake build in the release Draco has pinned is, to put it
+    # mildly, user unfriendly. Instead of wasting time trying to integrate it
+    # here, just shutil.copytree() everything in $eigen_submodule_path to
+    # $CMAKE_INSTALL_PREFIX/include/Eigen.
+    # Eigen claims to be header-only, so this should be adequate for Draco's
+    # needs here.
+    with timed_phase(config, 'install eigen'):
+      eigen_submodule_path = os.path.join(
+          DRACO_SOURCES_PATH, 'third_party', 'eigen', 'Eigen')
+      eigen_install_path = os.path.join(deps_install_path, 'include', 'Eigen')
+      shutil.copytree(src=eigen_submodule_path, dst=eigen_install_path)
+
+    # Build and install gulrak/filesystem. Note that this is basically running
+    # gulrak/filesystem's CMake build as an install script.
+    with timed_phase(config, 'install filesystem'):
+      fs_submodule_path = os.path.join(
+          DRACO_SOURCES_PATH, 'third_party', 'filesystem')
+      fs_build = os.path.join(draco_build_path, '_fs')
+      cmake_args = []
+      cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={deps_install_path}')
+      cmake_args.append(f'-DBUILD_SHARED_LIBS={"ON" if shared else "OFF"}')
+      cmake_args.append('-DGHC_FILESYSTEM_BUILD_TESTING=OFF')
+      cmake_args.append('-DGHC_FILESYSTEM_BUILD_EXAMPLES=OFF')
+      cmake_configure(build_path=fs_build, source_path=fs_submodule_path,
+                      cmake_args=cmake_args)
+      cmake_build(build_path=fs_build, num_processes=num_processes,
+                  cmake_args=['--target install'])
+
+    # Build and install TinyGLTF. Note, as above, that this is basically
+    # running TinyGLTF's CMake build as an install script.
+    with timed_phase(config, 'install tinygltf'):
+      tinygltf_submodule_path = os.path.join(
+          DRACO_SOURCES_PATH, 'third_party', 'tinygltf')
+      tinygltf_build = os.path.join(draco_build_path, '_TinyGLTF')
+      cmake_args = []
+      cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={deps_install_path}')
+      cmake_args.append('-DTINYGLTF_BUILD_EXAMPLES=OFF')
+      cmake_configure(build_path=tinygltf_build,
+                      source_path=tinygltf_submodule_path,
+                      cmake_args=cmake_args)
+      cmake_build(build_path=tinygltf_build, num_processes=num_processes,
+                  cmake_args=['--target install'])
+
+    with open(stamp_path, 'w') as stamp_file:
+      stamp_file.write(stamp)
+
+  with timed_phase(config, 'copy dependencies'):
+    shutil.copytree(src=deps_install_path, dst=draco_install_path,
+                    ignore=shutil.ignore_patterns(DEPS_STAMP_FILE),
+                    dirs_exist_ok=True)
+
+
+def build_and_install_draco(shared, num_processes):
+  """Builds and installs Draco in the shared or static configuration."""
+  config = 'shared' if shared else 'static'
+  build_path = DRACO_SHARED_BUILD_PATH if shared else DRACO_STATIC_BUILD_PATH
+  install_path = (
+      DRACO_SHARED_INSTALL_PATH if shared else DRACO_STATIC_INSTALL_PATH)
 
-  # Build and install Draco in shared library config for the current host
-  # machine.
-  os.chdir(DRACO_SHARED_BUILD_PATH)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_SHARED_INSTALL_PATH}')
-  cmake_args.append('-DBUILD_SHARED_LIBS=ON')
   if ENABLE_TRANSCODER:
-    cmake_args.append('-DDRACO_TRANSCODER_SUPPORTED=ON')
-  cmake_configure(source_path=DRACO_SOURCES_PATH, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
+    build_and_install_transcoder_dependencies(shared, build_path, install_path,
+                                              num_processes)
 
-  # Build and install Draco in the static config for the current host machine.
-  os.chdir(DRACO_STATIC_BUILD_PATH)
+  # Build and install Draco for the current host machine.
   cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={DRACO_STATIC_INSTALL_PATH}')
-  cmake_args.append('-DBUILD_SHARED_LIBS=OFF')
+  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={install_path}')
+  cmake_args.append(f'-DBUILD_SHARED_LIBS={"ON" if shared else "OFF"}')
   if ENABLE_TRANSCODER:
     cmake_args.append('-DDRACO_TRANSCODER_SUPPORTED=ON')
-  cmake_configure(source_path=DRACO_SOURCES_PATH, cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-
-  os.chdir(orig_dir)
-
-
-def build_test_project():
-  """Builds the test application in shared and static configurations."""
-  orig_dir = os.getcwd()
-
-  # Configure the test project against draco shared and build it.
-  os.chdir(TEST_SHARED_BUILD_PATH)
+  with timed_phase(config, 'configure draco'):
+    cmake_configure(build_path=build_path, source_path=DRACO_SOURCES_PATH,
+                    cmake_args=cmake_args)
+  with timed_phase(config, 'build and install draco'):
+    cmake_build(build_path=build_path, num_processes=num_processes,
+                cmake_args=['--target install'])
+
+
+def build_test_project(shared, num_processes):
+  """Builds and runs the test application in the shared or static config."""
+  config = 'shared' if shared else 'static'
+  build_path = TEST_SHARED_BUILD_PATH if shared else TEST_STATIC_BUILD_PATH
+  install_path = (
+      TEST_SHARED_INSTALL_PATH if shared else TEST_STATIC_INSTALL_PATH)
+  draco_install_path = (
+      DRACO_SHARED_INSTALL_PATH if shared else DRACO_STATIC_INSTALL_PATH)
+
+  # Configure the test project against the draco install and build it.
   cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={TEST_SHARED_INSTALL_PATH}')
-  cmake_args.append(f'-DCMAKE_PREFIX_PATH={DRACO_SHARED_INSTALL_PATH}')
-  cmake_args.append(f'-DCMAKE_INSTALL_RPATH={DRACO_SHARED_INSTALL_LIB_PATH}')
-  cmake_configure(source_path=f'{TEST_SOURCES_PATH}', cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-  run_install_check(TEST_SHARED_INSTALL_PATH)
-
-  # Configure the test project against draco static and build it.
-  os.chdir(TEST_STATIC_BUILD_PATH)
-  cmake_args = []
-  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={TEST_STATIC_INSTALL_PATH}')
-  cmake_args.append(f'-DCMAKE_PREFIX_PATH={DRACO_STATIC_INSTALL_PATH}')
-  cmake_configure(source_path=f'{TEST_SOURCES_PATH}', cmake_args=cmake_args)
-  cmake_build(cmake_args=['--target install'])
-  run_install_check(TEST_STATIC_INSTALL_PATH)
-
-  os.chdir(orig_dir)
+  cmake_args.append(f'-DCMAKE_INSTALL_PREFIX={install_path}')
+  cmake_args.append(f'-DCMAKE_PREFIX_PATH={draco_install_path}')
+  if shared:
+    cmake_args.append(f'-DCMAKE_INSTALL_RPATH={DRACO_SHARED_INSTALL_LIB_PATH}')
+  with timed_phase(config, 'configure test project'):
+    cmake_configure(build_path=build_path, source_path=f'{TEST_SOURCES_PATH}',
+                    cmake_args=cmake_args)
+  with timed_phase(config, 'build test project'):
+    cmake_build(build_path=build_path, num_processes=num_processes,
+                cmake_args=['--target install'])
+  with timed_phase(config, 'run install_check'):
+    run_install_check(install_path)
+
+
+def run_install_pipeline(shared, num_processes):
+  """Builds and installs Draco and then builds and runs the test project."""
+  config = 'shared' if shared else 'static'
+  with timed_phase(config, 'total'):
+    build_and_install_draco(shared, num_processes)
+    build_test_project(shared, num_processes)
 
 
 def test_draco_install():
   create_output_directories()
-  build_and_install_draco()
-  build_test_project()
+
+  # The shared and static pipelines are independent, so run them at the same
+  # time with half of the build job budget each.
+  num_processes = max(NUM_PROCESSES // 2, 1)
+  try:
+    with timed_phase('all', 'total'):
+      with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(run_install_pipeline, shared, num_processes)
+            for shared in (True, False)
+        ]
+        # Wait for both pipelines and re-raise the first failure.
+        for future in futures:
+          future.result()
+  finally:
+    print_phase_timings()
+
   cleanup()
 
 
@@ -422,6 +516,17 @@ if __name__ == '__main__':
       '--verbose',
       action='store_true',
       help='Show configuration and build output.')
+  parser.add_argument(
+      '-j', '--jobs',
+      type=int,
+      help='Number of build jobs shared by the shared and static builds.')
+  parser.add_argument(
+      '--rebuild_dependencies',
+      action='store_true',
+      help='Rebuild the transcoder dependencies instead of reusing them.')
+  parser.add_argument(
+      '--timings_file',
+      help='Writes the phase timings to the specified JSON file.')
   args = parser.parse_args()
 
   if args.cmake_define:
@@ -432,6 +537,12 @@ if __name__ == '__main__':
     VERBOSE = True
   if args.with_transcoder:
     ENABLE_TRANSCODER = True
+  if args.jobs:
+    NUM_PROCESSES = max(args.jobs, 1)
+  if args.rebuild_dependencies:
+    REBUILD_DEPENDENCIES = True
+  if args.timings_file:
+    TIMINGS_FILE = os.path.abspath(args.timings_file)
 
   if VERBOSE:
     print(f'CMAKE={CMAKE}')
@@ -444,6 +555,8 @@ if __name__ == '__main__':
     print(f'DRACO_STATIC_BUILD_PATH={DRACO_STATIC_BUILD_PATH}')
     print(f'DRACO_SHARED_INSTALL_PATH={DRACO_SHARED_INSTALL_PATH}')
     print(f'DRACO_STATIC_INSTALL_PATH={DRACO_STATIC_INSTALL_PATH}')
+    print(f'DEPS_SHARED_INSTALL_PATH={DEPS_SHARED_INSTALL_PATH}')
+    print(f'DEPS_STATIC_INSTALL_PATH={DEPS_STATIC_INSTALL_PATH}')
     print(f'NUM_PROCESSES={NUM_PROCESSES}')
     print(f'TEST_SHARED_BUILD_PATH={TEST_SHARED_BUILD_PATH}')
     print(f'TEST_STATIC_BUILD_PATH={TEST_STATIC_BUILD_PATH}')